@@ -14,6 +14,8 @@ Commands:
     validate - Run Phase 4: Test validation
     split - Split large task files into smaller evaluable chunks
     check-citations - Verify URLs in documents before evaluation
+    serve - Keep a warm daemon that other invocations forward to
+    stats - Summarize evaluation latency, tokens and cost
 """
 
 import argparse
@@ -734,6 +736,8 @@ def init(project_path: str = ".", interactive: bool = True) -> int:
         gitignore_entries = [
             ".adversarial/logs/",
             ".adversarial/artifacts/",
+            ".adversarial/cache/",
+            ".adversarial/metrics/",
             ".env",
         ]
 
@@ -2359,6 +2363,64 @@ def list_evaluators() -> int:
     return 0
 
 
+def stats(days: int = 30, evaluator: str | None = None, json_output: bool = False) -> int:
+    """Summarize recorded evaluation metrics by evaluator and model.
+
+    Args:
+        days: Only include evaluations from the last N days (0 for all)
+        evaluator: Only include this evaluator
+        json_output: Output in JSON format for machine parsing
+
+    Returns:
+        0 on success, 1 on invalid arguments
+    """
+    import json
+
+    from adversarial_workflow.evaluators.metrics import MetricsLog, since_days, summarize
+    from adversarial_workflow.utils.config import load_config
+
+    if days < 0:
+        print(f"{RED}Error: --days must be 0 or more, got {days}{RESET}")
+        return 1
+
+    log = MetricsLog.from_project_config(load_config())
+    if log is None:
+        print(f"{YELLOW}Metrics are disabled (metrics.enabled: false in config.yml).{RESET}")
+        return 0
+
+    records = log.records(since=since_days(days) if days else None)
+    if evaluator:
+        records = (r for r in records if r.get("evaluator") == evaluator)
+    summaries = summarize(records)
+
+    if json_output:
+        print(json.dumps([s.to_dict() for s in summaries], indent=2))
+        return 0
+
+    window = f"last {days} days" if days else "all time"
+    total = sum(s.runs for s in summaries)
+    print(f"{BOLD}Evaluation metrics{RESET} ({window}, {total} evaluations)")
+    if not summaries:
+        print(f"{GRAY}No evaluations recorded in {log.directory}/.{RESET}")
+        return 0
+
+    def seconds(ms: float | None) -> str:
+        return "-" if ms is None else f"{ms / 1000:.1f}s"
+
+    print()
+    print(
+        f"  {'Evaluator':<20} {'Model':<28} {'Runs':>5} {'Errors':>6} {'Cached':>6} "
+        f"{'p50':>7} {'p95':>7} {'Tokens in':>11} {'Tokens out':>11} {'Cost':>9}"
+    )
+    for s in summaries:
+        print(
+            f"  {s.evaluator:<20} {s.model:<28} {s.runs:>5} {s.errors:>6} {s.cached:>6} "
+            f"{seconds(s.p50_ms):>7} {seconds(s.p95_ms):>7} {s.prompt_tokens:>11,} "
+            f"{s.completion_tokens:>11,} {'$' + format(s.cost_usd, '.4f'):>9}"
+        )
+    return 0
+
+
 def check_citations(
     file_path: str,
     output_tasks: str | None = None,
@@ -2459,9 +2521,97 @@ def check_citations(
     return 0
 
 
+def run_multiple(
+    file_path: str,
+    evaluator_names: list[str],
+    evaluators: dict,
+    timeout: int | None = None,
+    no_cache: bool = False,
+) -> int:
+    """Run several evaluators on one file concurrently and print a verdict matrix.
+
+    Args:
+        file_path: File to evaluate
+        evaluator_names: Evaluator names or aliases to run
+        evaluators: Available evaluators (name/alias -> EvaluatorConfig)
+        timeout: Timeout per evaluator in seconds (None: each evaluator's own)
+        no_cache: Ignore cached responses
+
+    Returns:
+        0 if every evaluator passed, 1 otherwise
+    """
+    from adversarial_workflow.evaluators.multi import print_verdict_matrix, run_evaluators
+
+    unknown = [name for name in evaluator_names if name not in evaluators]
+    if unknown:
+        print(f"{RED}Error: Unknown evaluator(s): {', '.join(unknown)}{RESET}")
+        print("   Run 'adversarial list-evaluators' to see what is available")
+        return 1
+
+    if timeout is not None:
+        if timeout <= 0:
+            print(f"{RED}Error: Timeout must be positive (> 0), got {timeout}{RESET}")
+            return 1
+        if timeout > 600:
+            print(
+                f"{YELLOW}Warning: Timeout {timeout}s exceeds maximum (600s), clamping to 600s{RESET}"
+            )
+            timeout = 600
+
+    batch = run_evaluators(
+        [evaluators[name] for name in evaluator_names],
+        file_path,
+        timeout=timeout,
+        use_cache=not no_cache,
+    )
+    print_verdict_matrix(batch)
+    return batch.exit_code
+
+
+# Commands that always run in the invoking process: interactive setup,
+# the daemon itself, and commands that never load litellm
+_LOCAL_COMMANDS = {
+    "agent",
+    "check",
+    "check-citations",
+    "doctor",
+    "health",
+    "init",
+    "library",
+    "list-evaluators",
+    "quickstart",
+    "serve",
+    "split",
+    "stats",
+    "validate",
+}
+
+
 def main():
-    """Main CLI entry point."""
-    import logging
+    """Main CLI entry point.
+
+    When ``adversarial serve`` is running for the current project, model-calling
+    commands are forwarded to it; otherwise (or if it cannot be reached) they
+    run locally.
+    """
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    # --watch runs until interrupted; it would tie up the daemon indefinitely
+    if (
+        command
+        and not command.startswith("-")
+        and command not in _LOCAL_COMMANDS
+        and "--watch" not in sys.argv
+    ):
+        from adversarial_workflow.daemon import forward
+
+        exit_code = forward(sys.argv[1:])
+        if exit_code is not None:
+            return exit_code
+    return run_cli()
+
+
+def run_cli():
+    """Parse sys.argv and run the command in this process."""
     import sys
 
     # Load .env file before any commands run
@@ -2481,11 +2631,31 @@ def main():
         except (OSError, UnicodeDecodeError) as e:
             print(f"Warning: Could not load .env file: {e}", file=sys.stderr)
 
+    # Tracing is configured from the environment, so .env can enable it
+    from adversarial_workflow import tracing
+
+    tracing.configure()
+    try:
+        with tracing.span("adversarial.cli") as cli_span:
+            exit_code = _run_command()
+            cli_span.set_attribute("process.exit_code", exit_code)
+            return exit_code
+    finally:
+        tracing.shutdown()
+
+
+def _run_command():
+    """Build the parser, then parse sys.argv and dispatch the command."""
+    import logging
+
+    from adversarial_workflow import tracing
+
+    # Only discovery is needed to build the parser; the runner (and litellm)
+    # is imported once an evaluator command is actually dispatched
     from adversarial_workflow.evaluators import (
         BUILTIN_EVALUATORS,
         discover_local_evaluators,
         get_all_evaluators,
-        run_evaluator,
     )
 
     logger = logging.getLogger(__name__)
@@ -2505,6 +2675,9 @@ def main():
         "review",
         "list-evaluators",
         "check-citations",
+        "run",
+        "serve",
+        "stats",
     }
 
     parser = argparse.ArgumentParser(
@@ -2519,12 +2692,21 @@ Examples:
   adversarial agent onboard             # Set up agent coordination
   adversarial evaluate tasks/feat.md    # Evaluate plan
   adversarial proofread docs/guide.md   # Proofread teaching content
+  adversarial evaluate --batch 'tasks/**/*.md'  # Evaluate many files concurrently
+  adversarial evaluate --stream task.md         # Show output as it is generated
+  adversarial evaluate --chunked big-spec.md    # Map-reduce a large document
+  adversarial evaluate --watch tasks/feat.md    # Re-evaluate on every save
+  adversarial evaluate --incremental spec.md    # Send only changed sections
+  adversarial run -e evaluate -e proofread doc.md  # Several evaluators at once
   adversarial review <task_file>         # Review implementation
   adversarial validate "npm test"       # Validate with tests
   adversarial split large-task.md       # Split large files
   adversarial check-citations doc.md    # Verify URLs in document
   adversarial library list              # Browse available evaluators
   adversarial library install google/gemini-flash  # Install evaluator
+  adversarial library mirror lib.tar.gz # Offline copy for air-gapped CI
+  adversarial serve &                   # Keep a warm daemon for fast repeat calls
+  adversarial stats --days 7            # Latency, tokens and cost per evaluator
 
 For more information: https://github.com/movito/adversarial-workflow
         """,
@@ -2592,6 +2774,9 @@ For more information: https://github.com/movito/adversarial-workflow
     library_list_parser.add_argument(
         "--category", "-c", help="Filter by category (e.g., quick-check, deep-reasoning)"
     )
+    library_list_parser.add_argument(
+        "--search", "-s", help="Show evaluators whose name or description contains this text"
+    )
     library_list_parser.add_argument(
         "--verbose", "-v", action="store_true", help="Show detailed information"
     )
@@ -2666,6 +2851,20 @@ For more information: https://github.com/movito/adversarial-workflow
         "--no-cache", action="store_true", help="Bypass cache and fetch fresh data"
     )
 
+    # library mirror subcommand
+    library_mirror_parser = library_subparsers.add_parser(
+        "mirror", help="Download the whole library for offline use"
+    )
+    library_mirror_parser.add_argument(
+        "destination", help="Mirror directory, or .tar.gz archive to create"
+    )
+    library_mirror_parser.add_argument(
+        "--ref", help="Library ref (branch, tag or commit) to mirror (default: configured ref)"
+    )
+    library_mirror_parser.add_argument(
+        "--force", "-f", action="store_true", help="Replace an existing mirror"
+    )
+
     # review command
     review_parser = subparsers.add_parser("review", help="Run Phase 3: Code review")
     review_parser.add_argument("task_file", help="Task file path")
@@ -2735,6 +2934,57 @@ For more information: https://github.com/movito/adversarial-workflow
         help="Timeout per URL in seconds (default: 10)",
     )
 
+    # run command (several evaluators on one file)
+    run_parser = subparsers.add_parser(
+        "run",
+        help="Run several evaluators on one file concurrently",
+    )
+    run_parser.add_argument("file", help="File to evaluate")
+    run_parser.add_argument(
+        "--evaluator",
+        "-e",
+        action="append",
+        required=True,
+        metavar="NAME",
+        help="Evaluator to run (repeat for each evaluator)",
+    )
+    run_parser.add_argument(
+        "--timeout",
+        "-t",
+        type=int,
+        default=None,
+        help="Timeout per evaluator in seconds (default: each evaluator's own, max: 600)",
+    )
+    run_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached responses and always call the model",
+    )
+
+    # serve command (background daemon)
+    subparsers.add_parser(
+        "serve",
+        help="Keep evaluators and models warm; other invocations forward to it",
+        description=(
+            "Listen on .adversarial/daemon.sock and run forwarded evaluator "
+            "commands in this process. Set ADVERSARIAL_NO_DAEMON=1 to bypass it."
+        ),
+    )
+
+    # stats command (recorded evaluation metrics)
+    stats_parser = subparsers.add_parser(
+        "stats",
+        help="Summarize evaluation latency, tokens and cost from .adversarial/metrics/",
+    )
+    stats_parser.add_argument(
+        "--days",
+        type=int,
+        default=30,
+        help="Only include the last N days (default: 30, 0 for all)",
+    )
+    stats_parser.add_argument("--evaluator", "-e", help="Only include this evaluator")
+    stats_parser.add_argument("--json", action="store_true", help="Output in JSON format")
+
     # Dynamic evaluator registration
     try:
         evaluators = get_all_evaluators()
@@ -2775,7 +3025,7 @@ For more information: https://github.com/movito/adversarial-workflow
             help=config.description,
             aliases=aliases,
         )
-        eval_parser.add_argument("file", help="File to evaluate")
+        eval_parser.add_argument("file", nargs="?", help="File to evaluate")
         eval_parser.add_argument(
             "--timeout",
             "-t",
@@ -2788,6 +3038,52 @@ For more information: https://github.com/movito/adversarial-workflow
             action="store_true",
             help="Verify URLs in document before evaluation",
         )
+        eval_parser.add_argument(
+            "--batch",
+            nargs="+",
+            metavar="PATH",
+            help="Evaluate many files concurrently (paths or glob patterns, e.g. 'tasks/**/*.md')",
+        )
+        eval_parser.add_argument(
+            "--concurrency",
+            "-j",
+            type=int,
+            default=4,
+            help="Worker pool size for --batch and --chunked (default: 4)",
+        )
+        eval_parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Ignore cached responses and always call the model",
+        )
+        eval_parser.add_argument(
+            "--stream",
+            action="store_true",
+            help="Write output and echo it to the terminal as tokens arrive",
+        )
+        eval_parser.add_argument(
+            "--chunked",
+            action="store_true",
+            help="Evaluate a large file section by section in parallel, then merge",
+        )
+        eval_parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Send only the sections changed since the last evaluation, "
+            "with that evaluation as context",
+        )
+        eval_parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="Re-evaluate the file (or Markdown files under a directory) whenever it changes",
+        )
+        eval_parser.add_argument(
+            "--chunk-lines",
+            type=int,
+            default=500,
+            metavar="N",
+            help="Maximum lines per section for --chunked (default: 500)",
+        )
         # Add --evaluator flag for the "evaluate" command only
         # This allows selecting a library-installed evaluator
         if config.name == "evaluate":
@@ -2801,6 +3097,7 @@ For more information: https://github.com/movito/adversarial-workflow
         eval_parser.set_defaults(evaluator_config=config)
 
     args = parser.parse_args()
+    tracing.current_span().set_attribute("adversarial.command", args.command)
 
     if not args.command:
         parser.print_help()
@@ -2862,6 +3159,60 @@ For more information: https://github.com/movito/adversarial-workflow
         # Log actual timeout and source
         print(f"Using timeout: {timeout}s ({source})")
 
+        batch_patterns = getattr(args, "batch", None)
+        if batch_patterns and args.chunked:
+            print(f"{RED}Error: --chunked cannot be combined with --batch{RESET}")
+            return 1
+        if args.watch and (batch_patterns or args.chunked):
+            print(f"{RED}Error: --watch cannot be combined with --batch or --chunked{RESET}")
+            return 1
+        if args.incremental and (batch_patterns or args.chunked or args.watch):
+            print(
+                f"{RED}Error: --incremental cannot be combined with "
+                f"--batch, --chunked or --watch{RESET}"
+            )
+            return 1
+        if getattr(args, "stream", False) and (
+            batch_patterns or args.chunked or args.incremental or args.watch
+        ):
+            print(
+                f"{RED}Error: --stream cannot be combined with "
+                f"--batch, --chunked, --incremental or --watch{RESET}"
+            )
+            return 1
+        if batch_patterns:
+            from adversarial_workflow.evaluators.batch import (
+                expand_file_patterns,
+                print_batch_summary,
+                run_evaluator_batch,
+            )
+
+            if args.file:
+                batch_patterns = [args.file, *batch_patterns]
+            if args.concurrency < 1:
+                print(f"{RED}Error: Concurrency must be at least 1, got {args.concurrency}{RESET}")
+                return 1
+            files = expand_file_patterns(batch_patterns)
+            if not files:
+                print(f"{RED}Error: No files matched: {' '.join(batch_patterns)}{RESET}")
+                return 1
+            print()
+            batch = run_evaluator_batch(
+                config_to_use,
+                files,
+                timeout=timeout,
+                concurrency=args.concurrency,
+                use_cache=not args.no_cache,
+            )
+            print_batch_summary(batch)
+            return batch.exit_code
+
+        if not args.file:
+            print(f"{RED}Error: No file specified{RESET}")
+            print(f"   Usage: adversarial {args.command} <file>")
+            print(f"      or: adversarial {args.command} --batch <path-or-glob> ...")
+            return 1
+
         # Check citations first if requested (read-only, doesn't modify file)
         if getattr(args, "check_citations", False):
             print()
@@ -2872,10 +3223,56 @@ For more information: https://github.com/movito/adversarial-workflow
                 )
             print()
 
+        if args.watch:
+            from adversarial_workflow.evaluators.watch import run_evaluator_watch
+
+            return run_evaluator_watch(
+                config_to_use,
+                [args.file],
+                timeout=timeout,
+                use_cache=not args.no_cache,
+            )
+
+        if args.incremental:
+            from adversarial_workflow.evaluators.incremental import run_evaluator_incremental
+
+            return run_evaluator_incremental(
+                config_to_use,
+                args.file,
+                timeout=timeout,
+                use_cache=not args.no_cache,
+            )
+
+        if args.chunked:
+            from adversarial_workflow.evaluators.chunked import run_evaluator_chunked
+
+            if args.chunk_lines < 1 or args.concurrency < 1:
+                print(f"{RED}Error: --chunk-lines and --concurrency must be at least 1{RESET}")
+                return 1
+            return run_evaluator_chunked(
+                config_to_use,
+                args.file,
+                timeout=timeout,
+                max_lines=args.chunk_lines,
+                concurrency=args.concurrency,
+                use_cache=not args.no_cache,
+            )
+
+        from adversarial_workflow.evaluators import run_evaluator
+
+        # Only pass options that differ from run_evaluator() defaults
+        run_options = {}
+        if getattr(args, "no_cache", False):
+            run_options["use_cache"] = False
+        if getattr(args, "stream", False):
+            run_options["stream"] = True
+            run_options["echo"] = True
+
         return run_evaluator(
             config_to_use,
             args.file,
             timeout=timeout,
+            **run_options,
         )
 
     # Execute static commands
@@ -2905,6 +3302,7 @@ For more information: https://github.com/movito/adversarial-workflow
             library_info,
             library_install,
             library_list,
+            library_mirror,
             library_update,
         )
 
@@ -2914,6 +3312,7 @@ For more information: https://github.com/movito/adversarial-workflow
                 category=args.category,
                 verbose=args.verbose,
                 no_cache=args.no_cache,
+                search=args.search,
             )
         elif args.library_subcommand == "info":
             return library_info(
@@ -2942,6 +3341,12 @@ For more information: https://github.com/movito/adversarial-workflow
                 no_cache=args.no_cache,
                 dry_run=args.dry_run,
             )
+        elif args.library_subcommand == "mirror":
+            return library_mirror(
+                destination=args.destination,
+                ref=args.ref,
+                force=args.force,
+            )
         else:
             # No subcommand provided
             print(f"{RED}Error: library command requires a subcommand{RESET}")
@@ -2951,6 +3356,7 @@ For more information: https://github.com/movito/adversarial-workflow
             print("  adversarial library install <provider>/<name>")
             print("  adversarial library check-updates")
             print("  adversarial library update <name>")
+            print("  adversarial library mirror <directory-or-archive>")
             return 1
     elif args.command == "review":
         return review(args.task_file)
@@ -2965,6 +3371,20 @@ For more information: https://github.com/movito/adversarial-workflow
         )
     elif args.command == "list-evaluators":
         return list_evaluators()
+    elif args.command == "run":
+        return run_multiple(
+            args.file,
+            args.evaluator,
+            evaluators,
+            timeout=args.timeout,
+            no_cache=args.no_cache,
+        )
+    elif args.command == "serve":
+        from adversarial_workflow.daemon import serve
+
+        return serve()
+    elif args.command == "stats":
+        return stats(days=args.days, evaluator=args.evaluator, json_output=args.json)
     elif args.command == "check-citations":
         return check_citations(
             args.file,
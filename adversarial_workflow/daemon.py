@@ -0,0 +1,332 @@
+"""Background server that keeps the CLI warm between invocations.
+
+Every ``adversarial`` invocation pays for interpreter startup, .env loading,
+evaluator discovery and the litellm import before it does any work. Agent
+harnesses that run dozens of evaluations per task pay that on every call.
+
+``adversarial serve`` imports litellm and the evaluator runner once, then
+listens on a Unix socket in the project::
+
+    .adversarial/daemon.sock
+
+While it is running, the ``adversarial`` entry point forwards model-calling
+commands to it (see forward()): the client sends its argv, working directory
+and environment, and the server runs the command in-process and streams
+stdout/stderr back, followed by the exit code. LiteLLM's HTTP clients and the
+parsed evaluator registry stay in memory between requests.
+
+Requests are handled one at a time because a command runs against
+process-wide state (cwd, environment, sys.stdout). Use ``--batch`` or
+``adversarial run`` for concurrency within one request. The command sees
+the client's stdin: ``isatty()`` reports the client terminal, and reads (such
+as the large-file confirmation prompt) are answered by the client, so an
+interactive user is prompted exactly as in a local run.
+
+Set ADVERSARIAL_NO_DAEMON=1 to always run commands locally.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import traceback
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from .utils.colors import GREEN, RED, RESET
+
+DAEMON_SOCKET = ".adversarial/daemon.sock"
+
+# Set to any non-empty value to disable forwarding
+NO_DAEMON_ENV = "ADVERSARIAL_NO_DAEMON"
+
+# How often serve_forever() checks for shutdown while idle
+_POLL_INTERVAL = 0.5
+
+
+def forward(argv: list[str], path: Path | str = DAEMON_SOCKET) -> int | None:
+    """Run a command on the project's daemon, streaming its output here.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+        path: Daemon socket path
+
+    Returns:
+        The command's exit code, or None if no daemon is reachable (the
+        caller should then run the command locally)
+    """
+    if os.environ.get(NO_DAEMON_ENV) or not os.path.exists(path):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+
+    streams = {"stdout": sys.stdout, "stderr": sys.stderr}
+    stdin = sys.stdin
+    request = {
+        "argv": list(argv),
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+        "tty": _isatty(stdin),
+    }
+    with sock, sock.makefile("rb") as replies:
+        try:
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            for line in replies:
+                message = json.loads(line)
+                if "exit" in message:
+                    return int(message["exit"])
+                if "read" in message:
+                    # The command is reading stdin (e.g. a confirmation prompt)
+                    data = stdin.readline() if stdin else ""
+                    sock.sendall(json.dumps({"data": data}).encode("utf-8") + b"\n")
+                    continue
+                stream = streams.get(message.get("stream"), streams["stdout"])
+                stream.write(message.get("data", ""))
+                stream.flush()
+        except (OSError, ValueError) as e:
+            print(f"{RED}Error: Lost connection to adversarial daemon: {e}{RESET}", file=sys.stderr)
+            return 1
+    print(f"{RED}Error: adversarial daemon closed the connection{RESET}", file=sys.stderr)
+    return 1
+
+
+class DaemonServer:
+    """Unix-socket server that runs forwarded CLI commands in-process."""
+
+    def __init__(
+        self,
+        path: Path | str = DAEMON_SOCKET,
+        run_command: Callable[[], int] | None = None,
+    ):
+        """
+        Args:
+            path: Socket path to listen on
+            run_command: Runs the command in sys.argv and returns its exit
+                code (default: the CLI's local dispatcher)
+        """
+        self.path = Path(path)
+        self._run_command = run_command
+        self._stopped = threading.Event()
+        self._listener: socket.socket | None = None
+
+    def bind(self) -> None:
+        """Create the listening socket, replacing a stale one.
+
+        Raises:
+            RuntimeError: If another daemon is already serving this path
+        """
+        if self.path.exists():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.path))
+            except OSError:
+                self.path.unlink()
+            else:
+                raise RuntimeError(f"A daemon is already running on {self.path}")
+            finally:
+                probe.close()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Requests carry the client's environment (API keys): owner only
+        old_umask = os.umask(0o177)
+        try:
+            listener.bind(str(self.path))
+        finally:
+            os.umask(old_umask)
+        listener.listen()
+        listener.settimeout(_POLL_INTERVAL)
+        self._listener = listener
+
+    def serve_forever(self) -> None:
+        """Handle requests one at a time until shutdown() is called."""
+        if self._listener is None:
+            self.bind()
+        try:
+            while not self._stopped.is_set():
+                try:
+                    conn, _ = self._listener.accept()
+                except TimeoutError:
+                    continue
+                with conn:
+                    conn.settimeout(None)
+                    self._handle(conn)
+        finally:
+            self._listener.close()
+            with contextlib.suppress(FileNotFoundError):
+                self.path.unlink()
+
+    def shutdown(self) -> None:
+        """Stop serve_forever() after the current request."""
+        self._stopped.set()
+
+    def _handle(self, conn: socket.socket) -> None:
+        with conn.makefile("rb") as reader:
+            self._handle_request(reader, _Sender(conn))
+
+    def _handle_request(self, reader: io.BufferedReader, send: _Sender) -> None:
+        try:
+            request = json.loads(reader.readline())
+            argv = [str(a) for a in request["argv"]]
+        except (ValueError, KeyError, TypeError):
+            return
+
+        try:
+            with _request_context(request, send, reader):
+                try:
+                    exit_code = self._dispatch(argv)
+                except SystemExit as e:
+                    exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                except Exception:
+                    traceback.print_exc()
+                    exit_code = 1
+        except OSError as e:
+            send({"stream": "stderr", "data": f"{RED}Error: {e}{RESET}\n"})
+            exit_code = 1
+        send({"exit": exit_code})
+
+    def _dispatch(self, argv: list[str]) -> int:
+        sys.argv = ["adversarial", *argv]
+        if self._run_command is not None:
+            return self._run_command()
+        from .cli import run_cli
+
+        return run_cli()
+
+
+def serve(path: Path | str = DAEMON_SOCKET) -> int:
+    """Warm up and serve forwarded commands until interrupted (``adversarial serve``)."""
+    server = DaemonServer(path)
+    try:
+        server.bind()
+    except (RuntimeError, OSError) as e:
+        print(f"{RED}Error: {e}{RESET}")
+        return 1
+
+    # The slow imports the daemon exists to amortize
+    from .evaluators import get_all_evaluators, runner  # noqa: F401
+
+    with contextlib.suppress(Exception):
+        get_all_evaluators()
+
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: server.shutdown())
+
+    print(f"{GREEN}Serving on {server.path}{RESET} (Ctrl-C to stop)")
+    with contextlib.suppress(KeyboardInterrupt):
+        server.serve_forever()
+    print("Daemon stopped.")
+    return 0
+
+
+class _Sender:
+    """Writes newline-delimited JSON messages to a client connection.
+
+    After the client disconnects, messages are dropped so the running
+    command still completes (and writes its output file).
+    """
+
+    def __init__(self, conn: socket.socket):
+        self._conn = conn
+        self._lock = threading.Lock()
+        self._connected = True
+
+    def __call__(self, message: dict[str, Any]) -> None:
+        data = json.dumps(message).encode("utf-8") + b"\n"
+        with self._lock:
+            if not self._connected:
+                return
+            try:
+                self._conn.sendall(data)
+            except OSError:
+                self._connected = False
+
+
+class _StreamWriter(io.TextIOBase):
+    """Text stream that forwards writes to the client as ``stream`` messages."""
+
+    def __init__(self, send: _Sender, name: str):
+        self._send = send
+        self._name = name
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        if s:
+            self._send({"stream": self._name, "data": s})
+        return len(s)
+
+
+class _ClientStdin(io.TextIOBase):
+    """Text stream that reads lines from the client's stdin on demand.
+
+    Each readline() sends a ``read`` message; the client answers with one
+    line of its own stdin ("" at end of input).
+    """
+
+    def __init__(self, send: _Sender, reader: io.BufferedReader, tty: bool):
+        self._send = send
+        self._reader = reader
+        self._tty = tty
+
+    def readable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def readline(self, size: int | None = -1) -> str:
+        self._send({"read": True})
+        try:
+            data = json.loads(self._reader.readline())["data"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return ""  # client gone: behave like end of input
+        data = str(data)
+        return data if size is None or size < 0 else data[:size]
+
+
+def _isatty(stream) -> bool:
+    try:
+        return bool(stream and stream.isatty())
+    except (AttributeError, ValueError):
+        return False
+
+
+@contextlib.contextmanager
+def _request_context(
+    request: dict[str, Any], send: _Sender, reader: io.BufferedReader
+) -> Iterator[None]:
+    """Run the block with the client's cwd, environment and standard streams."""
+    saved_cwd = os.getcwd()
+    saved_env = dict(os.environ)
+    saved_argv = sys.argv
+    saved_streams = sys.stdin, sys.stdout, sys.stderr
+    try:
+        os.chdir(request.get("cwd") or saved_cwd)
+        env = request.get("env")
+        if isinstance(env, dict):
+            os.environ.clear()
+            os.environ.update({str(k): str(v) for k, v in env.items()})
+        sys.stdin = _ClientStdin(send, reader, bool(request.get("tty")))
+        sys.stdout = _StreamWriter(send, "stdout")
+        sys.stderr = _StreamWriter(send, "stderr")
+        yield
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = saved_streams
+        sys.argv = saved_argv
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
@@ -3,17 +3,46 @@
 Supports dual-field model specification (ADV-0015):
 - Legacy: model + api_key_env fields (backwards compatible)
 - New: model_requirement field (resolved via ModelResolver)
+
+The execution modules (runner, batch, chunked, incremental, multi, transport,
+watch) import litellm, which takes seconds to load. They are imported on first
+attribute access so that evaluator discovery and CLI startup stay fast.
 """
 
+from importlib import import_module
+
+from .. import tracing
 from .builtins import BUILTIN_EVALUATORS
-from .config import EvaluatorConfig, ModelRequirement
+from .config import EvaluatorConfig, ModelRequirement, RetryPolicy
 from .discovery import (
     EvaluatorParseError,
     discover_local_evaluators,
     parse_evaluator_yaml,
 )
 from .resolver import ModelResolver, ResolutionError
-from .runner import run_evaluator
+
+# Public name -> submodule, loaded lazily by __getattr__
+_LAZY_ATTRS = {
+    "BatchResult": "batch",
+    "run_evaluator_batch": "batch",
+    "run_evaluator_chunked": "chunked",
+    "run_evaluator_incremental": "incremental",
+    "run_evaluators": "multi",
+    "EvaluationResult": "runner",
+    "run_evaluator": "runner",
+    "run_evaluator_async": "runner",
+    "connection_pool_stats": "transport",
+    "run_evaluator_watch": "watch",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
 
 
 def get_all_evaluators() -> dict[str, EvaluatorConfig]:
@@ -32,7 +61,9 @@ def get_all_evaluators() -> dict[str, EvaluatorConfig]:
     evaluators.update(BUILTIN_EVALUATORS)
 
     # Discover and add local evaluators (may override built-ins)
-    local = discover_local_evaluators()
+    with tracing.span("adversarial.discover_evaluators") as span:
+        local = discover_local_evaluators()
+        span.set_attribute("adversarial.evaluators.local", len(local))
     for name, config in local.items():
         if name in BUILTIN_EVALUATORS:
             logger.info("Local evaluator '%s' overrides built-in", name)
@@ -43,13 +74,23 @@ def get_all_evaluators() -> dict[str, EvaluatorConfig]:
 
 __all__ = [
     "BUILTIN_EVALUATORS",
+    "BatchResult",
+    "EvaluationResult",
     "EvaluatorConfig",
     "EvaluatorParseError",
     "ModelRequirement",
     "ModelResolver",
     "ResolutionError",
+    "RetryPolicy",
+    "connection_pool_stats",
     "discover_local_evaluators",
     "get_all_evaluators",
     "parse_evaluator_yaml",
     "run_evaluator",
+    "run_evaluator_async",
+    "run_evaluator_batch",
+    "run_evaluator_chunked",
+    "run_evaluator_incremental",
+    "run_evaluator_watch",
+    "run_evaluators",
 ]
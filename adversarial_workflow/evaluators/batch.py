@@ -0,0 +1,288 @@
+"""Batch evaluation: run one evaluator across many files concurrently.
+
+Files are fanned out over a bounded thread pool. Each model call also holds a
+slot from a per-provider semaphore, so a large pool never opens more than the
+configured number of concurrent requests against one provider.
+
+Wall-clock time is roughly ``slowest_file * ceil(files / concurrency)`` instead
+of the sum of every model latency.
+
+Outputs are named as for single runs (``{basename}-{suffix}.md``). Files that
+share a basename, such as ``a/README.md`` and ``b/README.md``, get a short hash
+of their path appended to the suffix instead, so they do not overwrite each
+other's output.
+
+Per-provider caps can be set in .adversarial/config.yml::
+
+    provider_concurrency:
+      openai: 8
+      gemini: 2
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import glob
+import hashlib
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..utils.colors import BOLD, GREEN, RED, RESET, YELLOW
+from .config import EvaluatorConfig
+from .ratelimit import ProviderLimiter
+from .runner import (
+    _PASS_VERDICTS,
+    _REJECT_VERDICTS,
+    _REVISE_VERDICTS,
+    EvaluationResult,
+    _check_file_size,
+    _confirm_large_file,
+    _evaluate_file,
+    _fits_context,
+    _normalize_output_suffix,
+    _prepare_run,
+)
+from .transport import PoolStats, connection_pool_stats
+
+DEFAULT_CONCURRENCY = 4
+
+# EvaluationResult.error for files skipped at the large-file prompt
+CANCELLED = "Cancelled"
+# EvaluationResult.error for files that cannot fit the model's context window
+TOO_LARGE = "Exceeds context window"
+
+
+@dataclass
+class BatchResult:
+    """Aggregate outcome of a batch run."""
+
+    results: list[EvaluationResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    connections: PoolStats | None = None
+
+    @property
+    def verdict_counts(self) -> Counter:
+        """Count of results per verdict ('ERROR' for failed calls, 'NONE' if undetected)."""
+        counts: Counter = Counter()
+        for r in self.results:
+            if r.error == CANCELLED:
+                counts["CANCELLED"] += 1
+            elif r.error:
+                counts["ERROR"] += 1
+            else:
+                counts[r.verdict or "NONE"] += 1
+        return counts
+
+    @property
+    def input_tokens(self) -> tuple[int, int]:
+        """(input, cached input) tokens summed over results that reported usage."""
+        total = sum(r.input_tokens or 0 for r in self.results)
+        cached = sum(r.cached_input_tokens or 0 for r in self.results)
+        return total, cached
+
+    @property
+    def exit_code(self) -> int:
+        """0 if every file passed, 1 otherwise."""
+        return 0 if all(r.exit_code == 0 for r in self.results) else 1
+
+
+def expand_file_patterns(patterns: list[str]) -> list[str]:
+    """Expand glob patterns (including ``**``) into a de-duplicated file list.
+
+    Patterns are usually expanded by the shell already; quoted patterns are
+    expanded here. Plain paths that do not exist are kept so the caller can
+    report them as missing.
+    """
+    files: list[str] = []
+    seen: set[str] = set()
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(m for m in glob.glob(pattern, recursive=True) if os.path.isfile(m))
+        else:
+            matches = [pattern]
+        for match in matches:
+            if match not in seen:
+                seen.add(match)
+                files.append(match)
+    return files
+
+
+def run_evaluator_batch(
+    config: EvaluatorConfig,
+    file_paths: list[str],
+    timeout: int = 180,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    provider_concurrency: int | None = None,
+    use_cache: bool = True,
+) -> BatchResult:
+    """Run one evaluator over many files using a bounded worker pool.
+
+    Model resolution, API-key checks and large-file confirmation happen once,
+    up front and serially; only the model calls run concurrently.
+
+    Args:
+        config: Evaluator configuration
+        file_paths: Files to evaluate
+        timeout: Timeout per model call in seconds
+        concurrency: Worker pool size
+        provider_concurrency: Maximum concurrent calls per provider (default:
+            same as concurrency). Overridden per provider by the
+            ``provider_concurrency`` mapping in .adversarial/config.yml.
+        use_cache: Serve unchanged files from the response cache
+
+    Returns:
+        BatchResult with one EvaluationResult per input file, in input order
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+    batch = BatchResult()
+    start = time.monotonic()
+
+    prepared = _prepare_run(config)
+    if prepared is None:
+        batch.results = [
+            EvaluationResult(file_path=f, evaluator=config.name, exit_code=1, error="Setup failed")
+            for f in file_paths
+        ]
+        return batch
+    project_config, resolved_model, resolved_api_key_env = prepared
+
+    limiter = ProviderLimiter.from_project_config(
+        project_config, provider_concurrency or concurrency
+    )
+
+    # Serial pre-flight: missing files, context window and large-file confirmation
+    results: dict[int, EvaluationResult] = {}
+    to_run: list[tuple[int, str]] = []
+    for i, file_path in enumerate(file_paths):
+        if not os.path.isfile(file_path):
+            results[i] = EvaluationResult(
+                file_path=file_path, evaluator=config.name, exit_code=1, error="File not found"
+            )
+            continue
+        line_count, tokens = _check_file_size(file_path, resolved_model)
+        if not _fits_context(config, file_path, resolved_model, tokens):
+            results[i] = EvaluationResult(
+                file_path=file_path, evaluator=config.name, exit_code=1, error=TOO_LARGE
+            )
+        elif not _confirm_large_file(line_count, tokens):
+            results[i] = EvaluationResult(
+                file_path=file_path, evaluator=config.name, exit_code=0, error=CANCELLED
+            )
+        else:
+            to_run.append((i, file_path))
+
+    stems = Counter(Path(path).stem for _, path in to_run)
+
+    def _worker(file_path: str) -> EvaluationResult:
+        file_config = config
+        if stems[Path(file_path).stem] > 1:
+            file_config = _distinct_output_config(config, file_path)
+        return _evaluate_file(
+            file_config,
+            file_path,
+            project_config,
+            timeout,
+            resolved_model,
+            resolved_api_key_env,
+            quiet=True,
+            use_cache=use_cache,
+            limiter=limiter,
+        )
+
+    prefix = config.log_prefix or config.name.upper()
+    print(f"{prefix}: Evaluating {len(to_run)} file(s) with {resolved_model}")
+    print(f"   Concurrency: {concurrency} workers")
+    print()
+
+    pool_before = _pool_totals()
+    done = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {pool.submit(_worker, path): i for i, path in to_run}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = EvaluationResult(
+                    file_path=file_paths[i], evaluator=config.name, exit_code=1, error=str(e)
+                )
+            results[i] = result
+            done += 1
+            print(f"   [{done}/{len(to_run)}] {format_status(result)}  {result.file_path}")
+
+    batch.results = [results[i] for i in range(len(file_paths))]
+    batch.elapsed = time.monotonic() - start
+    pool_after = _pool_totals()
+    if pool_after.requests > pool_before.requests:
+        batch.connections = PoolStats(
+            requests=pool_after.requests - pool_before.requests,
+            hits=pool_after.hits - pool_before.hits,
+            misses=pool_after.misses - pool_before.misses,
+        )
+    return batch
+
+
+def _distinct_output_config(config: EvaluatorConfig, file_path: str) -> EvaluatorConfig:
+    """Return ``config`` with a path hash added to its output suffix.
+
+    Used for files whose basename another file in the batch shares.
+    """
+    path_hash = hashlib.sha256(os.path.normpath(file_path).encode("utf-8")).hexdigest()[:8]
+    suffix = _normalize_output_suffix(config.output_suffix)
+    return dataclasses.replace(config, output_suffix=f"{suffix}-{path_hash}")
+
+
+def _pool_totals() -> PoolStats:
+    """Sum the shared connection pools' counters over all providers."""
+    total = PoolStats()
+    for stats in connection_pool_stats().values():
+        total.requests += stats.requests
+        total.hits += stats.hits
+        total.misses += stats.misses
+    return total
+
+
+def format_status(result: EvaluationResult) -> str:
+    """Return a colored, fixed-width status label for one result."""
+    if result.error:
+        return f"{RED}{'ERROR':<18}{RESET}"
+    verdict = result.verdict or "NO VERDICT"
+    if verdict in _PASS_VERDICTS:
+        color = GREEN
+    elif verdict in _REVISE_VERDICTS:
+        color = YELLOW
+    elif verdict in _REJECT_VERDICTS:
+        color = RED
+    else:
+        color = YELLOW
+    return f"{color}{verdict:<18}{RESET}"
+
+
+def print_batch_summary(batch: BatchResult) -> None:
+    """Print aggregate verdicts and per-file failures for a batch run."""
+    print()
+    print(f"{BOLD}Batch summary{RESET} ({len(batch.results)} files, {batch.elapsed:.1f}s)")
+    for verdict, count in sorted(batch.verdict_counts.items()):
+        print(f"   {verdict:<18} {count}")
+    total, cached = batch.input_tokens
+    if total:
+        print(f"   Input tokens: {total:,} ({cached:,} cached, {total - cached:,} uncached)")
+    if batch.connections is not None:
+        c = batch.connections
+        print(
+            f"   HTTP requests: {c.requests} ({c.hits} on reused connections, "
+            f"{c.misses} opened new; {c.hit_rate:.0%} reuse)"
+        )
+
+    failures = [r for r in batch.results if r.error and r.error != CANCELLED]
+    if failures:
+        print()
+        print(f"{RED}Errors:{RESET}")
+        for r in failures:
+            print(f"   {r.file_path}: {r.error}")
@@ -0,0 +1,156 @@
+"""Content-addressed on-disk cache for evaluator LLM responses.
+
+Re-running an evaluator on an unchanged file returns the stored response
+instead of paying the model latency and token cost again. Entries are keyed
+on a hash of (resolved model, evaluator prompt, evaluator version, file
+content), so any change to one of them is a miss.
+
+Configured in .adversarial/config.yml (all keys optional)::
+
+    response_cache:
+      enabled: true
+      ttl: 604800          # seconds (default: 7 days)
+      max_size_mb: 100     # LRU eviction above this size
+      directory: .adversarial/cache/responses
+
+Bypass per run with ``--no-cache`` on evaluator subcommands.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..utils.files import atomic_write, evict_lru, mark_used
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESPONSE_CACHE_DIR = ".adversarial/cache/responses"
+DEFAULT_RESPONSE_CACHE_TTL = 7 * 24 * 3600  # 7 days
+DEFAULT_RESPONSE_CACHE_MAX_MB = 100
+
+
+@dataclass
+class ResponseCacheConfig:
+    """Settings for the response cache (``response_cache`` in config.yml)."""
+
+    enabled: bool = True
+    ttl: int = DEFAULT_RESPONSE_CACHE_TTL
+    max_size_mb: float = DEFAULT_RESPONSE_CACHE_MAX_MB
+    directory: str = DEFAULT_RESPONSE_CACHE_DIR
+
+    @classmethod
+    def from_project_config(cls, project_config: dict[str, Any]) -> ResponseCacheConfig:
+        """Build from the loaded project config, ignoring invalid values."""
+        config = cls()
+        data = project_config.get("response_cache")
+        if not isinstance(data, dict):
+            return config
+        if isinstance(data.get("enabled"), bool):
+            config.enabled = data["enabled"]
+        elif "enabled" in data:
+            # YAML strings like "false" are truthy; don't guess what was meant
+            logger.warning(
+                "Ignoring response_cache.enabled=%r: expected true or false", data["enabled"]
+            )
+        with contextlib.suppress(TypeError, ValueError):
+            if "ttl" in data:
+                config.ttl = int(data["ttl"])
+        with contextlib.suppress(TypeError, ValueError):
+            if "max_size_mb" in data:
+                config.max_size_mb = float(data["max_size_mb"])
+        if data.get("directory"):
+            config.directory = str(data["directory"])
+        return config
+
+
+class ResponseCache:
+    """One JSON file per response; LRU eviction by mtime above a byte budget."""
+
+    def __init__(
+        self,
+        directory: Path,
+        ttl: int = DEFAULT_RESPONSE_CACHE_TTL,
+        max_bytes: int = DEFAULT_RESPONSE_CACHE_MAX_MB * 1024 * 1024,
+    ):
+        """
+        Args:
+            directory: Directory holding cache entries
+            ttl: Entry lifetime in seconds (<= 0 disables expiry)
+            max_bytes: Total size budget; least recently used entries are evicted
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_project_config(cls, project_config: dict[str, Any]) -> ResponseCache | None:
+        """Return a cache for the project, or None if disabled in config."""
+        settings = ResponseCacheConfig.from_project_config(project_config)
+        if not settings.enabled:
+            return None
+        return cls(
+            Path(settings.directory),
+            ttl=settings.ttl,
+            max_bytes=int(settings.max_size_mb * 1024 * 1024),
+        )
+
+    @staticmethod
+    def make_key(model: str, prompt: str, version: str, content: str) -> str:
+        """Return the content-addressed key for one evaluation request."""
+        payload = json.dumps([model, prompt, version, content], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response text, or None on miss or expiry."""
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if not isinstance(entry, dict) or not isinstance(entry.get("output"), str):
+            return None
+        if self.ttl > 0 and time.time() - entry.get("created", 0) > self.ttl:
+            with contextlib.suppress(OSError):
+                path.unlink()
+            return None
+
+        mark_used(path)
+        return entry["output"]
+
+    def set(self, key: str, output: str, model: str = "") -> bool:
+        """Store a response atomically, then evict down to the size budget."""
+        entry = {"output": output, "model": model, "created": time.time()}
+        try:
+            with atomic_write(self._entry_path(key), encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning("Could not write response cache entry: %s", e)
+            return False
+
+        self._evict()
+        return True
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits max_bytes."""
+        evict_lru(self.directory.glob("*.json"), self.max_bytes)
+
+    def clear(self) -> int:
+        """Delete all entries. Returns the number removed."""
+        count = 0
+        for path in self.directory.glob("*.json"):
+            with contextlib.suppress(OSError):
+                path.unlink()
+                count += 1
+        return count
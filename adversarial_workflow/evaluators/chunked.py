@@ -0,0 +1,234 @@
+"""Chunked (map-reduce) evaluation of large documents.
+
+Instead of sending a very large file as one prompt, the document is split at
+section boundaries with utils.file_splitter.split_by_sections(). Each part is
+evaluated concurrently (map), then a final call merges the per-part reports
+into one evaluation with a single verdict (reduce).
+
+Each part stays well under per-request token limits. Wall-clock time is
+roughly one part evaluation plus the merge, whatever the document size.
+
+Output files, in the evaluator's log directory::
+
+    {basename}-{suffix}-PART1.md ... PARTn.md   # per-part evaluations
+    {basename}-{suffix}.md                      # merged evaluation
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from ..utils.colors import RED, RESET, YELLOW
+from ..utils.file_splitter import split_by_sections
+from .batch import DEFAULT_CONCURRENCY, format_status
+from .config import EvaluatorConfig
+from .ratelimit import ProviderLimiter
+from .runner import (
+    _PASS_VERDICTS,
+    _REJECT_VERDICTS,
+    _REVISE_VERDICTS,
+    EvaluationResult,
+    _evaluate_file,
+    _normalize_output_suffix,
+    _prepare_run,
+    _report_verdict,
+)
+
+# Maximum lines per part (split_by_sections prefers section boundaries past 80%)
+DEFAULT_CHUNK_LINES = 500
+
+_PART_SCOPE = """\
+## Scope of This Review
+
+This is part {index} of {total} of {file_path} (lines {start}-{end}). The document
+was split at section boundaries because of its size; the other parts are reviewed
+separately and the findings merged afterwards. Evaluate only this part, do not
+report content as missing when it may appear in another part, and end with a
+verdict in the required format.
+"""
+
+_MERGE_INSTRUCTIONS = """\
+## Merge Instructions
+
+{file_path} was too large for a single review, so it was split into {total} parts
+and each part was evaluated separately with the instructions above. The document
+below contains those per-part evaluations, not the original text.
+
+Merge them into one evaluation of the whole document: combine and deduplicate
+findings, drop concerns that another part resolves, and give a single overall
+verdict in the required format.
+"""
+
+
+def run_evaluator_chunked(
+    config: EvaluatorConfig,
+    file_path: str,
+    timeout: int = 180,
+    max_lines: int = DEFAULT_CHUNK_LINES,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    use_cache: bool = True,
+) -> int:
+    """Evaluate a large file part by part, then merge the results.
+
+    Files that fit in one part are evaluated normally. No large-file
+    confirmation is needed: every request stays within ``max_lines``.
+
+    Args:
+        config: Evaluator configuration
+        file_path: Path to file to evaluate
+        timeout: Timeout per model call in seconds
+        max_lines: Maximum lines per part
+        concurrency: Maximum parts evaluated at once
+        use_cache: Serve unchanged parts from the response cache
+
+    Returns:
+        0 on success, non-zero on failure
+    """
+    if max_lines < 1:
+        raise ValueError(f"max_lines must be >= 1, got {max_lines}")
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+    prefix = config.log_prefix or config.name.upper()
+    print(f"{prefix}: Evaluating {file_path} (chunked)")
+    print()
+
+    if not os.path.exists(file_path):
+        print(f"{RED}Error: File not found: {file_path}{RESET}")
+        return 1
+
+    prepared = _prepare_run(config)
+    if prepared is None:
+        return 1
+    project_config, resolved_model, resolved_api_key_env = prepared
+
+    content = Path(file_path).read_text(encoding="utf-8")
+    parts = split_by_sections(content, max_lines=max_lines)
+
+    if len(parts) == 1:
+        print(f"{prefix}: Fits in one request ({parts[0]['line_count']} lines), not chunking")
+        result = _evaluate_file(
+            config,
+            file_path,
+            project_config,
+            timeout,
+            resolved_model,
+            resolved_api_key_env,
+            use_cache=use_cache,
+        )
+        return result.exit_code
+
+    # Map: evaluate every part concurrently
+    limiter = ProviderLimiter.from_project_config(project_config, concurrency)
+    suffix = _normalize_output_suffix(config.output_suffix)
+
+    def _evaluate_part(index: int, part: dict) -> EvaluationResult:
+        part_config = dataclasses.replace(config, output_suffix=f"{suffix}-PART{index}")
+        scope = _PART_SCOPE.format(
+            index=index,
+            total=len(parts),
+            file_path=file_path,
+            start=part["start_line"],
+            end=part["end_line"],
+        )
+        return _evaluate_file(
+            part_config,
+            file_path,
+            project_config,
+            timeout,
+            resolved_model,
+            resolved_api_key_env,
+            quiet=True,
+            use_cache=use_cache,
+            content=part["content"],
+            instructions=scope,
+            limiter=limiter,
+        )
+
+    print(f"{prefix}: Split into {len(parts)} parts of up to {max_lines} lines")
+    print(f"{prefix}: Evaluating parts with {resolved_model} ({concurrency} workers)")
+    results: dict[int, EvaluationResult] = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {
+            pool.submit(_evaluate_part, index, part): index for index, part in enumerate(parts, 1)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = EvaluationResult(
+                    file_path=file_path, evaluator=config.name, exit_code=1, error=str(e)
+                )
+            results[index] = result
+            part = parts[index - 1]
+            print(
+                f"   [{len(results)}/{len(parts)}] {format_status(result)}  "
+                f"part {index} (lines {part['start_line']}-{part['end_line']})"
+            )
+
+    failed = [i for i in sorted(results) if results[i].error]
+    if failed:
+        print()
+        print(f"{RED}Error: {len(failed)} of {len(parts)} parts failed; not merging{RESET}")
+        for i in failed:
+            print(f"   part {i}: {results[i].error}")
+        return 1
+
+    # Reduce: merge the part evaluations into one report and verdict
+    print()
+    print(f"{prefix}: Merging {len(parts)} part evaluations")
+    merged = "\n\n".join(
+        _part_report(i, len(parts), parts[i - 1], results[i]) for i in sorted(results)
+    )
+    final = _evaluate_file(
+        config,
+        file_path,
+        project_config,
+        timeout,
+        resolved_model,
+        resolved_api_key_env,
+        use_cache=use_cache,
+        quiet=True,
+        content=merged,
+        instructions=_MERGE_INSTRUCTIONS.format(file_path=file_path, total=len(parts)),
+    )
+    if final.error:
+        print(f"{RED}Error: Merge failed: {final.error}{RESET}")
+        print("   Per-part evaluations:")
+        for i in sorted(results):
+            print(f"   {results[i].output_file}")
+        return 1
+
+    verdict = final.verdict
+    if verdict is None:
+        verdict = combine_verdicts([results[i].verdict for i in sorted(results)])
+        if verdict:
+            print(f"{YELLOW}Merged report has no verdict; using most severe part verdict{RESET}")
+
+    print(f"{prefix}: Output written to {final.output_file}")
+    return _report_verdict(verdict, Path(final.output_file), config)
+
+
+def combine_verdicts(verdicts: list[str | None]) -> str | None:
+    """Return the most severe verdict (reject > revise > pass), or None if none detected."""
+    for severity in (_REJECT_VERDICTS, _REVISE_VERDICTS, _PASS_VERDICTS):
+        for verdict in verdicts:
+            if verdict in severity:
+                return verdict
+    return None
+
+
+def _part_report(index: int, total: int, part: dict, result: EvaluationResult) -> str:
+    """Return one part's evaluation (without its metadata header) for the merge prompt."""
+    text = Path(result.output_file).read_text(encoding="utf-8")
+    # Drop the metadata header written above the model output
+    _, sep, body = text.partition("\n---\n\n")
+    body = body if sep else text
+    return (
+        f"### Part {index} of {total} (lines {part['start_line']}-{part['end_line']})\n\n"
+        f"{body.strip()}"
+    )
@@ -32,6 +32,26 @@ class ModelRequirement:
     min_context: int = 0
 
 
+@dataclass
+class RetryPolicy:
+    """Retry policy for transient model failures (rate limits, timeouts, 5xx).
+
+    Each model is tried up to ``1 + max_retries`` times with jittered
+    exponential backoff (``Retry-After`` from the provider wins when present),
+    then the evaluator's ``fallback_model`` is tried with the same policy.
+
+    Attributes:
+        max_retries: Retries per model after the first attempt (0 disables retries)
+        backoff_base: Base delay in seconds; the ceiling doubles on every retry
+        backoff_max: Cap on any single delay in seconds. A ``Retry-After``
+            longer than this skips straight to the fallback model.
+    """
+
+    max_retries: int = 2
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+
+
 @dataclass
 class EvaluatorConfig:
     """Configuration for an evaluator (built-in or custom).
@@ -59,6 +79,7 @@ class EvaluatorConfig:
         aliases: Alternative command names
         version: Evaluator version
         timeout: Timeout in seconds (default: 180, max: 600)
+        retry: Retry/failover policy for transient model failures
         model_requirement: Structured model requirement (resolved via ModelResolver)
         source: "builtin" or "local" (set internally)
         config_file: Path to YAML file if local (set internally)
@@ -78,6 +99,7 @@ class EvaluatorConfig:
     aliases: list[str] = field(default_factory=list)
     version: str = "1.0.0"
     timeout: int = 180  # Timeout in seconds (default: 180, max: 600)
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
 
     # NEW: Structured model requirement (Phase 1 - ADV-0015)
     # When present, resolved via ModelResolver to actual model ID
@@ -13,15 +13,30 @@ Supports dual-field model specification (ADV-0015):
 from __future__ import annotations
 
 import logging
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
 
-from .config import EvaluatorConfig, ModelRequirement
+from .config import EvaluatorConfig, ModelRequirement, RetryPolicy
+
+if TYPE_CHECKING:
+    from .registry import RegistryCache
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader is several times faster on the multi-KB prompt blocks
+# of library evaluators; fall back to the pure-Python loader without it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Without libyaml, parse changed files in a process pool when at least this
+# many need parsing. libyaml parses an evaluator in well under a millisecond,
+# less than it costs to start a worker, so the pool is not used with it.
+PARALLEL_PARSE_THRESHOLD = 16
+
 
 class EvaluatorParseError(Exception):
     """Raised when evaluator YAML is invalid."""
@@ -47,7 +62,7 @@ def parse_evaluator_yaml(yml_file: Path) -> EvaluatorConfig:
         raise EvaluatorParseError(f"File encoding error (not UTF-8): {yml_file}") from e
 
     # Parse YAML
-    data = yaml.safe_load(content)
+    data = yaml.load(content, Loader=_SafeLoader)  # noqa: S506 - safe loader
 
     # Check for empty YAML
     if data is None or (isinstance(data, str) and not data.strip()):
@@ -222,6 +237,11 @@ def parse_evaluator_yaml(yml_file: Path) -> EvaluatorConfig:
             min_context=min_context,
         )
 
+    # Parse retry policy if present
+    retry = RetryPolicy()
+    if "retry" in data:
+        retry = _parse_retry_policy(data["retry"])
+
     # Filter to known fields only (log unknown fields)
     known_fields = {
         "name",
@@ -236,6 +256,7 @@ def parse_evaluator_yaml(yml_file: Path) -> EvaluatorConfig:
         "version",
         "timeout",
         "model_requirement",  # ADV-0015
+        "retry",
     }
     unknown = set(data.keys()) - known_fields
     # Ignore underscore-prefixed metadata fields (e.g., _meta from library install)
@@ -243,8 +264,8 @@ def parse_evaluator_yaml(yml_file: Path) -> EvaluatorConfig:
     if unknown:
         logger.warning("Unknown fields in %s: %s", yml_file.name, ", ".join(sorted(unknown)))
 
-    # Build filtered data dict (exclude model_requirement as it's handled separately)
-    scalar_fields = known_fields - {"model_requirement"}
+    # Build filtered data dict (exclude mappings handled separately)
+    scalar_fields = known_fields - {"model_requirement", "retry"}
     filtered_data = {k: v for k, v in data.items() if k in scalar_fields}
 
     # Set defaults for optional model/api_key_env when model_requirement is present
@@ -258,6 +279,7 @@ def parse_evaluator_yaml(yml_file: Path) -> EvaluatorConfig:
     config = EvaluatorConfig(
         **filtered_data,
         model_requirement=model_requirement,
+        retry=retry,
         source="local",
         config_file=str(yml_file),
     )
@@ -265,8 +287,50 @@ def parse_evaluator_yaml(yml_file: Path) -> EvaluatorConfig:
     return config
 
 
+def _parse_retry_policy(retry_data) -> RetryPolicy:
+    """Parse the optional ``retry`` mapping of an evaluator YAML file.
+
+    Raises:
+        EvaluatorParseError: If the mapping or any of its values is invalid
+    """
+    if retry_data is None:
+        return RetryPolicy()
+    if not isinstance(retry_data, dict):
+        raise EvaluatorParseError(f"retry must be a mapping, got {type(retry_data).__name__}")
+
+    unknown = set(retry_data) - {"max_retries", "backoff_base", "backoff_max"}
+    if unknown:
+        raise EvaluatorParseError(f"Unknown retry fields: {', '.join(sorted(unknown))}")
+
+    policy = RetryPolicy()
+    if "max_retries" in retry_data:
+        value = retry_data["max_retries"]
+        # Check for bool before int (bool is subclass of int in Python)
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise EvaluatorParseError(
+                f"retry.max_retries must be an integer, got {type(value).__name__}: {value!r}"
+            )
+        if value < 0:
+            raise EvaluatorParseError(f"retry.max_retries must be >= 0, got {value}")
+        policy.max_retries = value
+
+    for field in ("backoff_base", "backoff_max"):
+        if field in retry_data:
+            value = retry_data[field]
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise EvaluatorParseError(
+                    f"retry.{field} must be a number, got {type(value).__name__}: {value!r}"
+                )
+            if value < 0:
+                raise EvaluatorParseError(f"retry.{field} must be >= 0, got {value}")
+            setattr(policy, field, float(value))
+
+    return policy
+
+
 def discover_local_evaluators(
     base_path: Path | None = None,
+    use_cache: bool = True,
 ) -> dict[str, EvaluatorConfig]:
     """Discover evaluators from .adversarial/evaluators/
 
@@ -276,8 +340,12 @@ def discover_local_evaluators(
 
     Flat files take precedence over nested files with the same evaluator name.
 
+    Parsed files are kept in the registry cache (.adversarial/cache/evaluators.json)
+    and only parsed again when their mtime or size changes.
+
     Args:
         base_path: Project root (default: current directory)
+        use_cache: Read and update the registry cache (default: True)
 
     Returns:
         Dict mapping evaluator name (and aliases) to EvaluatorConfig
@@ -312,15 +380,30 @@ def discover_local_evaluators(
         logger.warning("Could not read evaluators directory: %s", e)
         return evaluators
 
+    from .registry import RegistryCache
+
+    cache = RegistryCache.for_project(base_path) if use_cache else None
+
+    entries: list[tuple[Path, Path | str]] = []
     for yml_file in yml_files:
         # Use relative path for clearer warning messages (especially for nested files)
         try:
-            rel_path = yml_file.relative_to(local_dir)
+            entries.append((yml_file, yml_file.relative_to(local_dir)))
         except ValueError:
-            rel_path = yml_file.name
+            entries.append((yml_file, yml_file.name))
 
+    prefetched = _parse_changed_in_parallel(entries, cache)
+
+    # Register in the serial (flat, then nested, sorted) order so precedence
+    # and alias conflicts do not depend on how the files were parsed
+    for yml_file, rel_path in entries:
         try:
-            config = parse_evaluator_yaml(yml_file)
+            if yml_file in prefetched:
+                config = _take_prefetched(prefetched[yml_file], cache, str(rel_path))
+            elif cache is not None:
+                config = cache.parse(yml_file, str(rel_path))
+            else:
+                config = parse_evaluator_yaml(yml_file)
 
             # Check for name conflicts
             if config.name in evaluators:
@@ -351,4 +434,96 @@ def discover_local_evaluators(
         except OSError as e:
             logger.warning("Could not load %s: %s", rel_path, e)
 
+    if cache is not None:
+        cache.save()
+
     return evaluators
+
+
+# (file stat, parsed config or parse error, captured (level, message) log records)
+_ParseOutcome = tuple[os.stat_result | None, EvaluatorConfig | Exception, list[tuple[int, str]]]
+
+
+def _parse_changed_in_parallel(
+    entries: list[tuple[Path, Path | str]], cache: RegistryCache | None
+) -> dict[Path, _ParseOutcome]:
+    """Parse the files the registry cache cannot answer in a process pool.
+
+    Only used with the pure-Python YAML loader and when at least
+    PARALLEL_PARSE_THRESHOLD files need parsing; otherwise (or if no pool can
+    be started) files are parsed serially by the caller.
+    """
+    if _SafeLoader is not yaml.SafeLoader or len(entries) < PARALLEL_PARSE_THRESHOLD:
+        return {}
+
+    pending: list[Path] = []
+    for yml_file, rel_path in entries:
+        if cache is not None:
+            try:
+                if cache.lookup(yml_file, str(rel_path), yml_file.stat()) is not None:
+                    continue
+            except (EvaluatorParseError, OSError):
+                continue  # cached error or unreadable: the serial path reports it
+        pending.append(yml_file)
+
+    workers = min(len(pending), os.cpu_count() or 1)
+    if len(pending) < PARALLEL_PARSE_THRESHOLD or workers < 2:
+        return {}
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(
+                pool.map(_parse_in_worker, pending, chunksize=-(-len(pending) // workers))
+            )
+    except Exception as e:  # e.g. no process support on this platform, broken pool
+        logger.debug("Parallel evaluator parsing unavailable (%s); parsing serially", e)
+        return {}
+    return dict(zip(pending, outcomes, strict=True))
+
+
+def _take_prefetched(
+    outcome: _ParseOutcome, cache: RegistryCache | None, key: str
+) -> EvaluatorConfig:
+    """Replay a worker's log records and return its config (or raise its error)."""
+    stat, result, records = outcome
+    for level, message in records:
+        logger.log(level, "%s", message)
+    if isinstance(result, OSError) or stat is None:
+        raise result
+    if cache is not None:
+        return cache.store(key, stat, result)
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+class _RecordCollector(logging.Handler):
+    """Collects (level, message) pairs so a worker's warnings reach the parent."""
+
+    def __init__(self):
+        super().__init__()
+        self.records: list[tuple[int, str]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append((record.levelno, record.getMessage()))
+
+
+def _parse_in_worker(yml_file: Path) -> _ParseOutcome:
+    """Process-pool entry point: parse one file, returning errors instead of raising."""
+    collector = _RecordCollector()
+    propagate = logger.propagate
+    logger.addHandler(collector)
+    logger.propagate = False
+    stat = None
+    try:
+        stat = yml_file.stat()
+        result: EvaluatorConfig | Exception = parse_evaluator_yaml(yml_file)
+    except yaml.YAMLError as e:
+        # Marked YAML errors carry parser state; send only the message
+        result = yaml.YAMLError(str(e))
+    except (EvaluatorParseError, OSError) as e:
+        result = e
+    finally:
+        logger.removeHandler(collector)
+        logger.propagate = propagate
+    return stat, result, collector.records
@@ -0,0 +1,287 @@
+"""Incremental re-evaluation of documents that changed in a few sections.
+
+After a full evaluation, the Markdown sections of the document (headings as
+detected by utils.file_splitter.detect_sections()) are hashed and stored next
+to the output file::
+
+    {log_directory}/{basename}-{suffix}.sections.json
+
+On the next ``--incremental`` run, only sections whose content changed (or
+that are new) are sent, together with the previous evaluation and the titles
+of removed sections, and the model updates the previous evaluation for the
+whole document. Token volume and latency scale with the size of the edit
+rather than the size of the document.
+
+A full evaluation is run instead when there is no usable previous state
+(first run, different model or prompt, output file replaced) or when more than
+half of the document's lines changed. When nothing changed, no call is made and the
+previous verdict is reported.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from ..utils.colors import RED, RESET
+from ..utils.file_splitter import detect_sections
+from ..utils.files import atomic_write
+from .config import EvaluatorConfig
+from .runner import (
+    EvaluationResult,
+    _evaluate_file,
+    _output_path,
+    _preflight,
+    _prepare_run,
+    _report_verdict,
+)
+
+# Bump when the state file layout changes
+_STATE_FORMAT = 1
+
+# Re-evaluate the whole document when more than this share of its lines changed
+FULL_REEVALUATION_RATIO = 0.5
+
+_UPDATE_INSTRUCTIONS = """\
+## Incremental Update Instructions
+
+{file_path} was evaluated before with the instructions above. Since then,
+{changed} of its {total} sections changed. The document below contains your
+previous evaluation of the whole document, followed by only the sections that
+are new or changed{removed_note}.
+
+Produce an updated evaluation of the whole document: keep findings about
+unchanged sections that still apply, revise or drop findings the changes
+resolve, evaluate the changed sections, and give a single overall verdict in
+the required format.
+"""
+
+
+@dataclasses.dataclass
+class _Section:
+    title: str
+    start_line: int
+    end_line: int
+    text: str
+
+    @property
+    def line_count(self) -> int:
+        return self.end_line - self.start_line + 1
+
+    @property
+    def digest(self) -> str:
+        # Trailing blank lines depend on the section's position (the last one
+        # runs to the end of the file), not on its content
+        return hashlib.sha256(self.text.rstrip().encode("utf-8")).hexdigest()
+
+
+def run_evaluator_incremental(
+    config: EvaluatorConfig,
+    file_path: str,
+    timeout: int = 180,
+    use_cache: bool = True,
+) -> int:
+    """Evaluate a file, sending only the sections changed since the last run.
+
+    Args:
+        config: Evaluator configuration
+        file_path: Path to file to evaluate
+        timeout: Timeout in seconds (default: 180)
+        use_cache: Serve unchanged inputs from the response cache (default: True)
+
+    Returns:
+        0 on success, non-zero on failure
+    """
+    prefix = config.log_prefix or config.name.upper()
+    print(f"{prefix}: Evaluating {file_path} (incremental)")
+    print()
+
+    if not os.path.exists(file_path):
+        print(f"{RED}Error: File not found: {file_path}{RESET}")
+        return 1
+
+    prepared = _prepare_run(config)
+    if prepared is None:
+        return 1
+    project_config, resolved_model, resolved_api_key_env = prepared
+
+    content = Path(file_path).read_text(encoding="utf-8")
+    sections = _split_sections(content)
+    output_file = _output_path(config, file_path, project_config)
+    state_file = _state_path(output_file)
+    state = _load_state(state_file, config, resolved_model, output_file)
+
+    previous = state["sections"] if state else []
+    previous_digests = {entry["digest"] for entry in previous}
+    current_digests = {s.digest for s in sections}
+    changed = [s for s in sections if s.digest not in previous_digests]
+    current_titles = {s.title for s in sections}
+    removed = [entry["title"] for entry in previous if entry["title"] not in current_titles]
+
+    if state is not None and not changed and not removed:
+        print(f"{prefix}: No sections changed since the last evaluation; not calling the model")
+        return _report_verdict(state.get("verdict"), output_file, config)
+
+    # Churn counts lines on both sides: changed or new sections now, and
+    # replaced or removed sections before, against both versions' lengths
+    total_lines = sum(s.line_count for s in sections)
+    changed_lines = sum(s.line_count for s in changed)
+    churn = changed_lines + sum(e["lines"] for e in previous if e["digest"] not in current_digests)
+    base = total_lines + sum(e["lines"] for e in previous)
+
+    if state is None or churn > base * FULL_REEVALUATION_RATIO:
+        if state is None:
+            print(f"{prefix}: No previous evaluation to update; evaluating the whole document")
+        else:
+            print(f"{prefix}: Most of the document changed; evaluating the whole document")
+        status = _preflight(config, file_path, resolved_model)
+        if status is not None:
+            return status
+        result = _evaluate_file(
+            config,
+            file_path,
+            project_config,
+            timeout,
+            resolved_model,
+            resolved_api_key_env,
+            use_cache=use_cache,
+        )
+    else:
+        print(
+            f"{prefix}: {len(changed)} of {len(sections)} sections changed "
+            f"({changed_lines} of {total_lines} lines); sending only those"
+        )
+        instructions = _UPDATE_INSTRUCTIONS.format(
+            file_path=file_path,
+            changed=len(changed),
+            total=len(sections),
+            removed_note=", and the titles of sections that were removed" if removed else "",
+        )
+        result = _evaluate_file(
+            config,
+            file_path,
+            project_config,
+            timeout,
+            resolved_model,
+            resolved_api_key_env,
+            use_cache=use_cache,
+            content=_update_document(_previous_evaluation(output_file), changed, removed),
+            instructions=instructions,
+        )
+
+    _save_state(state_file, config, resolved_model, sections, result)
+    return result.exit_code
+
+
+def _split_sections(content: str) -> list[_Section]:
+    """Split a document into its Markdown sections, keeping every line.
+
+    Lines before the first heading form a "(preamble)" section, so edits
+    there are detected too.
+    """
+    lines = content.split("\n")
+    detected = detect_sections(content)
+    sections = []
+    first = detected[0]["start_line"] if detected else len(lines) + 1
+    if first > 1 and any(line.strip() for line in lines[: first - 1]):
+        sections.append(_Section("(preamble)", 1, first - 1, "\n".join(lines[: first - 1])))
+    for section in detected:
+        start, end = section["start_line"], section["end_line"]
+        sections.append(_Section(section["title"], start, end, "\n".join(lines[start - 1 : end])))
+    return sections
+
+
+def _state_path(output_file: Path) -> Path:
+    return output_file.with_suffix(".sections.json")
+
+
+def _state_stamp(config: EvaluatorConfig, model: str) -> dict[str, Any]:
+    """Fields that must match for a previous evaluation to be updated."""
+    return {
+        "format": _STATE_FORMAT,
+        "evaluator": config.name,
+        "model": model,
+        "prompt": hashlib.sha256(config.prompt.encode("utf-8")).hexdigest(),
+    }
+
+
+def _load_state(
+    state_file: Path, config: EvaluatorConfig, model: str, output_file: Path
+) -> dict[str, Any] | None:
+    """Return the previous run's state, or None if missing, stale or unusable."""
+    try:
+        with open(state_file, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or not isinstance(state.get("sections"), list):
+        return None
+    if not all(
+        isinstance(e, dict) and {"title", "digest", "lines"} <= e.keys() for e in state["sections"]
+    ):
+        return None
+    if any(state.get(k) != v for k, v in _state_stamp(config, model).items()):
+        return None
+    # The output must still be the evaluation these hashes describe (a
+    # non-incremental run may have overwritten it since)
+    if _file_digest(output_file) != state.get("output"):
+        return None
+    return state
+
+
+def _save_state(
+    state_file: Path,
+    config: EvaluatorConfig,
+    model: str,
+    sections: list[_Section],
+    result: EvaluationResult,
+) -> None:
+    """Record section hashes for the evaluation just written; clear it on failure."""
+    if result.error or not result.output_file:
+        with contextlib.suppress(FileNotFoundError):
+            state_file.unlink()
+        return
+    state = {
+        **_state_stamp(config, model),
+        "verdict": result.verdict,
+        "output": _file_digest(Path(result.output_file)),
+        "sections": [
+            {"title": s.title, "digest": s.digest, "lines": s.line_count} for s in sections
+        ],
+    }
+    with atomic_write(state_file, encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+
+
+def _file_digest(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _previous_evaluation(output_file: Path) -> str:
+    """Return the previous evaluation without its metadata header."""
+    text = output_file.read_text(encoding="utf-8")
+    _, sep, body = text.partition("\n---\n\n")
+    return (body if sep else text).strip()
+
+
+def _update_document(previous: str, changed: list[_Section], removed: list[str]) -> str:
+    """Build the incremental request: previous evaluation plus changed sections."""
+    parts = ["## Previous Evaluation", "", previous, "", "## Changed Sections", ""]
+    for section in changed:
+        parts.append(f"### Lines {section.start_line}-{section.end_line}: {section.title}")
+        parts.append("")
+        parts.append(section.text)
+        parts.append("")
+    if removed:
+        parts.append("## Removed Sections")
+        parts.append("")
+        parts.extend(f"- {title}" for title in removed)
+    return "\n".join(parts).rstrip() + "\n"
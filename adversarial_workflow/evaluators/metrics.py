@@ -0,0 +1,229 @@
+"""Per-evaluation timing and token telemetry.
+
+Every evaluation appends one JSON record to a monthly file under the
+project's metrics directory::
+
+    .adversarial/metrics/evaluations-2026-10.jsonl
+
+Each record holds the evaluator, model, verdict and outcome, the wall-clock
+duration split into phases (config load, model resolution, preflight, the
+model call including retries, output writing and validation), and the
+provider-reported usage: prompt, completion and cached tokens and the cost
+LiteLLM computed for the call. ``adversarial stats`` aggregates the records
+into p50/p95 latency, tokens and cost per evaluator and model.
+
+Configured in .adversarial/config.yml (all keys optional)::
+
+    metrics:
+      enabled: true
+      directory: .adversarial/metrics
+
+Recording is best-effort: a metrics file that cannot be written is logged
+and never fails the evaluation. Metrics are per developer: ``adversarial
+init`` adds ``.adversarial/metrics/`` to .gitignore.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import math
+import os
+import time
+from collections.abc import Iterable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METRICS_DIR = ".adversarial/metrics"
+
+# Phase timings (milliseconds) of the evaluation running in this context
+_PHASES: ContextVar[dict[str, float] | None] = ContextVar("adversarial_phases", default=None)
+
+
+@contextlib.contextmanager
+def recording() -> Iterator[dict[str, float]]:
+    """Collect phase timings for one evaluation.
+
+    Phases timed by an enclosing recording() (the setup done once by
+    run_evaluator() before the model call) are carried into the first nested
+    recording and then cleared, so they are attributed to one record only.
+    """
+    inherited = _PHASES.get()
+    phases = dict(inherited or {})
+    token = _PHASES.set(phases)
+    try:
+        yield phases
+    finally:
+        _PHASES.reset(token)
+        if inherited is not None:
+            inherited.clear()
+
+
+@contextlib.contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Add the time spent in the block to ``name`` in the current recording."""
+    phases = _PHASES.get()
+    if phases is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        phases[name] = phases.get(name, 0.0) + elapsed
+
+
+@dataclass
+class MetricsLog:
+    """Append-only JSONL store of evaluation records."""
+
+    directory: Path
+
+    @classmethod
+    def from_project_config(cls, project_config: dict[str, Any]) -> MetricsLog | None:
+        """Return the project's metrics log, or None if metrics are disabled."""
+        data = project_config.get("metrics")
+        if not isinstance(data, dict):
+            data = {}
+        if not data.get("enabled", True):
+            return None
+        return cls(Path(str(data.get("directory") or DEFAULT_METRICS_DIR)))
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Append one record; errors are logged, never raised."""
+        line = (json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n").encode("utf-8")
+        month = str(record.get("timestamp", ""))[:7] or "unknown"
+        path = self.directory / f"evaluations-{month}.jsonl"
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # One write() on an O_APPEND descriptor, so concurrent writers
+            # (batch workers, parallel processes) never interleave lines
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.warning("Could not write evaluation metrics to %s: %s", path, e)
+
+    def records(self, since: datetime | None = None) -> Iterator[dict[str, Any]]:
+        """Yield stored records, oldest file first, skipping unreadable lines."""
+        if not self.directory.is_dir():
+            return
+        oldest = since.strftime("%Y-%m") if since else ""
+        cutoff = since.isoformat(timespec="seconds") if since else ""
+        for path in sorted(self.directory.glob("evaluations-*.jsonl")):
+            if path.stem.removeprefix("evaluations-") < oldest:
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            continue
+                        if not isinstance(record, dict):
+                            continue
+                        if since and str(record.get("timestamp", "")) < cutoff:
+                            continue
+                        yield record
+            except OSError as e:
+                logger.warning("Could not read evaluation metrics from %s: %s", path, e)
+
+
+@dataclass
+class MetricsSummary:
+    """Aggregate of the records for one (evaluator, model) pair."""
+
+    evaluator: str
+    model: str
+    runs: int = 0
+    errors: int = 0
+    cached: int = 0
+    durations_ms: list[float] = field(default_factory=list)
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    cost_usd: float = 0.0
+
+    @property
+    def p50_ms(self) -> float | None:
+        return percentile(self.durations_ms, 50)
+
+    @property
+    def p95_ms(self) -> float | None:
+        return percentile(self.durations_ms, 95)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "evaluator": self.evaluator,
+            "model": self.model,
+            "runs": self.runs,
+            "errors": self.errors,
+            "cached": self.cached,
+            "p50_ms": self.p50_ms,
+            "p95_ms": self.p95_ms,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_tokens": self.cached_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+        }
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile of ``values`` (None when empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(records: Iterable[dict[str, Any]]) -> list[MetricsSummary]:
+    """Group records by (evaluator, model), sorted by evaluator then model.
+
+    Latency percentiles only count evaluations that called the model, so
+    response-cache hits do not flatter them.
+    """
+    groups: dict[tuple[str, str], MetricsSummary] = {}
+    for record in records:
+        key = (str(record.get("evaluator", "?")), str(record.get("model", "?")))
+        summary = groups.get(key)
+        if summary is None:
+            summary = groups[key] = MetricsSummary(*key)
+        summary.runs += 1
+        if record.get("error"):
+            summary.errors += 1
+        if record.get("cached"):
+            summary.cached += 1
+        elif isinstance(record.get("duration_ms"), (int, float)):
+            summary.durations_ms.append(float(record["duration_ms"]))
+        tokens = record.get("tokens") or {}
+        summary.prompt_tokens += _int(tokens.get("prompt"))
+        summary.completion_tokens += _int(tokens.get("completion"))
+        summary.cached_tokens += _int(tokens.get("cached"))
+        cost = record.get("cost_usd")
+        if isinstance(cost, (int, float)):
+            summary.cost_usd += cost
+    return [groups[key] for key in sorted(groups)]
+
+
+def _int(value: Any) -> int:
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
+
+
+def utc_now() -> str:
+    """Timestamp format used in records (UTC, ISO 8601, seconds)."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def since_days(days: int) -> datetime:
+    """Start of a ``--days`` window ending now."""
+    return datetime.now(timezone.utc) - timedelta(days=days)
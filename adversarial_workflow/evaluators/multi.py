@@ -0,0 +1,162 @@
+"""Multi-evaluator runs: several evaluators on the same file in one invocation.
+
+``adversarial run -e evaluate -e proofread -e gemini-flash FILE`` loads the
+project config and reads the file once, resolves every evaluator's model up
+front, then dispatches all model calls concurrently. Wall-clock time is
+roughly the slowest evaluator instead of the sum of all of them.
+
+Results are printed as a verdict matrix, one row per evaluator.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from ..utils.colors import BOLD, RED, RESET
+from ..utils.tokens import count_tokens
+from .batch import CANCELLED, TOO_LARGE, BatchResult, format_status
+from .config import EvaluatorConfig
+from .ratelimit import ProviderLimiter
+from .runner import (
+    EvaluationResult,
+    _confirm_large_file,
+    _count_lines,
+    _evaluate_file,
+    _fits_context,
+    _load_project_config,
+    _resolve_model,
+)
+
+# Upper bound on a single model call, as for single-evaluator runs
+MAX_TIMEOUT = 600
+
+
+def run_evaluators(
+    configs: list[EvaluatorConfig],
+    file_path: str,
+    timeout: int | None = None,
+    use_cache: bool = True,
+) -> BatchResult:
+    """Run several evaluators on one file concurrently.
+
+    Args:
+        configs: Evaluators to run (duplicates are run once)
+        file_path: Path to file to evaluate
+        timeout: Timeout per model call in seconds (default: each evaluator's
+            own ``timeout``), capped at 600
+        use_cache: Serve unchanged inputs from the response cache
+
+    Returns:
+        BatchResult with one EvaluationResult per evaluator, in input order
+    """
+    batch = BatchResult()
+    start = time.monotonic()
+
+    unique: list[EvaluatorConfig] = []
+    for config in configs:
+        if not any(config is seen for seen in unique):
+            unique.append(config)
+
+    def _failed(config: EvaluatorConfig, error: str) -> EvaluationResult:
+        return EvaluationResult(
+            file_path=file_path, evaluator=config.name, exit_code=1, error=error
+        )
+
+    if not os.path.exists(file_path):
+        print(f"{RED}Error: File not found: {file_path}{RESET}")
+        batch.results = [_failed(c, "File not found") for c in unique]
+        return batch
+
+    project_config = _load_project_config()
+    if project_config is None:
+        batch.results = [_failed(c, "Setup failed") for c in unique]
+        return batch
+
+    # Resolve every model before any call so setup errors surface immediately
+    resolved: dict[int, tuple[str, str]] = {}
+    results: dict[int, EvaluationResult] = {}
+    for i, config in enumerate(unique):
+        models = _resolve_model(config)
+        if models is None:
+            results[i] = _failed(config, "Setup failed")
+        else:
+            resolved[i] = models
+
+    # Read the file once for every evaluator
+    content = Path(file_path).read_text(encoding="utf-8")
+
+    # Drop evaluators whose model cannot fit the document, then apply the size gate
+    max_tokens = 0
+    for i, (model, _) in list(resolved.items()):
+        tokens = count_tokens(content, model)
+        if _fits_context(unique[i], file_path, model, tokens):
+            max_tokens = max(max_tokens, tokens)
+        else:
+            results[i] = _failed(unique[i], TOO_LARGE)
+            del resolved[i]
+
+    if resolved and not _confirm_large_file(_count_lines(content), max_tokens):
+        print("Evaluation cancelled.")
+        for i in resolved:
+            results[i] = EvaluationResult(
+                file_path=file_path, evaluator=unique[i].name, exit_code=0, error=CANCELLED
+            )
+        batch.results = [results[i] for i in range(len(unique))]
+        return batch
+
+    limiter = ProviderLimiter.from_project_config(project_config, max(1, len(resolved)))
+
+    def _worker(i: int) -> EvaluationResult:
+        config = unique[i]
+        model, api_key_env = resolved[i]
+        call_timeout = min(timeout if timeout is not None else config.timeout, MAX_TIMEOUT)
+        return _evaluate_file(
+            config,
+            file_path,
+            project_config,
+            call_timeout,
+            model,
+            api_key_env,
+            quiet=True,
+            use_cache=use_cache,
+            content=content,
+            limiter=limiter,
+        )
+
+    print(f"Running {len(resolved)} evaluator(s) on {file_path}")
+    for i in resolved:
+        print(f"   {unique[i].name:<20} {resolved[i][0]}")
+    print()
+
+    if resolved:
+        done = 0
+        with ThreadPoolExecutor(max_workers=len(resolved)) as pool:
+            futures = {pool.submit(_worker, i): i for i in resolved}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = _failed(unique[i], str(e))
+                results[i] = result
+                done += 1
+                status = format_status(result)
+                print(f"   [{done}/{len(resolved)}] {status}  {result.evaluator}")
+
+    batch.results = [results[i] for i in range(len(unique))]
+    batch.elapsed = time.monotonic() - start
+    return batch
+
+
+def print_verdict_matrix(batch: BatchResult) -> None:
+    """Print one row per evaluator: verdict, model and output file (or error)."""
+    print()
+    print(f"{BOLD}Verdict matrix{RESET} ({len(batch.results)} evaluators, {batch.elapsed:.1f}s)")
+    width = max([len("EVALUATOR")] + [len(r.evaluator) for r in batch.results])
+    print(f"   {'EVALUATOR':<{width}}  {'VERDICT':<18}  {'MODEL':<28}  OUTPUT")
+    for r in batch.results:
+        detail = r.error if r.error else (r.output_file or "")
+        print(f"   {r.evaluator:<{width}}  {format_status(r)}  {r.model or '-':<28}  {detail}")
@@ -0,0 +1,276 @@
+"""Client-side rate limiting for model calls, shared across threads and processes.
+
+Each budget is a pair of token buckets (requests per minute and tokens per
+minute) that refill continuously. Before every model call the runner takes
+one request and the estimated prompt tokens from the matching budget, waiting
+until enough has refilled. Throughput then stays at the configured quota
+instead of bursting into provider 429s.
+
+Bucket state lives in small JSON files guarded by an exclusive file lock, so
+parallel processes on one host (e.g. CI shards) share the same budget.
+
+Configured in .adversarial/config.yml, keyed by API key env var or provider
+(the API key env var wins when both match)::
+
+    rate_limits:
+      openai:
+        requests_per_minute: 500
+        tokens_per_minute: 200000
+      ANTHROPIC_API_KEY:
+        requests_per_minute: 50
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: in-process locking only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_LIMIT_DIR = ".adversarial/cache/ratelimit"
+
+# Serializes state-file access between threads (the file lock covers processes)
+_STATE_LOCK = threading.Lock()
+
+
+def provider_for_model(model: str) -> str:
+    """Return the LiteLLM provider name for a model ID (e.g. 'openai', 'gemini').
+
+    Falls back to the ``provider/`` prefix, or the model ID itself, when
+    LiteLLM cannot map the model.
+    """
+    import litellm  # slow to import; loaded on first use
+
+    try:
+        _, provider, _, _ = litellm.get_llm_provider(model)
+        if provider:
+            return provider
+    except Exception as e:
+        logger.debug("LiteLLM cannot map model %s (%s); using its prefix", model, e)
+    return model.split("/", 1)[0] if "/" in model else model
+
+
+class ProviderLimiter:
+    """Per-provider concurrency cap shared by all workers of a run."""
+
+    def __init__(self, default_limit: int, limits: dict[str, int] | None = None):
+        """
+        Args:
+            default_limit: Maximum concurrent calls per provider
+            limits: Optional per-provider overrides (provider name -> limit)
+        """
+        if default_limit < 1:
+            raise ValueError(f"default_limit must be >= 1, got {default_limit}")
+        self.default_limit = default_limit
+        self.limits = dict(limits or {})
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_project_config(cls, project_config: dict, default_limit: int) -> ProviderLimiter:
+        """Build a limiter with the ``provider_concurrency`` overrides from config.yml."""
+        overrides = project_config.get("provider_concurrency") or {}
+        if not isinstance(overrides, dict):
+            overrides = {}
+        return cls(default_limit, overrides)
+
+    def _semaphore(self, provider: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if provider not in self._semaphores:
+                limit = max(1, int(self.limits.get(provider, self.default_limit)))
+                self._semaphores[provider] = threading.BoundedSemaphore(limit)
+            return self._semaphores[provider]
+
+    @contextlib.contextmanager
+    def slot(self, model: str) -> Iterator[None]:
+        """Hold one concurrency slot for the provider serving ``model``."""
+        semaphore = self._semaphore(provider_for_model(model))
+        with semaphore:
+            yield
+
+
+@dataclass
+class RateLimit:
+    """Per-minute budgets for one provider or API key (None = unlimited)."""
+
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+
+    @classmethod
+    def from_dict(cls, data: Any) -> RateLimit | None:
+        """Build from a config mapping; returns None if it sets no valid budget."""
+        if not isinstance(data, dict):
+            return None
+        limit = cls()
+        for field in ("requests_per_minute", "tokens_per_minute"):
+            value = data.get(field)
+            if value is None:
+                continue
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                logger.warning("Ignoring invalid rate_limits %s: %r", field, value)
+                continue
+            if value > 0:
+                setattr(limit, field, value)
+        if limit.requests_per_minute is None and limit.tokens_per_minute is None:
+            return None
+        return limit
+
+
+class RateLimiter:
+    """Token-bucket limiter with state shared through lock-protected files."""
+
+    def __init__(self, limits: dict[str, RateLimit], state_dir: Path):
+        """
+        Args:
+            limits: Budgets keyed by API key env var or provider name
+            state_dir: Directory holding the shared bucket state files
+        """
+        self.limits = dict(limits)
+        self.state_dir = Path(state_dir)
+
+    @classmethod
+    def from_project_config(cls, project_config: dict[str, Any]) -> RateLimiter | None:
+        """Return a limiter for the ``rate_limits`` config section, or None if unset."""
+        data = project_config.get("rate_limits")
+        if not isinstance(data, dict):
+            return None
+        limits = {}
+        for key, value in data.items():
+            limit = RateLimit.from_dict(value)
+            if limit is not None:
+                limits[str(key)] = limit
+        if not limits:
+            return None
+        return cls(limits, Path(DEFAULT_RATE_LIMIT_DIR))
+
+    def key_for(self, model: str, api_key_env: str = "") -> str | None:
+        """Return the budget that applies to a call, or None if it is unlimited."""
+        if api_key_env and api_key_env in self.limits:
+            return api_key_env
+        provider = provider_for_model(model)
+        return provider if provider in self.limits else None
+
+    def try_acquire(self, key: str, tokens: int = 0) -> float:
+        """Take one request and ``tokens`` from the budget if available.
+
+        A single request larger than the whole tokens-per-minute budget is
+        let through once the bucket is full, rather than blocking forever.
+
+        Returns:
+            0.0 if granted, otherwise seconds until enough budget has refilled
+        """
+        limit = self.limits[key]
+        with self._locked_state(key) as state:
+            self._refill(state, limit)
+            wait = 0.0
+            if limit.requests_per_minute is not None and state["requests"] < 1:
+                wait = max(wait, (1 - state["requests"]) * 60 / limit.requests_per_minute)
+            if limit.tokens_per_minute is not None:
+                needed = min(tokens, limit.tokens_per_minute)
+                if state["tokens"] < needed:
+                    wait = max(wait, (needed - state["tokens"]) * 60 / limit.tokens_per_minute)
+            if wait > 0:
+                return wait
+            state["requests"] -= 1
+            state["tokens"] -= tokens
+            return 0.0
+
+    def acquire(self, key: str, tokens: int = 0) -> float:
+        """Block until the call fits the budget. Returns seconds spent waiting."""
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(key, tokens)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self, key: str, tokens: int = 0) -> float:
+        """Async counterpart of acquire(); waits without blocking the event loop."""
+        waited = 0.0
+        while True:
+            wait = await asyncio.to_thread(self.try_acquire, key, tokens)
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def adjust(self, key: str, tokens: int) -> None:
+        """Charge (positive) or refund (negative) tokens after the actual usage is known."""
+        if not tokens:
+            return
+        limit = self.limits[key]
+        with self._locked_state(key) as state:
+            self._refill(state, limit)
+            state["tokens"] -= tokens
+
+    @staticmethod
+    def _refill(state: dict[str, float], limit: RateLimit) -> None:
+        now = time.time()
+        elapsed = max(0.0, now - state["updated"])
+        state["updated"] = now
+        if limit.requests_per_minute is not None:
+            state["requests"] = min(
+                limit.requests_per_minute,
+                state["requests"] + elapsed * limit.requests_per_minute / 60,
+            )
+        if limit.tokens_per_minute is not None:
+            state["tokens"] = min(
+                limit.tokens_per_minute,
+                state["tokens"] + elapsed * limit.tokens_per_minute / 60,
+            )
+
+    @contextlib.contextmanager
+    def _locked_state(self, key: str) -> Iterator[dict[str, float]]:
+        """Yield the bucket state for ``key`` under an exclusive lock, then save it."""
+        limit = self.limits[key]
+        name = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+        state_path = self.state_dir / f"{name}.json"
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+
+        with _STATE_LOCK, open(self.state_dir / f"{name}.lock", "a", encoding="utf-8") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                state = self._read_state(state_path, limit)
+                yield state
+                tmp_path = state_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_text(json.dumps(state), encoding="utf-8")
+                os.replace(tmp_path, state_path)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _read_state(path: Path, limit: RateLimit) -> dict[str, float]:
+        """Load saved bucket state; a missing or corrupt file starts with full buckets."""
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+            return {
+                "requests": float(state["requests"]),
+                "tokens": float(state["tokens"]),
+                "updated": float(state["updated"]),
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return {
+                "requests": limit.requests_per_minute or 0.0,
+                "tokens": limit.tokens_per_minute or 0.0,
+                "updated": time.time(),
+            }
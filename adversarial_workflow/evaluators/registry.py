@@ -0,0 +1,181 @@
+"""Persistent cache of parsed evaluator definitions.
+
+discover_local_evaluators() runs ``yaml.safe_load`` plus full validation on
+every evaluator file, on every CLI invocation. The registry cache stores each
+file's parsed EvaluatorConfig (or its parse error) keyed on the file's path,
+mtime and size, so only new or changed files are parsed again::
+
+    .adversarial/cache/evaluators.json
+
+Entries for deleted files are dropped on the next save, and the whole cache
+is invalidated when the package version changes (validation rules may have).
+``library install`` and ``library update`` clear it explicitly.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import json
+import logging
+import os
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from ..utils.files import atomic_write
+from .config import EvaluatorConfig, ModelRequirement, RetryPolicy
+from .discovery import EvaluatorParseError, parse_evaluator_yaml
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_CACHE_FILE = ".adversarial/cache/evaluators.json"
+
+# Bump when the entry layout changes
+_FORMAT = 1
+
+
+def _package_version() -> str:
+    try:
+        return version("adversarial-workflow")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class RegistryCache:
+    """Parsed evaluator configs keyed on (relative path, mtime, size)."""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: JSON file holding the cache
+        """
+        self.path = Path(path)
+        self._stamp = {"format": _FORMAT, "version": _package_version()}
+        self._entries = self._load()
+        self._seen: set[str] = set()
+        self._dirty = False
+
+    @classmethod
+    def for_project(cls, base_path: Path) -> RegistryCache:
+        """Return the registry cache of the project rooted at ``base_path``."""
+        return cls(base_path / REGISTRY_CACHE_FILE)
+
+    def parse(self, yml_file: Path, key: str) -> EvaluatorConfig:
+        """Return the config for ``yml_file``, parsing it only if it changed.
+
+        Args:
+            yml_file: Evaluator YAML file
+            key: Stable cache key (path relative to the evaluators directory)
+
+        Raises:
+            EvaluatorParseError: If the file is invalid (cached errors are re-raised)
+            OSError: If the file cannot be read
+        """
+        stat = yml_file.stat()
+        config = self.lookup(yml_file, key, stat)
+        if config is not None:
+            return config
+        try:
+            result: EvaluatorConfig | Exception = parse_evaluator_yaml(yml_file)
+        except (EvaluatorParseError, yaml.YAMLError) as e:
+            result = e
+        return self.store(key, stat, result)
+
+    def lookup(self, yml_file: Path, key: str, stat: os.stat_result) -> EvaluatorConfig | None:
+        """Return the cached config if ``stat`` still matches, or None on a miss.
+
+        Raises:
+            EvaluatorParseError: If the unchanged file was cached as invalid
+        """
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        if (
+            entry
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+        ):
+            if "error" in entry:
+                raise EvaluatorParseError(entry["error"])
+            with contextlib.suppress(TypeError, KeyError):
+                return _config_from_dict(entry["config"], yml_file)
+        return None
+
+    def store(
+        self, key: str, stat: os.stat_result, result: EvaluatorConfig | Exception
+    ) -> EvaluatorConfig:
+        """Record a parse result taken from a file with ``stat`` and return the config.
+
+        Args:
+            key: Cache key passed to lookup()
+            stat: File status taken before the file was read
+            result: Parsed config, or the EvaluatorParseError / YAMLError raised
+
+        Raises:
+            EvaluatorParseError: If ``result`` is a parse error
+        """
+        self._seen.add(key)
+        entry: dict[str, Any] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        if isinstance(result, EvaluatorConfig):
+            entry["config"] = dataclasses.asdict(result)
+            self._put(key, entry)
+            return result
+        if isinstance(result, yaml.YAMLError):
+            entry["error"] = f"YAML syntax error: {result}"
+            self._put(key, entry)
+            raise EvaluatorParseError(entry["error"]) from result
+        entry["error"] = str(result)
+        self._put(key, entry)
+        raise result
+
+    def save(self) -> None:
+        """Write the cache if anything changed, dropping entries for removed files."""
+        stale = set(self._entries) - self._seen
+        if not self._dirty and not stale:
+            return
+        for key in stale:
+            del self._entries[key]
+        data = {**self._stamp, "entries": self._entries}
+        try:
+            with atomic_write(self.path, encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+        except OSError as e:
+            logger.debug("Could not write evaluator registry cache: %s", e)
+            return
+        self._dirty = False
+
+    def _put(self, key: str, entry: dict[str, Any]) -> None:
+        self._entries[key] = entry
+        self._dirty = True
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Load entries; a missing, corrupt or outdated cache starts empty."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or any(data.get(k) != v for k, v in self._stamp.items()):
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+
+def clear_registry_cache(base_path: Path | None = None) -> None:
+    """Delete the project's registry cache so every evaluator is parsed again."""
+    if base_path is None:
+        base_path = Path.cwd()
+    with contextlib.suppress(FileNotFoundError):
+        (base_path / REGISTRY_CACHE_FILE).unlink()
+
+
+def _config_from_dict(data: dict[str, Any], yml_file: Path) -> EvaluatorConfig:
+    """Rebuild an EvaluatorConfig serialized with dataclasses.asdict()."""
+    data = dict(data)
+    data["retry"] = RetryPolicy(**data["retry"])
+    if data.get("model_requirement") is not None:
+        data["model_requirement"] = ModelRequirement(**data["model_requirement"])
+    data["config_file"] = str(yml_file)
+    return EvaluatorConfig(**data)
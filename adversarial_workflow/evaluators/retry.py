@@ -0,0 +1,103 @@
+"""Retry and failover helpers for evaluator model calls.
+
+Transient provider failures (HTTP 429, timeouts, connection errors, 5xx) are
+retried with jittered exponential backoff; a ``Retry-After`` header from the
+provider takes precedence over the computed delay. Once a model's retries are
+exhausted the runner fails over to the evaluator's ``fallback_model``.
+
+Configured per evaluator in YAML (all keys optional)::
+
+    fallback_model: gpt-4o-mini
+    retry:
+      max_retries: 2      # retries per model (0 disables)
+      backoff_base: 1.0   # seconds; ceiling doubles each retry
+      backoff_max: 30.0   # cap per delay; longer Retry-After fails over at once
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+import litellm
+
+from .config import RetryPolicy
+
+# Errors worth retrying: the same request may succeed a moment later
+RETRYABLE_ERRORS = (
+    litellm.RateLimitError,
+    litellm.Timeout,
+    litellm.APIConnectionError,
+    litellm.ServiceUnavailableError,
+    litellm.InternalServerError,
+    litellm.BadGatewayError,
+)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Return True if ``error`` is a transient failure worth retrying."""
+    return isinstance(error, RETRYABLE_ERRORS)
+
+
+def retry_after_seconds(error: Exception) -> float | None:
+    """Return the provider's ``Retry-After`` hint in seconds, if the error carries one.
+
+    Supports ``retry-after-ms``, ``retry-after`` as seconds, and
+    ``retry-after`` as an HTTP date.
+    """
+    headers = _error_headers(error)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return max(0.0, float(value) / 1000)
+        except (TypeError, ValueError):
+            pass
+
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(str(value)).timestamp() - time.time())
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def backoff_delay(policy: RetryPolicy, attempt: int, error: Exception) -> float | None:
+    """Return seconds to wait before retry number ``attempt + 1``.
+
+    Uses "equal jitter": half of the exponential ceiling plus a random share
+    of the other half, so concurrent clients spread out but every retry still
+    waits longer than the last. A ``Retry-After`` hint is used as-is.
+
+    Returns:
+        Delay in seconds, or None when the provider asks for a longer wait
+        than ``policy.backoff_max`` (better to fail over than to sit idle)
+    """
+    retry_after = retry_after_seconds(error)
+    if retry_after is not None:
+        return retry_after if retry_after <= policy.backoff_max else None
+
+    ceiling = min(policy.backoff_max, policy.backoff_base * (2**attempt))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)  # noqa: S311 - not crypto
+
+
+def _error_headers(error: Exception) -> dict[str, str]:
+    """Return the error's HTTP response headers with lower-cased names."""
+    for headers in (
+        getattr(error, "litellm_response_headers", None),
+        getattr(getattr(error, "response", None), "headers", None),
+    ):
+        if headers:
+            try:
+                return {str(k).lower(): v for k, v in headers.items()}
+            except AttributeError:
+                continue
+    return {}
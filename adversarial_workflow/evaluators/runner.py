@@ -4,23 +4,79 @@ Supports dual-field model specification (ADV-0015):
 - Legacy: model + api_key_env fields (backwards compatible)
 - New: model_requirement field (resolved via ModelResolver)
 
-Transport: Uses litellm.completion() for LLM calls (ADV-0065).
+Transport: Uses litellm.completion() for LLM calls (ADV-0065), or
+litellm.acompletion() via run_evaluator_async(). With stream=True the output
+file is written chunk by chunk as tokens arrive. Transient failures are
+retried with backoff, then fail over to the evaluator's fallback_model. Calls
+share per-provider keep-alive connection pools (see transport.py).
+
+The static evaluator prompt is sent as a system message ahead of the document
+so providers can cache it across calls; providers that only cache explicitly
+marked prefixes get a cache_control marker on it.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import os
 import sys
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
 import litellm
 
+from .. import tracing
 from ..utils.colors import BOLD, GREEN, RED, RESET, YELLOW
 from ..utils.config import load_config
-from ..utils.validation import validate_evaluation_output
+from ..utils.tokens import context_window, count_tokens
+from ..utils.validation import VerdictScanner, validate_evaluation_content
+from . import metrics
+from .cache import ResponseCache
 from .config import EvaluatorConfig
+from .ratelimit import ProviderLimiter, RateLimiter, provider_for_model
 from .resolver import ModelResolver, ResolutionError
+from .retry import backoff_delay, is_retryable
+from .transport import install_connection_pools, provider_context
+
+
+@dataclass
+class EvaluationResult:
+    """Outcome of evaluating a single file.
+
+    Returned by the non-interactive entry points (batch and multi-evaluator
+    runs) so callers can aggregate verdicts instead of parsing terminal output.
+
+    Attributes:
+        file_path: Path of the evaluated file
+        evaluator: Evaluator name
+        exit_code: 0 on success, non-zero on failure (same as run_evaluator)
+        verdict: Extracted verdict, or None if not detected / not evaluated
+        output_file: Path to the written evaluation output, if any
+        model: Model ID that produced the output
+        error: Short error description when the evaluation failed
+        input_tokens: Prompt tokens reported by the provider, if any
+        cached_input_tokens: Part of input_tokens served from the provider's
+            prompt cache, if reported
+        output_tokens: Completion tokens reported by the provider, if any
+        cost_usd: Cost of the model call as computed by LiteLLM, if known
+        cached: True when the output was served from the response cache
+    """
+
+    file_path: str
+    evaluator: str
+    exit_code: int
+    verdict: str | None = None
+    output_file: str | None = None
+    model: str = ""
+    error: str | None = None
+    input_tokens: int | None = None
+    cached_input_tokens: int | None = None
+    output_tokens: int | None = None
+    cost_usd: float | None = None
+    cached: bool = False
 
 
 def _normalize_output_suffix(output_suffix: str) -> str:
@@ -30,7 +86,14 @@ def _normalize_output_suffix(output_suffix: str) -> str:
     return output_suffix
 
 
-def run_evaluator(config: EvaluatorConfig, file_path: str, timeout: int = 180) -> int:
+def run_evaluator(
+    config: EvaluatorConfig,
+    file_path: str,
+    timeout: int = 180,
+    use_cache: bool = True,
+    stream: bool = False,
+    echo: bool = False,
+) -> int:
     """Run an evaluator on a file.
 
     All evaluators (built-in and custom) use the same LiteLLM transport path.
@@ -39,6 +102,10 @@ def run_evaluator(config: EvaluatorConfig, file_path: str, timeout: int = 180) -
         config: Evaluator configuration
         file_path: Path to file to evaluate
         timeout: Timeout in seconds (default: 180)
+        use_cache: Serve unchanged inputs from the response cache (default: True)
+        stream: Write the output file as tokens arrive; partial output is kept
+            if the call fails or times out (default: False)
+        echo: With stream, also echo tokens to stdout (default: False)
 
     Returns:
         0 on success, non-zero on failure
@@ -52,40 +119,297 @@ def run_evaluator(config: EvaluatorConfig, file_path: str, timeout: int = 180) -
         print(f"{RED}Error: File not found: {file_path}{RESET}")
         return 1
 
-    # 2. Load project config (check initialization first)
+    # Setup phases are timed here and attributed to the evaluation's record
+    with metrics.recording():
+        # 2-4. Load project config, resolve model, check API key
+        prepared = _prepare_run(config)
+        if prepared is None:
+            return 1
+        project_config, resolved_model, resolved_api_key_env = prepared
+
+        # 5. Pre-flight context window and file size check
+        with metrics.phase("preflight"):
+            status = _preflight(config, file_path, resolved_model)
+        if status is not None:
+            return status
+
+        # 6. Run evaluator via LiteLLM (all evaluators use the same path)
+        return _run_custom_evaluator(
+            config,
+            file_path,
+            project_config,
+            timeout,
+            resolved_model,
+            resolved_api_key_env,
+            use_cache=use_cache,
+            stream=stream,
+            echo=echo,
+        )
+
+
+async def run_evaluator_async(
+    config: EvaluatorConfig,
+    file_path: str,
+    timeout: int = 180,
+    use_cache: bool = True,
+    stream: bool = False,
+    echo: bool = False,
+) -> int:
+    """Run an evaluator on a file without blocking the event loop.
+
+    Asyncio-native counterpart of run_evaluator() built on litellm.acompletion().
+    Prompt building, output writing and verdict validation are shared with the
+    sync path, so embedding hosts can run many evaluations on one event loop::
+
+        codes = await asyncio.gather(
+            *(run_evaluator_async(config, f) for f in files)
+        )
+
+    Args:
+        config: Evaluator configuration
+        file_path: Path to file to evaluate
+        timeout: Timeout in seconds (default: 180)
+        use_cache: Serve unchanged inputs from the response cache (default: True)
+        stream: Write the output file as tokens arrive (default: False)
+        echo: With stream, also echo tokens to stdout (default: False)
+
+    Returns:
+        0 on success, non-zero on failure
+    """
+    prefix = config.log_prefix or config.name.upper()
+    print(f"{prefix}: Evaluating {file_path}")
+    print()
+
+    if not os.path.exists(file_path):
+        print(f"{RED}Error: File not found: {file_path}{RESET}")
+        return 1
+
+    with metrics.recording():
+        prepared = _prepare_run(config)
+        if prepared is None:
+            return 1
+        project_config, resolved_model, resolved_api_key_env = prepared
+
+        # The large-file check may prompt on a TTY; keep input() off the event loop
+        with metrics.phase("preflight"):
+            status = await asyncio.to_thread(_preflight, config, file_path, resolved_model)
+        if status is not None:
+            return status
+
+        result = await _evaluate_file_async(
+            config,
+            file_path,
+            project_config,
+            timeout,
+            resolved_model,
+            resolved_api_key_env,
+            use_cache=use_cache,
+            stream=stream,
+            echo=echo,
+        )
+        return result.exit_code
+
+
+def _prepare_run(config: EvaluatorConfig) -> tuple[dict, str, str] | None:
+    """Load project config, resolve the model and check its API key.
+
+    Shared by every entry point that runs evaluations. Prints the error and
+    returns None when the run cannot proceed.
+
+    Returns:
+        (project_config, resolved_model, resolved_api_key_env) or None
+    """
+    with metrics.phase("config"):
+        project_config = _load_project_config()
+    if project_config is None:
+        return None
+    with metrics.phase("resolve"), tracing.span("adversarial.resolve_model") as span:
+        resolved = _resolve_model(config)
+        if resolved is not None:
+            span.set_attribute("gen_ai.request.model", resolved[0])
+    if resolved is None:
+        return None
+    return project_config, *resolved
+
+
+def _load_project_config() -> dict | None:
+    """Load .adversarial/config.yml, or print an error and return None if not initialized."""
+    # Load project config (check initialization first)
     config_path = Path(".adversarial/config.yml")
     if not config_path.exists():
         print(f"{RED}Error: Not initialized. Run 'adversarial init' first.{RESET}")
-        return 1
-    project_config = load_config()
+        return None
+    return load_config()
+
 
-    # 3. Resolve model (ADV-0015: dual-field support)
+def _resolve_model(config: EvaluatorConfig) -> tuple[str, str] | None:
+    """Resolve the evaluator's model and check its API key is set.
+
+    Returns:
+        (resolved_model, resolved_api_key_env), or None after printing the error
+    """
+    # Resolve model (ADV-0015: dual-field support)
     resolver = ModelResolver()
     try:
         resolved_model, resolved_api_key_env = resolver.resolve(config)
     except ResolutionError as e:
         print(f"{RED}Error: {e}{RESET}")
-        return 1
+        return None
 
-    # 4. Check API key (using resolved api_key_env)
+    # Check API key (using resolved api_key_env)
     api_key = os.environ.get(resolved_api_key_env)
     if not api_key:
         print(f"{RED}Error: {resolved_api_key_env} not set{RESET}")
         print(f"   Set in .env or export {resolved_api_key_env}=your-key")
+        return None
+
+    return resolved_model, resolved_api_key_env
+
+
+def _preflight(config: EvaluatorConfig, file_path: str, model: str) -> int | None:
+    """Check the file fits the model's context window, then apply the size gate.
+
+    The file is read and tokenized once for both checks.
+
+    Returns:
+        None to proceed, 1 if the input cannot fit, 0 if the user cancelled
+    """
+    line_count, document_tokens = _check_file_size(file_path, model)
+    if not _fits_context(config, file_path, model, document_tokens):
         return 1
+    if not _confirm_large_file(line_count, document_tokens):
+        print("Evaluation cancelled.")
+        return 0
+    return None
+
 
-    # 5. Pre-flight file size check
-    line_count, estimated_tokens = _check_file_size(file_path)
-    if line_count > 500 or estimated_tokens > 20000:
-        _warn_large_file(line_count, estimated_tokens)
+def _confirm_large_file(line_count: int, tokens: int) -> bool:
+    """Warn about large files and ask to continue. Returns False if cancelled."""
+    if line_count > 500 or tokens > 20000:
+        _warn_large_file(line_count, tokens)
         if line_count > 700 and not _confirm_continue():
-            print("Evaluation cancelled.")
-            return 0
+            return False
+    return True
+
+
+def _fits_context(
+    config: EvaluatorConfig, file_path: str, model: str, document_tokens: int
+) -> bool:
+    """Return False (after printing why) if prompt plus document exceed the context window.
+
+    Models without a known context window always pass.
+    """
+    window = context_window(model)
+    if window is None:
+        return True
+    # Evaluator prompt and template, without the document itself
+    total = count_tokens(_messages_text(_build_messages(config, file_path, "")), model)
+    total += document_tokens
+    if total <= window:
+        return True
+    print(f"{RED}Error: Input too large for {model}{RESET}")
+    print(f"   Prompt + document: {total:,} tokens (context window: {window:,})")
+    print("   Tip: --chunked evaluates it section by section in parallel")
+    return False
 
-    # 6. Run evaluator via LiteLLM (all evaluators use the same path)
-    return _run_custom_evaluator(
-        config, file_path, project_config, timeout, resolved_model, resolved_api_key_env
-    )
+
+# Providers that only cache prompt prefixes marked with cache_control (OpenAI,
+# DeepSeek and Gemini cache long prefixes automatically)
+_CACHE_MARKER_PROVIDERS = {"anthropic", "bedrock", "vertex_ai"}
+
+
+def _build_messages(
+    config: EvaluatorConfig, file_path: str, file_content: str, instructions: str = ""
+) -> list[dict]:
+    """Build the messages: static evaluator prompt (system) then the document (user).
+
+    Keeping the prompt in its own leading message makes it an identical
+    prefix on every call, which is what provider prompt caches match on.
+    Per-call ``instructions`` therefore go in the user message, ahead of the
+    document, never into the prompt.
+    """
+    document = f"""## Document to Evaluate
+
+**File**: {file_path}
+
+{file_content}
+"""
+    if instructions:
+        document = f"{instructions.strip()}\n\n---\n\n{document}"
+    messages = [{"role": "user", "content": document}]
+    if config.prompt:
+        messages.insert(0, {"role": "system", "content": config.prompt})
+    return messages
+
+
+def _messages_text(messages: list[dict]) -> str:
+    """Return the plain text of messages built by _build_messages()."""
+    return "\n\n".join(m["content"] for m in messages)
+
+
+def _cacheable_messages(messages: list[dict], model: str) -> list[dict]:
+    """Return messages with a cache_control marker on the system prompt, if the model needs one."""
+    if messages[0]["role"] != "system" or not _needs_cache_marker(model):
+        return messages
+    system = {
+        "role": "system",
+        "content": [
+            {
+                "type": "text",
+                "text": messages[0]["content"],
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+    }
+    return [system, *messages[1:]]
+
+
+def _needs_cache_marker(model: str) -> bool:
+    """Return True if the model supports prompt caching only via explicit markers."""
+    if provider_for_model(model) not in _CACHE_MARKER_PROVIDERS:
+        return False
+    try:
+        return bool(litellm.utils.supports_prompt_caching(model))
+    except Exception:
+        return False
+
+
+def _output_path(config: EvaluatorConfig, file_path: str, project_config: dict) -> Path:
+    """Return the output path ({log_directory}/{basename}-{suffix}.md), creating the dir."""
+    logs_dir = Path(project_config["log_directory"])
+    logs_dir.mkdir(parents=True, exist_ok=True)
+
+    file_basename = Path(file_path).stem
+    suffix = _normalize_output_suffix(config.output_suffix)
+    return logs_dir / f"{file_basename}-{suffix}.md"
+
+
+def _output_header(
+    config: EvaluatorConfig,
+    file_path: str,
+    model: str,
+    cached: bool = False,
+    fallback_from: str | None = None,
+) -> str:
+    """Return the metadata header written above the model output.
+
+    ``model`` is the model that actually answered; ``fallback_from`` names
+    the primary model when the evaluator failed over to its fallback_model.
+    """
+    suffix = _normalize_output_suffix(config.output_suffix)
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    fallback_line = f"**Fallback**: primary model {fallback_from} failed\n" if fallback_from else ""
+    cache_line = "**Cache**: hit (input unchanged)\n" if cached else ""
+    return f"""# {suffix.replace("-", " ").replace("_", " ").title()}
+
+**Source**: {file_path}
+**Evaluator**: {config.name}
+**Model**: {model}
+{fallback_line}**Generated**: {timestamp}
+{cache_line}
+---
+
+"""
 
 
 def _run_custom_evaluator(
@@ -95,6 +419,9 @@ def _run_custom_evaluator(
     timeout: int,
     resolved_model: str,
     resolved_api_key_env: str = "",
+    use_cache: bool = True,
+    stream: bool = False,
+    echo: bool = False,
 ) -> int:
     """Run an evaluator via litellm.completion().
 
@@ -105,87 +432,823 @@ def _run_custom_evaluator(
         timeout: Timeout in seconds
         resolved_model: Resolved model ID from ModelResolver
         resolved_api_key_env: Resolved API key env var name (for error messages)
+        use_cache: Serve unchanged inputs from the response cache
+        stream: Write the output file as tokens arrive
+        echo: With stream, also echo tokens to stdout
     """
-    # Prepare output path
-    logs_dir = Path(project_config["log_directory"])
-    logs_dir.mkdir(parents=True, exist_ok=True)
+    result = _evaluate_file(
+        config,
+        file_path,
+        project_config,
+        timeout,
+        resolved_model,
+        resolved_api_key_env,
+        use_cache=use_cache,
+        stream=stream,
+        echo=echo,
+    )
+    return result.exit_code
 
-    file_basename = Path(file_path).stem
-    suffix = _normalize_output_suffix(config.output_suffix)
-    output_file = logs_dir / f"{file_basename}-{suffix}.md"
 
-    # Read input file
-    file_content = Path(file_path).read_text(encoding="utf-8")
+@dataclass
+class _EvaluationRequest:
+    """Per-file state shared by the sync and async evaluation paths."""
 
-    # Build full prompt
-    full_prompt = f"""{config.prompt}
+    result: EvaluationResult
+    output_file: Path
+    messages: list[dict]
+    cache: ResponseCache | None = None
+    cache_key: str = ""
+    cached_output: str | None = None
+    # Set once streamed output has been written to output_file
+    streamed: bool = False
+    # Metadata header written above the streamed output
+    streamed_header: str = ""
+    # "model (reason)" of the primary model when a fallback model answered
+    fallback_from: str | None = None
+    # Client-side pacing (None when no rate_limits are configured)
+    rate_limiter: RateLimiter | None = None
+    # Per-provider concurrency cap of a batch-style run, held per model call
+    provider_limiter: ProviderLimiter | None = None
+    estimated_tokens: int = 0
+    # Total tokens reported by the provider for the last call, if any
+    usage_tokens: int | None = None
 
----
 
-## Document to Evaluate
+def _evaluate_file(
+    config: EvaluatorConfig,
+    file_path: str,
+    project_config: dict,
+    timeout: int,
+    resolved_model: str,
+    resolved_api_key_env: str = "",
+    quiet: bool = False,
+    use_cache: bool = True,
+    stream: bool = False,
+    echo: bool = False,
+    content: str | None = None,
+    instructions: str = "",
+    limiter: ProviderLimiter | None = None,
+) -> EvaluationResult:
+    """Evaluate one file via litellm.completion() and return the structured result.
 
-**File**: {file_path}
+    Args:
+        config: Evaluator configuration
+        file_path: Path to file to evaluate
+        project_config: Project configuration dict
+        timeout: Timeout in seconds
+        resolved_model: Resolved model ID from ModelResolver
+        resolved_api_key_env: Resolved API key env var name (for error messages)
+        quiet: Suppress per-file terminal output (batch mode reports a summary
+            instead); errors are returned in EvaluationResult.error
+        use_cache: Serve unchanged inputs from the response cache
+        stream: Write the output file as tokens arrive (partial output is kept
+            if the call fails part-way)
+        echo: With stream, also echo tokens to stdout
+        content: Text to evaluate instead of reading file_path (chunked mode
+            passes one section of the file, or the merged part reports)
+        instructions: Per-call instructions sent with the document, after the
+            unchanged evaluator prompt (chunked part scope, merge or update
+            instructions)
+        limiter: Per-provider concurrency cap shared by the workers of a
+            batch, chunked or multi-evaluator run. A slot is held for each
+            model call, for the provider of the model actually called (the
+            fallback model's provider after a failover).
+    """
+    with metrics.recording() as phases, _evaluation_span(config, file_path) as span:
+        start = time.perf_counter()
+        with metrics.phase("prepare"):
+            request = _start_evaluation(
+                config,
+                file_path,
+                project_config,
+                resolved_model,
+                quiet,
+                use_cache,
+                content,
+                instructions,
+            )
+            request.provider_limiter = limiter
+        result = _attempt_evaluation(
+            request, config, timeout, resolved_model, resolved_api_key_env, quiet, stream, echo
+        )
+        _log_metrics(result, config, project_config, phases, start)
+        _annotate_span(span, result)
+    return result
 
-{file_content}
-"""
 
-    prefix = config.log_prefix or config.name.upper()
+def _attempt_evaluation(
+    request: _EvaluationRequest,
+    config: EvaluatorConfig,
+    timeout: int,
+    resolved_model: str,
+    resolved_api_key_env: str,
+    quiet: bool,
+    stream: bool,
+    echo: bool,
+) -> EvaluationResult:
+    """Serve the request from the cache or call the model, retrying and failing over."""
+    try:
+        if request.cached_output is not None:
+            return _finish_evaluation(request.cached_output, request, config, quiet)
+
+        attempts = _Attempts(config, request, resolved_model, timeout, quiet)
+        while True:
+            try:
+                with metrics.phase("rate_limit"):
+                    key = _pace(request, attempts.model, attempts.api_key_env(resolved_api_key_env))
+                with _provider_slot(request, attempts.model):
+                    result = _complete(
+                        request, config, attempts.model, timeout, quiet, stream, echo
+                    )
+                _settle(request, key)
+                return result
+            except Exception as e:
+                delay = attempts.after_failure(e)
+                if delay is None:
+                    raise
+                with metrics.phase("backoff"):
+                    _backoff(delay)
+    except Exception as e:
+        result = _handle_llm_error(e, request.result, config, timeout, resolved_api_key_env, quiet)
+        return _keep_partial_output(result, request, quiet)
+
+
+def _complete(
+    request: _EvaluationRequest,
+    config: EvaluatorConfig,
+    model: str,
+    timeout: int,
+    quiet: bool,
+    stream: bool,
+    echo: bool,
+) -> EvaluationResult:
+    """Make one litellm.completion() call with ``model`` and finish the evaluation."""
+    request.result.model = model
+    provider = provider_for_model(model)
+    if stream:
+        writer = _StreamWriter(request, config, echo, quiet)
+        with _llm_span(model, provider, stream=True) as span:
+            with metrics.phase("model"), provider_context(provider):
+                chunks = litellm.completion(
+                    model=model,
+                    messages=_cacheable_messages(request.messages, model),
+                    timeout=timeout,
+                    stream=True,
+                    **_stream_options(model),
+                )
+                with writer:
+                    for chunk in chunks:
+                        writer.feed(chunk)
+            _record_usage(request, writer.usage, _usage_cost(model, writer.usage), config, quiet)
+            span.set_attributes(_usage_attributes(request.result))
+        return _finish_evaluation(writer.text, request, config, quiet)
+
+    # Call LiteLLM completion API
+    with _llm_span(model, provider) as span:
+        with metrics.phase("model"), provider_context(provider):
+            response = litellm.completion(
+                model=model,
+                messages=_cacheable_messages(request.messages, model),
+                timeout=timeout,
+            )
+        _record_usage(
+            request, getattr(response, "usage", None), _response_cost(response), config, quiet
+        )
+        span.set_attributes(_usage_attributes(request.result))
+    return _finish_evaluation(_response_text(response), request, config, quiet)
 
+
+async def _evaluate_file_async(
+    config: EvaluatorConfig,
+    file_path: str,
+    project_config: dict,
+    timeout: int,
+    resolved_model: str,
+    resolved_api_key_env: str = "",
+    quiet: bool = False,
+    use_cache: bool = True,
+    stream: bool = False,
+    echo: bool = False,
+) -> EvaluationResult:
+    """Async counterpart of _evaluate_file() using litellm.acompletion()."""
+    with metrics.recording() as phases, _evaluation_span(config, file_path) as span:
+        start = time.perf_counter()
+        with metrics.phase("prepare"):
+            request = _start_evaluation(
+                config, file_path, project_config, resolved_model, quiet, use_cache
+            )
+        result = await _attempt_evaluation_async(
+            request, config, timeout, resolved_model, resolved_api_key_env, quiet, stream, echo
+        )
+        _log_metrics(result, config, project_config, phases, start)
+        _annotate_span(span, result)
+    return result
+
+
+async def _attempt_evaluation_async(
+    request: _EvaluationRequest,
+    config: EvaluatorConfig,
+    timeout: int,
+    resolved_model: str,
+    resolved_api_key_env: str,
+    quiet: bool,
+    stream: bool,
+    echo: bool,
+) -> EvaluationResult:
+    """Async counterpart of _attempt_evaluation()."""
     try:
+        if request.cached_output is not None:
+            return _finish_evaluation(request.cached_output, request, config, quiet)
+
+        attempts = _Attempts(config, request, resolved_model, timeout, quiet)
+        while True:
+            try:
+                with metrics.phase("rate_limit"):
+                    key = await _pace_async(
+                        request, attempts.model, attempts.api_key_env(resolved_api_key_env)
+                    )
+                result = await _complete_async(
+                    request, config, attempts.model, timeout, quiet, stream, echo
+                )
+                _settle(request, key)
+                return result
+            except Exception as e:
+                delay = attempts.after_failure(e)
+                if delay is None:
+                    raise
+                with metrics.phase("backoff"):
+                    await _backoff_async(delay)
+    except Exception as e:
+        result = _handle_llm_error(e, request.result, config, timeout, resolved_api_key_env, quiet)
+        return _keep_partial_output(result, request, quiet)
+
+
+async def _complete_async(
+    request: _EvaluationRequest,
+    config: EvaluatorConfig,
+    model: str,
+    timeout: int,
+    quiet: bool,
+    stream: bool,
+    echo: bool,
+) -> EvaluationResult:
+    """Async counterpart of _complete() using litellm.acompletion()."""
+    request.result.model = model
+    provider = provider_for_model(model)
+    if stream:
+        writer = _StreamWriter(request, config, echo, quiet)
+        with _llm_span(model, provider, stream=True) as span:
+            with metrics.phase("model"), provider_context(provider):
+                chunks = await litellm.acompletion(
+                    model=model,
+                    messages=_cacheable_messages(request.messages, model),
+                    timeout=timeout,
+                    stream=True,
+                    **_stream_options(model),
+                )
+                with writer:
+                    async for chunk in chunks:
+                        writer.feed(chunk)
+            _record_usage(request, writer.usage, _usage_cost(model, writer.usage), config, quiet)
+            span.set_attributes(_usage_attributes(request.result))
+        return _finish_evaluation(writer.text, request, config, quiet)
+
+    with _llm_span(model, provider) as span:
+        with metrics.phase("model"), provider_context(provider):
+            response = await litellm.acompletion(
+                model=model,
+                messages=_cacheable_messages(request.messages, model),
+                timeout=timeout,
+            )
+        _record_usage(
+            request, getattr(response, "usage", None), _response_cost(response), config, quiet
+        )
+        span.set_attributes(_usage_attributes(request.result))
+    return _finish_evaluation(_response_text(response), request, config, quiet)
+
+
+class _Attempts:
+    """Retry/failover plan for one evaluation: primary model, then fallback_model.
+
+    Each model gets ``1 + config.retry.max_retries`` attempts on transient
+    errors. Nothing is retried once streamed output has reached the output
+    file, so partial output is never overwritten by a second attempt.
+    """
+
+    def __init__(
+        self,
+        config: EvaluatorConfig,
+        request: _EvaluationRequest,
+        resolved_model: str,
+        timeout: int,
+        quiet: bool,
+    ):
+        self.config = config
+        self.request = request
+        self.timeout = timeout
+        self.quiet = quiet
+        self.models = [resolved_model]
+        if config.fallback_model and config.fallback_model != resolved_model:
+            self.models.append(config.fallback_model)
+        self._index = 0
+        self._attempt = 0
+
+    @property
+    def model(self) -> str:
+        """Model to use for the next call."""
+        return self.models[self._index]
+
+    def api_key_env(self, resolved_api_key_env: str) -> str:
+        """API key env var of the next call (unknown for the fallback model)."""
+        return resolved_api_key_env if self._index == 0 else ""
+
+    def after_failure(self, error: Exception) -> float | None:
+        """Record a failed call and decide what happens next.
+
+        Returns:
+            Seconds to wait before calling again with ``self.model`` (which
+            may now be the fallback), or None to give up and surface ``error``
+        """
+        if self.request.streamed or not is_retryable(error):
+            return None
+
+        prefix = self.config.log_prefix or self.config.name.upper()
+        reason = _describe_transient_error(error, self.timeout)
+        policy = self.config.retry
+
+        if self._attempt < policy.max_retries:
+            delay = backoff_delay(policy, self._attempt, error)
+            if delay is not None:
+                self._attempt += 1
+                if not self.quiet:
+                    print(
+                        f"{YELLOW}{prefix}: {self.model} {reason}, retrying in {delay:.1f}s "
+                        f"(retry {self._attempt}/{policy.max_retries}){RESET}"
+                    )
+                return delay
+
+        if self._index + 1 < len(self.models):
+            failed = self.model
+            self._index += 1
+            self._attempt = 0
+            self.request.fallback_from = f"{failed} ({reason})"
+            if not self.quiet:
+                print(f"{YELLOW}{prefix}: {failed} {reason}, failing over to {self.model}{RESET}")
+            return 0.0
+
+        return None
+
+
+def _describe_transient_error(error: Exception, timeout: int) -> str:
+    """Return a short description of a retryable error for progress messages."""
+    if isinstance(error, litellm.RateLimitError):
+        return "rate limited"
+    if isinstance(error, litellm.Timeout):
+        return f"timed out (>{timeout}s)"
+    return f"unavailable ({type(error).__name__})"
+
+
+def _backoff(delay: float) -> None:
+    """Wait before retrying a model call."""
+    if delay > 0:
+        time.sleep(delay)
+
+
+async def _backoff_async(delay: float) -> None:
+    """Async counterpart of _backoff()."""
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+
+def _pace(request: _EvaluationRequest, model: str, api_key_env: str) -> str | None:
+    """Wait for rate-limit budget before a model call. Returns the budget key used."""
+    limiter = request.rate_limiter
+    key = limiter.key_for(model, api_key_env) if limiter else None
+    if key is not None:
+        limiter.acquire(key, request.estimated_tokens)
+    return key
+
+
+async def _pace_async(request: _EvaluationRequest, model: str, api_key_env: str) -> str | None:
+    """Async counterpart of _pace()."""
+    limiter = request.rate_limiter
+    key = limiter.key_for(model, api_key_env) if limiter else None
+    if key is not None:
+        await limiter.acquire_async(key, request.estimated_tokens)
+    return key
+
+
+def _provider_slot(request: _EvaluationRequest, model: str):
+    """Hold the run's concurrency slot for the provider serving ``model``, if capped."""
+    if request.provider_limiter is None:
+        return contextlib.nullcontext()
+    return request.provider_limiter.slot(model)
+
+
+def _settle(request: _EvaluationRequest, key: str | None) -> None:
+    """Charge the difference between actual and estimated tokens to the budget."""
+    if key is not None and request.usage_tokens is not None:
+        request.rate_limiter.adjust(key, request.usage_tokens - request.estimated_tokens)
+
+
+def _start_evaluation(
+    config: EvaluatorConfig,
+    file_path: str,
+    project_config: dict,
+    resolved_model: str,
+    quiet: bool,
+    use_cache: bool = True,
+    content: str | None = None,
+    instructions: str = "",
+) -> _EvaluationRequest:
+    """Read the input file, build the request and consult the response cache.
+
+    The returned request's result starts out as a failure and is filled in by
+    _finish_evaluation() or _handle_llm_error().
+    """
+    result = EvaluationResult(
+        file_path=file_path, evaluator=config.name, exit_code=1, model=resolved_model
+    )
+    output_file = _output_path(config, file_path, project_config)
+
+    # Read input file (unless the caller supplies the text to evaluate)
+    file_content = Path(file_path).read_text(encoding="utf-8") if content is None else content
+
+    request = _EvaluationRequest(
+        result=result,
+        output_file=output_file,
+        messages=_build_messages(config, file_path, file_content, instructions),
+    )
+
+    prefix = config.log_prefix or config.name.upper()
+
+    install_connection_pools(project_config)
+    request.rate_limiter = RateLimiter.from_project_config(project_config)
+    if request.rate_limiter is not None:
+        request.estimated_tokens = count_tokens(_messages_text(request.messages), resolved_model)
+
+    if use_cache:
+        request.cache = ResponseCache.from_project_config(project_config)
+    if request.cache is not None:
+        request.cache_key = ResponseCache.make_key(
+            resolved_model, config.prompt, config.version, instructions + file_content
+        )
+        request.cached_output = request.cache.get(request.cache_key)
+        if request.cached_output is not None:
+            if not quiet:
+                print(f"{prefix}: Input unchanged, using cached response ({resolved_model})")
+            return request
+
+    if not quiet:
         print(f"{prefix}: Using model {resolved_model}")
 
-        # Call LiteLLM completion API
-        response = litellm.completion(
-            model=resolved_model,
-            messages=[{"role": "user", "content": full_prompt}],
-            timeout=timeout,
+    return request
+
+
+def _response_text(response) -> str | None:
+    """Extract the completion text from a LiteLLM response."""
+    return response.choices[0].message.content
+
+
+def _usage_count(value) -> int | None:
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def _record_usage(
+    request: _EvaluationRequest, usage, cost: float | None, config: EvaluatorConfig, quiet: bool
+) -> None:
+    """Store the token usage of a model call and report cached input tokens."""
+    request.usage_tokens = _usage_count(getattr(usage, "total_tokens", None))
+    result = request.result
+    result.input_tokens = _usage_count(getattr(usage, "prompt_tokens", None))
+    result.output_tokens = _usage_count(getattr(usage, "completion_tokens", None))
+    details = getattr(usage, "prompt_tokens_details", None)
+    result.cached_input_tokens = _usage_count(getattr(details, "cached_tokens", None))
+    result.cost_usd = cost
+    if quiet or result.input_tokens is None:
+        return
+    prefix = config.log_prefix or config.name.upper()
+    cached = result.cached_input_tokens or 0
+    print(
+        f"{prefix}: Input tokens: {result.input_tokens:,} "
+        f"({cached:,} cached, {result.input_tokens - cached:,} uncached)"
+    )
+
+
+# Phases timed by run_evaluator() before the evaluation's own clock starts
+_SETUP_PHASES = {"config", "resolve", "preflight"}
+
+
+def _response_cost(response) -> float | None:
+    """Return the cost LiteLLM computed for a response, if it knows the model's pricing."""
+    hidden = getattr(response, "_hidden_params", None)
+    cost = hidden.get("response_cost") if isinstance(hidden, dict) else None
+    if isinstance(cost, (int, float)) and not isinstance(cost, bool):
+        return float(cost)
+    return None
+
+
+def _usage_cost(model: str, usage) -> float | None:
+    """Price streamed usage, which LiteLLM does not attach to the chunks."""
+    prompt = _usage_count(getattr(usage, "prompt_tokens", None))
+    completion = _usage_count(getattr(usage, "completion_tokens", None))
+    if prompt is None or completion is None:
+        return None
+    try:
+        prompt_cost, completion_cost = litellm.cost_per_token(
+            model=model, prompt_tokens=prompt, completion_tokens=completion
         )
+    except Exception:  # unknown pricing
+        return None
+    return prompt_cost + completion_cost
 
-        # Extract response content
-        output = response.choices[0].message.content
-        if output is None:
-            output = ""
-            print(f"{YELLOW}Warning: Model returned empty response{RESET}")
 
-        # Write output with metadata header
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-        header = f"""# {suffix.replace("-", " ").replace("_", " ").title()}
+def _stream_options(model: str) -> dict:
+    """Ask for a final usage chunk where the provider supports it."""
+    try:
+        supported = litellm.get_supported_openai_params(model=model) or []
+    except Exception:
+        supported = []
+    return {"stream_options": {"include_usage": True}} if "stream_options" in supported else {}
 
-**Source**: {file_path}
-**Evaluator**: {config.name}
-**Model**: {resolved_model}
-**Generated**: {timestamp}
 
----
+def _log_metrics(
+    result: EvaluationResult,
+    config: EvaluatorConfig,
+    project_config: dict,
+    phases: dict[str, float],
+    start: float,
+) -> None:
+    """Append the evaluation's telemetry record to the project's metrics log."""
+    log = metrics.MetricsLog.from_project_config(project_config)
+    if log is None:
+        return
+    # Setup phases inherited from run_evaluator() ran before ``start``
+    setup = sum(v for k, v in phases.items() if k in _SETUP_PHASES)
+    log.append(
+        {
+            "timestamp": metrics.utc_now(),
+            "evaluator": config.name,
+            "evaluator_version": config.version,
+            "model": result.model,
+            "file": result.file_path,
+            "verdict": result.verdict,
+            "exit_code": result.exit_code,
+            "error": result.error,
+            "cached": result.cached,
+            "duration_ms": round(setup + (time.perf_counter() - start) * 1000, 1),
+            "phases": {name: round(ms, 1) for name, ms in phases.items()},
+            "tokens": {
+                "prompt": result.input_tokens,
+                "completion": result.output_tokens,
+                "cached": result.cached_input_tokens,
+            },
+            "cost_usd": result.cost_usd,
+        }
+    )
 
-"""
-        output_file.write_text(header + output, encoding="utf-8")
 
+def _evaluation_span(config: EvaluatorConfig, file_path: str):
+    """Span covering one evaluation, from prompt building to the verdict."""
+    return tracing.span(
+        "adversarial.evaluate",
+        {
+            "adversarial.evaluator": config.name,
+            "adversarial.evaluator.version": config.version,
+            "adversarial.file": file_path,
+        },
+    )
+
+
+def _llm_span(model: str, provider: str, stream: bool = False):
+    """Client span for one model call, named per the GenAI semantic conventions."""
+    return tracing.span(
+        f"chat {model}",
+        {
+            "gen_ai.operation.name": "chat",
+            "gen_ai.system": provider,
+            "gen_ai.request.model": model,
+            "adversarial.stream": stream,
+        },
+        kind=tracing.SPAN_KIND_CLIENT,
+    )
+
+
+def _usage_attributes(result: EvaluationResult) -> dict:
+    return {
+        "gen_ai.usage.input_tokens": result.input_tokens,
+        "gen_ai.usage.output_tokens": result.output_tokens,
+        "adversarial.usage.cached_input_tokens": result.cached_input_tokens,
+        "adversarial.cost_usd": result.cost_usd,
+    }
+
+
+def _annotate_span(span, result: EvaluationResult) -> None:
+    """Record the evaluation's outcome on its span."""
+    span.set_attributes(
+        {
+            "gen_ai.request.model": result.model,
+            "adversarial.verdict": result.verdict,
+            "adversarial.exit_code": result.exit_code,
+            "adversarial.cached": result.cached,
+            **_usage_attributes(result),
+        }
+    )
+    if result.error:
+        span.fail(result.error)
+
+
+def _chunk_text(chunk) -> str:
+    """Extract the text delta from a LiteLLM streaming chunk."""
+    if not chunk.choices:
+        return ""
+    return chunk.choices[0].delta.content or ""
+
+
+class _StreamWriter:
+    """Append streamed chunks to the output file as they arrive.
+
+    The file (header first) is only opened when the first non-empty chunk
+    arrives, so a call that fails before producing anything leaves a previous
+    output file untouched. Also echoes chunks to stdout when requested and
+    reports an explicit ``Verdict:`` line as soon as it is complete.
+    """
+
+    def __init__(
+        self, request: _EvaluationRequest, config: EvaluatorConfig, echo: bool, quiet: bool
+    ):
+        self.request = request
+        self.config = config
+        self.echo = echo and not quiet
+        self.quiet = quiet
+        self.scanner = VerdictScanner()
+        self._parts: list[str] = []
+        self._file = None
+        # Token usage, sent on the final chunk when requested
+        self.usage = None
+
+    @property
+    def text(self) -> str:
+        """All output received so far."""
+        return "".join(self._parts)
+
+    def __enter__(self) -> _StreamWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def feed(self, chunk) -> None:
+        """Write one streaming chunk and keep any usage it carries."""
+        usage = getattr(chunk, "usage", None)
+        if usage is not None:
+            self.usage = usage
+        self.write(_chunk_text(chunk))
+
+    def write(self, text: str) -> None:
+        """Append one chunk to the output file (and stdout when echoing)."""
+        if not text:
+            return
+        if self._file is None:
+            result = self.request.result
+            header = _output_header(
+                self.config,
+                result.file_path,
+                result.model,
+                fallback_from=self.request.fallback_from,
+            )
+            self._file = open(self.request.output_file, "w", encoding="utf-8")  # noqa: SIM115
+            self._file.write(header)
+            self.request.streamed = True
+            self.request.streamed_header = header
+            result.output_file = str(self.request.output_file)
+        self._parts.append(text)
+        self._file.write(text)
+        self._file.flush()
+
+        if self.echo:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        self._note_verdict(self.scanner.feed(text))
+
+    def close(self) -> None:
+        """Close the output file and report a verdict on an unterminated last line."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._note_verdict(self.scanner.finish())
+        if self.echo and self._parts:
+            print()
+
+    def _note_verdict(self, verdict: str | None) -> None:
+        # When echoing, the verdict line is already on screen
+        if verdict and not self.quiet and not self.echo:
+            prefix = self.config.log_prefix or self.config.name.upper()
+            print(f"{prefix}: Verdict detected: {verdict} (still receiving output)")
+
+
+def _finish_evaluation(
+    output: str | None,
+    request: _EvaluationRequest,
+    config: EvaluatorConfig,
+    quiet: bool,
+) -> EvaluationResult:
+    """Write the model output to the output file and determine the verdict."""
+    prefix = config.log_prefix or config.name.upper()
+    result = request.result
+    output_file = request.output_file
+    from_cache = request.cached_output is not None
+
+    if output is None:
+        output = ""
+        if not quiet:
+            print(f"{YELLOW}Warning: Model returned empty response{RESET}")
+
+    # Write output with metadata header (already on disk when streamed)
+    if request.streamed:
+        content = request.streamed_header + output
+    else:
+        header = _output_header(
+            config,
+            result.file_path,
+            result.model,
+            cached=from_cache,
+            fallback_from=request.fallback_from,
+        )
+        content = header + output
+        with metrics.phase("write"):
+            output_file.write_text(content, encoding="utf-8")
+    result.output_file = str(output_file)
+    result.cached = from_cache
+
+    if not quiet:
         print(f"{prefix}: Output written to {output_file}")
 
-        # Validate output and determine verdict
-        is_valid, verdict, message = validate_evaluation_output(str(output_file))
+    # Validate the text just written instead of reading the file back
+    with metrics.phase("validate"):
+        is_valid, verdict, message = validate_evaluation_content(content)
 
-        if not is_valid:
+    if not is_valid:
+        result.error = message
+        if not quiet:
             print(f"{RED}Evaluation failed: {message}{RESET}")
-            return 1
+        return result
 
-        return _report_verdict(verdict, output_file, config)
+    # Only cache valid evaluations from the requested model (the key names it)
+    if request.cache is not None and not from_cache and not request.fallback_from:
+        request.cache.set(request.cache_key, output, model=result.model)
 
-    except litellm.RateLimitError:
-        _print_rate_limit_error(file_path)
-        return 1
-    except litellm.AuthenticationError:
+    result.verdict = verdict
+    if quiet:
+        result.exit_code = _verdict_exit_code(verdict)
+    else:
+        result.exit_code = _report_verdict(verdict, output_file, config)
+    return result
+
+
+def _handle_llm_error(
+    error: Exception,
+    result: EvaluationResult,
+    config: EvaluatorConfig,
+    timeout: int,
+    resolved_api_key_env: str,
+    quiet: bool,
+) -> EvaluationResult:
+    """Translate a LiteLLM exception into a failed EvaluationResult (and print it)."""
+    if isinstance(error, litellm.RateLimitError):
+        result.error = "API rate limit exceeded"
+        if not quiet:
+            _print_rate_limit_error(result.file_path)
+    elif isinstance(error, litellm.AuthenticationError):
         api_key_name = resolved_api_key_env or config.api_key_env or "API key"
-        print(f"{RED}Error: Invalid API key for {api_key_name}{RESET}")
-        print(f"   Check your {api_key_name} environment variable")
-        return 1
-    except litellm.Timeout:
-        _print_timeout_error(timeout)
-        return 1
-    except Exception as e:
-        print(f"{RED}Error: LLM call failed: {e}{RESET}")
-        return 1
+        result.error = f"Invalid API key for {api_key_name}"
+        if not quiet:
+            print(f"{RED}Error: Invalid API key for {api_key_name}{RESET}")
+            print(f"   Check your {api_key_name} environment variable")
+    elif isinstance(error, litellm.Timeout):
+        result.error = f"Evaluation timed out (>{timeout}s)"
+        if not quiet:
+            _print_timeout_error(timeout)
+    else:
+        result.error = f"LLM call failed: {error}"
+        if not quiet:
+            print(f"{RED}Error: LLM call failed: {error}{RESET}")
+    result.exit_code = 1
+    return result
+
+
+def _keep_partial_output(
+    result: EvaluationResult, request: _EvaluationRequest, quiet: bool
+) -> EvaluationResult:
+    """Point a failed result at the partial output of an interrupted stream, if any."""
+    if not request.streamed:
+        return result
+    result.output_file = str(request.output_file)
+    result.error = f"{result.error} (partial output kept)"
+    if not quiet:
+        print(f"{YELLOW}   Partial output kept: {request.output_file}{RESET}")
+    return result
 
 
 _PASS_VERDICTS = {"APPROVED", "PROCEED", "COMPLIANT", "PASS"}
@@ -193,6 +1256,13 @@ _REVISE_VERDICTS = {"NEEDS_REVISION", "REVISION_SUGGESTED", "MOSTLY_COMPLIANT",
 _REJECT_VERDICTS = {"REJECTED", "RETHINK", "RESTRUCTURE_NEEDED", "NON_COMPLIANT", "FAIL"}
 
 
+def _verdict_exit_code(verdict: str | None) -> int:
+    """Map a verdict to the exit code reported by _report_verdict (without printing)."""
+    if verdict in _REVISE_VERDICTS or verdict in _REJECT_VERDICTS:
+        return 1
+    return 0
+
+
 def _report_verdict(verdict: str | None, log_file: Path, config: EvaluatorConfig) -> int:
     """Report the evaluation verdict to terminal."""
     print()
@@ -215,13 +1285,20 @@ def _report_verdict(verdict: str | None, log_file: Path, config: EvaluatorConfig
 
 
 # Helper functions
-def _check_file_size(file_path: str) -> tuple[int, int]:
-    """Return (line_count, estimated_tokens)."""
-    with open(file_path, encoding="utf-8") as f:
-        lines = f.readlines()
-        f.seek(0)
-        content = f.read()
-    return len(lines), len(content) // 4
+def _check_file_size(file_path: str, model: str | None = None) -> tuple[int, int]:
+    """Return (line_count, tokens), reading the file once.
+
+    Tokens are counted with the model's tokenizer when ``model`` is given,
+    otherwise (or if it is unavailable) estimated at ~4 characters per token.
+    """
+    content = Path(file_path).read_text(encoding="utf-8")
+    return _count_lines(content), count_tokens(content, model)
+
+
+def _count_lines(content: str) -> int:
+    """Count lines the way readlines() does (a trailing newline adds no line)."""
+    lines = content.count("\n")
+    return lines + 1 if content and not content.endswith("\n") else lines
 
 
 def _warn_large_file(line_count: int, tokens: int) -> None:
@@ -229,6 +1306,7 @@ def _warn_large_file(line_count: int, tokens: int) -> None:
     print(f"{YELLOW}Large file detected:{RESET}")
     print(f"   Lines: {line_count:,}")
     print(f"   Estimated tokens: ~{tokens:,}")
+    print("   Tip: --chunked evaluates it section by section in parallel")
     print()
 
 
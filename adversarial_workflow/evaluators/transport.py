@@ -0,0 +1,337 @@
+"""Shared, long-lived HTTP connection pools for model calls.
+
+Every model call in a process (single runs, batch workers, multi-evaluator
+runs, and every request a daemon serves) goes through one keep-alive pool
+per provider, so TLS handshakes are paid once per connection instead of once
+per evaluation. HTTP/2 is negotiated where the provider supports it and the
+``h2`` package is installed.
+
+The pools are handed to LiteLLM as ``litellm.client_session`` and
+``litellm.aclient_session``, the httpx clients it gives the OpenAI SDK for
+OpenAI-compatible providers. Providers that LiteLLM calls through its own
+HTTP handlers keep LiteLLM's cached per-process clients. A client session
+installed by a host application is left alone, and pooling is skipped when a
+proxy is configured in the environment (``HTTPS_PROXY``, ``https_proxy`` and
+the like, as httpx reads them), since custom transports would bypass it.
+
+Configured in .adversarial/config.yml (all keys optional)::
+
+    http_pool:
+      enabled: true
+      max_connections: 20            # per provider
+      max_keepalive_connections: 10
+      keepalive_expiry: 60           # seconds an idle connection is kept
+      http2: true
+      providers:
+        anthropic:
+          max_connections: 5
+
+Reuse is counted per provider (see connection_pool_stats()): a request that
+went out on an idle pooled connection is a hit, one that had to open a new
+connection is a miss.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import importlib.util
+import logging
+import threading
+import urllib.request
+import weakref
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+import litellm
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+
+# Pool used for requests made outside provider_context()
+DEFAULT_POOL = "default"
+
+# httpx negotiates HTTP/2 only with the optional h2 package installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Provider whose pool serves requests made in the current context
+_PROVIDER: ContextVar[str | None] = ContextVar("adversarial_http_provider", default=None)
+
+_INSTALL_LOCK = threading.Lock()
+_pools: ConnectionPools | None = None
+
+
+@dataclass(frozen=True)
+class PoolLimits:
+    """Connection limits for one provider's pool."""
+
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY
+    http2: bool = True
+
+    def merged(self, data: Any) -> PoolLimits:
+        """Return a copy with the valid values from a config mapping applied."""
+        if not isinstance(data, dict):
+            return self
+        changes: dict[str, Any] = {}
+        for field, cast in (
+            ("max_connections", int),
+            ("max_keepalive_connections", int),
+            ("keepalive_expiry", float),
+        ):
+            if field not in data:
+                continue
+            try:
+                value = cast(data[field])
+            except (TypeError, ValueError):
+                logger.warning("Ignoring invalid http_pool %s: %r", field, data[field])
+                continue
+            if value > 0 or (field != "max_connections" and value == 0):
+                changes[field] = value
+            else:
+                logger.warning("Ignoring invalid http_pool %s: %r", field, data[field])
+        if "http2" in data:
+            changes["http2"] = bool(data["http2"])
+        return dataclasses.replace(self, **changes)
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Settings for the shared pools (``http_pool`` in config.yml)."""
+
+    enabled: bool = True
+    defaults: PoolLimits = PoolLimits()
+    providers: tuple[tuple[str, PoolLimits], ...] = ()
+
+    @classmethod
+    def from_project_config(cls, project_config: dict[str, Any]) -> PoolSettings:
+        """Build from the loaded project config, ignoring invalid values."""
+        data = project_config.get("http_pool")
+        if not isinstance(data, dict):
+            return cls()
+        defaults = PoolLimits().merged(data)
+        providers = data.get("providers")
+        overrides = []
+        if isinstance(providers, dict):
+            for name, value in sorted(providers.items(), key=lambda item: str(item[0])):
+                overrides.append((str(name), defaults.merged(value)))
+        return cls(
+            enabled=bool(data.get("enabled", True)),
+            defaults=defaults,
+            providers=tuple(overrides),
+        )
+
+    def limits_for(self, provider: str) -> PoolLimits:
+        """Return the limits for a provider's pool."""
+        return dict(self.providers).get(provider, self.defaults)
+
+
+@dataclass
+class PoolStats:
+    """Request counts for one provider's pool."""
+
+    requests: int = 0
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of requests that reused an open connection (0.0 when idle)."""
+        return self.hits / self.requests if self.requests else 0.0
+
+
+class ConnectionPools:
+    """Per-provider httpx transports behind one sync and one async client."""
+
+    def __init__(self, settings: PoolSettings):
+        self.settings = settings
+        self._lock = threading.Lock()
+        self._sync: dict[str, httpx.HTTPTransport] = {}
+        # Async connections belong to the event loop that opened them
+        self._async: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, httpx.AsyncHTTPTransport]
+        ] = weakref.WeakKeyDictionary()
+        self._stats: dict[str, PoolStats] = {}
+        self.client = httpx.Client(transport=_PooledTransport(self), follow_redirects=True)
+        self.async_client = httpx.AsyncClient(
+            transport=_AsyncPooledTransport(self), follow_redirects=True
+        )
+
+    def stats(self) -> dict[str, PoolStats]:
+        """Return a snapshot of the per-provider request counts."""
+        with self._lock:
+            return {name: dataclasses.replace(s) for name, s in self._stats.items()}
+
+    def reconfigure(self, settings: PoolSettings) -> None:
+        """Apply new settings; connections are pooled under them from now on.
+
+        Existing pools are dropped rather than closed, so requests still in
+        flight on them can finish.
+        """
+        with self._lock:
+            self.settings = settings
+            self._sync = {}
+            self._async = weakref.WeakKeyDictionary()
+
+    def _transport_kwargs(self, provider: str) -> dict[str, Any]:
+        limits = self.settings.limits_for(provider)
+        return {
+            "limits": httpx.Limits(
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                keepalive_expiry=limits.keepalive_expiry,
+            ),
+            "http2": limits.http2 and _HTTP2_AVAILABLE,
+        }
+
+    def _sync_transport(self, provider: str) -> httpx.HTTPTransport:
+        with self._lock:
+            transport = self._sync.get(provider)
+            if transport is None:
+                transport = httpx.HTTPTransport(**self._transport_kwargs(provider))
+                self._sync[provider] = transport
+            return transport
+
+    def _async_transport(self, provider: str) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transports = self._async.setdefault(loop, {})
+            transport = transports.get(provider)
+            if transport is None:
+                transport = httpx.AsyncHTTPTransport(**self._transport_kwargs(provider))
+                transports[provider] = transport
+            return transport
+
+    def _record(self, provider: str, opened: bool) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(provider, PoolStats())
+            stats.requests += 1
+            if opened:
+                stats.misses += 1
+            else:
+                stats.hits += 1
+
+
+class _PooledTransport(httpx.BaseTransport):
+    """Routes each request to the pool of the provider in context."""
+
+    def __init__(self, pools: ConnectionPools):
+        self._pools = pools
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        provider = _PROVIDER.get() or DEFAULT_POOL
+        opened = _watch_connects(request, asynchronous=False)
+        response = self._pools._sync_transport(provider).handle_request(request)
+        self._pools._record(provider, bool(opened))
+        return response
+
+
+class _AsyncPooledTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of _PooledTransport."""
+
+    def __init__(self, pools: ConnectionPools):
+        self._pools = pools
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        provider = _PROVIDER.get() or DEFAULT_POOL
+        opened = _watch_connects(request, asynchronous=True)
+        transport = self._pools._async_transport(provider)
+        response = await transport.handle_async_request(request)
+        self._pools._record(provider, bool(opened))
+        return response
+
+
+def _watch_connects(request: httpx.Request, asynchronous: bool) -> list[str]:
+    """Record, via httpcore's trace hook, whether the request opens a connection.
+
+    Returns a list that gains an entry for every new connection; an existing
+    ``trace`` extension keeps receiving its events.
+    """
+    opened: list[str] = []
+    previous: Callable[..., Any] | None = request.extensions.get("trace")
+
+    def note(name: str) -> None:
+        if name.startswith("connection.connect_") and name.endswith(".started"):
+            opened.append(name)
+
+    if asynchronous:
+
+        async def trace(name: str, info: dict[str, Any]) -> None:
+            note(name)
+            if previous is not None:
+                await previous(name, info)
+
+    else:
+
+        def trace(name: str, info: dict[str, Any]) -> None:
+            note(name)
+            if previous is not None:
+                previous(name, info)
+
+    request.extensions = {**request.extensions, "trace": trace}
+    return opened
+
+
+def install_connection_pools(project_config: dict[str, Any]) -> ConnectionPools | None:
+    """Hand LiteLLM the shared pools configured for this project.
+
+    Idempotent: the pools are created on first use and kept for the life of
+    the process (LiteLLM caches SDK clients that hold on to them). When the
+    ``http_pool`` settings change, e.g. in a daemon serving another project,
+    the pools are resized for subsequent connections.
+
+    Returns:
+        The installed pools, or None if pooling is disabled, a proxy is
+        configured, or the host application set its own client session
+    """
+    global _pools
+    settings = PoolSettings.from_project_config(project_config)
+    with _INSTALL_LOCK:
+        if _pools is not None and litellm.client_session is _pools.client:
+            if _pools.settings != settings:
+                _pools.reconfigure(settings)
+            return _pools
+        if litellm.client_session is not None or litellm.aclient_session is not None:
+            return None
+        if not settings.enabled or _proxy_configured():
+            return None
+        _pools = ConnectionPools(settings)
+        litellm.client_session = _pools.client
+        litellm.aclient_session = _pools.async_client
+        return _pools
+
+
+def _proxy_configured() -> bool:
+    """Return True if the environment routes HTTP(S) requests through a proxy.
+
+    Uses the same lookup as httpx (``urllib.request.getproxies()``), which reads
+    upper- and lowercase ``*_proxy`` variables. ``NO_PROXY=*`` turns proxies off.
+    """
+    proxies = urllib.request.getproxies()
+    if proxies.get("no", "").strip() == "*":
+        return False
+    return any(proxies.get(scheme) for scheme in ("https", "http", "all"))
+
+
+def connection_pool_stats() -> dict[str, PoolStats]:
+    """Return per-provider hit/miss counts of the shared pools (empty if unused)."""
+    pools = _pools
+    return pools.stats() if pools is not None else {}
+
+
+@contextlib.contextmanager
+def provider_context(provider: str) -> Iterator[None]:
+    """Route HTTP requests made in this context to ``provider``'s pool."""
+    token = _PROVIDER.set(provider)
+    try:
+        yield
+    finally:
+        _PROVIDER.reset(token)
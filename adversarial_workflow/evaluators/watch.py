@@ -0,0 +1,213 @@
+"""Watch mode: re-evaluate task files whenever they change.
+
+``adversarial <evaluator> --watch PATH`` evaluates PATH, then keeps polling it
+and runs the evaluator again after each edit. PATH may also be a directory, in
+which case every Markdown file under it (skipping hidden directories and the
+configured log_directory, where the output files go) is watched and evaluated
+when it is created or changed.
+
+Files are polled with os.stat (mtime and size): one stat per file per
+interval, with no platform notification API or extra dependency. A change is
+acted on only once the file has been quiet for the debounce period, so an
+editor's burst of writes triggers one evaluation. Files whose content hash
+matches the last successfully evaluated content (e.g. saved without edits) are
+skipped; after a failed evaluation, saving again retries it.
+When a newer edit of a file is picked up while its previous evaluation is
+still running, that evaluation is cancelled (closing the request) rather than
+left to finish on stale content.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import os
+
+from ..utils.colors import BOLD, GRAY, RED, RESET, YELLOW
+from ..utils.config import load_config
+from .config import EvaluatorConfig
+from .runner import run_evaluator_async
+
+# Seconds between polls
+DEFAULT_POLL_INTERVAL = 0.5
+
+# Seconds a changed file must stay unchanged before it is evaluated
+DEFAULT_DEBOUNCE = 1.0
+
+# File types watched inside a directory
+WATCH_SUFFIXES = (".md",)
+
+
+def run_evaluator_watch(
+    config: EvaluatorConfig,
+    paths: list[str],
+    timeout: int = 180,
+    use_cache: bool = True,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    debounce: float = DEFAULT_DEBOUNCE,
+) -> int:
+    """Watch files and re-evaluate them on change until interrupted (Ctrl-C).
+
+    Args:
+        config: Evaluator configuration
+        paths: Files to evaluate now and on every change, or directories
+            whose Markdown files are evaluated when created or changed
+        timeout: Timeout per evaluation in seconds (default: 180)
+        use_cache: Serve unchanged inputs from the response cache (default: True)
+        poll_interval: Seconds between polls (default: 0.5)
+        debounce: Quiet period before a change is evaluated (default: 1.0)
+
+    Returns:
+        0 when stopped by the user, 1 if nothing can be watched
+    """
+    try:
+        return asyncio.run(
+            watch_evaluator(
+                config,
+                paths,
+                timeout=timeout,
+                use_cache=use_cache,
+                poll_interval=poll_interval,
+                debounce=debounce,
+            )
+        )
+    except KeyboardInterrupt:
+        print()
+        print("Stopped watching.")
+        return 0
+
+
+async def watch_evaluator(
+    config: EvaluatorConfig,
+    paths: list[str],
+    timeout: int = 180,
+    use_cache: bool = True,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    debounce: float = DEFAULT_DEBOUNCE,
+    stop: asyncio.Event | None = None,
+) -> int:
+    """Asyncio-native watch loop behind run_evaluator_watch().
+
+    Runs until ``stop`` is set (or the task is cancelled); in-flight
+    evaluations are cancelled on the way out.
+    """
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        print(f"{RED}Error: Cannot watch missing path(s): {', '.join(missing)}{RESET}")
+        return 1
+
+    stop = stop or asyncio.Event()
+    loop = asyncio.get_running_loop()
+    output_dir = _output_directory()
+    running: dict[str, asyncio.Task] = {}
+    started: dict[str, str] = {}  # path -> content hash of the latest evaluation started
+    evaluated: dict[str, str] = {}  # path -> content hash of the last successful evaluation
+    changed_at: dict[str, float] = {}  # path -> when a not-yet-evaluated change was seen
+
+    def finished(path: str, digest: str, task: asyncio.Task) -> None:
+        if running.get(path) is not task:
+            return  # superseded by a newer edit
+        if not task.cancelled() and task.exception() is None and task.result() == 0:
+            evaluated[path] = digest
+        else:
+            # Failed or cancelled: the next save retries, even without edits
+            evaluated.pop(path, None)
+
+    def start(path: str) -> None:
+        digest = _content_hash(path)
+        if digest is None:
+            return
+        stale = running.get(path)
+        busy = stale is not None and not stale.done()
+        if digest == (started.get(path) if busy else evaluated.get(path)):
+            print(f"{GRAY}{path}: content unchanged, skipping{RESET}")
+            return
+        if busy:
+            stale.cancel()
+            print(f"{YELLOW}{path}: changed again, cancelled the in-flight evaluation{RESET}")
+        started[path] = digest
+        task = asyncio.create_task(
+            run_evaluator_async(config, path, timeout=timeout, use_cache=use_cache)
+        )
+        task.add_done_callback(lambda t: finished(path, digest, t))
+        running[path] = task
+
+    state = _snapshot(paths, output_dir)
+    for path in paths:
+        if os.path.isfile(path):
+            start(path)
+    print(
+        f"{BOLD}Watching {len(state)} file(s) for changes{RESET} "
+        f"(poll {poll_interval}s, debounce {debounce}s; Ctrl-C to stop)"
+    )
+
+    try:
+        while not stop.is_set():
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(stop.wait(), timeout=poll_interval)
+            current = _snapshot(paths, output_dir)
+            now = loop.time()
+            for path, signature in current.items():
+                if state.get(path) != signature:
+                    changed_at[path] = now
+            state = current
+
+            for path, seen in list(changed_at.items()):
+                if now - seen >= debounce:
+                    del changed_at[path]
+                    if path in state:
+                        start(path)
+    finally:
+        for task in running.values():
+            task.cancel()
+        await asyncio.gather(*running.values(), return_exceptions=True)
+    return 0
+
+
+def _output_directory() -> str | None:
+    """Resolved log_directory, where evaluation outputs are written."""
+    try:
+        return os.path.realpath(load_config()["log_directory"])
+    except Exception:  # unreadable config; the evaluation itself reports it
+        return None
+
+
+def _snapshot(paths: list[str], output_dir: str | None = None) -> dict[str, tuple[int, int]]:
+    """Return (mtime_ns, size) for every watched file that currently exists.
+
+    Inside watched directories, hidden directories and ``output_dir`` are
+    skipped so evaluation outputs never trigger evaluations themselves.
+    """
+    files: dict[str, tuple[int, int]] = {}
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs[:] = sorted(
+                    d
+                    for d in dirs
+                    if not d.startswith(".")
+                    and os.path.realpath(os.path.join(root, d)) != output_dir
+                )
+                for name in sorted(names):
+                    if name.endswith(WATCH_SUFFIXES):
+                        _add_signature(files, os.path.join(root, name))
+        else:
+            _add_signature(files, path)
+    return files
+
+
+def _add_signature(files: dict[str, tuple[int, int]], path: str) -> None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return
+    files[path] = (stat.st_mtime_ns, stat.st_size)
+
+
+def _content_hash(path: str) -> str | None:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
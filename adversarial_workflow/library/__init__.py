@@ -10,6 +10,7 @@ Philosophy: "Copy, Don't Link"
 - Updates are explicit and user-controlled
 """
 
+from .artifacts import DEFAULT_ARTIFACT_CACHE_MB, Artifact, ArtifactStore
 from .cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_TTL, CacheManager
 from .client import (
     DEFAULT_LIBRARY_URL,
@@ -23,15 +24,20 @@ from .commands import (
     library_info,
     library_install,
     library_list,
+    library_mirror,
     library_update,
 )
 from .config import LibraryConfig, get_library_config
+from .mirror import LibraryMirror
 from .models import EvaluatorEntry, IndexData, InstalledEvaluatorMeta, UpdateInfo
 
 __all__ = [
+    "DEFAULT_ARTIFACT_CACHE_MB",
     "DEFAULT_CACHE_DIR",
     "DEFAULT_CACHE_TTL",
     "DEFAULT_LIBRARY_URL",
+    "Artifact",
+    "ArtifactStore",
     "CacheManager",
     "EvaluatorEntry",
     "IndexData",
@@ -39,6 +45,7 @@ __all__ = [
     "LibraryClient",
     "LibraryClientError",
     "LibraryConfig",
+    "LibraryMirror",
     "NetworkError",
     "ParseError",
     "UpdateInfo",
@@ -47,5 +54,6 @@ __all__ = [
     "library_info",
     "library_install",
     "library_list",
+    "library_mirror",
     "library_update",
 ]
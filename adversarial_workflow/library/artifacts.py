@@ -0,0 +1,178 @@
+"""Content-addressed on-disk store for fetched library files.
+
+Evaluator YAMLs and READMEs are stored once per distinct content, under the
+SHA-256 of their bytes, and looked up through a small reference record per
+(library source, path)::
+
+    <cache_dir>/artifacts/objects/3f/3fa4...e1     file content
+    <cache_dir>/artifacts/refs/9b0c...77.json      {"sha256", "version", "validators", ...}
+
+The library source is the client's base URL, which includes the library ref.
+The reference record keeps the HTTP validators (ETag, Last-Modified) of the
+response and the library index version it was fetched under. The store lives
+in the user cache directory, so every project on a machine (or CI host)
+shares it.
+
+Writes go through a temporary file and a rename, so concurrent installs
+never see a partial file. Objects beyond the byte budget are evicted least
+recently used first; a reference whose object was evicted is a miss.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..utils.files import atomic_write, evict_lru, mark_used
+
+DEFAULT_ARTIFACT_CACHE_MB = 50
+
+
+@dataclass
+class Artifact:
+    """A stored library file and what is known about its origin."""
+
+    content: str
+    sha256: str
+    version: str | None = None
+    validators: dict[str, str] = field(default_factory=dict)
+
+
+class ArtifactStore:
+    """Content-addressed file store with LRU eviction above a byte budget."""
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = DEFAULT_ARTIFACT_CACHE_MB * 1024 * 1024,
+    ):
+        """
+        Args:
+            directory: Directory holding the store (``objects/`` and ``refs/``)
+            max_bytes: Size budget for stored objects; least recently used
+                objects are evicted above it
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    @property
+    def _objects(self) -> Path:
+        return self.directory / "objects"
+
+    @property
+    def _refs(self) -> Path:
+        return self.directory / "refs"
+
+    def _object_path(self, sha256: str) -> Path:
+        return self._objects / sha256[:2] / sha256
+
+    def _ref_path(self, source: str, path: str) -> Path:
+        digest = hashlib.sha256(f"{source}\0{path}".encode()).hexdigest()
+        return self._refs / f"{digest}.json"
+
+    def get(self, source: str, path: str) -> Artifact | None:
+        """Return the stored file for ``path`` in ``source``, or None on a miss.
+
+        An object whose content no longer matches its hash is discarded.
+        """
+        try:
+            with open(self._ref_path(source, path), encoding="utf-8") as f:
+                ref = json.load(f)
+            sha256 = ref["sha256"]
+            object_path = self._object_path(sha256)
+            data = object_path.read_bytes()
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if hashlib.sha256(data).hexdigest() != sha256:
+            with contextlib.suppress(OSError):
+                object_path.unlink()
+            return None
+
+        mark_used(object_path)
+        validators = ref.get("validators")
+        return Artifact(
+            content=data.decode("utf-8"),
+            sha256=sha256,
+            version=ref.get("version"),
+            validators=validators if isinstance(validators, dict) else {},
+        )
+
+    def put(
+        self,
+        source: str,
+        path: str,
+        content: str,
+        validators: dict[str, str] | None = None,
+        version: str | None = None,
+    ) -> str | None:
+        """Store ``content`` for ``path`` in ``source``. Returns its hash, or None on error."""
+        data = content.encode("utf-8")
+        sha256 = hashlib.sha256(data).hexdigest()
+        object_path = self._object_path(sha256)
+        try:
+            if object_path.exists():
+                mark_used(object_path)
+            else:
+                with atomic_write(object_path, "wb") as f:
+                    f.write(data)
+            self._write_ref(source, path, sha256, validators, version)
+        except OSError:
+            return None
+
+        self._evict()
+        return sha256
+
+    def refresh(
+        self,
+        source: str,
+        path: str,
+        artifact: Artifact,
+        validators: dict[str, str] | None = None,
+        version: str | None = None,
+    ) -> bool:
+        """Record that the server confirmed ``artifact`` is current (304 Not Modified)."""
+        try:
+            self._write_ref(source, path, artifact.sha256, validators, version)
+            return True
+        except OSError:
+            return False
+
+    def _write_ref(
+        self,
+        source: str,
+        path: str,
+        sha256: str,
+        validators: dict[str, str] | None,
+        version: str | None,
+    ) -> None:
+        ref = {
+            "source": source,
+            "path": path,
+            "sha256": sha256,
+            "version": version,
+            "validators": validators or {},
+            "stored": time.time(),
+        }
+        with atomic_write(self._ref_path(source, path), encoding="utf-8") as f:
+            json.dump(ref, f)
+
+    def _evict(self) -> None:
+        """Delete least recently used objects until the store fits max_bytes."""
+        evict_lru(self._objects.glob("*/*"), self.max_bytes)
+
+    def clear(self) -> int:
+        """Delete all objects and references. Returns the number of objects removed."""
+        count = 0
+        for path in self._objects.glob("*/*"):
+            with contextlib.suppress(OSError):
+                path.unlink()
+                count += 1
+        for path in self._refs.glob("*.json"):
+            with contextlib.suppress(OSError):
+                path.unlink()
+        return count
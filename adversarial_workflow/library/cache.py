@@ -1,6 +1,7 @@
 """Cache management for the evaluator library client."""
 
 import json
+import os
 import time
 from pathlib import Path
 from typing import Any
@@ -13,7 +14,12 @@ DEFAULT_CACHE_DIR = Path.home() / ".cache" / "adversarial-workflow"
 
 
 class CacheManager:
-    """Manages caching for the library client."""
+    """Manages caching for the library client.
+
+    Each entry is a JSON file. HTTP validators (ETag, Last-Modified) for the
+    entry are kept beside it in a ``.validators`` file, so an expired entry
+    can be revalidated with a conditional request instead of re-downloaded.
+    """
 
     def __init__(
         self,
@@ -45,6 +51,10 @@ class CacheManager:
         safe_key = key.replace("/", "_").replace(":", "_")
         return self.cache_dir / f"{safe_key}.json"
 
+    def _get_validators_path(self, key: str) -> Path:
+        """Get the path for a cache entry's HTTP validators."""
+        return self._get_cache_path(key).with_suffix(".validators")
+
     def _is_expired(self, cache_path: Path) -> bool:
         """Check if a cache entry is expired."""
         if not cache_path.exists():
@@ -102,23 +112,76 @@ class CacheManager:
         except (json.JSONDecodeError, OSError):
             return None
 
-    def set(self, key: str, value: dict[str, Any]) -> bool:
+    def get_validators(self, key: str) -> dict[str, str]:
+        """
+        Get the HTTP validators stored with a cache entry.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The validators (e.g. ``etag``, ``last_modified``), or an empty dict
+            if the entry has none or does not exist.
+        """
+        if not self._get_cache_path(key).exists():
+            return {}
+
+        try:
+            with open(self._get_validators_path(key), encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {k: v for k, v in data.items() if isinstance(v, str)}
+
+    def set(
+        self, key: str, value: dict[str, Any], validators: dict[str, str] | None = None
+    ) -> bool:
         """
         Store a value in the cache.
 
         Args:
             key: The cache key.
             value: The value to cache.
+            validators: HTTP validators of the response the value came from.
+                Replaces any stored validators; None removes them.
 
         Returns:
             True if successfully cached, False otherwise.
         """
         cache_path = self._get_cache_path(key)
+        validators_path = self._get_validators_path(key)
 
         try:
             self._ensure_cache_dir()
             with open(cache_path, "w", encoding="utf-8") as f:
                 json.dump(value, f, indent=2)
+            if validators:
+                with open(validators_path, "w", encoding="utf-8") as f:
+                    json.dump(validators, f, indent=2)
+            else:
+                validators_path.unlink(missing_ok=True)
+            return True
+        except OSError:
+            try:
+                validators_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return False
+
+    def touch(self, key: str) -> bool:
+        """
+        Restart a cache entry's TTL, e.g. after a 304 Not Modified response.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            True if the entry exists and was refreshed, False otherwise.
+        """
+        try:
+            os.utime(self._get_cache_path(key))
             return True
         except OSError:
             return False
@@ -138,6 +201,7 @@ class CacheManager:
         try:
             if cache_path.exists():
                 cache_path.unlink()
+            self._get_validators_path(key).unlink(missing_ok=True)
             return True
         except OSError:
             return False
@@ -157,6 +221,11 @@ class CacheManager:
                     count += 1
                 except OSError:
                     pass
+            for validators_file in self.cache_dir.glob("*.validators"):
+                try:
+                    validators_file.unlink()
+                except OSError:
+                    pass
         except OSError:
             pass
         return count
@@ -1,13 +1,24 @@
 """HTTP client for the evaluator library."""
 
+import http.client
+import io
 import json
+import tarfile
+import threading
 import urllib.error
+import urllib.parse
 import urllib.request
+import urllib.response
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, TypeVar
 
+from .artifacts import ArtifactStore
 from .cache import CacheManager
 from .config import LibraryConfig, get_library_config
-from .models import IndexData
+from .mirror import LibraryMirror
+from .models import UNKNOWN_VERSION, IndexData
 
 # Library repository URLs (used as fallback defaults)
 # Note: DEFAULT_LIBRARY_URL uses 'main' branch; use ADVERSARIAL_LIBRARY_REF env var to override
@@ -21,6 +32,10 @@ README_PATH_TEMPLATE = "evaluators/{provider}/{name}/README.md"
 
 # HTTP settings
 DEFAULT_TIMEOUT = 10  # seconds
+DEFAULT_MAX_WORKERS = 8  # concurrent fetches (and idle keep-alive connections per host)
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 class LibraryClientError(Exception):
@@ -41,8 +56,134 @@ class ParseError(LibraryClientError):
     pass
 
 
+class _KeepAliveHandler(urllib.request.BaseHandler):
+    """Serve http(s) requests over pooled keep-alive connections.
+
+    urllib's own handlers open (and TLS-handshake) a new connection for every
+    request. This handler keeps idle connections per host for reuse. Library
+    files are small, so each response is read in full and its connection
+    returned to the pool before the caller sees it. Proxied requests fall
+    through to urllib's default handlers; redirects and HTTP errors are still
+    handled by the opener.
+    """
+
+    handler_order = 400  # ahead of urllib's HTTPHandler/HTTPSHandler (500)
+
+    def __init__(self, max_idle_per_host: int = DEFAULT_MAX_WORKERS):
+        self._max_idle = max_idle_per_host
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+
+    def http_open(self, req: urllib.request.Request):
+        return self._open(req, http.client.HTTPConnection)
+
+    def https_open(self, req: urllib.request.Request):
+        return self._open(req, http.client.HTTPSConnection)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    def _open(self, req: urllib.request.Request, http_class: type[http.client.HTTPConnection]):
+        if req.has_proxy() or getattr(req, "_tunnel_host", None):
+            return None
+        if not req.host:
+            raise urllib.error.URLError("no host given")
+
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items() if k not in headers})
+        headers = {name.title(): value for name, value in headers.items()}
+        key = (req.type, req.host)
+
+        for attempt in range(2):
+            conn, reused = self._acquire(key, http_class, req.timeout)
+            try:
+                conn.request(req.get_method(), req.selector, req.data, headers)
+                response = conn.getresponse()
+                body = response.read()
+            except TimeoutError:
+                conn.close()
+                raise
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                # The server may have closed a connection while it sat idle
+                if reused and attempt == 0:
+                    continue
+                raise urllib.error.URLError(e) from e
+            break
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        result = urllib.response.addinfourl(
+            io.BytesIO(body), response.headers, req.get_full_url(), response.status
+        )
+        result.msg = response.reason
+        return result
+
+    def _acquire(
+        self, key: tuple[str, str], http_class: type[http.client.HTTPConnection], timeout
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            self.requests += 1
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+            self.connections_opened += 1
+        return http_class(key[1], timeout=timeout), False
+
+    def _release(self, key: tuple[str, str], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+
+def _map_bounded(fn: Callable[[T], R], items: list[T], max_workers: int) -> list[R]:
+    """Apply ``fn`` to ``items`` on at most ``max_workers`` threads, keeping order."""
+    workers = min(max_workers, len(items))
+    if workers <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, items))
+
+
+def _response_validators(url: str, headers) -> dict[str, str]:
+    """Return the cache validators of a response, or {} if it has none."""
+    validators = {}
+    for name, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+        value = headers.get(header) if headers is not None else None
+        if isinstance(value, str) and value:
+            validators[name] = value
+    if validators:
+        validators["url"] = url
+    return validators
+
+
 class LibraryClient:
-    """Client for fetching evaluators from the community library."""
+    """Client for fetching evaluators from the community library.
+
+    Requests share keep-alive connections, and fetch_evaluators() fetches
+    several evaluators concurrently over them. Cached responses keep their
+    ETag / Last-Modified validators, so refreshing an unchanged file is a
+    conditional request answered with 304 Not Modified rather than a download.
+
+    Evaluator YAMLs and READMEs are kept in a content-addressed ArtifactStore
+    shared by all projects; a file already fetched under the current index
+    version is served from disk without a request.
+
+    With a mirror configured (``library.mirror`` or a ``file://`` URL), every
+    file is read from the mirror instead and nothing goes over the network.
+    """
 
     def __init__(
         self,
@@ -67,7 +208,8 @@ class LibraryClient:
         # Store ref for potential use (e.g., logging, debugging)
         self.ref = config.ref
 
-        # URL precedence: explicit arg > config.url (if customized) > default template
+        # URL precedence: explicit arg > mirror > config.url (if customized) > default template
+        self.mirror: LibraryMirror | None = None
         if base_url:
             # Explicit base_url argument takes highest precedence
             self.base_url = base_url.rstrip("/")
@@ -77,33 +219,61 @@ class LibraryClient:
         else:
             # Use default template with ref for branch switching
             self.base_url = DEFAULT_LIBRARY_URL_TEMPLATE.format(ref=config.ref)
+        if config.mirror and not base_url:
+            self.base_url = config.mirror.resolve().as_uri()
+        if self.base_url.startswith("file:"):
+            parsed = urllib.parse.urlparse(self.base_url)
+            self.mirror = LibraryMirror(
+                Path(urllib.request.url2pathname(parsed.netloc + parsed.path))
+            )
         self.timeout = timeout
         self.cache = CacheManager(
             cache_dir=cache_dir or config.cache_dir,
             ttl=config.cache_ttl,
         )
-
-    def _fetch_url(self, url: str) -> str:
+        self.artifacts = ArtifactStore(
+            self.cache.cache_dir / "artifacts",
+            max_bytes=int(config.artifact_cache_mb * 1024 * 1024),
+        )
+        # Version of the last index fetched; stored files are tagged with it
+        self._index_version: str | None = None
+        # Set by fetch_index(no_cache=True): revalidate every stored file too
+        self._revalidate = False
+        self._keepalive = _KeepAliveHandler()
+        self._opener = urllib.request.build_opener(self._keepalive)
+
+    def _fetch_url(
+        self, url: str, validators: dict[str, str] | None = None
+    ) -> tuple[str | None, dict[str, str]]:
         """
-        Fetch content from a URL.
+        Fetch content from a URL, conditionally if validators are given.
 
         Args:
             url: The URL to fetch.
+            validators: Validators of a cached copy (``etag``, ``last_modified``),
+                sent as If-None-Match / If-Modified-Since.
 
         Returns:
-            The response content as a string.
+            Tuple of (content, validators). content is None when the server
+            answered 304 Not Modified; validators are the response's own.
 
         Raises:
             NetworkError: If the request fails.
         """
+        headers = {"User-Agent": "adversarial-workflow-library-client"}
+        if validators:
+            if "etag" in validators:
+                headers["If-None-Match"] = validators["etag"]
+            if "last_modified" in validators:
+                headers["If-Modified-Since"] = validators["last_modified"]
         try:
-            request = urllib.request.Request(
-                url,
-                headers={"User-Agent": "adversarial-workflow-library-client"},
-            )
-            with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                return response.read().decode("utf-8")
+            request = urllib.request.Request(url, headers=headers)
+            with self._opener.open(request, timeout=self.timeout) as response:
+                content = response.read().decode("utf-8")
+                return content, _response_validators(url, response.headers)
         except urllib.error.HTTPError as e:
+            if e.code == 304 and validators:
+                return None, {**validators, **_response_validators(url, e.headers)}
             # HTTPError must be caught before URLError (HTTPError subclasses URLError)
             raise NetworkError(f"HTTP error {e.code} fetching {url}: {e.reason}") from e
         except urllib.error.URLError as e:
@@ -113,58 +283,160 @@ class LibraryClient:
         except OSError as e:
             raise NetworkError(f"Network error fetching {url}: {e}") from e
 
+    def _cached_validators(self, cache_key: str, url: str) -> dict[str, str]:
+        """Validators of the cached copy of ``url``, or {} if there is none."""
+        validators = self.cache.get_validators(cache_key)
+        return validators if validators.get("url") == url else {}
+
+    def _refresh(
+        self, cache_key: str, value: dict[str, Any], old: dict[str, str], new: dict[str, str]
+    ) -> None:
+        """Record a 304 for a cache entry: restart its TTL, keeping new validators."""
+        if new != old:
+            self.cache.set(cache_key, value, new)
+        else:
+            self.cache.touch(cache_key)
+
+    def _read_mirror(self, path: str) -> str:
+        """
+        Read a library file from the configured mirror.
+
+        Raises:
+            NetworkError: If the mirror lacks the file or cannot be read.
+        """
+        try:
+            return self.mirror.read(path)
+        except FileNotFoundError as e:
+            raise NetworkError(f"{path} not found in library mirror {self.mirror.path}") from e
+        except (OSError, ValueError, tarfile.TarError) as e:
+            raise NetworkError(f"Could not read library mirror {self.mirror.path}: {e}") from e
+
+    def _fetch_artifact(self, path: str) -> str:
+        """
+        Fetch a library file through the artifact store.
+
+        A stored copy tagged with the current index version is returned without
+        a request, unless caching is disabled, the index was fetched with
+        ``no_cache`` or it has no version. Any other stored copy is revalidated
+        with a conditional request.
+
+        Raises:
+            NetworkError: If the request fails.
+        """
+        if self.mirror is not None:
+            return self._read_mirror(path)
+
+        url = f"{self.base_url}/{path}"
+        version = self._index_version
+        artifact = self.artifacts.get(self.base_url, path)
+        if (
+            artifact is not None
+            and not self._revalidate
+            and version not in (None, UNKNOWN_VERSION)
+            and artifact.version == version
+            and self.cache.ttl > 0
+        ):
+            return artifact.content
+
+        validators = artifact.validators if artifact is not None else {}
+        content, new_validators = self._fetch_url(url, validators)
+        if content is None:
+            self.artifacts.refresh(self.base_url, path, artifact, new_validators, version)
+            return artifact.content
+        self.artifacts.put(self.base_url, path, content, new_validators, version)
+        return content
+
+    @staticmethod
+    def _parse_index(content: str) -> tuple[IndexData, dict[str, Any]]:
+        """Parse index JSON. Returns (IndexData, raw data)."""
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ParseError(f"Invalid JSON in index: {e}") from e
+
+        # Validate and parse
+        try:
+            return IndexData.from_dict(data), data
+        except (KeyError, TypeError) as e:
+            raise ParseError(f"Invalid index structure: {e}") from e
+
     def fetch_index(self, no_cache: bool = False) -> tuple[IndexData, bool]:
         """
         Fetch the library index.
 
+        An expired cached index is revalidated with a conditional request; if
+        the server answers 304 Not Modified its TTL restarts and no body is
+        downloaded.
+
         Args:
-            no_cache: If True, bypass the cache and fetch fresh data.
+            no_cache: If True, bypass the cache and fetch fresh data
+                (a cached copy may still be confirmed by a conditional request).
+                Evaluators and READMEs fetched afterwards are revalidated the
+                same way.
 
         Returns:
             Tuple of (IndexData, from_cache) where from_cache indicates if
-            the data came from cache.
+            the data came from cache without being confirmed by the server.
 
         Raises:
             NetworkError: If the request fails and no cache is available.
             ParseError: If the response cannot be parsed.
         """
+        if self.mirror is not None:
+            index_data, _ = self._parse_index(self._read_mirror(INDEX_PATH))
+            self._index_version = index_data.version
+            return index_data, False
+
         cache_key = "library-index"
+        self._revalidate = self._revalidate or no_cache
 
         # Try cache first (unless no_cache is set)
         if not no_cache:
             cached_data = self.cache.get(cache_key)
             if cached_data:
                 try:
-                    return IndexData.from_dict(cached_data), True
+                    index_data = IndexData.from_dict(cached_data)
                 except (KeyError, TypeError):
                     # Cache data is invalid, will try to fetch fresh
                     pass
+                else:
+                    self._index_version = index_data.version
+                    return index_data, True
 
-        # Fetch fresh data
+        # Fetch fresh data, or confirm the cached copy is still current
         url = f"{self.base_url}/{INDEX_PATH}"
+        validators = self._cached_validators(cache_key, url)
+        cached_data = self.cache.get_stale(cache_key) if validators else None
         try:
-            content = self._fetch_url(url)
-            data = json.loads(content)
+            content, new_validators = self._fetch_url(url, validators if cached_data else None)
+            if content is None:
+                try:
+                    index_data = IndexData.from_dict(cached_data)
+                except (KeyError, TypeError):
+                    # Cached copy is unusable; download it again
+                    content, new_validators = self._fetch_url(url)
+                else:
+                    self._refresh(cache_key, cached_data, validators, new_validators)
+                    self._index_version = index_data.version
+                    return index_data, False
         except NetworkError:
             # Try stale cache as fallback
             stale_data = self.cache.get_stale(cache_key)
             if stale_data:
                 try:
-                    return IndexData.from_dict(stale_data), True
+                    index_data = IndexData.from_dict(stale_data)
                 except (KeyError, TypeError):
                     pass
+                else:
+                    self._index_version = index_data.version
+                    return index_data, True
             raise
-        except json.JSONDecodeError as e:
-            raise ParseError(f"Invalid JSON in index: {e}") from e
 
-        # Validate and parse
-        try:
-            index_data = IndexData.from_dict(data)
-        except (KeyError, TypeError) as e:
-            raise ParseError(f"Invalid index structure: {e}") from e
+        index_data, data = self._parse_index(content)
 
         # Update cache
-        self.cache.set(cache_key, data)
+        self.cache.set(cache_key, data, new_validators)
+        self._index_version = index_data.version
 
         return index_data, False
 
@@ -172,6 +444,10 @@ class LibraryClient:
         """
         Fetch an evaluator configuration.
 
+        Served from the artifact store when already fetched under the current
+        index version; otherwise a stored copy is revalidated with a
+        conditional request rather than downloaded again.
+
         Args:
             provider: The provider name (e.g., 'google', 'openai').
             name: The evaluator name (e.g., 'gemini-flash').
@@ -183,8 +459,33 @@ class LibraryClient:
             NetworkError: If the request fails.
         """
         path = EVALUATOR_PATH_TEMPLATE.format(provider=provider, name=name)
-        url = f"{self.base_url}/{path}"
-        return self._fetch_url(url)
+        return self._fetch_artifact(path)
+
+    def fetch_evaluators(
+        self, specs: list[tuple[str, str]], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> list[str | NetworkError]:
+        """
+        Fetch several evaluator configurations concurrently.
+
+        Requests run on a bounded thread pool and reuse the client's
+        keep-alive connections.
+
+        Args:
+            specs: (provider, name) pairs.
+            max_workers: Maximum number of requests in flight.
+
+        Returns:
+            For each spec, in order, the raw YAML content or the NetworkError
+            that prevented fetching it.
+        """
+
+        def fetch(spec: tuple[str, str]) -> str | NetworkError:
+            try:
+                return self.fetch_evaluator(*spec)
+            except NetworkError as e:
+                return e
+
+        return _map_bounded(fetch, specs, max_workers)
 
     def fetch_readme(self, provider: str, name: str) -> str | None:
         """
@@ -198,12 +499,22 @@ class LibraryClient:
             The README content as a string, or None if not found.
         """
         path = README_PATH_TEMPLATE.format(provider=provider, name=name)
-        url = f"{self.base_url}/{path}"
         try:
-            return self._fetch_url(url)
+            return self._fetch_artifact(path)
         except NetworkError:
             return None
 
+    def fetch_readmes(
+        self, specs: list[tuple[str, str]], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> list[str | None]:
+        """
+        Fetch several evaluator READMEs concurrently, as fetch_evaluators().
+
+        Returns:
+            For each spec, in order, the README content or None if not found.
+        """
+        return _map_bounded(lambda spec: self.fetch_readme(*spec), specs, max_workers)
+
     def get_cache_age(self) -> float | None:
         """
         Get the age of the cached index in seconds.
@@ -213,6 +524,10 @@ class LibraryClient:
         """
         return self.cache.get_age("library-index")
 
+    def close(self) -> None:
+        """Close idle keep-alive connections."""
+        self._keepalive.close()
+
     def clear_cache(self) -> int:
         """
         Clear all cached data.
@@ -220,4 +535,4 @@ class LibraryClient:
         Returns:
             Number of cache entries cleared.
         """
-        return self.cache.clear()
+        return self.cache.clear() + self.artifacts.clear()
@@ -1,13 +1,26 @@
 """CLI commands for the evaluator library."""
 
 import difflib
+import json
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
 import yaml
 
-from .client import LibraryClient, NetworkError, ParseError
+from .client import (
+    DEFAULT_LIBRARY_URL,
+    DEFAULT_LIBRARY_URL_TEMPLATE,
+    EVALUATOR_PATH_TEMPLATE,
+    INDEX_PATH,
+    README_PATH_TEMPLATE,
+    LibraryClient,
+    NetworkError,
+    ParseError,
+)
+from .config import get_library_config
+from .mirror import write_mirror
 from .models import InstalledEvaluatorMeta, UpdateInfo
 
 # ANSI color codes (matching cli.py)
@@ -25,6 +38,46 @@ def get_evaluators_dir() -> Path:
     return Path.cwd() / ".adversarial" / "evaluators"
 
 
+def _invalidate_registry_cache() -> None:
+    """Drop the parsed-evaluator registry cache after evaluator files changed."""
+    from ..evaluators.registry import clear_registry_cache
+
+    clear_registry_cache(get_evaluators_dir().parent.parent)
+
+
+def _strip_document_separator(yaml_content: str) -> str:
+    """Strip a leading YAML document separator to prevent multi-document issues."""
+    clean = yaml_content.lstrip()
+    if clean.startswith("---"):
+        # Remove the document separator and any following newline
+        clean = clean[3:].lstrip("\n")
+    return clean
+
+
+def _yaml_error(yaml_content: str) -> str | None:
+    """Return why ``yaml_content`` is not a usable evaluator config, or None."""
+    try:
+        parsed = yaml.safe_load(yaml_content)
+    except yaml.YAMLError as e:
+        return str(e)
+    return None if parsed else "Empty YAML content"
+
+
+def _stage(path: Path, content: str) -> Path:
+    """Write ``content`` to a temporary file beside ``path`` and return it.
+
+    os.replace() the returned file onto ``path`` to install it atomically.
+    """
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(content)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+    return tmp
+
+
 def format_table(headers: list[str], rows: list[list[str]], widths: list[int] | None = None) -> str:
     """
     Format data as a simple table.
@@ -113,6 +166,7 @@ def library_list(
     category: str | None = None,
     verbose: bool = False,
     no_cache: bool = False,
+    search: str | None = None,
 ) -> int:
     """
     List available evaluators from the library.
@@ -122,6 +176,8 @@ def library_list(
         category: Filter by category name.
         verbose: Show detailed information.
         no_cache: Bypass cache and fetch fresh data.
+        search: Only show evaluators whose name or description contains this
+            text, best matches first.
 
     Returns:
         Exit code (0 for success, 1 for error).
@@ -146,18 +202,20 @@ def library_list(
     evaluators = index.evaluators
 
     if provider:
-        evaluators = [e for e in evaluators if e.provider == provider]
+        evaluators = index.filter_by_provider(provider)
         if not evaluators:
             print(f"{YELLOW}No evaluators found for provider: {provider}{RESET}")
             print()
             print("Available providers:")
-            providers = sorted(set(e.provider for e in index.evaluators))
-            for p in providers:
+            for p in index.providers:
                 print(f"  - {p}")
             return 1
 
     if category:
-        evaluators = [e for e in evaluators if e.category == category]
+        if provider:
+            evaluators = [e for e in evaluators if e.category == category]
+        else:
+            evaluators = index.filter_by_category(category)
         if not evaluators:
             print(f"{YELLOW}No evaluators found for category: {category}{RESET}")
             print()
@@ -166,8 +224,17 @@ def library_list(
                 print(f"  - {cat_name}: {cat_desc}")
             return 1
 
+    if search:
+        evaluators = index.search(search, provider=provider, category=category)
+        if not evaluators:
+            print(f"{YELLOW}No evaluators match: {search}{RESET}")
+            return 1
+
     # Print header
-    cache_note = f" {GRAY}(cached){RESET}" if from_cache else ""
+    if client.mirror is not None:
+        cache_note = f" {GRAY}(mirror){RESET}"
+    else:
+        cache_note = f" {GRAY}(cached){RESET}" if from_cache else ""
     print()
     print(
         f"{BOLD}Available evaluators from adversarial-evaluator-library "
@@ -200,7 +267,7 @@ def library_list(
     # Summary
     count = len(evaluators)
     total = len(index.evaluators)
-    if provider or category:
+    if provider or category or search:
         print(f"{count} evaluators shown (of {total} total).")
     else:
         print(f"{count} evaluators available.")
@@ -427,7 +494,8 @@ def library_install(
     if not dry_run:
         evaluators_dir.mkdir(parents=True, exist_ok=True)
 
-    success_count = 0
+    # Resolve every spec first; the evaluators are then fetched concurrently
+    planned: list[tuple[str, str, str, Path]] = []
     for spec in evaluator_specs:
         # Parse spec (provider/name or provider/name@version - version ignored for now)
         if "@" in spec:
@@ -450,8 +518,18 @@ def library_install(
 
         # Check if file already exists (use provider-name format to avoid collisions)
         dest_path = evaluators_dir / f"{provider}-{name}.yml"
+        if not dry_run and dest_path.exists() and not force:
+            print(f"{YELLOW}Skipping: {provider}-{name}.yml already exists{RESET}")
+            print(f"  Use {CYAN}--force{RESET} to overwrite.")
+            continue
 
-        if dry_run:
+        planned.append((spec, provider, name, dest_path))
+
+    fetched = client.fetch_evaluators([(provider, name) for _, provider, name, _ in planned])
+
+    success_count = 0
+    if dry_run:
+        for (spec, _provider, _name, dest_path), yaml_content in zip(planned, fetched, strict=True):
             # Dry-run mode: show preview without making changes
             print(f"Dry run: Would install {CYAN}{spec}{RESET} (v{index.version})")
             print()
@@ -462,14 +540,12 @@ def library_install(
                 print(f"  Status: {GREEN}New file (clean install){RESET}")
             print()
 
-            # Fetch and preview evaluator config
-            preview_success = False
-            try:
-                yaml_content = client.fetch_evaluator(provider, name)
-                yaml_content_clean = yaml_content.lstrip()
-                if yaml_content_clean.startswith("---"):
-                    yaml_content_clean = yaml_content_clean[3:].lstrip("\n")
-
+            if isinstance(yaml_content, NetworkError):
+                print(f"  {RED}Error: Could not fetch preview{RESET}")
+                print(f"    {yaml_content}")
+                print()
+            else:
+                yaml_content_clean = _strip_document_separator(yaml_content)
                 print("  Evaluator config preview:")
                 print("  " + "─" * 25)
                 preview_lines = yaml_content_clean.split("\n")[:10]
@@ -478,66 +554,70 @@ def library_install(
                 if len(yaml_content_clean.split("\n")) > 10:
                     print("  ...")
                 print()
-                preview_success = True
-            except NetworkError as e:
-                print(f"  {RED}Error: Could not fetch preview{RESET}")
-                print(f"    {e}")
-                print()
+                success_count += 1
 
             print(f"{YELLOW}No changes made (dry run).{RESET}")
             print()
-            if preview_success:
-                success_count += 1
-            continue
-
-        if dest_path.exists() and not force:
-            print(f"{YELLOW}Skipping: {provider}-{name}.yml already exists{RESET}")
-            print(f"  Use {CYAN}--force{RESET} to overwrite.")
-            continue
-
-        # Fetch evaluator config
-        print(f"Installing {CYAN}{spec}{RESET}...")
-        try:
-            yaml_content = client.fetch_evaluator(provider, name)
-        except NetworkError as e:
-            print(f"  {RED}Error: Failed to fetch evaluator{RESET}")
-            print(f"    {e}")
-            continue
-
-        # Strip leading YAML document separator to prevent multi-document issues
-        yaml_content_clean = yaml_content.lstrip()
-        if yaml_content_clean.startswith("---"):
-            # Remove the document separator and any following newline
-            yaml_content_clean = yaml_content_clean[3:].lstrip("\n")
-
-        # Validate YAML
-        try:
-            parsed = yaml.safe_load(yaml_content_clean)
-            if not parsed:
-                raise ValueError("Empty YAML content")
-        except (yaml.YAMLError, ValueError) as e:
-            print(f"  {RED}Error: Invalid YAML in evaluator{RESET}")
-            print(f"    {e}")
-            if skip_validation:
-                print(f"  {YELLOW}Warning: --skip-validation is set, continuing anyway{RESET}")
-            else:
+    else:
+        # Validate everything before writing anything, so a failed fetch or a
+        # broken config never leaves a partial install behind
+        staged: list[tuple[Path, str]] = []
+        failures = 0
+        for (spec, provider, name, dest_path), yaml_content in zip(planned, fetched, strict=True):
+            print(f"Installing {CYAN}{spec}{RESET}...")
+            if isinstance(yaml_content, NetworkError):
+                print(f"  {RED}Error: Failed to fetch evaluator{RESET}")
+                print(f"    {yaml_content}")
+                failures += 1
                 continue
 
-        # Add provenance header
-        full_content = (
-            generate_provenance_header(provider, name, index.version) + yaml_content_clean
-        )
+            yaml_content_clean = _strip_document_separator(yaml_content)
+            error = _yaml_error(yaml_content_clean)
+            if error:
+                print(f"  {RED}Error: Invalid YAML in evaluator{RESET}")
+                print(f"    {error}")
+                if skip_validation:
+                    print(f"  {YELLOW}Warning: --skip-validation is set, continuing anyway{RESET}")
+                else:
+                    failures += 1
+                    continue
+
+            # Add provenance header
+            staged.append(
+                (
+                    dest_path,
+                    generate_provenance_header(provider, name, index.version) + yaml_content_clean,
+                )
+            )
 
-        # Write file
+        if failures:
+            print()
+            print(
+                f"{RED}No evaluators installed: {failures} of {len(planned)} "
+                f"could not be fetched or validated.{RESET}"
+            )
+            return 1
+
+        # Write every file to a temporary name, then move them all into place
+        temp_files: list[tuple[Path, Path]] = []
         try:
-            with open(dest_path, "w", encoding="utf-8") as f:
-                f.write(full_content)
-            print(f"  {GREEN}Installed: {dest_path}{RESET}")
-            success_count += 1
+            for dest_path, content in staged:
+                temp_files.append((_stage(dest_path, content), dest_path))
         except OSError as e:
+            for tmp, _ in temp_files:
+                tmp.unlink(missing_ok=True)
             print(f"  {RED}Error: Could not write file{RESET}")
             print(f"    {e}")
-            continue
+            print()
+            print(f"{RED}No evaluators installed.{RESET}")
+            return 1
+        for tmp, dest_path in temp_files:
+            os.replace(tmp, dest_path)
+            print(f"  {GREEN}Installed: {dest_path}{RESET}")
+        success_count = len(temp_files)
+
+    if success_count and not dry_run:
+        _invalidate_registry_cache()
 
     # Summary
     print()
@@ -748,17 +828,37 @@ def library_update(
     evaluators_dir = get_evaluators_dir()
     updated_count = 0
 
-    for meta, entry in to_update:
+    # Fetch and validate every update before touching any file
+    fetched = client.fetch_evaluators([(entry.provider, entry.name) for _, entry in to_update])
+    new_configs: list[str] = []
+    failures = 0
+    for (meta, _entry), new_yaml in zip(to_update, fetched, strict=True):
+        if isinstance(new_yaml, NetworkError):
+            print(f"{RED}Error: Failed to fetch {meta.name}{RESET}")
+            print(f"  {new_yaml}")
+            failures += 1
+            continue
+        # Strip leading YAML document separator to prevent multi-document issues
+        new_yaml_clean = _strip_document_separator(new_yaml)
+        error = _yaml_error(new_yaml_clean)
+        if error:
+            print(f"{RED}Error: Invalid YAML in {meta.name}{RESET}")
+            print(f"  {error}")
+            failures += 1
+            continue
+        new_configs.append(new_yaml_clean)
+
+    if failures:
         print()
-        print(f"Updating {CYAN}{meta.name}{RESET} ({meta.version} → {index.version})...")
+        print(
+            f"{RED}No evaluators were updated: {failures} of {len(to_update)} "
+            f"could not be fetched or validated.{RESET}"
+        )
+        return 1
 
-        # Fetch new content
-        try:
-            new_yaml = client.fetch_evaluator(entry.provider, entry.name)
-        except NetworkError as e:
-            print(f"  {RED}Error: Failed to fetch evaluator{RESET}")
-            print(f"    {e}")
-            continue
+    for (meta, entry), new_yaml_clean in zip(to_update, new_configs, strict=True):
+        print()
+        print(f"Updating {CYAN}{meta.name}{RESET} ({meta.version} → {index.version})...")
 
         # Read current content using tracked file path
         if meta.file_path:
@@ -777,10 +877,6 @@ def library_update(
             continue
 
         # Generate new content with updated provenance
-        # Strip leading YAML document separator to prevent multi-document issues
-        new_yaml_clean = new_yaml.lstrip()
-        if new_yaml_clean.startswith("---"):
-            new_yaml_clean = new_yaml_clean[3:].lstrip("\n")
         new_content = (
             generate_provenance_header(entry.provider, entry.name, index.version) + new_yaml_clean
         )
@@ -827,14 +923,16 @@ def library_update(
 
         # Apply update
         try:
-            with open(current_path, "w", encoding="utf-8") as f:
-                f.write(new_content)
+            os.replace(_stage(current_path, new_content), current_path)
             print(f"  {GREEN}Updated!{RESET}")
             updated_count += 1
         except OSError as e:
             print(f"  {RED}Error: Could not write file{RESET}")
             print(f"    {e}")
 
+    if updated_count:
+        _invalidate_registry_cache()
+
     # Summary
     print()
     if preview_only:
@@ -845,3 +943,106 @@ def library_update(
         print(f"{YELLOW}No evaluators were updated.{RESET}")
 
     return 0
+
+
+def library_mirror(destination: str, ref: str | None = None, force: bool = False) -> int:
+    """
+    Download the whole library for offline use.
+
+    Fetches the index and every evaluator and README, then writes them to a
+    mirror directory or, for a .tar.gz / .tgz destination, a single archive.
+
+    Args:
+        destination: Mirror directory or archive path.
+        ref: Library ref (branch, tag or commit) to mirror; defaults to the
+            configured ref. Only applies to the default library URL.
+        force: Replace an existing mirror at the destination.
+
+    Returns:
+        Exit code (0 for success, 1 for error).
+    """
+    config = get_library_config()
+    if ref:
+        if config.mirror or config.url != DEFAULT_LIBRARY_URL:
+            source = "library mirror" if config.mirror else "custom library URL"
+            print(f"{RED}Error: --ref cannot be used with a {source}{RESET}")
+            print(f"  The library is read from {config.mirror or config.url}")
+            return 1
+        config.ref = ref
+    client = LibraryClient(config=config)
+
+    try:
+        index, from_cache = client.fetch_index(no_cache=True)
+    except NetworkError as e:
+        print(f"{RED}Error: Network unavailable{RESET}")
+        print(f"  {e}")
+        return 1
+    except ParseError as e:
+        print(f"{RED}Error: Could not parse library index{RESET}")
+        print(f"  {e}")
+        return 1
+    if from_cache:
+        print(f"{YELLOW}Warning: library unreachable, mirroring the cached index{RESET}")
+
+    specs = [(e.provider, e.name) for e in index.evaluators]
+    print(
+        f"Mirroring {len(specs)} evaluator(s) from {CYAN}{client.base_url}{RESET} "
+        f"(v{index.version})..."
+    )
+
+    # Every evaluator must be fetched; READMEs are optional
+    evaluators = client.fetch_evaluators(specs)
+    failures = [
+        (spec, error)
+        for spec, error in zip(specs, evaluators, strict=True)
+        if isinstance(error, NetworkError)
+    ]
+    if failures:
+        for (provider, name), error in failures:
+            print(f"{RED}Error: Failed to fetch {provider}/{name}{RESET}")
+            print(f"  {error}")
+        print()
+        print(
+            f"{RED}No mirror written: {len(failures)} of {len(specs)} could not be fetched.{RESET}"
+        )
+        return 1
+    readmes = client.fetch_readmes(specs)
+
+    raw_index = index.raw if index.raw is not None else index.to_dict()
+    files = {INDEX_PATH: (json.dumps(raw_index, indent=2) + "\n").encode("utf-8")}
+    for (provider, name), yaml_content, readme in zip(specs, evaluators, readmes, strict=True):
+        path = EVALUATOR_PATH_TEMPLATE.format(provider=provider, name=name)
+        files[path] = yaml_content.encode("utf-8")
+        if readme is not None:
+            path = README_PATH_TEMPLATE.format(provider=provider, name=name)
+            files[path] = readme.encode("utf-8")
+
+    dest_path = Path(destination)
+    # A custom URL or mirror is not built from the ref, so there is none to record
+    from_ref = client.base_url == DEFAULT_LIBRARY_URL_TEMPLATE.format(ref=client.ref)
+    info = {
+        "source": client.base_url,
+        "ref": client.ref if from_ref else None,
+        "version": index.version,
+    }
+    try:
+        write_mirror(dest_path, files, info, force=force)
+    except FileExistsError as e:
+        print(f"{RED}Error: {e}{RESET}")
+        print(f"  Use {CYAN}--force{RESET} to replace an existing mirror.")
+        return 1
+    except OSError as e:
+        print(f"{RED}Error: Could not write mirror{RESET}")
+        print(f"    {e}")
+        return 1
+
+    readme_count = sum(readme is not None for readme in readmes)
+    print(
+        f"{GREEN}Mirror written: {dest_path}{RESET} "
+        f"({len(specs)} evaluators, {readme_count} READMEs)"
+    )
+    print()
+    print("Use it offline by setting:")
+    print(f"  {CYAN}ADVERSARIAL_LIBRARY_MIRROR={dest_path}{RESET}")
+    print(f"  or {CYAN}library: {{mirror: {dest_path}}}{RESET} in .adversarial/config.yml")
+    return 0
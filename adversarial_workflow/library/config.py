@@ -19,6 +19,8 @@ class LibraryConfig:
     ref: str = "main"
     cache_ttl: int = 3600  # 1 hour
     cache_dir: Path = field(default_factory=lambda: Path.home() / ".cache" / "adversarial-workflow")
+    artifact_cache_mb: float = 50  # byte budget for stored evaluator files
+    mirror: Path | None = None  # offline mirror directory or archive
     enabled: bool = True
 
 
@@ -54,6 +56,10 @@ def get_library_config(config_path: Path | None = None) -> LibraryConfig:
             if "cache_dir" in lib_config:
                 # Expand ~ in path
                 config.cache_dir = Path(lib_config["cache_dir"]).expanduser()
+            if "artifact_cache_mb" in lib_config:
+                config.artifact_cache_mb = float(lib_config["artifact_cache_mb"])
+            if lib_config.get("mirror"):
+                config.mirror = Path(lib_config["mirror"]).expanduser()
             if "enabled" in lib_config:
                 config.enabled = bool(lib_config["enabled"])
         except (yaml.YAMLError, OSError, ValueError):
@@ -73,6 +79,13 @@ def get_library_config(config_path: Path | None = None) -> LibraryConfig:
     if os.environ.get("ADVERSARIAL_LIBRARY_NO_CACHE"):
         config.cache_ttl = 0
 
+    if artifact_mb := os.environ.get("ADVERSARIAL_LIBRARY_ARTIFACT_CACHE_MB"):
+        with contextlib.suppress(ValueError):
+            config.artifact_cache_mb = float(artifact_mb)
+
+    if mirror := os.environ.get("ADVERSARIAL_LIBRARY_MIRROR"):
+        config.mirror = Path(mirror).expanduser()
+
     if ref := os.environ.get("ADVERSARIAL_LIBRARY_REF"):
         config.ref = ref
 
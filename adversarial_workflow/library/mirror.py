@@ -0,0 +1,188 @@
+"""Offline mirrors of the evaluator library.
+
+A mirror is a copy of the library files for one ref, laid out as in the
+library repository, plus a manifest::
+
+    evaluators/index.json
+    evaluators/<provider>/<name>/evaluator.yml
+    evaluators/<provider>/<name>/README.md
+    mirror.json        # source, ref, index version and SHA-256 of every file
+
+It is either a directory or a single ``.tar.gz`` archive. Create one with
+``adversarial library mirror``. To point the client at it, use ``library.mirror``
+in .adversarial/config.yml, ``ADVERSARIAL_LIBRARY_MIRROR``, or a ``file://``
+library URL. Every read then comes from disk, with no HTTP and no caching.
+A directory without a manifest, such as a checkout of the library
+repository, also works; its files are not checked against hashes.
+
+Archives are written deterministically (sorted members, fixed timestamps),
+so mirroring the same library content twice gives byte-identical files.
+Mirrors get the usual permissions for the current umask, so accounts other
+than the one that built a mirror can read it.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from ..utils.files import atomic_write, current_umask
+
+MANIFEST_NAME = "mirror.json"
+MANIFEST_FORMAT = 1
+ARCHIVE_SUFFIXES = (".tar.gz", ".tgz")
+
+
+def is_archive(path: Path) -> bool:
+    """Return True if ``path`` names a mirror archive rather than a directory."""
+    return path.name.endswith(ARCHIVE_SUFFIXES)
+
+
+class LibraryMirror:
+    """Read-only access to a mirror directory or archive."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._archive_files: dict[str, bytes] | None = None
+        self._hashes: dict[str, str] | None = None
+
+    def _load(self) -> None:
+        """Read the archive (if any) and the manifest, once."""
+        with self._lock:
+            if self._loaded:
+                return
+            if is_archive(self.path):
+                files = {}
+                with tarfile.open(self.path, "r:gz") as tar:
+                    for member in tar.getmembers():
+                        if member.isfile():
+                            files[member.name] = tar.extractfile(member).read()
+                self._archive_files = files
+            try:
+                manifest = json.loads(self._read_bytes(MANIFEST_NAME))
+            except FileNotFoundError:
+                manifest = None
+            if manifest is not None:
+                hashes = manifest.get("files") if isinstance(manifest, dict) else None
+                if not isinstance(hashes, dict):
+                    raise ValueError(f"Invalid mirror manifest in {self.path}")
+                self._hashes = hashes
+            self._loaded = True
+
+    def _read_bytes(self, relpath: str) -> bytes:
+        if ".." in PurePosixPath(relpath).parts:
+            raise FileNotFoundError(relpath)
+        if self._archive_files is not None:
+            try:
+                return self._archive_files[relpath]
+            except KeyError:
+                raise FileNotFoundError(relpath) from None
+        return (self.path / relpath).read_bytes()
+
+    def read(self, relpath: str) -> str:
+        """
+        Read a library file from the mirror.
+
+        Args:
+            relpath: Path within the library (e.g. ``evaluators/index.json``).
+
+        Returns:
+            The file content.
+
+        Raises:
+            FileNotFoundError: If the mirror does not contain the file.
+            ValueError: If the file does not match the manifest's hash.
+            OSError: If the mirror cannot be read.
+        """
+        self._load()
+        if self._hashes is not None and relpath not in self._hashes:
+            raise FileNotFoundError(relpath)
+        data = self._read_bytes(relpath)
+        if self._hashes is not None and hashlib.sha256(data).hexdigest() != self._hashes[relpath]:
+            raise ValueError(f"{relpath} does not match the mirror manifest")
+        return data.decode("utf-8")
+
+
+def write_mirror(
+    destination: Path, files: dict[str, bytes], info: dict[str, Any], force: bool = False
+) -> None:
+    """
+    Write a mirror atomically, as a directory or (for .tar.gz / .tgz) an archive.
+
+    Args:
+        destination: Mirror directory or archive path.
+        files: Library files by path within the library.
+        info: Extra manifest fields (source, ref, version).
+        force: Replace an existing mirror at ``destination``.
+
+    Raises:
+        FileExistsError: If ``destination`` exists and ``force`` is not set, or
+            it is a non-empty directory that is not a mirror.
+        OSError: If the mirror cannot be written.
+    """
+    manifest = {
+        **info,
+        "format": MANIFEST_FORMAT,
+        "files": {path: hashlib.sha256(data).hexdigest() for path, data in sorted(files.items())},
+    }
+    files = {**files, MANIFEST_NAME: (json.dumps(manifest, indent=2) + "\n").encode("utf-8")}
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    if is_archive(destination):
+        _write_archive(destination, files, force)
+    else:
+        _write_directory(destination, files, force)
+
+
+def _write_archive(destination: Path, files: dict[str, bytes], force: bool) -> None:
+    if destination.exists() and not force:
+        raise FileExistsError(f"{destination} already exists")
+    with (
+        atomic_write(destination, "wb", permissions=0o666) as raw,
+        gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0) as gz,
+        tarfile.open(fileobj=gz, mode="w", format=tarfile.PAX_FORMAT) as tar,
+    ):
+        for name in sorted(files):
+            member = tarfile.TarInfo(name)
+            member.size = len(files[name])
+            member.mode = 0o644
+            tar.addfile(member, io.BytesIO(files[name]))
+
+
+def _write_directory(destination: Path, files: dict[str, bytes], force: bool) -> None:
+    existing = destination.exists() and any(destination.iterdir())
+    if existing:
+        if not (destination / MANIFEST_NAME).is_file():
+            raise FileExistsError(f"{destination} is not empty and is not a library mirror")
+        if not force:
+            raise FileExistsError(f"{destination} already exists")
+
+    staging = Path(tempfile.mkdtemp(dir=destination.parent, prefix=f".{destination.name}."))
+    try:
+        for name, data in files.items():
+            path = staging / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        # mkdtemp creates the directory 0700
+        os.chmod(staging, 0o777 & ~current_umask())
+        if destination.exists():
+            # Swap the old mirror out, then delete it
+            old = Path(tempfile.mkdtemp(dir=destination.parent, prefix=f".{destination.name}."))
+            os.replace(destination, old / "mirror")
+            os.replace(staging, destination)
+            shutil.rmtree(old, ignore_errors=True)
+        else:
+            os.replace(staging, destination)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
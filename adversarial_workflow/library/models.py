@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
+# IndexData.version of an index that does not declare one
+UNKNOWN_VERSION = "unknown"
 
-@dataclass
+
+@dataclass(slots=True)
 class EvaluatorEntry:
     """An evaluator entry from the library index."""
 
@@ -29,6 +32,17 @@ class EvaluatorEntry:
             description=data["description"],
         )
 
+    def to_dict(self) -> dict:
+        """Convert to the index's dictionary form."""
+        return {
+            "name": self.name,
+            "provider": self.provider,
+            "path": self.path,
+            "model": self.model,
+            "category": self.category,
+            "description": self.description,
+        }
+
     @property
     def full_name(self) -> str:
         """Return provider/name format."""
@@ -37,38 +51,117 @@ class EvaluatorEntry:
 
 @dataclass
 class IndexData:
-    """Parsed library index data."""
+    """Parsed library index data.
+
+    Lookups by (provider, name), provider and category go through
+    dictionaries built once when the index is created, so they stay constant
+    time as the index grows. The indexes assume ``evaluators`` is not
+    modified afterwards.
+    """
 
     version: str
     evaluators: list[EvaluatorEntry]
     categories: dict[str, str]
     fetched_at: datetime | None = None
+    # The index JSON as parsed, including fields this model does not cover
+    raw: dict | None = field(default=None, repr=False, compare=False)
+    _by_key: dict[tuple[str, str], EvaluatorEntry] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _by_provider: dict[str, list[EvaluatorEntry]] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _by_category: dict[str, list[EvaluatorEntry]] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    # Lowercased (name, provider/name, description) per entry, for search()
+    _search_text: list[tuple[str, str, str]] = field(
+        init=False, repr=False, compare=False, default_factory=list
+    )
+
+    def __post_init__(self) -> None:
+        for e in self.evaluators:
+            # First entry wins on duplicate keys, as with a linear scan
+            self._by_key.setdefault((e.provider, e.name), e)
+            self._by_provider.setdefault(e.provider, []).append(e)
+            self._by_category.setdefault(e.category, []).append(e)
+            self._search_text.append((e.name.lower(), e.full_name.lower(), e.description.lower()))
 
     @classmethod
     def from_dict(cls, data: dict) -> IndexData:
         """Create an IndexData from a dictionary."""
         evaluators = [EvaluatorEntry.from_dict(e) for e in data.get("evaluators", [])]
         return cls(
-            version=data.get("version", "unknown"),
+            version=data.get("version", UNKNOWN_VERSION),
             evaluators=evaluators,
             categories=data.get("categories", {}),
             fetched_at=datetime.now(timezone.utc),
+            raw=data,
         )
 
+    def to_dict(self) -> dict:
+        """Convert to the index's dictionary form (fetched_at is not part of it)."""
+        return {
+            "version": self.version,
+            "evaluators": [e.to_dict() for e in self.evaluators],
+            "categories": dict(self.categories),
+        }
+
     def get_evaluator(self, provider: str, name: str) -> EvaluatorEntry | None:
         """Find an evaluator by provider and name."""
-        for e in self.evaluators:
-            if e.provider == provider and e.name == name:
-                return e
-        return None
+        return self._by_key.get((provider, name))
 
     def filter_by_provider(self, provider: str) -> list[EvaluatorEntry]:
         """Filter evaluators by provider."""
-        return [e for e in self.evaluators if e.provider == provider]
+        return list(self._by_provider.get(provider, ()))
 
     def filter_by_category(self, category: str) -> list[EvaluatorEntry]:
         """Filter evaluators by category."""
-        return [e for e in self.evaluators if e.category == category]
+        return list(self._by_category.get(category, ()))
+
+    @property
+    def providers(self) -> list[str]:
+        """All providers in the index, sorted."""
+        return sorted(self._by_provider)
+
+    def search(
+        self, query: str, provider: str | None = None, category: str | None = None
+    ) -> list[EvaluatorEntry]:
+        """
+        Find evaluators whose name or description contains ``query``.
+
+        Matching is case-insensitive, on the name, ``provider/name`` and the
+        description. Results are ranked: exact name, name prefix, name
+        substring, then description substring; index order breaks ties.
+
+        Args:
+            query: Text to look for.
+            provider: Only consider evaluators from this provider.
+            category: Only consider evaluators in this category.
+
+        Returns:
+            Matching evaluators, best match first.
+        """
+        q = query.strip().lower()
+        ranked = []
+        for position, (e, (name, full_name, description)) in enumerate(
+            zip(self.evaluators, self._search_text, strict=True)
+        ):
+            if (provider and e.provider != provider) or (category and e.category != category):
+                continue
+            if q in (name, full_name):
+                rank = 0
+            elif name.startswith(q) or full_name.startswith(q):
+                rank = 1
+            elif q in full_name:
+                rank = 2
+            elif q in description:
+                rank = 3
+            else:
+                continue
+            ranked.append((rank, position, e))
+        ranked.sort(key=lambda item: item[:2])
+        return [e for _, _, e in ranked]
 
 
 @dataclass
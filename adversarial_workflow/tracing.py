@@ -0,0 +1,383 @@
+"""Optional tracing of CLI runs and evaluations.
+
+Spans cover command dispatch, evaluator discovery, model resolution, each
+model call, citation checking and output validation, with the model, token
+usage and verdict as attributes. They use OpenTelemetry's data model and are
+exported in the OTLP/JSON encoding, so any OpenTelemetry collector or backend
+can ingest them; no OpenTelemetry package needs to be installed.
+
+Tracing is off unless an exporter is configured in the environment (or in
+the project's .env file, which the CLI loads first)::
+
+    ADVERSARIAL_TRACE_FILE=.adversarial/traces.jsonl
+        Append each run's spans as one OTLP/JSON line (the format read by the
+        collector's otlpjsonfile receiver)
+    OTEL_EXPORTER_OTLP_TRACES_ENDPOINT=http://collector:4318/v1/traces
+    OTEL_EXPORTER_OTLP_ENDPOINT=http://collector:4318
+        POST spans to an OTLP/HTTP endpoint (``/v1/traces`` is appended to
+        the base endpoint); OTEL_EXPORTER_OTLP_TRACES_HEADERS or
+        OTEL_EXPORTER_OTLP_HEADERS add request headers (``k=v,k2=v2``)
+
+OTEL_SERVICE_NAME overrides the service name, OTEL_SDK_DISABLED=true turns
+tracing off, and a W3C ``TRACEPARENT`` set by the calling process makes the
+run's spans part of the caller's trace.
+
+When tracing is off, span() returns a shared no-op object: no ids, clocks or
+allocations. Spans are exported when the run's outermost span ends (and
+periodically in long-running commands); export errors are logged, never
+raised.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import secrets
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+TRACE_FILE_ENV = "ADVERSARIAL_TRACE_FILE"
+DEFAULT_SERVICE_NAME = "adversarial-workflow"
+
+# Spans held before an export is forced (watch mode never closes its root span)
+_MAX_BUFFERED_SPANS = 256
+_EXPORT_TIMEOUT = 5.0
+
+# OTLP SpanKind and StatusCode values
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+_TRACEPARENT_RE = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+# Innermost open span in the current context
+_CURRENT: ContextVar[Span | None] = ContextVar("adversarial_span", default=None)
+
+_tracer: _Tracer | None = None
+
+
+class _NoOpSpan:
+    """Returned by span() when tracing is off; every method does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NoOpSpan:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        pass
+
+    def fail(self, message: str) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoOpSpan()
+
+
+class Span:
+    """One timed operation; use as a context manager (see span())."""
+
+    def __init__(self, tracer: _Tracer, name: str, attributes: dict[str, Any], kind: int):
+        self._tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.attributes = dict(attributes)
+        self.trace_id = ""
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id: str | None = None
+        self.start_ns = 0
+        self.end_ns = 0
+        self.error: str | None = None
+        self.exception: BaseException | None = None
+        self._token = None
+
+    def __enter__(self) -> Span:
+        self._tracer.start(self)
+        self._token = _CURRENT.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _CURRENT.reset(self._token)
+        # argparse exits with 0 for --help and --version
+        if exc is not None and not (isinstance(exc, SystemExit) and not exc.code):
+            self.exception = exc
+            self.fail(str(exc) or type(exc).__name__)
+        self._tracer.end(self)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        self.attributes.update(attributes)
+
+    def fail(self, message: str) -> None:
+        """Mark the span as failed without an exception (e.g. an error result)."""
+        self.error = message
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Encode as an OTLP/JSON span."""
+        data: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": _STATUS_OK},
+        }
+        if self.parent_span_id:
+            data["parentSpanId"] = self.parent_span_id
+        if self.error is not None:
+            data["status"] = {"code": _STATUS_ERROR, "message": self.error}
+        if self.exception is not None:
+            data["events"] = [
+                {
+                    "name": "exception",
+                    "timeUnixNano": str(self.end_ns),
+                    "attributes": _otlp_attributes(
+                        {
+                            "exception.type": type(self.exception).__qualname__,
+                            "exception.message": str(self.exception),
+                        }
+                    ),
+                }
+            ]
+        return data
+
+
+class _Tracer:
+    """Assigns ids and parents to spans and exports them in batches."""
+
+    def __init__(
+        self,
+        service_name: str,
+        trace_file: Path | None = None,
+        endpoint: str | None = None,
+        headers: dict[str, str] | None = None,
+        remote_parent: tuple[str, str] | None = None,
+    ):
+        self.service_name = service_name
+        self.trace_file = trace_file
+        self.endpoint = endpoint
+        self.headers = headers or {}
+        self.remote_parent = remote_parent
+        self._lock = threading.Lock()
+        self._finished: list[Span] = []
+        # Outermost open span; spans started in threads that have no span in
+        # context (batch and multi-evaluator workers) are attached to it
+        self._root: Span | None = None
+
+    def start(self, span: Span) -> None:
+        parent = _CURRENT.get()
+        with self._lock:
+            if parent is None and self._root is not None:
+                parent = self._root
+            if parent is not None:
+                span.trace_id = parent.trace_id
+                span.parent_span_id = parent.span_id
+            else:
+                self._root = span
+                if self.remote_parent is not None:
+                    span.trace_id, span.parent_span_id = self.remote_parent
+                else:
+                    span.trace_id = secrets.token_hex(16)
+        span.start_ns = time.time_ns()
+
+    def end(self, span: Span) -> None:
+        span.end_ns = time.time_ns()
+        with self._lock:
+            self._finished.append(span)
+            if span is self._root:
+                self._root = None
+            elif len(self._finished) < _MAX_BUFFERED_SPANS:
+                return
+            batch, self._finished = self._finished, []
+        self._export(batch)
+
+    def flush(self) -> None:
+        with self._lock:
+            batch, self._finished = self._finished, []
+        if batch:
+            self._export(batch)
+
+    def _export(self, spans: list[Span]) -> None:
+        body = json.dumps(self._payload(spans), separators=(",", ":"))
+        if self.trace_file is not None:
+            try:
+                self.trace_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.trace_file, "a", encoding="utf-8") as f:
+                    f.write(body + "\n")
+            except OSError as e:
+                logger.warning("Could not write trace spans to %s: %s", self.trace_file, e)
+        if self.endpoint is not None:
+            self._post(body.encode("utf-8"))
+
+    def _post(self, body: bytes) -> None:
+        # urllib keeps the exporter free of third-party imports
+        import urllib.error
+        import urllib.request
+
+        # configure() only accepts http(s) endpoints
+        request = urllib.request.Request(  # noqa: S310
+            self.endpoint,
+            data=body,
+            headers={**self.headers, "Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=_EXPORT_TIMEOUT) as response:  # noqa: S310
+                response.read()
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            logger.warning("Could not export trace spans to %s: %s", self.endpoint, e)
+
+    def _payload(self, spans: list[Span]) -> dict[str, Any]:
+        from . import __version__
+
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes(
+                            {
+                                "service.name": self.service_name,
+                                "service.version": __version__,
+                            }
+                        )
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "adversarial_workflow", "version": __version__},
+                            "spans": [s.to_otlp() for s in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    """Encode attributes as OTLP KeyValues, dropping None values."""
+    encoded = []
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            any_value: dict[str, Any] = {"boolValue": value}
+        elif isinstance(value, int):
+            any_value = {"intValue": str(value)}
+        elif isinstance(value, float):
+            any_value = {"doubleValue": value}
+        else:
+            any_value = {"stringValue": str(value)}
+        encoded.append({"key": key, "value": any_value})
+    return encoded
+
+
+def _parse_headers(value: str) -> dict[str, str]:
+    headers = {}
+    for item in value.split(","):
+        name, sep, header_value = item.partition("=")
+        if sep and name.strip():
+            headers[name.strip()] = header_value.strip()
+    return headers
+
+
+def _parse_traceparent(value: str) -> tuple[str, str] | None:
+    match = _TRACEPARENT_RE.match(value.strip().lower())
+    if match is None or set(match.group(1)) == {"0"} or set(match.group(2)) == {"0"}:
+        return None
+    return match.group(1), match.group(2)
+
+
+def configure(environ: dict[str, str] | None = None) -> bool:
+    """Enable or disable tracing from the environment.
+
+    Called at the start of each CLI run (the daemon calls it per request with
+    the client's environment). Spans still buffered from a previous
+    configuration are exported first.
+
+    Returns:
+        True if tracing is enabled
+    """
+    global _tracer
+    env = os.environ if environ is None else environ
+    shutdown()
+
+    if env.get("OTEL_SDK_DISABLED", "").strip().lower() == "true":
+        return False
+    trace_file = env.get(TRACE_FILE_ENV, "").strip()
+    endpoint = env.get("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT", "").strip()
+    if not endpoint:
+        base = env.get("OTEL_EXPORTER_OTLP_ENDPOINT", "").strip()
+        if base:
+            endpoint = base.rstrip("/") + "/v1/traces"
+    if endpoint and not endpoint.startswith(("http://", "https://")):
+        logger.warning("Ignoring OTLP endpoint %s: only http(s) is supported", endpoint)
+        endpoint = ""
+    if not trace_file and not endpoint:
+        return False
+
+    headers = _parse_headers(env.get("OTEL_EXPORTER_OTLP_HEADERS", ""))
+    headers.update(_parse_headers(env.get("OTEL_EXPORTER_OTLP_TRACES_HEADERS", "")))
+    _tracer = _Tracer(
+        service_name=env.get("OTEL_SERVICE_NAME", "").strip() or DEFAULT_SERVICE_NAME,
+        trace_file=Path(trace_file) if trace_file else None,
+        endpoint=endpoint or None,
+        headers=headers,
+        remote_parent=_parse_traceparent(env.get("TRACEPARENT", "")),
+    )
+    return True
+
+
+def shutdown() -> None:
+    """Export any buffered spans and turn tracing off."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.flush()
+
+
+def enabled() -> bool:
+    """Return True if spans are being recorded."""
+    return _tracer is not None
+
+
+def span(
+    name: str, attributes: dict[str, Any] | None = None, kind: int = SPAN_KIND_INTERNAL
+) -> Span | _NoOpSpan:
+    """Return a context manager that records ``name`` as a span.
+
+    Nested spans (in the same thread or asyncio task) become children of the
+    enclosing one. An exception leaving the block marks the span as failed
+    and is re-raised::
+
+        with tracing.span("adversarial.validate_output") as s:
+            ...
+            s.set_attribute("adversarial.verdict", verdict)
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP_SPAN
+    return Span(tracer, name, attributes or {}, kind)
+
+
+def current_span() -> Span | _NoOpSpan:
+    """Return the innermost open span, or the no-op span."""
+    if _tracer is None:
+        return _NOOP_SPAN
+    return _CURRENT.get() or _NOOP_SPAN
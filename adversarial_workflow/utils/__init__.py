@@ -2,7 +2,7 @@
 
 from .colors import BOLD, CYAN, GRAY, GREEN, RED, RESET, YELLOW
 from .config import load_config
-from .validation import validate_evaluation_output
+from .validation import extract_verdict, validate_evaluation_content, validate_evaluation_output
 
 __all__ = [
     "BOLD",
@@ -12,6 +12,8 @@ __all__ = [
     "RED",
     "RESET",
     "YELLOW",
+    "extract_verdict",
     "load_config",
+    "validate_evaluation_content",
     "validate_evaluation_output",
 ]
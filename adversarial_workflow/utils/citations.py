@@ -25,6 +25,8 @@ from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 
+from .. import tracing
+
 # Module logger for debugging URL check failures
 logger = logging.getLogger(__name__)
 
@@ -412,23 +414,29 @@ def check_urls(
         if "no running event loop" not in str(e).lower():
             raise
 
-    # Load cache
-    cache_path = get_cache_path(cache_dir)
-    cache = load_cache(cache_path)
-
-    # Run async check
-    results = asyncio.run(
-        check_urls_parallel(
-            urls,
-            concurrency=concurrency,
-            timeout=timeout,
-            cache=cache,
-            cache_ttl=cache_ttl,
+    with tracing.span("adversarial.check_citations", {"adversarial.urls": len(urls)}) as span:
+        # Load cache
+        cache_path = get_cache_path(cache_dir)
+        cache = load_cache(cache_path)
+
+        # Run async check
+        results = asyncio.run(
+            check_urls_parallel(
+                urls,
+                concurrency=concurrency,
+                timeout=timeout,
+                cache=cache,
+                cache_ttl=cache_ttl,
+            )
         )
-    )
 
-    # Save cache
-    save_cache(cache_path, cache)
+        # Save cache
+        save_cache(cache_path, cache)
+
+        if tracing.enabled():
+            for status in URLStatus:
+                count = sum(1 for r in results if r.status == status)
+                span.set_attribute(f"adversarial.urls.{status.value}", count)
 
     return results
 
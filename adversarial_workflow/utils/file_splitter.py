@@ -9,6 +9,8 @@ import re
 from pathlib import Path
 from typing import Any
 
+from .tokens import estimate_tokens
+
 
 def analyze_task_file(file_path: str) -> dict[str, Any]:
     """Analyze file structure and suggest split points.
@@ -20,7 +22,7 @@ def analyze_task_file(file_path: str) -> dict[str, Any]:
         Dict containing:
         - total_lines: Total number of lines
         - sections: List of detected sections with metadata
-        - estimated_tokens: Rough token estimate (lines * 4)
+        - estimated_tokens: Rough token estimate (~4 characters per token)
         - suggested_splits: List of suggested split points
 
     Raises:
@@ -36,6 +38,38 @@ def analyze_task_file(file_path: str) -> dict[str, Any]:
     if not content.strip():
         raise ValueError("File is empty or too small")
 
+    total_lines = len(content.split("\n"))
+    sections = detect_sections(content)
+
+    estimated_tokens = estimate_tokens(content)
+
+    # Suggest splits if file is large
+    suggested_splits = []
+    if total_lines > 500:
+        # Suggest section-based splits
+        suggested_splits = _suggest_section_splits(sections, max_lines=500)
+
+    return {
+        "total_lines": total_lines,
+        "sections": sections,
+        "estimated_tokens": estimated_tokens,
+        "suggested_splits": suggested_splits,
+    }
+
+
+def detect_sections(content: str) -> list[dict[str, Any]]:
+    """Detect Markdown sections: each heading line starts a new section.
+
+    Lines before the first heading belong to no section. A document without
+    headings is returned as a single "Full Document" section.
+
+    Args:
+        content: Markdown text
+
+    Returns:
+        List of dicts with title, heading_level, start_line, end_line and
+        line_count (1-based, inclusive)
+    """
     lines = content.split("\n")
     total_lines = len(lines)
 
@@ -85,21 +119,7 @@ def analyze_task_file(file_path: str) -> dict[str, Any]:
             }
         ]
 
-    # Estimate tokens (rough approximation: 1 line ≈ 4 tokens)
-    estimated_tokens = total_lines * 4
-
-    # Suggest splits if file is large
-    suggested_splits = []
-    if total_lines > 500:
-        # Suggest section-based splits
-        suggested_splits = _suggest_section_splits(sections, max_lines=500)
-
-    return {
-        "total_lines": total_lines,
-        "sections": sections,
-        "estimated_tokens": estimated_tokens,
-        "suggested_splits": suggested_splits,
-    }
+    return sections
 
 
 def split_by_sections(content: str, max_lines: int = 500) -> list[dict[str, Any]]:
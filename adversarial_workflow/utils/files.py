@@ -0,0 +1,95 @@
+"""Atomic file writes and LRU eviction for the on-disk caches and stores.
+
+atomic_write() writes to a temporary file beside the target and renames it
+into place, so concurrent readers (parallel processes, batch workers) never
+see a partial file. The response cache and the library artifact store order
+their entries by mtime: mark_used() touches an entry when it is read, and
+evict_lru() deletes the least recently used entries above a byte budget.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any
+
+
+@contextlib.contextmanager
+def atomic_write(
+    path: Path | str,
+    mode: str = "w",
+    encoding: str | None = None,
+    permissions: int | None = None,
+) -> Iterator[IO[Any]]:
+    """Open a temporary file beside ``path`` and rename it onto ``path`` on success.
+
+    If the block raises, the temporary file is removed and ``path`` is left
+    untouched. Parent directories are created as needed.
+
+    Args:
+        path: Destination file
+        mode: "w" for text or "wb" for bytes
+        encoding: Text encoding (text mode only)
+        permissions: File mode to apply, masked by the umask. By default the
+            file keeps mkstemp's owner-only 0600.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+        if permissions is not None:
+            os.chmod(tmp_name, permissions & ~current_umask())
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def mark_used(path: Path | str) -> None:
+    """Record a read of a cache entry for LRU ordering (mtime = last use)."""
+    with contextlib.suppress(OSError):
+        os.utime(path)
+
+
+def evict_lru(paths: Iterable[Path], max_bytes: int) -> int:
+    """Delete the least recently used of ``paths`` until they fit ``max_bytes``.
+
+    Temporary files of in-progress atomic writes are skipped.
+
+    Returns:
+        Number of files deleted
+    """
+    entries = []
+    total = 0
+    for path in paths:
+        if path.suffix == ".tmp":
+            continue
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+        total += stat.st_size
+
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        with contextlib.suppress(OSError):
+            path.unlink()
+            total -= size
+            removed += 1
+    return removed
+
+
+def current_umask() -> int:
+    """Return the process umask (os.umask can only read it by setting it)."""
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
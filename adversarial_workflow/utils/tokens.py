@@ -0,0 +1,49 @@
+"""Token counting for size gates and context-window preflight.
+
+count_tokens() uses LiteLLM's tokenizer for the given model and falls back to
+the ~4 characters per token heuristic when no model is given or the model has
+no known tokenizer. litellm is imported lazily so callers that only need the
+heuristic (e.g. ``adversarial split``) do not pay for the import.
+"""
+
+from __future__ import annotations
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rough average for English prose and Markdown
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Return a fast heuristic token estimate (characters / 4)."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """Return the number of tokens ``text`` encodes to for ``model``.
+
+    Falls back to estimate_tokens() when no model is given or the tokenizer
+    cannot be loaded.
+    """
+    if model:
+        try:
+            import litellm
+
+            return int(litellm.token_counter(model=model, text=text))
+        except Exception as e:
+            logger.debug("Token counter unavailable for %s (%s); using heuristic", model, e)
+    return estimate_tokens(text)
+
+
+def context_window(model: str) -> int | None:
+    """Return the maximum input tokens for ``model``, or None if unknown."""
+    try:
+        import litellm
+
+        info = litellm.get_model_info(model)
+    except Exception:
+        return None
+    window = info.get("max_input_tokens")
+    return window if isinstance(window, int) and window > 0 else None
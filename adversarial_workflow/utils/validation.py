@@ -5,6 +5,40 @@ from __future__ import annotations
 import os
 import re
 
+from .. import tracing
+
+# All recognized verdicts across built-in and custom evaluators
+_ALL_VERDICTS = (
+    "APPROVED|NEEDS_REVISION|REJECTED"  # built-in
+    "|PROCEED|RETHINK"  # architecture-planner
+    "|REVISION_SUGGESTED|RESTRUCTURE_NEEDED"  # architecture-reviewer
+    "|COMPLIANT|MOSTLY_COMPLIANT|NON_COMPLIANT"  # spec-compliance
+    "|PASS|CONCERNS|FAIL"  # code-reviewer
+)
+
+# Verdict line formats, in priority order
+_VERDICT_PATTERNS = [
+    rf"^\s*Verdict:\s*({_ALL_VERDICTS})\s*$",
+    rf"^\s*\*\*Verdict\*\*:\s*({_ALL_VERDICTS})\s*$",
+    rf"^\s*\*\*Verdict\*\*:\s*\*\*({_ALL_VERDICTS})\*\*\s*$",  # **Verdict**: **FAIL**
+    rf"^\s*[-*]\s+\*\*({_ALL_VERDICTS})\*\*(?::|\s*$)",  # list item verdict line
+    rf"^\s*\*\*({_ALL_VERDICTS})\*\*\s*$",  # bold verdict as full line
+    rf"^({_ALL_VERDICTS})\s*$",  # FAIL (bare line)
+]
+
+# All formats as one pattern, scanned in a single pass. Each alternative has
+# exactly one capturing group, so ``match.lastindex - 1`` is its priority.
+_VERDICT_RE = re.compile(
+    "|".join(f"(?:{p})" for p in _VERDICT_PATTERNS), re.MULTILINE | re.IGNORECASE
+)
+
+# Explicit "Verdict:" lines (the first three formats) are unambiguous enough
+# to report while output is still streaming
+_KEYED_FORMATS = 3
+
+# Evaluations shorter than this (header included) are treated as failed calls
+MIN_OUTPUT_LENGTH = 500
+
 
 def validate_evaluation_output(
     log_file_path: str,
@@ -12,6 +46,9 @@ def validate_evaluation_output(
     """
     Validate that evaluation log contains actual evaluation content.
 
+    Reads the file and checks it with validate_evaluation_content(); callers
+    that still hold the text they wrote should call that directly.
+
     Args:
         log_file_path: Path to the evaluation log file
 
@@ -27,8 +64,26 @@ def validate_evaluation_output(
     with open(log_file_path, encoding="utf-8") as f:
         content = f.read()
 
+    return validate_evaluation_content(content)
+
+
+def validate_evaluation_content(content: str) -> tuple[bool, str | None, str]:
+    """Validate evaluation output held in memory (the full text of the log file).
+
+    Returns:
+        (is_valid, verdict, message), as validate_evaluation_output()
+    """
+    with tracing.span("adversarial.validate_output") as span:
+        is_valid, verdict, message = _validate_content(content)
+        span.set_attributes({"adversarial.valid": is_valid, "adversarial.verdict": verdict})
+        if not is_valid:
+            span.fail(message)
+    return is_valid, verdict, message
+
+
+def _validate_content(content: str) -> tuple[bool, str | None, str]:
     # Check minimum content size
-    if len(content) < 500:
+    if len(content) < MIN_OUTPUT_LENGTH:
         return (
             False,
             None,
@@ -36,32 +91,76 @@ def validate_evaluation_output(
         )
 
     # Extract verdict — supports built-in and custom evaluator verdict names
-    verdict = None
-    # All recognized verdicts across built-in and custom evaluators
-    all_verdicts = (
-        "APPROVED|NEEDS_REVISION|REJECTED"  # built-in
-        "|PROCEED|RETHINK"  # architecture-planner
-        "|REVISION_SUGGESTED|RESTRUCTURE_NEEDED"  # architecture-reviewer
-        "|COMPLIANT|MOSTLY_COMPLIANT|NON_COMPLIANT"  # spec-compliance
-        "|PASS|CONCERNS|FAIL"  # code-reviewer
-    )
-    verdict_patterns = [
-        rf"^\s*Verdict:\s*({all_verdicts})\s*$",
-        rf"^\s*\*\*Verdict\*\*:\s*({all_verdicts})\s*$",
-        rf"^\s*\*\*Verdict\*\*:\s*\*\*({all_verdicts})\*\*\s*$",  # **Verdict**: **FAIL**
-        rf"^\s*[-*]\s+\*\*({all_verdicts})\*\*(?::|\s*$)",  # list item verdict line
-        rf"^\s*\*\*({all_verdicts})\*\*\s*$",  # bold verdict as full line
-        rf"^({all_verdicts})\s*$",  # FAIL (bare line)
-    ]
-
-    for pattern in verdict_patterns:
-        match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE)
-        if match:
-            verdict = match.group(1).upper()
-            break
+    verdict = extract_verdict(content)
 
     if verdict:
         return True, verdict, f"Valid evaluation with verdict: {verdict}"
     else:
         # Has content but no clear verdict
         return True, None, "Evaluation complete (verdict not detected)"
+
+
+def extract_verdict(content: str) -> str | None:
+    """Return the verdict in ``content``, or None if there is none.
+
+    When several formats occur, the highest-priority one wins (an explicit
+    ``Verdict:`` line over a bold or bare verdict word), and within a format
+    the first occurrence. Scanning stops at the first ``Verdict:`` line,
+    since nothing can outrank it.
+    """
+    best_rank = len(_VERDICT_PATTERNS)
+    verdict = None
+    for match in _VERDICT_RE.finditer(content):
+        rank = match.lastindex - 1
+        if rank < best_rank:
+            best_rank, verdict = rank, match.group(match.lastindex).upper()
+            if rank == 0:
+                break
+    return verdict
+
+
+class VerdictScanner:
+    """Detect an explicit ``Verdict:`` line in streamed output as soon as it completes.
+
+    Feed chunks in arrival order; each line is checked once it ends with a
+    newline. Only the explicit ``Verdict:`` formats are recognized here - the
+    authoritative verdict still comes from validate_evaluation_content() on the
+    full output.
+    """
+
+    def __init__(self) -> None:
+        self.verdict: str | None = None
+        self._pending = ""
+
+    def feed(self, text: str) -> str | None:
+        """Consume a chunk. Returns the verdict the first time one is seen, else None."""
+        if self.verdict is not None or not text:
+            return None
+        self._pending += text
+        *lines, self._pending = self._pending.split("\n")
+        for line in lines:
+            verdict = _match_keyed_verdict(line)
+            if verdict:
+                self.verdict = verdict
+                self._pending = ""
+                return verdict
+        return None
+
+    def finish(self) -> str | None:
+        """Check the trailing line (no final newline). Returns a new verdict or None."""
+        if self.verdict is not None or not self._pending:
+            return None
+        verdict = _match_keyed_verdict(self._pending)
+        self._pending = ""
+        if verdict:
+            self.verdict = verdict
+        return verdict
+
+
+def _match_keyed_verdict(line: str) -> str | None:
+    """Return the verdict on an explicit ``Verdict:`` line, or None."""
+    # Alternatives are tried in priority order, so a keyed format wins if any matches
+    match = _VERDICT_RE.match(line)
+    if match is None or match.lastindex > _KEYED_FORMATS:
+        return None
+    return match.group(match.lastindex).upper()
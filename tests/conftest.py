@@ -8,10 +8,12 @@ including temporary directories, sample files, and mocked dependencies.
 import os
 import subprocess
 import sys
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from adversarial_workflow.evaluators.config import EvaluatorConfig
+
 
 @pytest.fixture
 def tmp_project(tmp_path):
@@ -166,6 +168,16 @@ def change_test_dir(tmp_project):
     os.chdir(old_cwd)
 
 
+@pytest.fixture(autouse=True)
+def no_retry_backoff():
+    """Skip real backoff sleeps between model-call retries (delays are still computed)."""
+    with (
+        patch("adversarial_workflow.evaluators.runner._backoff") as backoff,
+        patch("adversarial_workflow.evaluators.runner._backoff_async") as backoff_async,
+    ):
+        yield backoff, backoff_async
+
+
 @pytest.fixture
 def cli_python():
     """Get Python interpreter path that has adversarial_workflow installed.
@@ -194,3 +206,54 @@ def run_cli(cli_python):
         return subprocess.run(cmd, capture_output=True, text=True, **kwargs)
 
     return _run_cli
+
+
+@pytest.fixture
+def evaluator_config():
+    """A local evaluator on gpt-4o that writes ``{basename}-TEST-EVAL.md``."""
+    return EvaluatorConfig(
+        name="test-eval",
+        description="Test evaluator",
+        model="gpt-4o",
+        api_key_env="OPENAI_API_KEY",
+        prompt="Evaluate this document.",
+        output_suffix="TEST-EVAL",
+        source="local",
+    )
+
+
+@pytest.fixture
+def eval_project(tmp_path, monkeypatch):
+    """Project to run evaluators in: the working directory, with OPENAI_API_KEY set.
+
+    Has a minimal ``.adversarial/config.yml`` (log_directory only); tests add
+    the documents to evaluate.
+    """
+    adv = tmp_path / ".adversarial"
+    adv.mkdir()
+    (adv / "config.yml").write_text("log_directory: .adversarial/logs/\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    return tmp_path
+
+
+@pytest.fixture
+def make_completion_response():
+    """Factory for mocked ``litellm.completion()`` responses.
+
+    The content is long enough to pass output validation and ends with a
+    ``Verdict:`` line, or with ``text`` when given.
+
+    Usage:
+        response = make_completion_response("NEEDS_REVISION")
+        response = make_completion_response(text="\nVerdict: PASS")
+    """
+
+    def _make(verdict: str = "APPROVED", text: str | None = None) -> MagicMock:
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        ending = f"\nVerdict: {verdict}" if text is None else text
+        response.choices[0].message.content = "Evaluation details. " * 30 + ending
+        return response
+
+    return _make
@@ -0,0 +1,133 @@
+"""Tests for the asyncio-native runner (run_evaluator_async / litellm.acompletion)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import litellm
+import pytest
+
+from adversarial_workflow.evaluators.runner import (
+    _evaluate_file_async,
+    run_evaluator_async,
+)
+
+
+@pytest.fixture
+def project(eval_project):
+    for i in range(3):
+        (eval_project / f"doc-{i}.md").write_text(f"# Document {i}\n\nBody.\n")
+    return eval_project
+
+
+class TestRunEvaluatorAsync:
+    async def test_uses_acompletion(self, evaluator_config, project, make_completion_response):
+        mock = AsyncMock(return_value=make_completion_response())
+        with (
+            patch("adversarial_workflow.evaluators.runner.litellm.acompletion", mock),
+            patch("adversarial_workflow.evaluators.runner.litellm.completion") as sync_mock,
+        ):
+            result = await run_evaluator_async(evaluator_config, "doc-0.md", timeout=90)
+
+        assert result == 0
+        sync_mock.assert_not_called()
+        kwargs = mock.call_args.kwargs
+        assert kwargs["model"] == "gpt-4o"
+        assert kwargs["timeout"] == 90
+        assert "Evaluate this document." in kwargs["messages"][0]["content"]
+        assert "Document 0" in kwargs["messages"][1]["content"]
+
+    async def test_writes_same_output_as_sync_path(
+        self, evaluator_config, project, make_completion_response
+    ):
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.acompletion",
+            AsyncMock(return_value=make_completion_response("NEEDS_REVISION")),
+        ):
+            result = await run_evaluator_async(evaluator_config, "doc-0.md")
+
+        assert result == 1
+        output = (project / ".adversarial" / "logs" / "doc-0-TEST-EVAL.md").read_text()
+        assert "**Evaluator**: test-eval" in output
+        assert "Verdict: NEEDS_REVISION" in output
+
+    async def test_many_evaluations_share_one_loop(
+        self, evaluator_config, project, make_completion_response
+    ):
+        in_flight = 0
+        peak = 0
+
+        async def acompletion(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return make_completion_response()
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.acompletion",
+            side_effect=acompletion,
+        ):
+            codes = await asyncio.gather(
+                *(run_evaluator_async(evaluator_config, f"doc-{i}.md") for i in range(3))
+            )
+
+        assert codes == [0, 0, 0]
+        assert peak == 3
+
+    async def test_file_not_found(self, evaluator_config, project, capsys):
+        assert await run_evaluator_async(evaluator_config, "missing.md") == 1
+        assert "File not found" in capsys.readouterr().out
+
+    async def test_large_file_cancelled(self, evaluator_config, project, capsys):
+        with (
+            patch(
+                "adversarial_workflow.evaluators.runner._check_file_size",
+                return_value=(800, 25000),
+            ),
+            patch(
+                "adversarial_workflow.evaluators.runner._confirm_continue",
+                return_value=False,
+            ),
+        ):
+            assert await run_evaluator_async(evaluator_config, "doc-0.md") == 0
+        assert "Evaluation cancelled" in capsys.readouterr().out
+
+
+class TestEvaluateFileAsyncErrors:
+    async def test_rate_limit_error(self, evaluator_config, project, capsys):
+        error = litellm.RateLimitError(
+            message="Rate limit exceeded", model="gpt-4o", llm_provider="openai"
+        )
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.acompletion",
+            AsyncMock(side_effect=error),
+        ):
+            result = await _evaluate_file_async(
+                evaluator_config, "doc-0.md", {"log_directory": ".adversarial/logs/"}, 180, "gpt-4o"
+            )
+
+        assert result.exit_code == 1
+        assert result.error == "API rate limit exceeded"
+        assert "rate limit" in capsys.readouterr().out.lower()
+
+    async def test_timeout_quiet(self, evaluator_config, project, capsys):
+        error = litellm.Timeout(message="timed out", model="gpt-4o", llm_provider="openai")
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.acompletion",
+            AsyncMock(side_effect=error),
+        ):
+            result = await _evaluate_file_async(
+                evaluator_config,
+                "doc-0.md",
+                {"log_directory": ".adversarial/logs/"},
+                30,
+                "gpt-4o",
+                quiet=True,
+            )
+
+        assert result.exit_code == 1
+        assert "timed out" in result.error
+        assert capsys.readouterr().out == ""
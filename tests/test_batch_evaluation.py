@@ -0,0 +1,226 @@
+"""Tests for batch evaluation (one evaluator across many files)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from adversarial_workflow.evaluators.batch import (
+    BatchResult,
+    expand_file_patterns,
+    run_evaluator_batch,
+)
+from adversarial_workflow.evaluators.ratelimit import ProviderLimiter, provider_for_model
+from adversarial_workflow.evaluators.runner import EvaluationResult
+
+
+@pytest.fixture
+def project(eval_project):
+    """Initialized project with a handful of task files."""
+    tasks = eval_project / "tasks" / "sub"
+    tasks.mkdir(parents=True)
+    for i in range(6):
+        (tasks / f"task-{i}.md").write_text(f"# Task {i}\n\nContent {i}\n")
+    return eval_project
+
+
+class TestExpandFilePatterns:
+    def test_recursive_glob(self, project):
+        files = expand_file_patterns(["tasks/**/*.md"])
+        assert len(files) == 6
+        assert files == sorted(files)
+
+    def test_deduplicates_and_keeps_order(self, project):
+        first = "tasks/sub/task-3.md"
+        files = expand_file_patterns([first, "tasks/**/*.md"])
+        assert files[0] == first
+        assert len(files) == 6
+
+    def test_missing_plain_path_kept(self, project):
+        assert expand_file_patterns(["nope.md"]) == ["nope.md"]
+
+
+class TestProviderLimiter:
+    def test_provider_for_model(self):
+        assert provider_for_model("gpt-4o") == "openai"
+        assert provider_for_model("gemini/gemini-2.5-flash") == "gemini"
+        assert provider_for_model("madeup/thing") == "madeup"
+
+    def test_caps_concurrency_per_provider(self):
+        limiter = ProviderLimiter(default_limit=10, limits={"openai": 2})
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal active, peak
+            with limiter.slot("gpt-4o"):
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.05)
+                with lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert peak == 2
+
+    def test_invalid_limit(self):
+        with pytest.raises(ValueError):
+            ProviderLimiter(0)
+
+    def test_from_project_config(self):
+        limiter = ProviderLimiter.from_project_config({"provider_concurrency": {"gemini": 2}}, 8)
+        assert (limiter.default_limit, limiter.limits) == (8, {"gemini": 2})
+        # A malformed mapping is ignored
+        limiter = ProviderLimiter.from_project_config({"provider_concurrency": [2]}, 4)
+        assert (limiter.default_limit, limiter.limits) == (4, {})
+
+
+class TestRunEvaluatorBatch:
+    def test_runs_concurrently_and_aggregates(
+        self, evaluator_config, project, make_completion_response
+    ):
+        def slow_completion(**kwargs):
+            time.sleep(0.2)
+            if "Task 0" in kwargs["messages"][-1]["content"]:
+                return make_completion_response("NEEDS_REVISION")
+            return make_completion_response("APPROVED")
+
+        files = expand_file_patterns(["tasks/**/*.md"])
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=slow_completion,
+        ):
+            start = time.monotonic()
+            batch = run_evaluator_batch(evaluator_config, files, concurrency=6)
+            elapsed = time.monotonic() - start
+
+        # Six 0.2s calls on six workers: much closer to 0.2s than 1.2s
+        assert elapsed < 0.8
+        assert [r.file_path for r in batch.results] == files
+        assert batch.verdict_counts["APPROVED"] == 5
+        assert batch.verdict_counts["NEEDS_REVISION"] == 1
+        assert batch.exit_code == 1
+        assert len(list((project / ".adversarial" / "logs").glob("*.md"))) == 6
+
+    def test_same_named_files_get_distinct_outputs(
+        self, evaluator_config, project, make_completion_response
+    ):
+        for directory in ("a", "b"):
+            (project / directory).mkdir()
+            (project / directory / "README.md").write_text(f"# Task {directory}\n")
+        (project / "c.md").write_text("# Task c\n")
+
+        def completion(**kwargs):
+            if "Task a" in kwargs["messages"][-1]["content"]:
+                return make_completion_response("NEEDS_REVISION")
+            return make_completion_response("APPROVED")
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion", side_effect=completion
+        ):
+            batch = run_evaluator_batch(evaluator_config, ["a/README.md", "b/README.md", "c.md"])
+
+        a, b, c = (r.output_file for r in batch.results)
+        assert len({a, b, c}) == 3
+        assert Path(c).name == "c-TEST-EVAL.md"
+        assert "NEEDS_REVISION" in Path(a).read_text()
+        assert "APPROVED" in Path(b).read_text()
+
+    def test_missing_file_reported(self, evaluator_config, project, make_completion_response):
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=make_completion_response("APPROVED"),
+        ):
+            batch = run_evaluator_batch(evaluator_config, ["tasks/sub/task-1.md", "missing.md"])
+
+        assert batch.results[0].verdict == "APPROVED"
+        assert batch.results[1].error == "File not found"
+        assert batch.verdict_counts["ERROR"] == 1
+
+    def test_provider_concurrency_from_project_config(
+        self, evaluator_config, project, make_completion_response
+    ):
+        (project / ".adversarial" / "config.yml").write_text(
+            "log_directory: .adversarial/logs/\nprovider_concurrency:\n  openai: 1\n"
+        )
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def completion(**kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return make_completion_response("APPROVED")
+
+        files = expand_file_patterns(["tasks/**/*.md"])
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=completion,
+        ):
+            batch = run_evaluator_batch(evaluator_config, files, concurrency=4)
+
+        assert peak == 1
+        assert batch.exit_code == 0
+
+    def test_setup_failure_marks_all_files(self, evaluator_config, project, monkeypatch):
+        monkeypatch.delenv("OPENAI_API_KEY")
+        batch = run_evaluator_batch(
+            evaluator_config, ["tasks/sub/task-1.md", "tasks/sub/task-2.md"]
+        )
+        assert batch.exit_code == 1
+        assert all(r.error for r in batch.results)
+
+
+class TestBatchResult:
+    def test_empty_batch_passes(self):
+        assert BatchResult().exit_code == 0
+
+    def test_no_verdict_counted_as_none(self):
+        batch = BatchResult(results=[EvaluationResult("a.md", "e", 0)])
+        assert batch.verdict_counts["NONE"] == 1
+
+
+class TestBatchCLI:
+    def test_batch_flag_dispatches(self, project, capsys, make_completion_response):
+        from adversarial_workflow.cli import main
+
+        with (
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion",
+                return_value=make_completion_response("APPROVED"),
+            ),
+            patch(
+                "sys.argv",
+                ["adversarial", "evaluate", "--batch", "tasks/**/*.md", "-j", "3"],
+            ),
+        ):
+            result = main()
+
+        assert result == 0
+        out = capsys.readouterr().out
+        assert "Batch summary" in out
+        assert "APPROVED" in out
+
+    def test_no_file_and_no_batch_errors(self, project, capsys):
+        from adversarial_workflow.cli import main
+
+        with patch("sys.argv", ["adversarial", "evaluate"]):
+            result = main()
+
+        assert result == 1
+        assert "No file specified" in capsys.readouterr().out
@@ -0,0 +1,180 @@
+"""Tests for chunked (map-reduce) evaluation of large documents."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from adversarial_workflow.evaluators.chunked import combine_verdicts, run_evaluator_chunked
+
+
+@pytest.fixture
+def project(eval_project):
+    sections = []
+    for i in range(4):
+        sections.append(f"## Section {i}\n" + "\n".join(f"Line {i}.{j}" for j in range(40)))
+    (eval_project / "big.md").write_text("\n".join(sections) + "\n")
+    (eval_project / "small.md").write_text("# Small\n\nShort doc.\n")
+    return eval_project
+
+
+def _is_merge(kwargs) -> bool:
+    return "Merge Instructions" in kwargs["messages"][-1]["content"]
+
+
+class TestCombineVerdicts:
+    def test_most_severe_wins(self):
+        assert combine_verdicts(["APPROVED", "NEEDS_REVISION", None]) == "NEEDS_REVISION"
+        assert combine_verdicts(["PASS", "FAIL", "CONCERNS"]) == "FAIL"
+        assert combine_verdicts(["APPROVED", None]) == "APPROVED"
+        assert combine_verdicts([None]) is None
+
+
+class TestRunEvaluatorChunked:
+    def test_map_then_reduce(self, evaluator_config, project, make_completion_response):
+        prompts = []
+        system_prompts = set()
+        lock = threading.Lock()
+
+        def completion(**kwargs):
+            content = "\n".join(m["content"] for m in kwargs["messages"])
+            with lock:
+                prompts.append(content)
+                system_prompts.add(kwargs["messages"][0]["content"])
+            if _is_merge(kwargs):
+                return make_completion_response(text="\nMerged findings.\nVerdict: NEEDS_REVISION")
+            return make_completion_response(text="\nPart finding.\nVerdict: APPROVED")
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=completion,
+        ):
+            result = run_evaluator_chunked(evaluator_config, "big.md", max_lines=50)
+
+        assert result == 1  # merged verdict wins
+        part_prompts = [p for p in prompts if "Scope of This Review" in p]
+        merge_prompts = [p for p in prompts if "Merge Instructions" in p]
+        assert len(part_prompts) == 4
+        assert len(merge_prompts) == 1
+        assert any("part 1 of 4 of big.md (lines 1-" in p for p in part_prompts)
+        # Merge prompt carries the part reports, not the original document
+        assert merge_prompts[0].count("Part finding.") == 4
+        assert "### Part 4 of 4" in merge_prompts[0]
+        assert "**Evaluator**" not in merge_prompts[0]
+        # Part and merge instructions travel with the document; the prompt stays cacheable
+        assert system_prompts == {evaluator_config.prompt}
+
+        logs = project / ".adversarial" / "logs"
+        assert sorted(p.name for p in logs.glob("big-TEST-EVAL-PART*.md")) == [
+            f"big-TEST-EVAL-PART{i}.md" for i in range(1, 5)
+        ]
+        assert "Merged findings." in (logs / "big-TEST-EVAL.md").read_text()
+
+    def test_parts_run_concurrently(self, evaluator_config, project, make_completion_response):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def completion(**kwargs):
+            nonlocal active, peak
+            if _is_merge(kwargs):
+                return make_completion_response("APPROVED")
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.1)
+            with lock:
+                active -= 1
+            return make_completion_response("APPROVED")
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=completion,
+        ):
+            assert (
+                run_evaluator_chunked(evaluator_config, "big.md", max_lines=50, concurrency=4) == 0
+            )
+
+        assert peak > 1
+
+    def test_merge_without_verdict_uses_most_severe_part(
+        self, evaluator_config, project, capsys, make_completion_response
+    ):
+        def completion(**kwargs):
+            if _is_merge(kwargs):
+                return make_completion_response(text="\nNo explicit verdict here.")
+            if "Section 2" in kwargs["messages"][-1]["content"]:
+                return make_completion_response("REJECTED")
+            return make_completion_response("APPROVED")
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=completion,
+        ):
+            assert run_evaluator_chunked(evaluator_config, "big.md", max_lines=50) == 1
+
+        out = capsys.readouterr().out
+        assert "most severe part verdict" in out
+        assert "Evaluation REJECTED" in out
+
+    def test_failed_part_skips_merge(
+        self, evaluator_config, project, capsys, make_completion_response
+    ):
+        short = MagicMock()
+        short.choices = [MagicMock()]
+        short.choices[0].message.content = "too short"
+        calls = []
+
+        def completion(**kwargs):
+            calls.append(_is_merge(kwargs))
+            if "Section 1" in kwargs["messages"][-1]["content"]:
+                return short
+            return make_completion_response("APPROVED")
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=completion,
+        ):
+            assert run_evaluator_chunked(evaluator_config, "big.md", max_lines=50) == 1
+
+        assert not any(calls)
+        assert "not merging" in capsys.readouterr().out
+
+    def test_small_file_not_chunked(
+        self, evaluator_config, project, capsys, make_completion_response
+    ):
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=make_completion_response("APPROVED"),
+        ) as mock_completion:
+            assert run_evaluator_chunked(evaluator_config, "small.md") == 0
+
+        assert mock_completion.call_count == 1
+        assert "not chunking" in capsys.readouterr().out
+
+    def test_file_not_found(self, evaluator_config, project, capsys):
+        assert run_evaluator_chunked(evaluator_config, "missing.md") == 1
+        assert "File not found" in capsys.readouterr().out
+
+    def test_cli_chunked_flag(self, project, make_completion_response):
+        from adversarial_workflow.cli import main
+
+        def completion(**kwargs):
+            return make_completion_response("APPROVED")
+
+        with (
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion",
+                side_effect=completion,
+            ) as mock_completion,
+            patch(
+                "sys.argv",
+                ["adversarial", "evaluate", "--chunked", "--chunk-lines", "50", "big.md"],
+            ),
+        ):
+            assert main() == 0
+
+        assert mock_completion.call_count == 5
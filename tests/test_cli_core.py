@@ -87,6 +87,7 @@ class TestInitCommand:
         gitignore_content = (tmp_path / ".gitignore").read_text()
         assert ".adversarial/logs/" in gitignore_content
         assert ".adversarial/artifacts/" in gitignore_content
+        assert ".adversarial/metrics/" in gitignore_content
         assert ".env" in gitignore_content
 
     def test_init_existing_with_interactive_cancel(self, tmp_path, capsys):
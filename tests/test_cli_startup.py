@@ -0,0 +1,94 @@
+"""Cold-start regression tests for commands that never call a model.
+
+Building the parser only needs evaluator discovery. litellm (several seconds
+to import), aiohttp and the library client must not be loaded until a command
+that uses them is dispatched.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import time
+
+import pytest
+
+# Generous for slow CI machines; importing litellm alone takes several seconds
+COLD_START_BUDGET_SECONDS = 2.0
+
+HEAVY_MODULES = ("litellm", "aiohttp", "adversarial_workflow.library")
+
+_PROBE = """
+import contextlib, io, json, sys
+from adversarial_workflow.cli import main
+sys.argv = ["adversarial", *sys.argv[1:]]
+with contextlib.redirect_stdout(io.StringIO()):
+    try:
+        main()
+    except SystemExit:
+        pass
+print(json.dumps(sorted(m for m in {heavy!r} if m in sys.modules)))
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    adv = tmp_path / ".adversarial"
+    (adv / "evaluators").mkdir(parents=True)
+    (adv / "config.yml").write_text("log_directory: .adversarial/logs/\n")
+    (adv / "evaluators" / "custom.yml").write_text(
+        "name: custom\n"
+        "description: Custom evaluator\n"
+        "model: gpt-4o\n"
+        "api_key_env: OPENAI_API_KEY\n"
+        "prompt: Review.\n"
+        "output_suffix: CUSTOM\n"
+    )
+    return tmp_path
+
+
+def _loaded_modules(cli_python, project, args: list[str]) -> list[str]:
+    probe = _PROBE.format(heavy=HEAVY_MODULES)
+    result = subprocess.run(
+        [cli_python, "-c", probe, *args],
+        capture_output=True,
+        text=True,
+        cwd=project,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["--version"], ["--help"], ["check"], ["list-evaluators"], ["stats"], ["custom", "--help"]],
+)
+def test_non_llm_commands_skip_heavy_imports(cli_python, project, args):
+    assert _loaded_modules(cli_python, project, args) == []
+
+
+def test_evaluators_package_loads_runner_on_demand(cli_python, project):
+    probe = (
+        "import sys, adversarial_workflow.evaluators as e\n"
+        "assert 'litellm' not in sys.modules\n"
+        "e.run_evaluator\n"
+        "assert 'litellm' in sys.modules\n"
+    )
+    result = subprocess.run(
+        [cli_python, "-c", probe], capture_output=True, text=True, cwd=project, timeout=120
+    )
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize("args", [["--version"], ["list-evaluators"]])
+def test_cold_start_budget(run_cli, project, args):
+    run_cli(args, cwd=project)  # warm the bytecode and registry caches
+    start = time.perf_counter()
+    result = run_cli(args, cwd=project)
+    elapsed = time.perf_counter() - start
+
+    assert result.returncode == 0, result.stderr
+    assert elapsed < COLD_START_BUDGET_SECONDS, (
+        f"adversarial {' '.join(args)} took {elapsed:.2f}s (budget {COLD_START_BUDGET_SECONDS}s)"
+    )
@@ -0,0 +1,229 @@
+"""Tests for the shared per-provider HTTP connection pools."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import litellm
+import pytest
+
+from adversarial_workflow.evaluators import transport
+from adversarial_workflow.evaluators.batch import BatchResult, print_batch_summary
+from adversarial_workflow.evaluators.transport import (
+    ConnectionPools,
+    PoolSettings,
+    PoolStats,
+    connection_pool_stats,
+    install_connection_pools,
+    provider_context,
+)
+
+_COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Verdict: APPROVED"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8},
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        self._reply(b"ok")
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply(json.dumps(_COMPLETION).encode())
+
+    def _reply(self, body: bytes) -> None:
+        self.server.connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.connections = set()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server, path="/") -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+@pytest.fixture
+def clean_install(monkeypatch):
+    """Run with no pools installed and restore LiteLLM's sessions afterwards."""
+    monkeypatch.setattr(transport, "_pools", None)
+    monkeypatch.setattr(litellm, "client_session", None)
+    monkeypatch.setattr(litellm, "aclient_session", None)
+    for var in ("HTTPS_PROXY", "HTTP_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+        monkeypatch.delenv(var.lower(), raising=False)
+
+
+class TestConnectionPools:
+    def test_sync_requests_reuse_connection(self, server):
+        pools = ConnectionPools(PoolSettings())
+        with provider_context("openai"):
+            for _ in range(3):
+                assert pools.client.get(_url(server)).text == "ok"
+
+        assert pools.stats() == {"openai": PoolStats(requests=3, hits=2, misses=1)}
+        assert len(server.connections) == 1
+
+    def test_pools_are_per_provider(self, server):
+        pools = ConnectionPools(PoolSettings())
+        for provider in ("openai", "anthropic", "openai"):
+            with provider_context(provider):
+                pools.client.get(_url(server))
+        pools.client.get(_url(server))
+
+        stats = pools.stats()
+        assert stats["openai"] == PoolStats(requests=2, hits=1, misses=1)
+        assert stats["anthropic"] == PoolStats(requests=1, hits=0, misses=1)
+        assert stats[transport.DEFAULT_POOL].misses == 1
+
+    def test_async_requests_reuse_connection_per_event_loop(self, server):
+        pools = ConnectionPools(PoolSettings())
+
+        async def fetch_twice():
+            with provider_context("openai"):
+                for _ in range(2):
+                    response = await pools.async_client.get(_url(server))
+                    assert response.text == "ok"
+
+        asyncio.run(fetch_twice())
+        asyncio.run(fetch_twice())
+
+        # Connections are not carried over to a new event loop
+        assert pools.stats()["openai"] == PoolStats(requests=4, hits=2, misses=2)
+
+    def test_keepalive_disabled_opens_every_time(self, server):
+        settings = PoolSettings.from_project_config({"http_pool": {"max_keepalive_connections": 0}})
+        pools = ConnectionPools(settings)
+        with provider_context("openai"):
+            for _ in range(2):
+                pools.client.get(_url(server))
+        assert pools.stats()["openai"].misses == 2
+
+    def test_existing_trace_extension_still_called(self, server):
+        pools = ConnectionPools(PoolSettings())
+        events = []
+        pools.client.get(_url(server), extensions={"trace": lambda name, info: events.append(name)})
+        assert "connection.connect_tcp.started" in events
+
+
+class TestPoolSettings:
+    def test_defaults_and_provider_overrides(self):
+        settings = PoolSettings.from_project_config(
+            {
+                "http_pool": {
+                    "max_connections": 8,
+                    "http2": False,
+                    "providers": {"anthropic": {"max_connections": 2}},
+                }
+            }
+        )
+        assert settings.limits_for("openai").max_connections == 8
+        anthropic = settings.limits_for("anthropic")
+        assert anthropic.max_connections == 2
+        # Provider entries inherit the top-level values they do not set
+        assert anthropic.http2 is False
+
+    def test_invalid_values_are_ignored(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            settings = PoolSettings.from_project_config(
+                {"http_pool": {"max_connections": 0, "keepalive_expiry": "soon"}}
+            )
+        assert settings == PoolSettings()
+        assert "Ignoring invalid http_pool max_connections" in caplog.text
+        assert "Ignoring invalid http_pool keepalive_expiry" in caplog.text
+
+
+class TestInstall:
+    def test_installs_once_and_reuses(self, clean_install):
+        pools = install_connection_pools({})
+        assert litellm.client_session is pools.client
+        assert litellm.aclient_session is pools.async_client
+        assert install_connection_pools({}) is pools
+
+    def test_settings_change_resizes_same_pools(self, clean_install):
+        pools = install_connection_pools({})
+        again = install_connection_pools({"http_pool": {"max_connections": 3}})
+        assert again is pools
+        assert pools.settings.defaults.max_connections == 3
+
+    def test_host_session_is_left_alone(self, clean_install, monkeypatch):
+        own = object()
+        monkeypatch.setattr(litellm, "client_session", own)
+        assert install_connection_pools({}) is None
+        assert litellm.client_session is own
+
+    @pytest.mark.parametrize(
+        ("config", "env"),
+        [
+            ({"http_pool": {"enabled": False}}, {}),
+            ({}, {"HTTPS_PROXY": "http://proxy:3128"}),
+            ({}, {"https_proxy": "http://proxy:3128"}),
+            ({}, {"all_proxy": "socks5://proxy:1080"}),
+        ],
+    )
+    def test_not_installed(self, clean_install, monkeypatch, config, env):
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        assert install_connection_pools(config) is None
+        assert litellm.client_session is None
+        assert connection_pool_stats() == {}
+
+    def test_no_proxy_wildcard_allows_pooling(self, clean_install, monkeypatch):
+        monkeypatch.setenv("https_proxy", "http://proxy:3128")
+        monkeypatch.setenv("no_proxy", "*")
+        assert install_connection_pools({}) is not None
+
+    def test_litellm_openai_calls_share_one_connection(self, clean_install, server):
+        install_connection_pools({})
+        for _ in range(3):
+            with provider_context("openai"):
+                response = litellm.completion(
+                    model="gpt-4o",
+                    api_base=_url(server, "/v1"),
+                    api_key="test-key",
+                    messages=[{"role": "user", "content": "hi"}],
+                )
+            assert response.choices[0].message.content == "Verdict: APPROVED"
+
+        assert connection_pool_stats()["openai"] == PoolStats(requests=3, hits=2, misses=1)
+        assert len(server.connections) == 1
+
+
+def test_batch_summary_reports_connection_reuse(capsys):
+    batch = BatchResult(connections=PoolStats(requests=10, hits=9, misses=1))
+    print_batch_summary(batch)
+    assert "HTTP requests: 10 (9 on reused connections, 1 opened new; 90% reuse)" in (
+        capsys.readouterr().out
+    )
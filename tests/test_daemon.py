@@ -0,0 +1,196 @@
+"""Tests for the background daemon (``adversarial serve``) and its thin client."""
+
+from __future__ import annotations
+
+import io
+import os
+import socket
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from adversarial_workflow.cli import main
+from adversarial_workflow.daemon import DAEMON_SOCKET, NO_DAEMON_ENV, DaemonServer, forward
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    adv = tmp_path / ".adversarial"
+    adv.mkdir()
+    (adv / "config.yml").write_text("log_directory: .adversarial/logs/\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(NO_DAEMON_ENV, raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def start_server(project):
+    servers = []
+
+    def _start(run_command=None) -> DaemonServer:
+        server = DaemonServer(project / DAEMON_SOCKET, run_command=run_command)
+        server.bind()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        servers.append((server, thread))
+        return server
+
+    yield _start
+    for server, thread in servers:
+        server.shutdown()
+        thread.join(timeout=5)
+
+
+class TestForward:
+    def test_no_daemon_returns_none(self, project):
+        assert forward(["evaluate", "task.md"]) is None
+
+    def test_stale_socket_returns_none(self, project):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(DAEMON_SOCKET)
+        stale.close()
+        assert forward(["evaluate", "task.md"]) is None
+
+    def test_streams_output_and_exit_code(self, project, start_server, capsys):
+        def run_command():
+            print(f"argv={sys.argv[1:]}")
+            print("warning", file=sys.stderr)
+            return 3
+
+        start_server(run_command)
+        assert forward(["evaluate", "task.md"]) == 3
+        out, err = capsys.readouterr()
+        assert "argv=['evaluate', 'task.md']" in out
+        assert "warning" in err
+
+    def test_runs_with_client_cwd_and_env(self, project, start_server, monkeypatch, capsys):
+        (project / "sub").mkdir()
+        server_cwd = os.getcwd()
+
+        def run_command():
+            print(os.getcwd(), os.environ.get("CLIENT_ONLY"), sys.stdin.isatty())
+            return 0
+
+        start_server(run_command)
+        monkeypatch.chdir(project / "sub")
+        monkeypatch.setenv("CLIENT_ONLY", "from-client")
+        assert forward(["x"], project / DAEMON_SOCKET) == 0
+        assert capsys.readouterr().out.split() == [
+            str(project / "sub"),
+            "from-client",
+            "False",
+        ]
+        assert os.getcwd() == str(project / "sub")
+        assert server_cwd == str(project)
+
+    def test_prompts_are_answered_by_the_client_terminal(
+        self, project, start_server, monkeypatch, capsys
+    ):
+        class _Terminal(io.StringIO):
+            def isatty(self):
+                return True
+
+        def run_command():
+            if not sys.stdin.isatty():
+                return 2
+            answer = input("Continue anyway? [y/N]: ")
+            print(f"answer={answer}")
+            return 0
+
+        start_server(run_command)
+        monkeypatch.setattr(sys, "stdin", _Terminal("y\n"))
+        assert forward(["evaluate", "big.md"]) == 0
+        out = capsys.readouterr().out
+        assert "Continue anyway? [y/N]: " in out
+        assert "answer=y" in out
+
+    def test_end_of_client_input(self, project, start_server, monkeypatch, capsys):
+        def run_command():
+            print(f"line={sys.stdin.readline()!r}")
+            return 0
+
+        start_server(run_command)
+        monkeypatch.setattr(sys, "stdin", io.StringIO(""))
+        assert forward(["x"]) == 0
+        assert "line=''" in capsys.readouterr().out
+
+    def test_exceptions_are_reported_and_server_survives(self, project, start_server, capsys):
+        calls = []
+
+        def run_command():
+            calls.append(sys.argv)
+            if len(calls) == 1:
+                raise ValueError("boom")
+            return 0
+
+        start_server(run_command)
+        assert forward(["first"]) == 1
+        assert "ValueError: boom" in capsys.readouterr().err
+        assert forward(["second"]) == 0
+
+    def test_system_exit_code(self, project, start_server):
+        def run_command():
+            raise SystemExit(2)
+
+        start_server(run_command)
+        assert forward(["bad-args"]) == 2
+
+    def test_disabled_by_env(self, project, start_server, monkeypatch):
+        start_server(lambda: 0)
+        monkeypatch.setenv(NO_DAEMON_ENV, "1")
+        assert forward(["evaluate"]) is None
+
+
+class TestDaemonServer:
+    def test_refuses_second_daemon(self, project, start_server):
+        start_server(lambda: 0)
+        with pytest.raises(RuntimeError, match="already running"):
+            DaemonServer(project / DAEMON_SOCKET).bind()
+
+    def test_socket_is_private_and_removed_on_shutdown(self, project):
+        server = DaemonServer(project / DAEMON_SOCKET, run_command=lambda: 0)
+        server.bind()
+        assert (project / DAEMON_SOCKET).stat().st_mode & 0o077 == 0
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        server.shutdown()
+        thread.join(timeout=5)
+        assert not (project / DAEMON_SOCKET).exists()
+
+    def test_runs_real_cli_commands(self, project, start_server, capsys):
+        start_server()
+        assert forward(["list-evaluators"]) == 0
+        assert "Built-in Evaluators" in capsys.readouterr().out
+
+
+class TestMainForwarding:
+    def test_evaluator_commands_are_forwarded(self, project):
+        with (
+            patch.object(sys, "argv", ["adversarial", "evaluate", "task.md"]),
+            patch("adversarial_workflow.daemon.forward", return_value=0) as fwd,
+            patch("adversarial_workflow.cli.run_cli") as run_cli,
+        ):
+            assert main() == 0
+        fwd.assert_called_once_with(["evaluate", "task.md"])
+        run_cli.assert_not_called()
+
+    @pytest.mark.parametrize("argv", [["init"], ["serve"], ["check"], ["--version"], []])
+    def test_local_commands_are_not_forwarded(self, project, argv):
+        with (
+            patch.object(sys, "argv", ["adversarial", *argv]),
+            patch("adversarial_workflow.daemon.forward") as fwd,
+            patch("adversarial_workflow.cli.run_cli", return_value=0),
+        ):
+            main()
+        fwd.assert_not_called()
+
+    def test_falls_back_to_local_when_unreachable(self, project):
+        with (
+            patch.object(sys, "argv", ["adversarial", "evaluate", "task.md"]),
+            patch("adversarial_workflow.daemon.forward", return_value=None),
+            patch("adversarial_workflow.cli.run_cli", return_value=5) as run_cli,
+        ):
+            assert main() == 5
+        run_cli.assert_called_once()
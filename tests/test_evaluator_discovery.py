@@ -594,6 +594,78 @@ timeout: 1200
         assert "exceeds maximum" in caplog.text
         assert "clamping to 600s" in caplog.text
 
+    # ========== retry policy tests ==========
+
+    def test_parse_retry_policy(self, tmp_path):
+        """Parse retry mapping into a RetryPolicy."""
+        yml = tmp_path / "retry.yml"
+        yml.write_text(
+            """
+name: test
+description: Test
+model: gpt-4o
+api_key_env: OPENAI_API_KEY
+prompt: Test prompt
+output_suffix: TEST
+fallback_model: gpt-4o-mini
+retry:
+  max_retries: 4
+  backoff_base: 2
+  backoff_max: 45.5
+"""
+        )
+        config = parse_evaluator_yaml(yml)
+
+        assert config.retry.max_retries == 4
+        assert config.retry.backoff_base == 2.0
+        assert config.retry.backoff_max == 45.5
+
+    def test_parse_retry_default(self, tmp_path):
+        """Retry policy defaults when not specified."""
+        yml = tmp_path / "test.yml"
+        yml.write_text(
+            """
+name: test
+description: Test
+model: gpt-4o
+api_key_env: OPENAI_API_KEY
+prompt: Test prompt
+output_suffix: TEST
+"""
+        )
+        config = parse_evaluator_yaml(yml)
+
+        assert config.retry.max_retries == 2
+
+    @pytest.mark.parametrize(
+        "retry_yaml,match",
+        [
+            ("retry: 3", "retry must be a mapping"),
+            ("retry:\n  max_retries: true", "must be an integer"),
+            ("retry:\n  max_retries: -1", "must be >= 0"),
+            ("retry:\n  backoff_max: soon", "must be a number"),
+            ("retry:\n  attempts: 3", "Unknown retry fields"),
+        ],
+    )
+    def test_parse_retry_invalid(self, tmp_path, retry_yaml, match):
+        """Error on invalid retry values."""
+        yml = tmp_path / "bad-retry.yml"
+        yml.write_text(
+            """
+name: test
+description: Test
+model: gpt-4o
+api_key_env: OPENAI_API_KEY
+prompt: Test prompt
+output_suffix: TEST
+"""
+            + retry_yaml
+            + "\n"
+        )
+
+        with pytest.raises(EvaluatorParseError, match=match):
+            parse_evaluator_yaml(yml)
+
     # ========== model_requirement tests (ADV-0015) ==========
 
     def test_parse_yaml_with_model_requirement_only(self, tmp_path):
@@ -0,0 +1,184 @@
+"""Tests for the persistent parsed-evaluator registry cache."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from unittest.mock import patch
+
+import pytest
+
+from adversarial_workflow.evaluators.discovery import (
+    discover_local_evaluators,
+    parse_evaluator_yaml,
+)
+from adversarial_workflow.evaluators.registry import REGISTRY_CACHE_FILE, clear_registry_cache
+from adversarial_workflow.library.commands import library_install
+from adversarial_workflow.library.models import EvaluatorEntry, IndexData
+
+_EVALUATOR = """
+name: {name}
+description: {name} evaluator
+model: gpt-4o
+api_key_env: OPENAI_API_KEY
+prompt: Review carefully.
+output_suffix: {suffix}
+"""
+
+_PARSE = "adversarial_workflow.evaluators.registry.parse_evaluator_yaml"
+
+
+@pytest.fixture
+def eval_dir(tmp_path):
+    path = tmp_path / ".adversarial" / "evaluators"
+    path.mkdir(parents=True)
+    (path / "alpha.yml").write_text(_EVALUATOR.format(name="alpha", suffix="ALPHA"))
+    (path / "beta.yml").write_text(_EVALUATOR.format(name="beta", suffix="BETA"))
+    return path
+
+
+def _bump(path, text: str) -> None:
+    """Rewrite a file and make sure its mtime moves even on coarse clocks."""
+    stat = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestRegistryCache:
+    def test_unchanged_files_are_not_parsed_again(self, tmp_path, eval_dir):
+        first = discover_local_evaluators(tmp_path)
+        assert (tmp_path / REGISTRY_CACHE_FILE).exists()
+
+        with patch(_PARSE, side_effect=parse_evaluator_yaml) as parse:
+            second = discover_local_evaluators(tmp_path)
+
+        parse.assert_not_called()
+        assert second == first
+        assert second["alpha"].config_file == str(eval_dir / "alpha.yml")
+
+    def test_changed_file_is_parsed_again(self, tmp_path, eval_dir):
+        discover_local_evaluators(tmp_path)
+        _bump(eval_dir / "beta.yml", _EVALUATOR.format(name="beta", suffix="BETA-V2"))
+
+        with patch(_PARSE, side_effect=parse_evaluator_yaml) as parse:
+            result = discover_local_evaluators(tmp_path)
+
+        assert [c.args[0].name for c in parse.call_args_list] == ["beta.yml"]
+        assert result["beta"].output_suffix == "BETA-V2"
+
+    def test_roundtrips_all_fields(self, tmp_path, eval_dir):
+        (eval_dir / "gamma.yml").write_text(
+            """
+name: gamma
+description: Gamma evaluator
+model_requirement:
+  family: claude
+  tier: sonnet
+  min_context: 128000
+prompt: Review carefully.
+output_suffix: GAMMA
+aliases: [g, gam]
+fallback_model: gpt-4o-mini
+timeout: 300
+retry:
+  max_retries: 4
+  backoff_base: 0.5
+"""
+        )
+        fresh = discover_local_evaluators(tmp_path)
+        cached = discover_local_evaluators(tmp_path)
+        assert cached["gamma"] == fresh["gamma"]
+        assert cached["gamma"].model_requirement.min_context == 128000
+        assert cached["gamma"].retry.max_retries == 4
+        assert cached["g"] is cached["gamma"]
+
+    def test_cached_parse_errors_still_warn(self, tmp_path, eval_dir, caplog):
+        (eval_dir / "broken.yml").write_text("name: broken\n  description: bad indent\n")
+        (eval_dir / "partial.yml").write_text("name: partial\n")
+        discover_local_evaluators(tmp_path)
+
+        with caplog.at_level(logging.WARNING), patch(_PARSE) as parse:
+            result = discover_local_evaluators(tmp_path)
+
+        parse.assert_not_called()
+        assert "broken" not in result and "partial" not in result
+        assert "Skipping broken.yml: YAML syntax error" in caplog.text
+        assert "Skipping partial.yml: Missing required fields" in caplog.text
+
+    def test_deleted_files_are_pruned(self, tmp_path, eval_dir):
+        discover_local_evaluators(tmp_path)
+        (eval_dir / "beta.yml").unlink()
+
+        result = discover_local_evaluators(tmp_path)
+
+        assert "beta" not in result
+        data = json.loads((tmp_path / REGISTRY_CACHE_FILE).read_text())
+        assert list(data["entries"]) == ["alpha.yml"]
+
+    def test_package_version_change_invalidates(self, tmp_path, eval_dir):
+        discover_local_evaluators(tmp_path)
+        with (
+            patch(
+                "adversarial_workflow.evaluators.registry._package_version",
+                return_value="99.0.0",
+            ),
+            patch(_PARSE, side_effect=parse_evaluator_yaml) as parse,
+        ):
+            discover_local_evaluators(tmp_path)
+        assert parse.call_count == 2
+
+    def test_corrupt_cache_is_ignored(self, tmp_path, eval_dir):
+        cache_file = tmp_path / REGISTRY_CACHE_FILE
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text("{not json")
+        assert set(discover_local_evaluators(tmp_path)) == {"alpha", "beta"}
+
+    def test_use_cache_false(self, tmp_path, eval_dir):
+        assert set(discover_local_evaluators(tmp_path, use_cache=False)) == {"alpha", "beta"}
+        assert not (tmp_path / REGISTRY_CACHE_FILE).exists()
+
+    def test_clear_registry_cache(self, tmp_path, eval_dir):
+        discover_local_evaluators(tmp_path)
+        clear_registry_cache(tmp_path)
+        assert not (tmp_path / REGISTRY_CACHE_FILE).exists()
+        clear_registry_cache(tmp_path)  # missing cache is fine
+
+
+class TestLibraryInvalidation:
+    def test_install_clears_registry_cache(self, tmp_path, eval_dir, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        discover_local_evaluators(tmp_path)
+
+        with (
+            patch(
+                "adversarial_workflow.library.commands.LibraryClient.fetch_index",
+                return_value=(_index(), False),
+            ),
+            patch(
+                "adversarial_workflow.library.commands.LibraryClient.fetch_evaluator",
+                return_value=_EVALUATOR.format(name="gemini-flash", suffix="GEMINI"),
+            ),
+        ):
+            assert library_install(["google/gemini-flash"], yes=True) == 0
+
+        assert not (tmp_path / REGISTRY_CACHE_FILE).exists()
+        assert "gemini-flash" in discover_local_evaluators(tmp_path)
+
+
+def _index() -> IndexData:
+    return IndexData(
+        version="1.0.0",
+        evaluators=[
+            EvaluatorEntry(
+                name="gemini-flash",
+                provider="google",
+                path="google/gemini-flash",
+                model="gemini/gemini-2.5-flash",
+                category="quick-check",
+                description="Fast evaluator",
+            )
+        ],
+        categories={"quick-check": "Fast checks"},
+        fetched_at=None,
+    )
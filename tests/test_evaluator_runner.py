@@ -1182,3 +1182,30 @@ class TestReportVerdictAllTypes:
         assert result == 1
         captured = capsys.readouterr()
         assert verdict in captured.out
+
+
+class TestInMemoryValidation:
+    """The verdict is taken from the response text, not by reading the output back."""
+
+    def test_output_file_is_not_reread(self, sample_config, tmp_path, monkeypatch):
+        (tmp_path / "task.md").write_text("# Task")
+        (tmp_path / ".adversarial").mkdir()
+        (tmp_path / ".adversarial" / "config.yml").write_text("log_directory: .adversarial/logs/")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Evaluation details. " * 30 + "\nVerdict: FAIL"
+        with (
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion",
+                return_value=mock_response,
+            ),
+            patch(
+                "adversarial_workflow.utils.validation.open",
+                create=True,
+                side_effect=AssertionError("output file read back"),
+            ),
+        ):
+            assert run_evaluator(sample_config, "task.md", use_cache=False) == 1
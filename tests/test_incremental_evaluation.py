@@ -0,0 +1,196 @@
+"""Tests for incremental re-evaluation (``adversarial <evaluator> --incremental``)."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from adversarial_workflow.evaluators.incremental import run_evaluator_incremental
+from adversarial_workflow.utils.file_splitter import analyze_task_file, detect_sections
+
+
+def _document(edits: dict[int, str] | None = None, count: int = 4) -> str:
+    edits = edits or {}
+    sections = []
+    for i in range(count):
+        body = edits.get(i, "\n".join(f"Line {i}.{j}" for j in range(40)))
+        sections.append(f"## Section {i}\n{body}")
+    return "Intro line.\n\n" + "\n".join(sections) + "\n"
+
+
+@pytest.fixture
+def project(eval_project):
+    (eval_project / "spec.md").write_text(_document())
+    return eval_project
+
+
+class _Model:
+    """Stands in for litellm.completion, recording the prompts it was sent."""
+
+    def __init__(self, make_response, verdict: str = "APPROVED"):
+        self.make_response = make_response
+        self.verdict = verdict
+        self.prompts: list[str] = []
+        self.system_prompts: list[str] = []
+
+    def __call__(self, **kwargs):
+        self.prompts.append("\n".join(m["content"] for m in kwargs["messages"]))
+        self.system_prompts.append(kwargs["messages"][0]["content"])
+        return self.make_response(text=f"\nFindings {len(self.prompts)}.\nVerdict: {self.verdict}")
+
+
+@pytest.fixture
+def fake_model(make_completion_response):
+    """Factory for _Model: ``fake_model(verdict="NEEDS_REVISION")``."""
+    return lambda verdict="APPROVED": _Model(make_completion_response, verdict)
+
+
+def _run(config, model: _Model, **kwargs) -> int:
+    with patch("adversarial_workflow.evaluators.runner.litellm.completion", side_effect=model):
+        return run_evaluator_incremental(config, "spec.md", use_cache=False, **kwargs)
+
+
+def _state_file(project):
+    return project / ".adversarial" / "logs" / "spec-TEST-EVAL.sections.json"
+
+
+class TestRunEvaluatorIncremental:
+    def test_first_run_is_full_and_records_sections(
+        self, evaluator_config, project, capsys, fake_model
+    ):
+        model = fake_model()
+        assert _run(evaluator_config, model) == 0
+
+        assert len(model.prompts) == 1
+        assert "Line 3.39" in model.prompts[0]
+        assert "No previous evaluation" in capsys.readouterr().out
+        state = json.loads(_state_file(project).read_text())
+        assert [s["title"] for s in state["sections"]] == [
+            "(preamble)",
+            "Section 0",
+            "Section 1",
+            "Section 2",
+            "Section 3",
+        ]
+        assert state["verdict"] == "APPROVED"
+
+    def test_unchanged_document_makes_no_call(self, evaluator_config, project, capsys, fake_model):
+        _run(evaluator_config, fake_model(verdict="NEEDS_REVISION"))
+        model = fake_model()
+        assert _run(evaluator_config, model) == 1  # previous verdict is reported
+
+        assert model.prompts == []
+        assert "No sections changed" in capsys.readouterr().out
+
+    def test_sends_only_changed_section_with_previous_evaluation(
+        self, evaluator_config, project, capsys, fake_model
+    ):
+        _run(evaluator_config, fake_model())
+        (project / "spec.md").write_text(_document({2: "Rewritten section two."}))
+        model = fake_model(verdict="NEEDS_REVISION")
+        assert _run(evaluator_config, model) == 1
+
+        assert len(model.prompts) == 1
+        prompt = model.prompts[0]
+        assert "Incremental Update Instructions" in prompt
+        assert "1 of its 5 sections changed" in prompt
+        # Update instructions travel with the document; the prompt stays cacheable
+        assert model.system_prompts == [evaluator_config.prompt]
+        assert "## Previous Evaluation" in prompt
+        assert "Findings 1." in prompt
+        assert "Rewritten section two." in prompt
+        assert "Line 1.0" not in prompt and "Line 3.0" not in prompt
+        assert "sending only those" in capsys.readouterr().out
+
+        output = project / ".adversarial" / "logs" / "spec-TEST-EVAL.md"
+        assert "Findings 1." in output.read_text()
+        assert json.loads(_state_file(project).read_text())["verdict"] == "NEEDS_REVISION"
+
+    def test_removed_sections_are_listed(self, evaluator_config, project, fake_model):
+        _run(evaluator_config, fake_model())
+        (project / "spec.md").write_text(_document(count=3))
+        model = fake_model()
+        _run(evaluator_config, model)
+
+        assert "## Removed Sections" in model.prompts[0]
+        assert "- Section 3" in model.prompts[0]
+        assert "## Changed Sections\n\n## Removed" in model.prompts[0]
+
+    def test_majority_change_runs_full_evaluation(
+        self, evaluator_config, project, capsys, fake_model
+    ):
+        _run(evaluator_config, fake_model())
+        (project / "spec.md").write_text(_document({0: "new", 1: "new", 2: "new"}))
+        model = fake_model()
+        _run(evaluator_config, model)
+
+        assert "Incremental Update Instructions" not in model.prompts[0]
+        assert "Line 3.0" in model.prompts[0]
+        assert "Most of the document changed" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("change", [{"prompt": "Different prompt."}, {"model": "gpt-4o-mini"}])
+    def test_prompt_or_model_change_invalidates_state(
+        self, evaluator_config, project, change, fake_model
+    ):
+        _run(evaluator_config, fake_model())
+        (project / "spec.md").write_text(_document({2: "Rewritten section two."}))
+        model = fake_model()
+        _run(dataclasses.replace(evaluator_config, **change), model)
+
+        assert "Incremental Update Instructions" not in model.prompts[0]
+
+    def test_overwritten_output_invalidates_state(self, evaluator_config, project, fake_model):
+        _run(evaluator_config, fake_model())
+        output = project / ".adversarial" / "logs" / "spec-TEST-EVAL.md"
+        output.write_text(output.read_text() + "\nEdited by another run.\n")
+        model = fake_model()
+        _run(evaluator_config, model)
+
+        assert len(model.prompts) == 1
+        assert "Incremental Update Instructions" not in model.prompts[0]
+
+    def test_failed_evaluation_clears_state(self, evaluator_config, project, fake_model):
+        _run(evaluator_config, fake_model())
+        (project / "spec.md").write_text(_document({2: "Rewritten section two."}))
+        short = MagicMock()
+        short.choices = [MagicMock()]
+        short.choices[0].message.content = "too short"
+        with patch("adversarial_workflow.evaluators.runner.litellm.completion", return_value=short):
+            assert run_evaluator_incremental(evaluator_config, "spec.md", use_cache=False) != 0
+
+        assert not _state_file(project).exists()
+
+    def test_file_not_found(self, evaluator_config, project, capsys):
+        assert run_evaluator_incremental(evaluator_config, "missing.md") == 1
+        assert "File not found" in capsys.readouterr().out
+
+
+def test_detect_sections_matches_analyze_task_file(tmp_path):
+    content = _document()
+    (tmp_path / "doc.md").write_text(content)
+    assert analyze_task_file(str(tmp_path / "doc.md"))["sections"] == detect_sections(content)
+    assert [s["title"] for s in detect_sections(content)][:2] == ["Section 0", "Section 1"]
+
+
+class TestIncrementalCli:
+    def test_flag_dispatches(self, project, fake_model):
+        from adversarial_workflow.cli import main
+
+        model = fake_model()
+        with (
+            patch("adversarial_workflow.evaluators.runner.litellm.completion", side_effect=model),
+            patch("sys.argv", ["adversarial", "evaluate", "--incremental", "spec.md"]),
+        ):
+            assert main() == 0
+        assert len(model.prompts) == 1
+        assert (project / ".adversarial" / "logs" / "spec-PLAN-EVALUATION.sections.json").exists()
+
+    def test_rejects_chunked(self, project, capsys):
+        from adversarial_workflow.cli import main
+
+        with patch("sys.argv", ["adversarial", "evaluate", "--incremental", "--chunked", "x.md"]):
+            assert main() == 1
+        assert "--incremental cannot be combined" in capsys.readouterr().out
@@ -0,0 +1,93 @@
+"""Tests for the content-addressed library artifact store."""
+
+from __future__ import annotations
+
+import os
+
+from adversarial_workflow.library.artifacts import ArtifactStore
+
+SOURCE = "https://example.com/library/main"
+
+
+def _objects(store: ArtifactStore) -> list:
+    return sorted(p for p in (store.directory / "objects").glob("*/*"))
+
+
+class TestArtifactStore:
+    def test_put_and_get(self, tmp_path):
+        store = ArtifactStore(tmp_path)
+        sha = store.put(SOURCE, "a/evaluator.yml", "name: a\n", {"etag": '"1"'}, "1.0.0")
+        artifact = store.get(SOURCE, "a/evaluator.yml")
+        assert artifact.content == "name: a\n"
+        assert artifact.sha256 == sha
+        assert artifact.version == "1.0.0"
+        assert artifact.validators == {"etag": '"1"'}
+
+    def test_keyed_by_source_and_path(self, tmp_path):
+        store = ArtifactStore(tmp_path)
+        store.put(SOURCE, "a/evaluator.yml", "name: a\n")
+        assert store.get(SOURCE, "b/evaluator.yml") is None
+        assert store.get("https://example.com/library/v2", "a/evaluator.yml") is None
+
+    def test_identical_content_is_stored_once(self, tmp_path):
+        store = ArtifactStore(tmp_path)
+        store.put(SOURCE, "a/evaluator.yml", "same\n")
+        store.put("https://mirror.example.com", "a/evaluator.yml", "same\n")
+        assert len(_objects(store)) == 1
+
+    def test_refresh_keeps_content(self, tmp_path):
+        store = ArtifactStore(tmp_path)
+        store.put(SOURCE, "a/evaluator.yml", "name: a\n", {"etag": '"1"'}, "1.0.0")
+        artifact = store.get(SOURCE, "a/evaluator.yml")
+        assert store.refresh(SOURCE, "a/evaluator.yml", artifact, {"etag": '"1"'}, "1.1.0")
+        assert store.get(SOURCE, "a/evaluator.yml").version == "1.1.0"
+
+    def test_corrupted_object_is_a_miss(self, tmp_path):
+        store = ArtifactStore(tmp_path)
+        store.put(SOURCE, "a/evaluator.yml", "name: a\n")
+        [path] = _objects(store)
+        path.write_text("tampered")
+        assert store.get(SOURCE, "a/evaluator.yml") is None
+        assert not path.exists()
+
+    def test_lru_eviction_over_budget(self, tmp_path):
+        store = ArtifactStore(tmp_path, max_bytes=250)
+        for i, name in enumerate(["a", "b"]):
+            store.put(SOURCE, name, name * 100)
+            [path] = [p for p in _objects(store) if p.read_text() == name * 100]
+            os.utime(path, (1000 + i, 1000 + i))
+        # Reading "a" makes "b" the least recently used
+        assert store.get(SOURCE, "a") is not None
+        store.put(SOURCE, "c", "c" * 100)
+
+        assert store.get(SOURCE, "b") is None
+        assert store.get(SOURCE, "a") is not None
+        assert store.get(SOURCE, "c") is not None
+        assert sum(p.stat().st_size for p in _objects(store)) <= 250
+
+    def test_writes_leave_no_temporary_files(self, tmp_path):
+        store = ArtifactStore(tmp_path)
+        store.put(SOURCE, "a/evaluator.yml", "name: a\n")
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_unwritable_directory(self, tmp_path):
+        (tmp_path / "store").write_text("not a directory")
+        store = ArtifactStore(tmp_path / "store")
+        assert store.put(SOURCE, "a/evaluator.yml", "name: a\n") is None
+        assert store.get(SOURCE, "a/evaluator.yml") is None
+
+    def test_clear(self, tmp_path):
+        store = ArtifactStore(tmp_path)
+        store.put(SOURCE, "a", "1")
+        store.put(SOURCE, "b", "2")
+        assert store.clear() == 2
+        assert store.get(SOURCE, "a") is None
+
+
+def test_client_budget_from_config(tmp_path, monkeypatch):
+    from adversarial_workflow.library.client import LibraryClient
+
+    monkeypatch.setenv("ADVERSARIAL_LIBRARY_ARTIFACT_CACHE_MB", "2")
+    client = LibraryClient(cache_dir=tmp_path)
+    assert client.artifacts.directory == tmp_path / "artifacts"
+    assert client.artifacts.max_bytes == 2 * 1024 * 1024
@@ -1,6 +1,7 @@
 """Unit tests for the library client module."""
 
 import json
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -126,6 +127,86 @@ class TestIndexData:
         filtered = index.filter_by_category("quick-check")
         assert len(filtered) == 2
 
+    def test_filters_return_copies(self):
+        index = IndexData.from_dict(SAMPLE_INDEX)
+        index.filter_by_provider("google").clear()
+        index.filter_by_category("quick-check").clear()
+        assert len(index.filter_by_provider("google")) == 1
+        assert len(index.filter_by_category("quick-check")) == 2
+        assert index.filter_by_provider("invalid") == []
+
+    def test_direct_construction_is_indexed(self):
+        entry = EvaluatorEntry.from_dict(SAMPLE_INDEX["evaluators"][0])
+        index = IndexData(version="1", evaluators=[entry], categories={})
+        assert index.get_evaluator("google", "gemini-flash") is entry
+
+    def test_duplicate_keys_keep_first(self):
+        data = {**SAMPLE_INDEX, "evaluators": SAMPLE_INDEX["evaluators"] * 2}
+        index = IndexData.from_dict(data)
+        assert index.get_evaluator("google", "gemini-flash") is index.evaluators[0]
+        assert len(index.filter_by_provider("google")) == 2
+
+    def test_providers(self):
+        index = IndexData.from_dict(SAMPLE_INDEX)
+        assert index.providers == ["anthropic", "google", "openai"]
+
+    def test_entries_use_slots(self):
+        entry = IndexData.from_dict(SAMPLE_INDEX).evaluators[0]
+        assert not hasattr(entry, "__dict__")
+
+    def test_search_ranking(self):
+        evaluators = [
+            {**SAMPLE_INDEX["evaluators"][0], "name": name, "description": description}
+            for name, description in [
+                ("deep-review", "Slow and thorough"),
+                ("gpt-review", "Quick review"),
+                ("review-lite", "Cheap"),
+                ("review", "Baseline"),
+                ("summary", "Mentions REVIEW in the description"),
+            ]
+        ]
+        index = IndexData.from_dict({**SAMPLE_INDEX, "evaluators": evaluators})
+        # Exact name, prefix, name substring (index order), then description
+        assert [e.name for e in index.search("Review")] == [
+            "review",
+            "review-lite",
+            "deep-review",
+            "gpt-review",
+            "summary",
+        ]
+        assert [e.name for e in index.search("google/review")] == ["review", "review-lite"]
+        assert index.search("nothing") == []
+
+    def test_search_with_filters(self):
+        index = IndexData.from_dict(SAMPLE_INDEX)
+        assert [e.name for e in index.search("review")] == ["fast-check", "claude-adversarial"]
+        assert [e.name for e in index.search("review", provider="openai")] == ["fast-check"]
+        assert [e.name for e in index.search("review", category="adversarial")] == [
+            "claude-adversarial"
+        ]
+
+    def test_large_index(self):
+        data = {
+            "version": "1",
+            "categories": {},
+            "evaluators": [
+                {
+                    "name": f"eval-{i}",
+                    "provider": f"provider-{i % 50}",
+                    "path": f"evaluators/provider-{i % 50}/eval-{i}",
+                    "model": "m",
+                    "category": f"cat-{i % 7}",
+                    "description": f"Evaluator number {i}",
+                }
+                for i in range(5000)
+            ],
+        }
+        index = IndexData.from_dict(data)
+        assert index.get_evaluator("provider-49", "eval-4999").name == "eval-4999"
+        assert len(index.filter_by_provider("provider-0")) == 100
+        assert len(index.providers) == 50
+        assert index.search("eval-4999")[0].name == "eval-4999"
+
 
 class TestInstalledEvaluatorMeta:
     """Tests for InstalledEvaluatorMeta model."""
@@ -230,6 +311,36 @@ class TestCacheManager:
             assert cache.get("key1") is None
             assert cache.get("key2") is None
 
+    def test_validators_stored_beside_entry(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CacheManager(cache_dir=Path(tmpdir))
+            cache.set("test-key", {"a": 1}, {"etag": '"abc"', "last_modified": "Mon"})
+            assert cache.get_validators("test-key") == {"etag": '"abc"', "last_modified": "Mon"}
+
+            # Rewriting without validators drops them
+            cache.set("test-key", {"a": 2})
+            assert cache.get_validators("test-key") == {}
+
+    def test_validators_removed_with_entry(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CacheManager(cache_dir=Path(tmpdir))
+            cache.set("key1", {"a": 1}, {"etag": '"1"'})
+            cache.set("key2", {"b": 2}, {"etag": '"2"'})
+            cache.invalidate("key1")
+            assert cache.get_validators("key1") == {}
+            assert cache.clear() == 1
+            assert list(Path(tmpdir).iterdir()) == []
+
+    def test_touch_restarts_ttl(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CacheManager(cache_dir=Path(tmpdir), ttl=60)
+            cache.set("test-key", {"a": 1})
+            os.utime(cache._get_cache_path("test-key"), (0, 0))
+            assert cache.get("test-key") is None
+            assert cache.touch("test-key")
+            assert cache.get("test-key") == {"a": 1}
+            assert not cache.touch("missing")
+
 
 class TestLibraryClient:
     """Tests for LibraryClient."""
@@ -244,7 +355,7 @@ class TestLibraryClient:
             mock_response.__enter__ = lambda s: s
             mock_response.__exit__ = MagicMock(return_value=False)
 
-            with patch("urllib.request.urlopen", return_value=mock_response) as mock_urlopen:
+            with patch.object(client._opener, "open", return_value=mock_response) as mock_urlopen:
                 # First call
                 _index1, from_cache1 = client.fetch_index()
                 assert not from_cache1
@@ -265,7 +376,7 @@ class TestLibraryClient:
             mock_response.__enter__ = lambda s: s
             mock_response.__exit__ = MagicMock(return_value=False)
 
-            with patch("urllib.request.urlopen", return_value=mock_response) as mock_urlopen:
+            with patch.object(client._opener, "open", return_value=mock_response) as mock_urlopen:
                 # First call
                 client.fetch_index(no_cache=True)
                 assert mock_urlopen.call_count == 1
@@ -285,8 +396,9 @@ class TestLibraryClient:
 
             client = LibraryClient(cache_dir=Path(tmpdir))
 
-            with patch(
-                "urllib.request.urlopen",
+            with patch.object(
+                client._opener,
+                "open",
                 side_effect=urllib.error.URLError("Network error"),
             ):
                 index, from_cache = client.fetch_index()
@@ -301,8 +413,8 @@ class TestLibraryClient:
             client = LibraryClient(cache_dir=Path(tmpdir))
 
             # Use URLError which is what urllib raises for network errors
-            with patch(
-                "urllib.request.urlopen", side_effect=urllib.error.URLError("Network error")
+            with patch.object(
+                client._opener, "open", side_effect=urllib.error.URLError("Network error")
             ):
                 with pytest.raises(NetworkError):
                     client.fetch_index()
@@ -317,7 +429,7 @@ class TestLibraryClient:
             mock_response.__enter__ = lambda s: s
             mock_response.__exit__ = MagicMock(return_value=False)
 
-            with patch("urllib.request.urlopen", return_value=mock_response):
+            with patch.object(client._opener, "open", return_value=mock_response):
                 with pytest.raises(ParseError):
                     client.fetch_index()
 
@@ -331,7 +443,7 @@ class TestLibraryClient:
             mock_response.__enter__ = lambda s: s
             mock_response.__exit__ = MagicMock(return_value=False)
 
-            with patch("urllib.request.urlopen", return_value=mock_response):
+            with patch.object(client._opener, "open", return_value=mock_response):
                 content = client.fetch_evaluator("google", "gemini-flash")
                 assert "name: gemini-flash" in content
 
@@ -345,7 +457,7 @@ class TestLibraryClient:
             mock_response.__enter__ = lambda s: s
             mock_response.__exit__ = MagicMock(return_value=False)
 
-            with patch("urllib.request.urlopen", return_value=mock_response):
+            with patch.object(client._opener, "open", return_value=mock_response):
                 client.fetch_index()
 
             count = client.clear_cache()
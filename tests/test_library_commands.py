@@ -213,6 +213,24 @@ class TestLibraryList:
             captured = capsys.readouterr()
             assert "No evaluators found for provider" in captured.out
 
+    def test_list_search(self, capsys):
+        with patch.object(
+            __import__(
+                "adversarial_workflow.library.client", fromlist=["LibraryClient"]
+            ).LibraryClient,
+            "fetch_index",
+            self._mock_fetch_index,
+        ):
+            result = library_list(search="GEMINI")
+            assert result == 0
+            captured = capsys.readouterr()
+            assert "gemini-flash" in captured.out
+            assert "fast-check" not in captured.out
+            assert "1 evaluators shown (of 2 total)" in captured.out
+
+            assert library_list(search="no-such-evaluator") == 1
+            assert "No evaluators match" in capsys.readouterr().out
+
 
 class TestLibraryInstall:
     """Tests for library install command."""
@@ -0,0 +1,346 @@
+"""Tests for library fetches: keep-alive, concurrency, revalidation, atomic installs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from adversarial_workflow.library.client import LibraryClient, NetworkError
+from adversarial_workflow.library.commands import library_install, library_update
+
+EVALUATORS = ["alpha", "beta", "gamma", "delta"]
+
+INDEX = {
+    "version": "2.0.0",
+    "evaluators": [
+        {
+            "name": name,
+            "provider": "acme",
+            "path": f"evaluators/acme/{name}",
+            "model": "gpt-4o",
+            "category": "quick-check",
+            "description": f"{name} evaluator",
+        }
+        for name in [*EVALUATORS, "broken", "missing"]
+    ],
+    "categories": {"quick-check": "Fast reviews"},
+}
+
+
+def _evaluator_yaml(name: str) -> str:
+    return f"---\nname: {name}\nmodel: gpt-4o\napi_key_env: OPENAI_API_KEY\nprompt: Review.\n"
+
+
+class _Library(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections open between requests
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if self.server.barrier is not None:
+            self.server.barrier.wait()
+        parts = self.path.strip("/").split("/")
+        if self.path.endswith("index.json"):
+            body = json.dumps(INDEX)
+        elif "missing" in parts:
+            body = None
+        elif "broken" in parts:
+            body = "name: [unclosed\n"
+        else:
+            body = _evaluator_yaml(parts[-2])
+        if body is None:
+            self._reply(404)
+            return
+        data = body.encode()
+        etag = f'"{hashlib.sha256(data).hexdigest()[:16]}"'
+        if self.server.etags and self.headers.get("If-None-Match") == etag:
+            self._reply(304, etag=etag)
+            return
+        self._reply(200, data, etag=etag if self.server.etags else None)
+
+    def _reply(self, status, data=b"", etag=None):
+        self.server.statuses.append(status)
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        if status != 304:
+            self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Library)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.connections = 0
+    httpd.requests = []
+    httpd.barrier = None
+    httpd.etags = True
+    httpd.statuses = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client(server, tmp_path):
+    client = LibraryClient(base_url=server.url, cache_dir=tmp_path / "cache")
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def project(server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ADVERSARIAL_LIBRARY_URL", server.url)
+    monkeypatch.setenv("ADVERSARIAL_LIBRARY_NO_CACHE", "1")
+    with patch.object(sys.stdin, "isatty", return_value=True):
+        yield tmp_path
+
+
+class TestKeepAlive:
+    def test_sequential_fetches_reuse_one_connection(self, client, server):
+        for name in EVALUATORS:
+            assert f"name: {name}" in client.fetch_evaluator("acme", name)
+        assert len(server.requests) == 4
+        assert server.connections == 1
+
+    def test_http_errors_still_raise(self, client):
+        with pytest.raises(NetworkError, match="HTTP error 404"):
+            client.fetch_evaluator("acme", "missing")
+        # The connection survives the error response
+        assert "name: alpha" in client.fetch_evaluator("acme", "alpha")
+
+    def test_connection_closed_while_idle_is_replaced(self, client, server):
+        client.fetch_evaluator("acme", "alpha")
+        for connections in client._keepalive._idle.values():
+            for conn in connections:
+                conn.sock.shutdown(socket.SHUT_RDWR)
+        assert "name: beta" in client.fetch_evaluator("acme", "beta")
+
+    def test_unreachable_host(self, tmp_path):
+        client = LibraryClient(base_url="http://127.0.0.1:9", cache_dir=tmp_path)
+        with pytest.raises(NetworkError, match="Failed to fetch"):
+            client.fetch_evaluator("acme", "alpha")
+
+
+class TestFetchEvaluators:
+    def test_fetches_concurrently_in_order(self, client, server):
+        # Every request blocks until four are in flight at once
+        server.barrier = threading.Barrier(4, timeout=5)
+        results = client.fetch_evaluators([("acme", name) for name in EVALUATORS])
+        assert [r.splitlines()[1] for r in results] == [f"name: {n}" for n in EVALUATORS]
+
+        server.barrier = None
+        client.fetch_evaluators([("acme", name) for name in EVALUATORS])
+        # The second round reuses the first round's connections
+        assert server.connections == 4
+
+    def test_failures_are_returned_in_place(self, client):
+        alpha, missing = client.fetch_evaluators([("acme", "alpha"), ("acme", "missing")])
+        assert "name: alpha" in alpha
+        assert isinstance(missing, NetworkError)
+
+    def test_empty(self, client):
+        assert client.fetch_evaluators([]) == []
+
+
+class TestRevalidation:
+    def test_expired_index_is_revalidated(self, client, server):
+        _, from_cache = client.fetch_index()
+        assert not from_cache
+        _, from_cache = client.fetch_index()
+        assert from_cache  # still fresh: no request
+        assert server.statuses == [200]
+
+        # Expire the entry: the next fetch is a conditional request
+        cache_file = client.cache._get_cache_path("library-index")
+        os.utime(cache_file, (0, 0))
+        refreshed, from_cache = client.fetch_index()
+        assert refreshed.version == "2.0.0"
+        assert not from_cache
+        assert server.statuses == [200, 304]
+        assert client.get_cache_age() < 60
+
+    def test_no_cache_still_sends_validators(self, client, server):
+        client.fetch_index(no_cache=True)
+        client.fetch_index(no_cache=True)
+        assert server.statuses == [200, 304]
+
+    def test_changed_index_is_downloaded(self, client, server):
+        client.fetch_index()
+        client.cache.set("library-index", {"version": "old", "evaluators": []}, {"etag": '"x"'})
+        index, _ = client.fetch_index(no_cache=True)
+        assert index.version == "2.0.0"
+        assert server.statuses == [200, 200]
+
+    def test_evaluator_and_readme_are_revalidated(self, client, server):
+        first = client.fetch_evaluator("acme", "alpha")
+        assert client.fetch_evaluator("acme", "alpha") == first
+        client.fetch_readme("acme", "alpha")
+        client.fetch_readme("acme", "alpha")
+        assert server.statuses == [200, 304, 200, 304]
+
+    def test_validators_are_tied_to_the_url(self, client, server, tmp_path):
+        client.fetch_evaluator("acme", "alpha")
+        other = LibraryClient(base_url=f"{server.url}/mirror", cache_dir=tmp_path / "cache")
+        other.fetch_evaluator("acme", "alpha")
+        assert server.statuses == [200, 200]
+
+    def test_without_validators_or_index_version_refetches(self, client, server):
+        server.etags = False
+        client.fetch_evaluator("acme", "alpha")
+        client.fetch_evaluator("acme", "alpha")
+        assert server.statuses == [200, 200]
+
+
+class TestArtifactStore:
+    def test_served_from_disk_across_projects(self, server, tmp_path):
+        # Two projects on one host share the user cache directory
+        for _ in range(2):
+            client = LibraryClient(base_url=server.url, cache_dir=tmp_path / "cache")
+            client.fetch_index()
+            assert "name: alpha" in client.fetch_evaluator("acme", "alpha")
+            assert client.fetch_readme("acme", "alpha")
+        assert server.statuses == [200, 200, 200]
+
+    def test_new_index_version_revalidates(self, client, server):
+        client.fetch_index()
+        client.fetch_evaluator("acme", "alpha")
+        client._index_version = "2.1.0"
+        client.fetch_evaluator("acme", "alpha")
+        client.fetch_evaluator("acme", "alpha")
+        assert server.statuses == [200, 200, 304]
+
+    def test_no_cache_index_revalidates_files(self, client, server, tmp_path):
+        client.fetch_index()
+        client.fetch_evaluator("acme", "alpha")
+        client.fetch_readme("acme", "alpha")
+        fresh = LibraryClient(base_url=server.url, cache_dir=tmp_path / "cache")
+        fresh.fetch_index(no_cache=True)
+        fresh.fetch_evaluator("acme", "alpha")
+        fresh.fetch_readme("acme", "alpha")
+        assert server.statuses == [200, 200, 200, 304, 304, 304]
+
+    def test_unknown_index_version_revalidates(self, client, server):
+        client.fetch_index()
+        client._index_version = "unknown"  # an index without "version"
+        client.fetch_evaluator("acme", "alpha")
+        client.fetch_evaluator("acme", "alpha")
+        assert server.statuses == [200, 200, 304]
+
+    def test_disabled_cache_revalidates(self, server, tmp_path, monkeypatch):
+        monkeypatch.setenv("ADVERSARIAL_LIBRARY_NO_CACHE", "1")
+        client = LibraryClient(base_url=server.url, cache_dir=tmp_path / "cache")
+        client.fetch_index()
+        client.fetch_evaluator("acme", "alpha")
+        client.fetch_evaluator("acme", "alpha")
+        assert server.statuses == [200, 200, 304]
+
+    def test_offline_install_uses_stored_files(self, project, server, tmp_path, monkeypatch):
+        monkeypatch.delenv("ADVERSARIAL_LIBRARY_NO_CACHE")
+        cache_dir = tmp_path / "shared-cache"
+        with patch(
+            "adversarial_workflow.library.commands.LibraryClient",
+            lambda: LibraryClient(cache_dir=cache_dir),
+        ):
+            assert library_install(["acme/alpha"], yes=True) == 0
+            (project / ".adversarial" / "evaluators" / "acme-alpha.yml").unlink()
+            server.shutdown()
+            assert library_install(["acme/alpha"], yes=True) == 0
+        assert (project / ".adversarial" / "evaluators" / "acme-alpha.yml").exists()
+
+
+class TestAtomicInstall:
+    def _installed(self, project):
+        directory = project / ".adversarial" / "evaluators"
+        return sorted(p.name for p in directory.iterdir()) if directory.exists() else []
+
+    def test_category_install(self, project, server, capsys):
+        assert library_install([f"acme/{n}" for n in EVALUATORS], yes=True) == 0
+        assert self._installed(project) == [f"acme-{n}.yml" for n in sorted(EVALUATORS)]
+        content = (project / ".adversarial" / "evaluators" / "acme-alpha.yml").read_text()
+        assert "name: alpha" in content
+        assert 'version: "2.0.0"' in content
+
+    @pytest.mark.parametrize("bad", ["broken", "missing"])
+    def test_any_failure_installs_nothing(self, project, bad, capsys):
+        assert library_install(["acme/alpha", f"acme/{bad}", "acme/beta"], yes=True) == 1
+        assert self._installed(project) == []
+        assert "No evaluators installed: 1 of 3" in capsys.readouterr().out
+
+    def test_skip_validation_installs_invalid_yaml(self, project):
+        assert library_install(["acme/broken"], yes=True, skip_validation=True) == 0
+        assert self._installed(project) == ["acme-broken.yml"]
+
+    def test_write_failure_leaves_no_files(self, project, capsys):
+        real_open = open
+
+        def failing_open(path, *args, **kwargs):
+            if str(path).endswith(".acme-beta.yml.tmp"):
+                raise OSError("disk full")
+            return real_open(path, *args, **kwargs)
+
+        with patch("builtins.open", failing_open):
+            assert library_install(["acme/alpha", "acme/beta"], yes=True) == 1
+        assert self._installed(project) == []
+        assert "disk full" in capsys.readouterr().out
+
+
+class TestAtomicUpdate:
+    def _install_old(self, project, *names):
+        directory = project / ".adversarial" / "evaluators"
+        directory.mkdir(parents=True)
+        for name in names:
+            (directory / f"acme-{name}.yml").write_text(
+                "_meta:\n  source: adversarial-evaluator-library\n"
+                f'  source_path: acme/{name}\n  version: "1.0.0"\n'
+                f"name: {name}\nmodel: old\n"
+            )
+        return directory
+
+    def test_updates_all(self, project):
+        directory = self._install_old(project, "alpha", "beta")
+        assert library_update(all_evaluators=True, yes=True) == 0
+        assert 'version: "2.0.0"' in (directory / "acme-alpha.yml").read_text()
+        assert 'version: "2.0.0"' in (directory / "acme-beta.yml").read_text()
+
+    def test_no_cache_fetches_changed_evaluator(self, project, server, tmp_path, monkeypatch):
+        monkeypatch.delenv("ADVERSARIAL_LIBRARY_NO_CACHE")
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        directory = self._install_old(project, "alpha")
+        assert library_update(all_evaluators=True, yes=True) == 0
+        # The library changes alpha without bumping the index version
+        (directory / "acme-alpha.yml").write_text(
+            (directory / "acme-alpha.yml").read_text().replace('"2.0.0"', '"1.0.0"')
+        )
+        with patch(f"{__name__}._evaluator_yaml", lambda name: f"name: {name}\nmodel: new\n"):
+            assert library_update(all_evaluators=True, yes=True, no_cache=True) == 0
+        assert "model: new" in (directory / "acme-alpha.yml").read_text()
+
+    def test_invalid_update_changes_nothing(self, project, capsys):
+        directory = self._install_old(project, "alpha", "broken")
+        before = {p.name: p.read_text() for p in directory.iterdir()}
+        assert library_update(all_evaluators=True, yes=True) == 1
+        assert {p.name: p.read_text() for p in directory.iterdir()} == before
+        assert "Invalid YAML in broken" in capsys.readouterr().out
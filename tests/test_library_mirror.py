@@ -0,0 +1,199 @@
+"""Tests for offline library mirrors (``adversarial library mirror``)."""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from adversarial_workflow.library.client import LibraryClient, NetworkError
+from adversarial_workflow.library.commands import (
+    library_check_updates,
+    library_install,
+    library_list,
+    library_mirror,
+)
+from adversarial_workflow.library.mirror import LibraryMirror, write_mirror
+
+INDEX = {
+    "version": "3.1.0",
+    "evaluators": [
+        {
+            "name": name,
+            "provider": "acme",
+            "path": f"evaluators/acme/{name}",
+            "model": "gpt-4o",
+            "category": "quick-check",
+            "description": f"{name} evaluator",
+            "tags": ["fast"],  # not modeled by EvaluatorEntry
+        }
+        for name in ("alpha", "beta")
+    ],
+    "categories": {"quick-check": "Fast reviews"},
+    "generated": "2026-01-01",  # not modeled by IndexData
+}
+
+
+@pytest.fixture
+def source(tmp_path):
+    """A library checkout on disk: the layout of the library repository."""
+    root = tmp_path / "library"
+    (root / "evaluators").mkdir(parents=True)
+    (root / "evaluators" / "index.json").write_text(json.dumps(INDEX))
+    for name in ("alpha", "beta"):
+        directory = root / "evaluators" / "acme" / name
+        directory.mkdir(parents=True)
+        (directory / "evaluator.yml").write_text(f"name: {name}\nmodel: gpt-4o\n")
+    (root / "evaluators" / "acme" / "alpha" / "README.md").write_text("# Alpha\n")
+    return root
+
+
+@pytest.fixture
+def project(tmp_path, source, monkeypatch):
+    project = tmp_path / "project"
+    project.mkdir()
+    monkeypatch.chdir(project)
+    monkeypatch.setenv("ADVERSARIAL_LIBRARY_URL", source.as_uri())
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    with patch.object(sys.stdin, "isatty", return_value=True):
+        yield project
+
+
+@pytest.fixture
+def no_http():
+    with patch.object(LibraryClient, "_fetch_url", side_effect=AssertionError("HTTP request")):
+        yield
+
+
+class TestMirrorCommand:
+    def test_directory_mirror(self, project, source, no_http):
+        assert library_mirror("mirror") == 0
+
+        mirror = project / "mirror"
+        manifest = json.loads((mirror / "mirror.json").read_text())
+        assert manifest["version"] == "3.1.0"
+        assert manifest["source"] == source.as_uri()
+        assert sorted(manifest["files"]) == [
+            "evaluators/acme/alpha/README.md",
+            "evaluators/acme/alpha/evaluator.yml",
+            "evaluators/acme/beta/evaluator.yml",
+            "evaluators/index.json",
+        ]
+        assert (mirror / "evaluators/acme/beta/evaluator.yml").read_text() == (
+            "name: beta\nmodel: gpt-4o\n"
+        )
+        assert json.loads((mirror / "evaluators/index.json").read_text()) == INDEX
+
+    def test_archive_is_deterministic(self, project):
+        assert library_mirror("lib.tar.gz") == 0
+        first = (project / "lib.tar.gz").read_bytes()
+        assert library_mirror("lib.tar.gz") == 1  # exists
+        assert library_mirror("lib.tar.gz", force=True) == 0
+        assert (project / "lib.tar.gz").read_bytes() == first
+
+    def test_force_replaces_directory_mirror(self, project, source):
+        assert library_mirror("mirror") == 0
+        (source / "evaluators/acme/beta/evaluator.yml").write_text("name: beta\nmodel: new\n")
+        assert library_mirror("mirror") == 1
+        assert library_mirror("mirror", force=True) == 0
+        assert "model: new" in (project / "mirror/evaluators/acme/beta/evaluator.yml").read_text()
+        assert [p.name for p in project.iterdir()] == ["mirror"]
+
+    @pytest.mark.parametrize("destination", ["mirror", "lib.tar.gz"])
+    def test_readable_by_other_accounts(self, project, destination):
+        old_umask = os.umask(0o022)
+        try:
+            assert library_mirror(destination) == 0
+        finally:
+            os.umask(old_umask)
+        mode = stat.S_IMODE((project / destination).stat().st_mode)
+        assert mode == (0o755 if destination == "mirror" else 0o644)
+
+    def test_ref_requires_default_url(self, project, capsys):
+        # ADVERSARIAL_LIBRARY_URL is set: the ref cannot change what is fetched
+        assert library_mirror("mirror", ref="v2") == 1
+        assert "--ref cannot be used with a custom library URL" in capsys.readouterr().out
+        assert not (project / "mirror").exists()
+
+        assert library_mirror("mirror") == 0
+        assert json.loads((project / "mirror" / "mirror.json").read_text())["ref"] is None
+
+    def test_refuses_non_mirror_directory(self, project, capsys):
+        (project / "docs").mkdir()
+        (project / "docs" / "keep.md").write_text("mine")
+        assert library_mirror("docs", force=True) == 1
+        assert "not a library mirror" in capsys.readouterr().out
+        assert (project / "docs" / "keep.md").read_text() == "mine"
+
+    def test_missing_evaluator_writes_nothing(self, project, source, capsys):
+        (source / "evaluators/acme/beta/evaluator.yml").unlink()
+        assert library_mirror("mirror") == 1
+        assert not (project / "mirror").exists()
+        assert "Failed to fetch acme/beta" in capsys.readouterr().out
+
+    def test_cli(self, project):
+        from adversarial_workflow.cli import main
+
+        with patch.object(sys, "argv", ["adversarial", "library", "mirror", "out.tgz"]):
+            assert main() == 0
+        assert (project / "out.tgz").exists()
+
+
+class TestServeFromMirror:
+    @pytest.mark.parametrize("destination", ["mirror", "lib.tar.gz"])
+    def test_offline_commands(self, project, monkeypatch, no_http, destination, capsys):
+        assert library_mirror(destination) == 0
+        monkeypatch.delenv("ADVERSARIAL_LIBRARY_URL")
+        monkeypatch.setenv("ADVERSARIAL_LIBRARY_MIRROR", str(project / destination))
+
+        assert library_list() == 0
+        assert "(mirror)" in capsys.readouterr().out
+        assert library_install(["acme/alpha", "acme/beta"], yes=True) == 0
+        installed = project / ".adversarial" / "evaluators" / "acme-alpha.yml"
+        assert 'version: "3.1.0"' in installed.read_text()
+        assert library_check_updates() == 0
+        assert "Up to date" in capsys.readouterr().out
+
+    def test_file_url_and_readme(self, source, tmp_path, no_http):
+        client = LibraryClient(base_url=source.as_uri(), cache_dir=tmp_path / "cache")
+        index, from_cache = client.fetch_index()
+        assert (index.version, from_cache) == ("3.1.0", False)
+        assert client.fetch_readme("acme", "alpha") == "# Alpha\n"
+        assert client.fetch_readme("acme", "beta") is None
+        # Nothing from a mirror is cached
+        assert not (tmp_path / "cache" / "artifacts").exists()
+
+    def test_tampered_file_is_rejected(self, project, monkeypatch):
+        assert library_mirror("mirror") == 0
+        (project / "mirror/evaluators/acme/alpha/evaluator.yml").write_text("name: evil\n")
+        client = LibraryClient(base_url=(project / "mirror").as_uri())
+        with pytest.raises(NetworkError, match="does not match the mirror manifest"):
+            client.fetch_evaluator("acme", "alpha")
+        assert "name: beta" in client.fetch_evaluator("acme", "beta")
+
+    def test_missing_file(self, source):
+        client = LibraryClient(base_url=source.as_uri())
+        with pytest.raises(NetworkError, match="not found in library mirror"):
+            client.fetch_evaluator("acme", "gamma")
+
+
+class TestLibraryMirror:
+    def test_paths_cannot_escape(self, tmp_path):
+        write_mirror(tmp_path / "m", {"evaluators/index.json": b"{}"}, {})
+        (tmp_path / "secret").write_text("x")
+        with pytest.raises(FileNotFoundError):
+            LibraryMirror(tmp_path / "m").read("../secret")
+
+    def test_config_file_mirror(self, tmp_path, monkeypatch, source):
+        from adversarial_workflow.library.config import get_library_config
+
+        monkeypatch.delenv("ADVERSARIAL_LIBRARY_MIRROR", raising=False)
+        config_file = tmp_path / "config.yml"
+        config_file.write_text(f"library:\n  mirror: {source}\n")
+        config = get_library_config(config_file)
+        assert config.mirror == source
+        assert LibraryClient(config=config).mirror.path == source
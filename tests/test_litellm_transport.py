@@ -103,12 +103,10 @@ class TestLiteLLMCompletion:
 
             call_kwargs = mock_completion.call_args
             messages = call_kwargs.kwargs["messages"]
-            assert len(messages) == 1
-            assert messages[0]["role"] == "user"
-            # Prompt should contain both the evaluator prompt and the document content
-            content = messages[0]["content"]
-            assert "You are a reviewer" in content
-            assert "Test Document" in content
+            # Static evaluator prompt first (cacheable), then the document
+            assert [m["role"] for m in messages] == ["system", "user"]
+            assert "You are a reviewer" in messages[0]["content"]
+            assert "Test Document" in messages[1]["content"]
 
     def test_timeout_passed(self, custom_config, project_env):
         """Timeout value is passed to litellm.completion()."""
@@ -0,0 +1,210 @@
+"""Tests for per-evaluation telemetry records and ``adversarial stats``."""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from adversarial_workflow.evaluators import metrics
+from adversarial_workflow.evaluators.batch import run_evaluator_batch
+from adversarial_workflow.evaluators.metrics import MetricsLog, percentile, summarize
+from adversarial_workflow.evaluators.runner import run_evaluator
+
+
+@pytest.fixture
+def project(eval_project):
+    (eval_project / "task.md").write_text("# Task\n\nDo the thing.\n")
+    (eval_project / "other.md").write_text("# Other\n\nDo another thing.\n")
+    return eval_project
+
+
+@pytest.fixture
+def response(make_completion_response):
+    """A completion response with provider-reported usage and cost."""
+    response = make_completion_response()
+    response.usage.prompt_tokens = 1200
+    response.usage.completion_tokens = 300
+    response.usage.total_tokens = 1500
+    response.usage.prompt_tokens_details.cached_tokens = 1000
+    response._hidden_params = {"response_cost": 0.0042}
+    return response
+
+
+def _records(project) -> list[dict]:
+    lines = []
+    for path in sorted((project / ".adversarial" / "metrics").glob("*.jsonl")):
+        lines.extend(json.loads(line) for line in path.read_text().splitlines())
+    return lines
+
+
+@pytest.fixture
+def evaluate(evaluator_config, response):
+    """Run the evaluator on task.md with a mocked model call."""
+
+    def _evaluate(**kwargs) -> int:
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion", return_value=response
+        ):
+            return run_evaluator(evaluator_config, "task.md", **kwargs)
+
+    return _evaluate
+
+
+class TestEvaluationRecords:
+    def test_one_record_per_evaluation(self, project, evaluate):
+        assert evaluate() == 0
+
+        [record] = _records(project)
+        assert record["evaluator"] == "test-eval"
+        assert record["model"] == "gpt-4o"
+        assert record["file"] == "task.md"
+        assert record["verdict"] == "APPROVED"
+        assert record["exit_code"] == 0
+        assert record["error"] is None
+        assert record["cached"] is False
+        assert record["tokens"] == {"prompt": 1200, "completion": 300, "cached": 1000}
+        assert record["cost_usd"] == 0.0042
+        assert set(record["phases"]) >= {
+            "config",
+            "resolve",
+            "preflight",
+            "prepare",
+            "model",
+            "write",
+            "validate",
+        }
+        assert record["duration_ms"] >= sum(record["phases"].values()) - 1
+
+    def test_cache_hit_is_recorded_without_model_call(self, project, evaluate):
+        evaluate()
+        evaluate()
+
+        first, second = _records(project)
+        assert "model" in first["phases"]
+        assert second["cached"] is True
+        assert "model" not in second["phases"]
+        assert second["tokens"] == {"prompt": None, "completion": None, "cached": None}
+
+    def test_failed_call_is_recorded(self, evaluator_config, project):
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=RuntimeError("boom"),
+        ):
+            assert run_evaluator(evaluator_config, "task.md", use_cache=False) == 1
+
+        [record] = _records(project)
+        assert record["error"] == "LLM call failed: boom"
+        assert record["exit_code"] == 1
+
+    def test_batch_writes_a_record_per_file(self, evaluator_config, project, response):
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=response,
+        ):
+            run_evaluator_batch(evaluator_config, ["task.md", "other.md"], use_cache=False)
+
+        records = _records(project)
+        assert sorted(r["file"] for r in records) == ["other.md", "task.md"]
+        # Setup runs once for the whole batch and is not attributed to any file
+        assert all("resolve" not in r["phases"] for r in records)
+
+    def test_disabled(self, project, evaluate):
+        (project / ".adversarial" / "config.yml").write_text(
+            "log_directory: .adversarial/logs/\nmetrics:\n  enabled: false\n"
+        )
+        evaluate()
+        assert not (project / ".adversarial" / "metrics").exists()
+
+    def test_unwritable_directory_does_not_fail_evaluation(self, project, caplog, evaluate):
+        (project / ".adversarial" / "metrics").write_text("not a directory")
+        assert evaluate() == 0
+        assert "Could not write evaluation metrics" in caplog.text
+
+
+class TestPhaseRecording:
+    def test_setup_phases_are_attributed_once(self):
+        with metrics.recording() as outer:
+            with metrics.phase("config"):
+                pass
+            with metrics.recording() as first:
+                pass
+            with metrics.recording() as second:
+                pass
+        assert "config" in first
+        assert "config" not in second
+        assert outer == {}
+
+    def test_phase_outside_recording_is_a_no_op(self):
+        with metrics.phase("model"):
+            pass
+
+
+class TestSummaries:
+    def test_percentiles(self):
+        assert percentile([], 50) is None
+        assert percentile([5.0], 95) == 5.0
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+
+    def test_summarize_groups_by_evaluator_and_model(self):
+        records = [
+            {"evaluator": "a", "model": "m1", "duration_ms": 100, "cost_usd": 0.5},
+            {"evaluator": "a", "model": "m1", "duration_ms": 300, "error": "x"},
+            {"evaluator": "a", "model": "m1", "duration_ms": 1, "cached": True},
+            {"evaluator": "b", "model": "m2", "tokens": {"prompt": 10, "completion": 2}},
+        ]
+        a, b = summarize(records)
+        assert (a.evaluator, a.model, a.runs, a.errors, a.cached) == ("a", "m1", 3, 1, 1)
+        assert a.p50_ms == 100
+        assert a.p95_ms == 300
+        assert a.cost_usd == 0.5
+        assert (b.prompt_tokens, b.completion_tokens, b.p50_ms) == (10, 2, None)
+
+    def test_records_since_skips_older_files_and_lines(self, tmp_path):
+        log = MetricsLog(tmp_path)
+        log.append({"timestamp": "2026-08-30T10:00:00+00:00", "evaluator": "old"})
+        log.append({"timestamp": "2026-10-01T10:00:00+00:00", "evaluator": "early"})
+        log.append({"timestamp": "2026-10-15T10:00:00+00:00", "evaluator": "recent"})
+        with open(tmp_path / "evaluations-2026-10.jsonl", "a") as f:
+            f.write("not json\n")
+
+        since = datetime.fromisoformat("2026-10-10T00:00:00+00:00")
+        assert [r["evaluator"] for r in log.records(since)] == ["recent"]
+        assert len(list(log.records())) == 3
+
+
+class TestStatsCommand:
+    def _run(self, *argv) -> int:
+        from adversarial_workflow.cli import main
+
+        with patch.object(sys, "argv", ["adversarial", "stats", *argv]):
+            return main()
+
+    def test_table(self, project, capsys, evaluate):
+        evaluate()
+        capsys.readouterr()
+        assert self._run() == 0
+        out = capsys.readouterr().out
+        assert "last 30 days, 1 evaluations" in out
+        assert "test-eval" in out and "gpt-4o" in out
+        assert "$0.0042" in out
+
+    def test_json_and_evaluator_filter(self, project, capsys, evaluate):
+        evaluate()
+        capsys.readouterr()
+        assert self._run("--json", "--days", "0") == 0
+        [row] = json.loads(capsys.readouterr().out)
+        assert row["runs"] == 1
+        assert row["prompt_tokens"] == 1200
+
+        assert self._run("--json", "-e", "other") == 0
+        assert json.loads(capsys.readouterr().out) == []
+
+    def test_empty(self, project, capsys):
+        assert self._run() == 0
+        assert "No evaluations recorded" in capsys.readouterr().out
@@ -0,0 +1,183 @@
+"""Tests for running several evaluators on one file (adversarial run)."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from adversarial_workflow.evaluators.config import EvaluatorConfig
+from adversarial_workflow.evaluators.multi import print_verdict_matrix, run_evaluators
+
+
+def _config(name: str, model: str = "gpt-4o", api_key_env: str = "OPENAI_API_KEY"):
+    return EvaluatorConfig(
+        name=name,
+        description=f"{name} evaluator",
+        model=model,
+        api_key_env=api_key_env,
+        prompt=f"You are {name}. Evaluate this document.",
+        output_suffix=name.upper(),
+        source="local",
+    )
+
+
+@pytest.fixture
+def project(eval_project):
+    (eval_project / "doc.md").write_text("# Doc\n\nSome content.\n")
+    return eval_project
+
+
+@pytest.fixture
+def completion_by_evaluator(make_completion_response):
+    def _make(verdicts: dict[str, str], delay: float = 0.0):
+        def completion(**kwargs):
+            time.sleep(delay)
+            content = kwargs["messages"][0]["content"]
+            for name, verdict in verdicts.items():
+                if f"You are {name}." in content:
+                    return make_completion_response(verdict)
+            raise AssertionError("unexpected prompt")
+
+        return completion
+
+    return _make
+
+
+class TestRunEvaluators:
+    def test_runs_concurrently_in_input_order(self, project, completion_by_evaluator):
+        configs = [_config("alpha"), _config("beta"), _config("gamma")]
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=completion_by_evaluator(
+                {"alpha": "APPROVED", "beta": "NEEDS_REVISION", "gamma": "PASS"}, delay=0.2
+            ),
+        ):
+            start = time.monotonic()
+            batch = run_evaluators(configs, "doc.md")
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5  # three 0.2s calls in parallel, not 0.6s
+        assert [r.evaluator for r in batch.results] == ["alpha", "beta", "gamma"]
+        assert [r.verdict for r in batch.results] == ["APPROVED", "NEEDS_REVISION", "PASS"]
+        assert batch.exit_code == 1
+        logs = project / ".adversarial" / "logs"
+        assert {p.name for p in logs.glob("*.md")} == {
+            "doc-ALPHA.md",
+            "doc-BETA.md",
+            "doc-GAMMA.md",
+        }
+
+    def test_reads_file_once(self, project, completion_by_evaluator):
+        configs = [_config("alpha"), _config("beta")]
+        real_read_text = type(project).read_text
+        reads = []
+
+        def read_text(self, *args, **kwargs):
+            if self.name == "doc.md":
+                reads.append(self)
+            return real_read_text(self, *args, **kwargs)
+
+        with (
+            patch("pathlib.Path.read_text", read_text),
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion",
+                side_effect=completion_by_evaluator({"alpha": "PASS", "beta": "PASS"}),
+            ),
+        ):
+            batch = run_evaluators(configs, "doc.md")
+
+        assert batch.exit_code == 0
+        assert len(reads) == 1
+
+    def test_setup_failure_for_one_evaluator(
+        self, project, monkeypatch, capsys, completion_by_evaluator
+    ):
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        configs = [
+            _config("alpha"),
+            _config("beta", model="anthropic/claude-x", api_key_env="ANTHROPIC_API_KEY"),
+        ]
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=completion_by_evaluator({"alpha": "APPROVED"}),
+        ) as mock_completion:
+            batch = run_evaluators(configs, "doc.md")
+
+        assert mock_completion.call_count == 1
+        assert batch.results[0].verdict == "APPROVED"
+        assert batch.results[1].error == "Setup failed"
+        assert batch.exit_code == 1
+        # Progress counts the evaluators that actually ran
+        assert "[1/1]" in capsys.readouterr().out
+
+    def test_duplicates_run_once(self, project, completion_by_evaluator):
+        alpha = _config("alpha")
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=completion_by_evaluator({"alpha": "APPROVED"}),
+        ) as mock_completion:
+            batch = run_evaluators([alpha, alpha], "doc.md")
+
+        assert mock_completion.call_count == 1
+        assert len(batch.results) == 1
+
+    def test_timeout_override(self, project, completion_by_evaluator):
+        configs = [_config("alpha")]
+        configs[0].timeout = 300
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=completion_by_evaluator({"alpha": "APPROVED"}),
+        ) as mock_completion:
+            run_evaluators(configs, "doc.md")
+            run_evaluators(configs, "doc.md", timeout=60, use_cache=False)
+
+        assert [c.kwargs["timeout"] for c in mock_completion.call_args_list] == [300, 60]
+
+    def test_file_not_found(self, project):
+        batch = run_evaluators([_config("alpha")], "missing.md")
+        assert batch.results[0].error == "File not found"
+        assert batch.exit_code == 1
+
+    def test_verdict_matrix(self, project, capsys, completion_by_evaluator):
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=completion_by_evaluator({"alpha": "APPROVED", "beta": "FAIL"}),
+        ):
+            batch = run_evaluators([_config("alpha"), _config("beta")], "doc.md")
+        print_verdict_matrix(batch)
+
+        out = capsys.readouterr().out
+        assert "Verdict matrix" in out
+        matrix = out.split("Verdict matrix")[1]
+        assert "alpha" in matrix and "APPROVED" in matrix and "doc-ALPHA.md" in matrix
+        assert "beta" in matrix and "FAIL" in matrix
+
+
+class TestRunCommand:
+    def test_cli_run(self, project, capsys, make_completion_response):
+        from adversarial_workflow.cli import main
+
+        with (
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion",
+                return_value=make_completion_response("APPROVED"),
+            ) as mock_completion,
+            patch(
+                "sys.argv",
+                ["adversarial", "run", "-e", "evaluate", "-e", "proofread", "doc.md"],
+            ),
+        ):
+            result = main()
+
+        assert result == 0
+        assert mock_completion.call_count == 2
+        assert "Verdict matrix" in capsys.readouterr().out
+
+    def test_cli_unknown_evaluator(self, project, capsys):
+        from adversarial_workflow.cli import main
+
+        with patch("sys.argv", ["adversarial", "run", "-e", "nope", "doc.md"]):
+            assert main() == 1
+        assert "Unknown evaluator(s): nope" in capsys.readouterr().out
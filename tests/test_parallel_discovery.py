@@ -0,0 +1,110 @@
+"""Tests for process-pool evaluator parsing and the libyaml loader."""
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from adversarial_workflow.evaluators import discovery
+from adversarial_workflow.evaluators.discovery import discover_local_evaluators
+
+_EVALUATOR = """
+name: {name}
+description: {name} evaluator
+model: gpt-4o
+api_key_env: OPENAI_API_KEY
+prompt: |
+  Review carefully.
+output_suffix: {suffix}
+"""
+
+
+@pytest.fixture
+def pool_enabled(monkeypatch):
+    """Force the process-pool path regardless of libyaml and CPU count."""
+    monkeypatch.setattr(discovery, "_SafeLoader", yaml.SafeLoader)
+    monkeypatch.setattr(discovery, "PARALLEL_PARSE_THRESHOLD", 4)
+    monkeypatch.setattr(discovery.os, "cpu_count", lambda: 2)
+
+
+@pytest.fixture
+def eval_dir(tmp_path):
+    path = tmp_path / ".adversarial" / "evaluators"
+    path.mkdir(parents=True)
+    for i in range(6):
+        (path / f"eval{i}.yml").write_text(_EVALUATOR.format(name=f"eval{i}", suffix=f"E{i}"))
+    # Flat file wins over a nested one with the same name
+    nested = path / "acme" / "eval0"
+    nested.mkdir(parents=True)
+    (nested / "evaluator.yml").write_text(_EVALUATOR.format(name="eval0", suffix="NESTED"))
+    # Alias clashing with an earlier evaluator's name
+    (path / "zeta.yml").write_text(
+        _EVALUATOR.format(name="zeta", suffix="ZETA") + "aliases: [eval1, z]\ntimeout: 900\n"
+    )
+    (path / "broken.yml").write_text("name: broken\n  description: bad indent\n")
+    (path / "partial.yml").write_text("name: partial\n")
+    return path
+
+
+def _discover(tmp_path, caplog, use_cache):
+    caplog.clear()
+    with caplog.at_level(logging.WARNING):
+        result = discover_local_evaluators(tmp_path, use_cache=use_cache)
+    return result, [r.getMessage() for r in caplog.records]
+
+
+def _summary(evaluators):
+    return {name: (c.name, c.output_suffix, c.timeout) for name, c in evaluators.items()}
+
+
+class TestParallelDiscovery:
+    @pytest.mark.parametrize("use_cache", [False, True])
+    def test_matches_serial_results_and_warnings(
+        self, tmp_path, eval_dir, caplog, pool_enabled, monkeypatch, use_cache
+    ):
+        monkeypatch.setattr(discovery, "PARALLEL_PARSE_THRESHOLD", 100)
+        serial, serial_log = _discover(tmp_path, caplog, use_cache=False)
+
+        monkeypatch.setattr(discovery, "PARALLEL_PARSE_THRESHOLD", 4)
+        with patch.object(
+            discovery, "ProcessPoolExecutor", wraps=discovery.ProcessPoolExecutor
+        ) as pool:
+            parallel, parallel_log = _discover(tmp_path, caplog, use_cache=use_cache)
+
+        pool.assert_called_once()
+        assert list(parallel) == list(serial)
+        assert _summary(parallel) == _summary(serial)
+        assert parallel["eval0"].output_suffix == "E0"
+        assert parallel["eval1"].name == "eval1"
+        assert parallel["z"] is parallel["zeta"]
+        assert parallel_log == serial_log
+        assert any("clamping to 600s" in m for m in parallel_log)
+
+    def test_results_are_cached(self, tmp_path, eval_dir, pool_enabled):
+        first = discover_local_evaluators(tmp_path)
+        with patch.object(discovery, "ProcessPoolExecutor") as pool:
+            second = discover_local_evaluators(tmp_path)
+        pool.assert_not_called()
+        assert _summary(second) == _summary(first)
+
+    def test_below_threshold_stays_serial(self, tmp_path, eval_dir, pool_enabled, monkeypatch):
+        monkeypatch.setattr(discovery, "PARALLEL_PARSE_THRESHOLD", 100)
+        with patch.object(discovery, "ProcessPoolExecutor") as pool:
+            discover_local_evaluators(tmp_path, use_cache=False)
+        pool.assert_not_called()
+
+    def test_pool_failure_falls_back_to_serial(self, tmp_path, eval_dir, pool_enabled):
+        with patch.object(discovery, "ProcessPoolExecutor", side_effect=OSError("no semaphores")):
+            result = discover_local_evaluators(tmp_path, use_cache=False)
+        assert "zeta" in result and "eval5" in result
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason="libyaml not available")
+def test_uses_libyaml_loader_when_available(tmp_path, eval_dir):
+    assert discovery._SafeLoader is yaml.CSafeLoader
+    with patch.object(discovery, "ProcessPoolExecutor") as pool:
+        discover_local_evaluators(tmp_path, use_cache=False)
+    pool.assert_not_called()
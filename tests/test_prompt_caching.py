@@ -0,0 +1,164 @@
+"""Tests for provider prompt caching of the static evaluator prompt."""
+
+from __future__ import annotations
+
+import dataclasses
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from litellm import Usage
+
+from adversarial_workflow.evaluators.batch import BatchResult, print_batch_summary
+from adversarial_workflow.evaluators.runner import (
+    EvaluationResult,
+    _build_messages,
+    _cacheable_messages,
+    _evaluate_file,
+    _evaluate_file_async,
+)
+
+
+@pytest.fixture
+def config(evaluator_config):
+    return dataclasses.replace(
+        evaluator_config,
+        model="claude-sonnet-4-20250514",
+        api_key_env="ANTHROPIC_API_KEY",
+        prompt="You are a reviewer. Evaluate this document.",
+    )
+
+
+@pytest.fixture
+def project(eval_project):
+    (eval_project / "task.md").write_text("# Task\n\nDo the thing.\n")
+    return eval_project
+
+
+_PROJECT_CONFIG = {"log_directory": ".adversarial/logs/"}
+
+
+@pytest.fixture
+def response(make_completion_response):
+    def _make(usage: Usage | None = None):
+        response = make_completion_response()
+        response.usage = usage
+        return response
+
+    return _make
+
+
+class TestBuildMessages:
+    def test_prompt_is_system_prefix(self, config):
+        messages = _build_messages(config, "task.md", "Document body")
+        assert messages[0] == {"role": "system", "content": config.prompt}
+        assert messages[1]["role"] == "user"
+        assert "**File**: task.md" in messages[1]["content"]
+        assert "Document body" in messages[1]["content"]
+
+    def test_prefix_identical_across_documents(self, config):
+        first = _build_messages(config, "a.md", "Alpha")
+        second = _build_messages(config, "b.md", "Beta")
+        assert first[0] == second[0]
+
+    def test_empty_prompt_sends_document_only(self, config):
+        config.prompt = ""
+        messages = _build_messages(config, "task.md", "Document body")
+        assert [m["role"] for m in messages] == ["user"]
+
+
+class TestCacheMarkers:
+    @pytest.mark.parametrize(
+        "model", ["claude-sonnet-4-20250514", "anthropic/claude-sonnet-4-20250514"]
+    )
+    def test_marks_system_prompt_for_anthropic(self, config, model):
+        messages = _cacheable_messages(_build_messages(config, "task.md", "Body"), model)
+        block = messages[0]["content"][0]
+        assert block["text"] == config.prompt
+        assert block["cache_control"] == {"type": "ephemeral"}
+        assert isinstance(messages[1]["content"], str)
+
+    @pytest.mark.parametrize("model", ["gpt-4o", "gemini/gemini-2.5-flash", "madeup/model"])
+    def test_no_markers_for_automatic_or_unknown_providers(self, config, model):
+        messages = _build_messages(config, "task.md", "Body")
+        assert _cacheable_messages(messages, model) is messages
+
+    def test_markers_follow_the_model_actually_called(self, config, project, response):
+        # Fallback from an Anthropic model to OpenAI drops the marker
+        config.fallback_model = "gpt-4o"
+        config.retry.max_retries = 0
+        calls = []
+
+        def completion(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                raise TimeoutError("primary down")
+            return response()
+
+        with (
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion",
+                side_effect=completion,
+            ),
+            patch("adversarial_workflow.evaluators.runner.is_retryable", return_value=True),
+            patch("adversarial_workflow.evaluators.runner._backoff"),
+        ):
+            _evaluate_file(config, "task.md", _PROJECT_CONFIG, 180, config.model, quiet=True)
+
+        assert isinstance(calls[0]["messages"][0]["content"], list)
+        assert isinstance(calls[1]["messages"][0]["content"], str)
+
+
+class TestUsageReporting:
+    def test_reports_cached_input_tokens(self, config, project, capsys, response):
+        usage = Usage(
+            prompt_tokens=1200,
+            completion_tokens=50,
+            total_tokens=1250,
+            prompt_tokens_details={"cached_tokens": 1000},
+        )
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=response(usage),
+        ):
+            result = _evaluate_file(config, "task.md", _PROJECT_CONFIG, 180, config.model)
+
+        assert result.input_tokens == 1200
+        assert result.cached_input_tokens == 1000
+        assert "Input tokens: 1,200 (1,000 cached, 200 uncached)" in capsys.readouterr().out
+
+    def test_missing_usage_is_silent(self, config, project, capsys, response):
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=response(),
+        ):
+            result = _evaluate_file(config, "task.md", _PROJECT_CONFIG, 180, config.model)
+
+        assert result.input_tokens is None
+        assert "Input tokens" not in capsys.readouterr().out
+
+    async def test_async_path_records_usage(self, config, project, response):
+        usage = Usage(prompt_tokens=900, completion_tokens=10, total_tokens=910)
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.acompletion",
+            AsyncMock(return_value=response(usage)),
+        ) as acompletion:
+            result = await _evaluate_file_async(
+                config, "task.md", _PROJECT_CONFIG, 180, config.model, quiet=True
+            )
+
+        assert result.input_tokens == 900
+        assert result.cached_input_tokens is None
+        system = acompletion.await_args.kwargs["messages"][0]
+        assert system["content"][0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_batch_summary_totals(self, capsys):
+        batch = BatchResult(
+            results=[
+                EvaluationResult(
+                    "a.md", "e", 0, "APPROVED", input_tokens=1000, cached_input_tokens=800
+                ),
+                EvaluationResult("b.md", "e", 0, "APPROVED", input_tokens=1000),
+            ]
+        )
+        print_batch_summary(batch)
+        assert "Input tokens: 2,000 (800 cached, 1,200 uncached)" in capsys.readouterr().out
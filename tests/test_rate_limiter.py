@@ -0,0 +1,211 @@
+"""Tests for the client-side token-bucket rate limiter."""
+
+from __future__ import annotations
+
+import multiprocessing
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from adversarial_workflow.evaluators.ratelimit import RateLimit, RateLimiter
+from adversarial_workflow.evaluators.runner import _evaluate_file, _evaluate_file_async
+
+
+def _limiter(tmp_path, **limits) -> RateLimiter:
+    return RateLimiter({k: RateLimit(*v) for k, v in limits.items()}, tmp_path / "rl")
+
+
+class TestRateLimitConfig:
+    def test_from_project_config(self):
+        limiter = RateLimiter.from_project_config(
+            {
+                "rate_limits": {
+                    "openai": {"requests_per_minute": 500, "tokens_per_minute": 200000},
+                    "ANTHROPIC_API_KEY": {"requests_per_minute": 50},
+                    "broken": {"requests_per_minute": "lots"},
+                }
+            }
+        )
+        assert limiter.limits["openai"] == RateLimit(500, 200000)
+        assert limiter.limits["ANTHROPIC_API_KEY"] == RateLimit(50, None)
+        assert "broken" not in limiter.limits
+
+    @pytest.mark.parametrize("section", [None, {}, "openai", {"openai": {}}])
+    def test_unset_or_empty_returns_none(self, section):
+        assert RateLimiter.from_project_config({"rate_limits": section}) is None
+
+    def test_api_key_env_wins_over_provider(self, tmp_path):
+        limiter = _limiter(tmp_path, openai=(10, None), TEAM_KEY=(5, None))
+        assert limiter.key_for("gpt-4o", "TEAM_KEY") == "TEAM_KEY"
+        assert limiter.key_for("gpt-4o", "OPENAI_API_KEY") == "openai"
+        assert limiter.key_for("gemini/gemini-2.5-flash", "GEMINI_API_KEY") is None
+
+
+class TestTokenBucket:
+    def test_requests_per_minute(self, tmp_path):
+        limiter = _limiter(tmp_path, openai=(2, None))
+        assert limiter.try_acquire("openai") == 0.0
+        assert limiter.try_acquire("openai") == 0.0
+        assert limiter.try_acquire("openai") == pytest.approx(30.0, abs=0.1)
+
+    def test_tokens_per_minute(self, tmp_path):
+        limiter = _limiter(tmp_path, openai=(None, 6000))
+        assert limiter.try_acquire("openai", 5000) == 0.0
+        # 1000 left; 3000 more refill at 100 tokens/s
+        assert limiter.try_acquire("openai", 4000) == pytest.approx(30.0, abs=0.1)
+
+    def test_oversized_request_allowed_when_bucket_full(self, tmp_path):
+        limiter = _limiter(tmp_path, openai=(None, 1000))
+        assert limiter.try_acquire("openai", 5000) == 0.0
+        # The overdraft is paid back before the next call
+        assert limiter.try_acquire("openai", 1) > 0
+
+    def test_refill_over_time(self, tmp_path):
+        limiter = _limiter(tmp_path, openai=(60, None))
+        with patch("adversarial_workflow.evaluators.ratelimit.time.time", return_value=1000.0):
+            for _ in range(60):
+                assert limiter.try_acquire("openai") == 0.0
+            assert limiter.try_acquire("openai") > 0
+        with patch("adversarial_workflow.evaluators.ratelimit.time.time", return_value=1002.0):
+            assert limiter.try_acquire("openai") == 0.0
+            assert limiter.try_acquire("openai") == 0.0
+            assert limiter.try_acquire("openai") > 0
+
+    def test_adjust_refunds_tokens(self, tmp_path):
+        limiter = _limiter(tmp_path, openai=(None, 1000))
+        assert limiter.try_acquire("openai", 1000) == 0.0
+        limiter.adjust("openai", -800)
+        assert limiter.try_acquire("openai", 500) == 0.0
+
+    def test_acquire_sleeps_until_available(self, tmp_path):
+        limiter = _limiter(tmp_path, openai=(1, None))
+        limiter.try_acquire("openai")
+        with (
+            patch.object(limiter, "try_acquire", side_effect=[2.5, 0.0]),
+            patch("adversarial_workflow.evaluators.ratelimit.time.sleep") as sleep,
+        ):
+            assert limiter.acquire("openai") == 2.5
+        sleep.assert_called_once_with(2.5)
+
+    def test_corrupt_state_starts_full(self, tmp_path):
+        limiter = _limiter(tmp_path, openai=(1, None))
+        (tmp_path / "rl").mkdir()
+        (tmp_path / "rl" / "openai.json").write_text("not json")
+        assert limiter.try_acquire("openai") == 0.0
+
+
+class TestSharedState:
+    def test_instances_share_budget(self, tmp_path):
+        first = _limiter(tmp_path, openai=(2, None))
+        second = _limiter(tmp_path, openai=(2, None))
+        assert first.try_acquire("openai") == 0.0
+        assert second.try_acquire("openai") == 0.0
+        assert first.try_acquire("openai") > 0
+
+    def test_processes_share_budget(self, tmp_path):
+        limiter = _limiter(tmp_path, openai=(10, None))
+        # The bound method pickles by reference to the ratelimit module, so spawned
+        # workers import only that module, not this test file and the runner
+        with multiprocessing.get_context("spawn").Pool(4) as pool:
+            waits = pool.map_async(limiter.try_acquire, ["openai"] * 20, chunksize=1)
+            granted = sum(wait == 0.0 for wait in waits.get(timeout=60))
+        # 10 requests/minute across all processes, not 10 each
+        assert 10 <= granted <= 11
+
+
+@pytest.fixture
+def project(eval_project):
+    (eval_project / "task.md").write_text("# Task\n\nDo the thing.\n" * 100)
+    return eval_project
+
+
+_PROJECT_CONFIG = {
+    "log_directory": ".adversarial/logs/",
+    "rate_limits": {"OPENAI_API_KEY": {"requests_per_minute": 100, "tokens_per_minute": 90000}},
+}
+
+
+@pytest.fixture
+def response(make_completion_response):
+    def _make(total_tokens=None):
+        response = make_completion_response()
+        response.usage.total_tokens = total_tokens
+        return response
+
+    return _make
+
+
+class TestRunnerPacing:
+    def test_acquires_before_model_call(self, evaluator_config, project, response):
+        calls = []
+        with (
+            patch.object(
+                RateLimiter, "acquire", autospec=True, side_effect=lambda *a: calls.append(a[1:])
+            ),
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion",
+                side_effect=lambda **kw: calls.append("completion") or response(),
+            ),
+        ):
+            result = _evaluate_file(
+                evaluator_config, "task.md", _PROJECT_CONFIG, 180, "gpt-4o", "OPENAI_API_KEY"
+            )
+
+        assert result.exit_code == 0
+        assert calls[1] == "completion"
+        key, tokens = calls[0]
+        assert key == "OPENAI_API_KEY"
+        assert tokens > 500  # prompt plus document estimate
+
+    def test_settles_actual_usage(self, evaluator_config, project, response):
+        with (
+            patch.object(RateLimiter, "adjust", autospec=True) as adjust,
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion",
+                return_value=response(total_tokens=5000),
+            ),
+        ):
+            _evaluate_file(
+                evaluator_config, "task.md", _PROJECT_CONFIG, 180, "gpt-4o", "OPENAI_API_KEY"
+            )
+
+        _, key, delta = adjust.call_args.args
+        assert key == "OPENAI_API_KEY"
+        assert 0 < delta < 5000
+
+    def test_no_config_is_noop(self, evaluator_config, project, response):
+        with (
+            patch.object(RateLimiter, "acquire") as acquire,
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion",
+                return_value=response(),
+            ),
+        ):
+            result = _evaluate_file(
+                evaluator_config, "task.md", {"log_directory": ".adversarial/logs/"}, 180, "gpt-4o"
+            )
+
+        assert result.exit_code == 0
+        acquire.assert_not_called()
+        assert not (project / ".adversarial" / "cache" / "ratelimit").exists()
+
+    async def test_async_path_paces(self, evaluator_config, project, response):
+        with (
+            patch.object(RateLimiter, "acquire_async", AsyncMock(return_value=0.0)) as acquire,
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.acompletion",
+                AsyncMock(return_value=response()),
+            ),
+        ):
+            result = await _evaluate_file_async(
+                evaluator_config,
+                "task.md",
+                _PROJECT_CONFIG,
+                180,
+                "gpt-4o",
+                "OPENAI_API_KEY",
+                quiet=True,
+            )
+
+        assert result.exit_code == 0
+        assert acquire.await_args.args[0] == "OPENAI_API_KEY"
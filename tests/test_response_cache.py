@@ -0,0 +1,183 @@
+"""Tests for the content-addressed evaluator response cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from adversarial_workflow.evaluators.cache import ResponseCache, ResponseCacheConfig
+from adversarial_workflow.evaluators.runner import run_evaluator
+
+
+@pytest.fixture
+def project(eval_project):
+    (eval_project / "task.md").write_text("# Task\n\nDo the thing.\n")
+    return eval_project
+
+
+class TestResponseCache:
+    def test_key_changes_with_each_component(self):
+        base = ResponseCache.make_key("gpt-4o", "prompt", "1.0.0", "content")
+        assert base == ResponseCache.make_key("gpt-4o", "prompt", "1.0.0", "content")
+        assert base != ResponseCache.make_key("gpt-4o-mini", "prompt", "1.0.0", "content")
+        assert base != ResponseCache.make_key("gpt-4o", "prompt2", "1.0.0", "content")
+        assert base != ResponseCache.make_key("gpt-4o", "prompt", "1.0.1", "content")
+        assert base != ResponseCache.make_key("gpt-4o", "prompt", "1.0.0", "content2")
+
+    def test_roundtrip(self, tmp_path):
+        cache = ResponseCache(tmp_path / "c")
+        assert cache.get("k") is None
+        assert cache.set("k", "output text", model="gpt-4o")
+        assert cache.get("k") == "output text"
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = ResponseCache(tmp_path, ttl=60)
+        cache.set("k", "old")
+        entry_path = tmp_path / "k.json"
+        entry = json.loads(entry_path.read_text())
+        entry["created"] = time.time() - 120
+        entry_path.write_text(json.dumps(entry))
+
+        assert cache.get("k") is None
+        assert not entry_path.exists()
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=10_000)
+        cache.set("a", "x" * 3000)
+        cache.set("b", "x" * 3000)
+        cache.set("c", "x" * 3000)
+        # Age the entries, then touch "a" so "b" becomes least recently used
+        for i, key in enumerate(["a", "b", "c"]):
+            past = time.time() - 100 + i
+            os.utime(tmp_path / f"{key}.json", (past, past))
+        assert cache.get("a") is not None
+
+        cache.set("d", "x" * 3000)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("d") is not None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        (tmp_path / "k.json").write_text("{not json")
+        assert ResponseCache(tmp_path).get("k") is None
+
+    def test_clear(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        assert cache.clear() == 2
+        assert cache.get("a") is None
+
+
+class TestResponseCacheConfig:
+    def test_defaults(self):
+        settings = ResponseCacheConfig.from_project_config({})
+        assert settings.enabled is True
+        assert settings.directory == ".adversarial/cache/responses"
+
+    def test_from_project_config(self):
+        settings = ResponseCacheConfig.from_project_config(
+            {"response_cache": {"enabled": True, "ttl": 10, "max_size_mb": 1, "directory": "x"}}
+        )
+        assert settings.ttl == 10
+        assert settings.max_size_mb == 1
+        assert settings.directory == "x"
+
+    def test_disabled_returns_no_cache(self):
+        assert ResponseCache.from_project_config({"response_cache": {"enabled": False}}) is None
+
+    def test_invalid_values_ignored(self):
+        settings = ResponseCacheConfig.from_project_config({"response_cache": {"ttl": "soon"}})
+        assert settings.ttl == 7 * 24 * 3600
+
+    @pytest.mark.parametrize("value", ["false", "no", 0, None])
+    def test_non_boolean_enabled_ignored(self, value, caplog):
+        settings = ResponseCacheConfig.from_project_config({"response_cache": {"enabled": value}})
+        assert settings.enabled is True
+        assert "response_cache.enabled" in caplog.text
+
+
+class TestRunnerCacheIntegration:
+    def test_second_run_served_from_cache(
+        self, evaluator_config, project, capsys, make_completion_response
+    ):
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=make_completion_response(),
+        ) as mock_completion:
+            assert run_evaluator(evaluator_config, "task.md") == 0
+            assert run_evaluator(evaluator_config, "task.md") == 0
+
+        assert mock_completion.call_count == 1
+        out = capsys.readouterr().out
+        assert "using cached response" in out
+        output = (project / ".adversarial" / "logs" / "task-TEST-EVAL.md").read_text()
+        assert "**Cache**: hit" in output
+        assert "Verdict: APPROVED" in output
+
+    def test_changed_content_misses(self, evaluator_config, project, make_completion_response):
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=make_completion_response(),
+        ) as mock_completion:
+            run_evaluator(evaluator_config, "task.md")
+            (project / "task.md").write_text("# Task\n\nDo a different thing.\n")
+            run_evaluator(evaluator_config, "task.md")
+
+        assert mock_completion.call_count == 2
+
+    def test_no_cache_flag_bypasses(self, evaluator_config, project, make_completion_response):
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=make_completion_response(),
+        ) as mock_completion:
+            run_evaluator(evaluator_config, "task.md")
+            run_evaluator(evaluator_config, "task.md", use_cache=False)
+
+        assert mock_completion.call_count == 2
+
+    def test_disabled_in_config(self, evaluator_config, project, make_completion_response):
+        (project / ".adversarial" / "config.yml").write_text(
+            "log_directory: .adversarial/logs/\nresponse_cache:\n  enabled: false\n"
+        )
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=make_completion_response(),
+        ) as mock_completion:
+            run_evaluator(evaluator_config, "task.md")
+            run_evaluator(evaluator_config, "task.md")
+
+        assert mock_completion.call_count == 2
+        assert not (project / ".adversarial" / "cache").exists()
+
+    def test_invalid_output_not_cached(self, evaluator_config, project):
+        short = MagicMock()
+        short.choices = [MagicMock()]
+        short.choices[0].message.content = "too short"
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=short,
+        ) as mock_completion:
+            assert run_evaluator(evaluator_config, "task.md") == 1
+            assert run_evaluator(evaluator_config, "task.md") == 1
+
+        assert mock_completion.call_count == 2
+
+    def test_cli_no_cache_flag(self, project, make_completion_response):
+        from adversarial_workflow.cli import main
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=make_completion_response(),
+        ) as mock_completion:
+            with patch("sys.argv", ["adversarial", "evaluate", "task.md"]):
+                assert main() == 0
+            with patch("sys.argv", ["adversarial", "evaluate", "--no-cache", "task.md"]):
+                assert main() == 0
+
+        assert mock_completion.call_count == 2
@@ -0,0 +1,251 @@
+"""Tests for retry with backoff and fallback_model failover."""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import litellm
+import pytest
+
+from adversarial_workflow.evaluators.config import RetryPolicy
+from adversarial_workflow.evaluators.ratelimit import ProviderLimiter
+from adversarial_workflow.evaluators.retry import (
+    backoff_delay,
+    is_retryable,
+    retry_after_seconds,
+)
+from adversarial_workflow.evaluators.runner import (
+    _evaluate_file,
+    _evaluate_file_async,
+    run_evaluator,
+)
+
+
+@pytest.fixture
+def config(evaluator_config):
+    return dataclasses.replace(
+        evaluator_config,
+        fallback_model="gpt-4o-mini",
+        retry=RetryPolicy(max_retries=2, backoff_base=1.0, backoff_max=30.0),
+    )
+
+
+@pytest.fixture
+def project(eval_project):
+    (eval_project / "task.md").write_text("# Task\n\nDo the thing.\n")
+    return eval_project
+
+
+_PROJECT_CONFIG = {"log_directory": ".adversarial/logs/"}
+
+
+def _rate_limit(headers: dict | None = None) -> litellm.RateLimitError:
+    response = httpx.Response(
+        429, headers=headers or {}, request=httpx.Request("POST", "https://x")
+    )
+    return litellm.RateLimitError(
+        message="Rate limit exceeded", model="gpt-4o", llm_provider="openai", response=response
+    )
+
+
+def _output(project) -> str:
+    return (project / ".adversarial" / "logs" / "task-TEST-EVAL.md").read_text()
+
+
+class TestRetryHelpers:
+    def test_retryable_errors(self):
+        assert is_retryable(_rate_limit())
+        assert is_retryable(litellm.Timeout(message="t", model="m", llm_provider="openai"))
+        assert not is_retryable(
+            litellm.AuthenticationError(message="bad key", model="m", llm_provider="openai")
+        )
+        assert not is_retryable(ValueError("boom"))
+
+    def test_retry_after_seconds(self):
+        assert retry_after_seconds(_rate_limit({"Retry-After": "7"})) == 7.0
+        assert retry_after_seconds(_rate_limit({"retry-after-ms": "1500"})) == 1.5
+        assert retry_after_seconds(_rate_limit()) is None
+
+    def test_retry_after_http_date_in_past(self):
+        error = _rate_limit({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        assert retry_after_seconds(error) == 0.0
+
+    def test_backoff_grows_and_is_capped(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+        error = _rate_limit()
+        for attempt, (low, high) in enumerate([(0.5, 1.0), (1.0, 2.0), (2.0, 4.0), (2.5, 5.0)]):
+            for _ in range(20):
+                assert low <= backoff_delay(policy, attempt, error) <= high
+
+    def test_backoff_honors_retry_after(self):
+        policy = RetryPolicy(backoff_max=30.0)
+        assert backoff_delay(policy, 0, _rate_limit({"Retry-After": "12"})) == 12.0
+        # Longer than backoff_max: give up on this model
+        assert backoff_delay(policy, 0, _rate_limit({"Retry-After": "120"})) is None
+
+
+class TestRunnerRetry:
+    def test_retries_then_succeeds(
+        self, config, project, no_retry_backoff, capsys, make_completion_response
+    ):
+        backoff, _ = no_retry_backoff
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=[
+                _rate_limit(),
+                _rate_limit({"Retry-After": "3"}),
+                make_completion_response(),
+            ],
+        ) as mock_completion:
+            result = _evaluate_file(config, "task.md", _PROJECT_CONFIG, 180, "gpt-4o")
+
+        assert result.exit_code == 0
+        assert result.model == "gpt-4o"
+        assert [c.kwargs["model"] for c in mock_completion.call_args_list] == ["gpt-4o"] * 3
+        assert backoff.call_count == 2
+        assert backoff.call_args_list[1].args[0] == 3.0
+        assert "retrying in" in capsys.readouterr().out
+        assert "**Fallback**" not in _output(project)
+
+    def test_fails_over_to_fallback_model(self, config, project, capsys, make_completion_response):
+        def completion(**kwargs):
+            if kwargs["model"] == "gpt-4o":
+                raise _rate_limit()
+            return make_completion_response()
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=completion,
+        ) as mock_completion:
+            result = _evaluate_file(config, "task.md", _PROJECT_CONFIG, 180, "gpt-4o")
+
+        assert result.exit_code == 0
+        assert result.model == "gpt-4o-mini"
+        assert mock_completion.call_count == 4  # 1 + 2 retries, then fallback
+        output = _output(project)
+        assert "**Model**: gpt-4o-mini" in output
+        assert "**Fallback**: primary model gpt-4o (rate limited) failed" in output
+        assert "failing over to gpt-4o-mini" in capsys.readouterr().out
+
+    def test_provider_slot_taken_per_attempt_for_the_model_called(
+        self, config, project, no_retry_backoff, make_completion_response
+    ):
+        slots = []
+
+        class _Limiter(ProviderLimiter):
+            @contextlib.contextmanager
+            def slot(self, model):
+                slots.append(model)
+                with super().slot(model):
+                    yield
+
+        def completion(**kwargs):
+            if kwargs["model"] == "gpt-4o":
+                raise _rate_limit()
+            return make_completion_response()
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=completion,
+        ):
+            result = _evaluate_file(
+                config, "task.md", _PROJECT_CONFIG, 180, "gpt-4o", limiter=_Limiter(1)
+            )
+
+        assert result.model == "gpt-4o-mini"
+        assert slots == ["gpt-4o", "gpt-4o", "gpt-4o", "gpt-4o-mini"]
+
+    def test_long_retry_after_fails_over_immediately(
+        self, config, project, make_completion_response
+    ):
+        calls = []
+
+        def completion(**kwargs):
+            calls.append(kwargs["model"])
+            if kwargs["model"] == "gpt-4o":
+                raise _rate_limit({"Retry-After": "600"})
+            return make_completion_response()
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=completion,
+        ):
+            result = _evaluate_file(config, "task.md", _PROJECT_CONFIG, 180, "gpt-4o")
+
+        assert result.exit_code == 0
+        assert calls == ["gpt-4o", "gpt-4o-mini"]
+
+    def test_all_models_exhausted(self, config, project, capsys):
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=_rate_limit(),
+        ) as mock_completion:
+            result = _evaluate_file(config, "task.md", _PROJECT_CONFIG, 180, "gpt-4o")
+
+        assert result.exit_code == 1
+        assert result.error == "API rate limit exceeded"
+        assert mock_completion.call_count == 6
+        assert "SOLUTIONS" in capsys.readouterr().out
+
+    def test_non_retryable_error_not_retried(self, config, project):
+        error = litellm.AuthenticationError(message="bad", model="gpt-4o", llm_provider="openai")
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=error,
+        ) as mock_completion:
+            result = _evaluate_file(config, "task.md", _PROJECT_CONFIG, 180, "gpt-4o")
+
+        assert result.exit_code == 1
+        assert mock_completion.call_count == 1
+
+    def test_retries_disabled(self, config, project):
+        config.retry = RetryPolicy(max_retries=0)
+        config.fallback_model = None
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=_rate_limit(),
+        ) as mock_completion:
+            assert run_evaluator(config, "task.md") == 1
+
+        assert mock_completion.call_count == 1
+
+    def test_fallback_answer_not_cached(self, config, project, make_completion_response):
+        def completion(**kwargs):
+            if kwargs["model"] == "gpt-4o":
+                raise _rate_limit()
+            return make_completion_response()
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=completion,
+        ):
+            _evaluate_file(config, "task.md", _PROJECT_CONFIG, 180, "gpt-4o")
+
+        assert not list((project / ".adversarial").glob("cache/responses/*.json"))
+
+    async def test_async_fails_over(
+        self, config, project, no_retry_backoff, make_completion_response
+    ):
+        _, backoff_async = no_retry_backoff
+
+        async def acompletion(**kwargs):
+            if kwargs["model"] == "gpt-4o":
+                raise litellm.Timeout(message="timed out", model="gpt-4o", llm_provider="openai")
+            return make_completion_response()
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.acompletion",
+            AsyncMock(side_effect=acompletion),
+        ):
+            result = await _evaluate_file_async(
+                config, "task.md", _PROJECT_CONFIG, 30, "gpt-4o", quiet=True
+            )
+
+        assert result.exit_code == 0
+        assert result.model == "gpt-4o-mini"
+        # Two backoffs on the primary, then an immediate switch to the fallback
+        assert [c.args[0] > 0 for c in backoff_async.call_args_list] == [True, True, False]
+        assert "timed out (>30s)" in _output(project)
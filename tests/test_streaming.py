@@ -0,0 +1,239 @@
+"""Tests for streaming evaluator output (stream=True)."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import litellm
+import pytest
+
+from adversarial_workflow.evaluators.runner import (
+    _evaluate_file,
+    run_evaluator,
+    run_evaluator_async,
+)
+from adversarial_workflow.utils.validation import VerdictScanner
+
+_BODY = "Evaluation details. " * 30
+
+
+@pytest.fixture
+def project(eval_project):
+    (eval_project / ".adversarial" / "config.yml").write_text(
+        "log_directory: .adversarial/logs/\nresponse_cache:\n  enabled: false\n"
+    )
+    (eval_project / "task.md").write_text("# Task\n\nDo the thing.\n")
+    return eval_project
+
+
+def _chunk(text: str | None) -> MagicMock:
+    chunk = MagicMock()
+    chunk.choices = [MagicMock()]
+    chunk.choices[0].delta.content = text
+    chunk.usage = None
+    return chunk
+
+
+def _usage_chunk() -> MagicMock:
+    """Final chunk sent with stream_options include_usage: no choices, only usage."""
+    chunk = MagicMock()
+    chunk.choices = []
+    chunk.usage = litellm.Usage(prompt_tokens=1200, completion_tokens=300, total_tokens=1500)
+    return chunk
+
+
+def _chunks(text: str, size: int = 7) -> list[MagicMock]:
+    return [_chunk(text[i : i + size]) for i in range(0, len(text), size)]
+
+
+def _output(project) -> str:
+    return (project / ".adversarial" / "logs" / "task-TEST-EVAL.md").read_text()
+
+
+class TestVerdictScanner:
+    def test_detects_verdict_split_across_chunks(self):
+        scanner = VerdictScanner()
+        assert scanner.feed("Some text\nVer") is None
+        assert scanner.feed("dict: APPR") is None
+        assert scanner.feed("OVED\nMore text") == "APPROVED"
+        # Reported once only
+        assert scanner.feed("\nVerdict: FAIL\n") is None
+        assert scanner.verdict == "APPROVED"
+
+    def test_bold_formats(self):
+        scanner = VerdictScanner()
+        assert scanner.feed("**Verdict**: **needs_revision**\n") == "NEEDS_REVISION"
+
+    def test_trailing_line_checked_on_finish(self):
+        scanner = VerdictScanner()
+        assert scanner.feed("body\nVerdict: PASS") is None
+        assert scanner.finish() == "PASS"
+
+    def test_ignores_unkeyed_formats(self):
+        scanner = VerdictScanner()
+        assert scanner.feed("PASS\n- **FAIL**: reason\n") is None
+        assert scanner.finish() is None
+
+
+class TestStreamingRunner:
+    def test_writes_chunks_and_echoes(self, evaluator_config, project, capsys):
+        text = _BODY + "\nVerdict: APPROVED\n"
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=iter(_chunks(text)),
+        ) as mock_completion:
+            result = run_evaluator(evaluator_config, "task.md", stream=True, echo=True)
+
+        assert result == 0
+        assert mock_completion.call_args.kwargs["stream"] is True
+        output = _output(project)
+        assert output.startswith("# Test Eval")
+        assert output.endswith(text)
+        assert "Verdict: APPROVED" in capsys.readouterr().out
+
+    def test_records_usage_from_final_chunk(self, evaluator_config, project, capsys):
+        chunks = [*_chunks(_BODY + "\nVerdict: APPROVED\n"), _usage_chunk()]
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=iter(chunks),
+        ) as mock_completion:
+            result = _evaluate_file(
+                evaluator_config,
+                "task.md",
+                {"log_directory": ".adversarial/logs/"},
+                30,
+                "gpt-4o",
+                stream=True,
+            )
+
+        assert mock_completion.call_args.kwargs["stream_options"] == {"include_usage": True}
+        assert (result.input_tokens, result.output_tokens) == (1200, 300)
+        assert result.cost_usd > 0
+        assert "Input tokens: 1,200" in capsys.readouterr().out
+        [metrics_file] = (project / ".adversarial" / "metrics").glob("*.jsonl")
+        record = json.loads(metrics_file.read_text())
+        assert record["tokens"]["prompt"] == 1200
+        assert record["tokens"]["completion"] == 300
+
+    def test_file_grows_while_streaming(self, evaluator_config, project):
+        sizes = []
+        log = project / ".adversarial" / "logs" / "task-TEST-EVAL.md"
+
+        def chunks():
+            for chunk in _chunks(_BODY + "\nVerdict: PASS\n", size=100):
+                yield chunk
+                sizes.append(log.stat().st_size)
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=chunks(),
+        ):
+            assert run_evaluator(evaluator_config, "task.md", stream=True) == 0
+
+        assert sizes == sorted(sizes)
+        assert sizes[0] < sizes[-1]
+
+    def test_verdict_reported_before_stream_ends(self, evaluator_config, project, capsys):
+        seen_before_end = []
+
+        def chunks():
+            yield from _chunks("Verdict: NEEDS_REVISION\n" + _BODY)
+            seen_before_end.append(capsys.readouterr().out)
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=chunks(),
+        ):
+            assert run_evaluator(evaluator_config, "task.md", stream=True) == 1
+
+        assert "Verdict detected: NEEDS_REVISION" in seen_before_end[0]
+
+    def test_timeout_keeps_partial_output(self, evaluator_config, project, capsys):
+        def chunks():
+            yield from _chunks("# Partial review\n\nFirst finding.\n")
+            raise litellm.Timeout(message="timed out", model="gpt-4o", llm_provider="openai")
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            return_value=chunks(),
+        ):
+            result = _evaluate_file(
+                evaluator_config,
+                "task.md",
+                {"log_directory": ".adversarial/logs/"},
+                30,
+                "gpt-4o",
+                stream=True,
+            )
+
+        assert result.exit_code == 1
+        assert "partial output kept" in result.error
+        assert result.output_file.endswith("task-TEST-EVAL.md")
+        assert "First finding." in _output(project)
+        assert "Partial output kept" in capsys.readouterr().out
+
+    def test_failure_before_first_chunk_keeps_previous_output(self, evaluator_config, project):
+        log = project / ".adversarial" / "logs"
+        log.mkdir(parents=True)
+        (log / "task-TEST-EVAL.md").write_text("previous run")
+
+        def chunks():
+            raise litellm.Timeout(message="timed out", model="gpt-4o", llm_provider="openai")
+            yield  # pragma: no cover
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=lambda **kwargs: chunks(),
+        ):
+            assert run_evaluator(evaluator_config, "task.md", stream=True) == 1
+
+        assert _output(project) == "previous run"
+
+    async def test_async_streaming(self, evaluator_config, project):
+        async def chunks():
+            for chunk in _chunks(_BODY + "\nVerdict: REJECTED\n"):
+                yield chunk
+
+        async def acompletion(**kwargs):
+            assert kwargs["stream"] is True
+            return chunks()
+
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.acompletion",
+            side_effect=acompletion,
+        ):
+            assert await run_evaluator_async(evaluator_config, "task.md", stream=True) == 1
+
+        assert "Verdict: REJECTED" in _output(project)
+
+    def test_cli_stream_flag(self, project, capsys):
+        from adversarial_workflow.cli import main
+
+        with (
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion",
+                return_value=iter(_chunks(_BODY + "\nVerdict: APPROVED\n")),
+            ) as mock_completion,
+            patch("sys.argv", ["adversarial", "evaluate", "--stream", "task.md"]),
+        ):
+            assert main() == 0
+
+        assert mock_completion.call_args.kwargs["stream"] is True
+        assert _BODY.strip() in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        "flags",
+        [["--batch", "task.md"], ["--chunked", "task.md"], ["--incremental", "task.md"]],
+    )
+    def test_cli_stream_rejects_other_modes(self, project, capsys, flags):
+        from adversarial_workflow.cli import main
+
+        with (
+            patch("adversarial_workflow.evaluators.runner.litellm.completion") as mock_completion,
+            patch("sys.argv", ["adversarial", "evaluate", "--stream", *flags]),
+        ):
+            assert main() == 1
+
+        assert mock_completion.call_count == 0
+        assert "--stream cannot be combined" in capsys.readouterr().out
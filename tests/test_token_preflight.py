@@ -0,0 +1,152 @@
+"""Tests for token counting and the context-window preflight."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from adversarial_workflow.evaluators.batch import run_evaluator_batch
+from adversarial_workflow.evaluators.config import EvaluatorConfig
+from adversarial_workflow.evaluators.multi import run_evaluators
+from adversarial_workflow.evaluators.runner import _check_file_size, run_evaluator
+from adversarial_workflow.utils.tokens import context_window, count_tokens, estimate_tokens
+
+
+@pytest.fixture
+def project(eval_project):
+    (eval_project / "doc.md").write_text("# Doc\n\nSome content.\n")
+    return eval_project
+
+
+class TestCountTokens:
+    def test_uses_model_tokenizer(self):
+        with patch("litellm.token_counter", return_value=42) as counter:
+            assert count_tokens("some text", "gpt-4o") == 42
+        counter.assert_called_once_with(model="gpt-4o", text="some text")
+
+    def test_no_model_uses_heuristic(self):
+        with patch("litellm.token_counter") as counter:
+            assert count_tokens("x" * 400) == 100
+        counter.assert_not_called()
+
+    def test_tokenizer_failure_falls_back(self):
+        with patch("litellm.token_counter", side_effect=ValueError("no tokenizer")):
+            assert count_tokens("x" * 400, "madeup/model") == estimate_tokens("x" * 400)
+
+    def test_context_window(self):
+        with patch("litellm.get_model_info", return_value={"max_input_tokens": 128000}):
+            assert context_window("gpt-4o") == 128000
+
+    @pytest.mark.parametrize("info", [{}, {"max_input_tokens": None}, ValueError("unmapped")])
+    def test_context_window_unknown(self, info):
+        kwargs = {"side_effect": info} if isinstance(info, Exception) else {"return_value": info}
+        with patch("litellm.get_model_info", **kwargs):
+            assert context_window("custom/model") is None
+
+
+class TestCheckFileSize:
+    @pytest.mark.parametrize(
+        "content, lines",
+        [("", 0), ("one", 1), ("one\n", 1), ("one\ntwo", 2), ("one\ntwo\n\n", 3)],
+    )
+    def test_line_count_matches_readlines(self, tmp_path, content, lines):
+        path = tmp_path / "doc.md"
+        path.write_text(content)
+        assert _check_file_size(str(path))[0] == lines
+
+    def test_counts_tokens_for_model(self, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text("hello world")
+        with patch("litellm.token_counter", return_value=2) as counter:
+            assert _check_file_size(str(path), "gpt-4o") == (1, 2)
+        counter.assert_called_once_with(model="gpt-4o", text="hello world")
+
+
+class TestContextPreflight:
+    def test_over_context_fails_without_calling_model(self, evaluator_config, project, capsys):
+        with (
+            patch("adversarial_workflow.evaluators.runner.context_window", return_value=1000),
+            patch(
+                "adversarial_workflow.evaluators.runner.count_tokens",
+                side_effect=lambda text, model=None: len(text),
+            ),
+            patch(
+                "adversarial_workflow.evaluators.runner._check_file_size",
+                return_value=(10, 5000),
+            ),
+            patch("adversarial_workflow.evaluators.runner.litellm.completion") as completion,
+        ):
+            assert run_evaluator(evaluator_config, "doc.md") == 1
+
+        completion.assert_not_called()
+        out = capsys.readouterr().out
+        assert "Input too large for gpt-4o" in out
+        assert "context window: 1,000" in out
+
+    def test_within_context_proceeds(self, evaluator_config, project, make_completion_response):
+        with (
+            patch("adversarial_workflow.evaluators.runner.context_window", return_value=128000),
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion",
+                return_value=make_completion_response(),
+            ) as completion,
+        ):
+            assert run_evaluator(evaluator_config, "doc.md") == 0
+        completion.assert_called_once()
+
+    def test_unknown_context_window_proceeds(
+        self, evaluator_config, project, make_completion_response
+    ):
+        with (
+            patch("adversarial_workflow.evaluators.runner.context_window", return_value=None),
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion",
+                return_value=make_completion_response(),
+            ),
+        ):
+            assert run_evaluator(evaluator_config, "doc.md") == 0
+
+    def test_batch_marks_oversized_files(self, evaluator_config, project, make_completion_response):
+        (project / "big.md").write_text("word " * 5000)
+        with (
+            patch("adversarial_workflow.evaluators.runner.context_window", return_value=2000),
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion",
+                return_value=make_completion_response(),
+            ) as completion,
+        ):
+            batch = run_evaluator_batch(evaluator_config, ["doc.md", "big.md"])
+
+        assert [r.exit_code for r in batch.results] == [0, 1]
+        assert batch.results[1].error == "Exceeds context window"
+        assert completion.call_count == 1
+
+    def test_multi_skips_evaluators_that_cannot_fit(
+        self, evaluator_config, project, make_completion_response
+    ):
+        small = EvaluatorConfig(
+            name="small-eval",
+            description="Small-context evaluator",
+            model="small-model",
+            api_key_env="OPENAI_API_KEY",
+            prompt="Evaluate this document.",
+            output_suffix="SMALL-EVAL",
+            source="local",
+        )
+        windows = {"gpt-4o": 128000, "small-model": 5}
+        with (
+            patch(
+                "adversarial_workflow.evaluators.runner.context_window",
+                side_effect=windows.get,
+            ),
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion",
+                return_value=make_completion_response(),
+            ) as completion,
+        ):
+            batch = run_evaluators([evaluator_config, small], "doc.md")
+
+        assert [r.exit_code for r in batch.results] == [0, 1]
+        assert batch.results[1].error == "Exceeds context window"
+        assert completion.call_count == 1
@@ -0,0 +1,263 @@
+"""Tests for optional OTLP/JSON tracing of CLI runs and evaluations."""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from adversarial_workflow import tracing
+from adversarial_workflow.utils.citations import check_urls
+
+
+@pytest.fixture(autouse=True)
+def no_tracer():
+    """Leave tracing off after every test."""
+    tracing.shutdown()
+    yield
+    tracing.shutdown()
+
+
+@pytest.fixture
+def project(eval_project, monkeypatch):
+    (eval_project / "task.md").write_text("# Task\n\nDo the thing.\n")
+    for var in ("OTEL_EXPORTER_OTLP_ENDPOINT", "OTEL_EXPORTER_OTLP_TRACES_ENDPOINT", "TRACEPARENT"):
+        monkeypatch.delenv(var, raising=False)
+    return eval_project
+
+
+@pytest.fixture
+def response(make_completion_response):
+    response = make_completion_response()
+    response.usage.prompt_tokens = 1200
+    response.usage.completion_tokens = 300
+    response.usage.total_tokens = 1500
+    response.usage.prompt_tokens_details.cached_tokens = 0
+    response._hidden_params = {}
+    return response
+
+
+def _spans(path) -> list[dict]:
+    spans = []
+    for line in path.read_text().splitlines():
+        for resource in json.loads(line)["resourceSpans"]:
+            for scope in resource["scopeSpans"]:
+                spans.extend(scope["spans"])
+    return spans
+
+
+def _attrs(span: dict) -> dict:
+    return {a["key"]: next(iter(a["value"].values())) for a in span["attributes"]}
+
+
+def _by_name(spans: list[dict]) -> dict[str, dict]:
+    return {s["name"]: s for s in spans}
+
+
+@pytest.fixture
+def cli(response):
+    def _run(*argv) -> int:
+        from adversarial_workflow.cli import main
+
+        with (
+            patch(
+                "adversarial_workflow.evaluators.runner.litellm.completion", return_value=response
+            ),
+            patch.object(sys, "argv", ["adversarial", *argv]),
+        ):
+            return main()
+
+    return _run
+
+
+class TestDisabled:
+    def test_span_is_shared_no_op(self):
+        assert tracing.configure({}) is False
+        assert tracing.span("x") is tracing.span("y")
+        with tracing.span("x") as span:
+            span.set_attribute("k", 1)
+            span.fail("ignored")
+        assert tracing.current_span() is tracing.span("z")
+
+    def test_sdk_disabled_wins(self, tmp_path):
+        env = {"ADVERSARIAL_TRACE_FILE": str(tmp_path / "t.jsonl"), "OTEL_SDK_DISABLED": "true"}
+        assert tracing.configure(env) is False
+
+    def test_non_http_endpoint_is_ignored(self, caplog):
+        assert tracing.configure({"OTEL_EXPORTER_OTLP_ENDPOINT": "file:///tmp/x"}) is False
+        assert "only http(s) is supported" in caplog.text
+
+    def test_cli_run_creates_no_spans(self, project, cli):
+        with patch.object(tracing, "Span", side_effect=AssertionError("span created")):
+            assert cli("evaluate", "task.md") == 0
+        assert not tracing.enabled()
+
+
+class TestCliTrace:
+    def test_evaluation_spans_form_one_trace(self, project, monkeypatch, cli):
+        monkeypatch.setenv("ADVERSARIAL_TRACE_FILE", "traces.jsonl")
+        assert cli("evaluate", "task.md") == 0
+
+        spans = _spans(project / "traces.jsonl")
+        named = _by_name(spans)
+        assert set(named) >= {
+            "adversarial.cli",
+            "adversarial.discover_evaluators",
+            "adversarial.resolve_model",
+            "adversarial.evaluate",
+            "chat gpt-4o",
+            "adversarial.validate_output",
+        }
+        assert len({s["traceId"] for s in spans}) == 1
+        root = named["adversarial.cli"]
+        assert "parentSpanId" not in root
+        assert _attrs(root)["adversarial.command"] == "evaluate"
+        assert _attrs(root)["process.exit_code"] == "0"
+
+        evaluate = named["adversarial.evaluate"]
+        llm = named["chat gpt-4o"]
+        validate = named["adversarial.validate_output"]
+        assert llm["parentSpanId"] == evaluate["spanId"]
+        assert validate["parentSpanId"] == evaluate["spanId"]
+        assert llm["kind"] == tracing.SPAN_KIND_CLIENT
+        assert _attrs(llm)["gen_ai.system"] == "openai"
+        assert _attrs(llm)["gen_ai.usage.input_tokens"] == "1200"
+        assert _attrs(llm)["gen_ai.usage.output_tokens"] == "300"
+        assert _attrs(evaluate)["adversarial.verdict"] == "APPROVED"
+        assert _attrs(evaluate)["adversarial.evaluator"] == "evaluate"
+        assert _attrs(validate)["adversarial.verdict"] == "APPROVED"
+        assert all(s["status"]["code"] == 1 for s in spans)
+
+    def test_traceparent_joins_callers_trace(self, project, monkeypatch, cli):
+        trace_id, parent_id = "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"
+        monkeypatch.setenv("ADVERSARIAL_TRACE_FILE", "traces.jsonl")
+        monkeypatch.setenv("TRACEPARENT", f"00-{trace_id}-{parent_id}-01")
+        cli("list-evaluators")
+
+        spans = _spans(project / "traces.jsonl")
+        assert {s["traceId"] for s in spans} == {trace_id}
+        assert _by_name(spans)["adversarial.cli"]["parentSpanId"] == parent_id
+
+    def test_failed_evaluation_marks_span(self, project, monkeypatch):
+        monkeypatch.setenv("ADVERSARIAL_TRACE_FILE", "traces.jsonl")
+        with patch(
+            "adversarial_workflow.evaluators.runner.litellm.completion",
+            side_effect=RuntimeError("boom"),
+        ):
+            from adversarial_workflow.evaluators import BUILTIN_EVALUATORS, run_evaluator
+
+            tracing.configure()
+            run_evaluator(BUILTIN_EVALUATORS["evaluate"], "task.md", use_cache=False)
+            tracing.shutdown()
+
+        named = _by_name(_spans(project / "traces.jsonl"))
+        llm = named["chat gpt-4o"]
+        assert llm["status"] == {"code": 2, "message": "boom"}
+        assert llm["events"][0]["name"] == "exception"
+        assert named["adversarial.evaluate"]["status"]["message"] == "LLM call failed: boom"
+
+    def test_help_exit_is_not_an_error(self, project, monkeypatch, cli):
+        monkeypatch.setenv("ADVERSARIAL_TRACE_FILE", "traces.jsonl")
+        with pytest.raises(SystemExit):
+            cli("--version")
+        root = _by_name(_spans(project / "traces.jsonl"))["adversarial.cli"]
+        assert root["status"]["code"] == 1
+
+
+def _open_worker_span() -> None:
+    with tracing.span("worker"):
+        pass
+
+
+class TestTracer:
+    def test_worker_thread_spans_attach_to_root(self, tmp_path):
+        tracing.configure({"ADVERSARIAL_TRACE_FILE": str(tmp_path / "t.jsonl")})
+        with tracing.span("root") as root:
+            worker = threading.Thread(target=_open_worker_span)
+            worker.start()
+            worker.join()
+        tracing.shutdown()
+
+        named = _by_name(_spans(tmp_path / "t.jsonl"))
+        assert named["worker"]["parentSpanId"] == root.span_id
+
+    def test_exception_is_recorded_and_reraised(self, tmp_path):
+        tracing.configure({"ADVERSARIAL_TRACE_FILE": str(tmp_path / "t.jsonl")})
+        with pytest.raises(ValueError), tracing.span("op"):
+            raise ValueError("bad input")
+        [span] = _spans(tmp_path / "t.jsonl")
+        assert span["status"] == {"code": 2, "message": "bad input"}
+        assert _attrs(span["events"][0]) == {
+            "exception.type": "ValueError",
+            "exception.message": "bad input",
+        }
+
+    def test_attribute_encoding(self, tmp_path):
+        tracing.configure({"ADVERSARIAL_TRACE_FILE": str(tmp_path / "t.jsonl")})
+        with tracing.span("op", {"s": "x", "i": 3, "f": 0.5, "b": True, "none": None}):
+            pass
+        [span] = _spans(tmp_path / "t.jsonl")
+        assert span["attributes"] == [
+            {"key": "s", "value": {"stringValue": "x"}},
+            {"key": "i", "value": {"intValue": "3"}},
+            {"key": "f", "value": {"doubleValue": 0.5}},
+            {"key": "b", "value": {"boolValue": True}},
+        ]
+
+    def test_citation_check_span(self, tmp_path):
+        tracing.configure({"ADVERSARIAL_TRACE_FILE": str(tmp_path / "t.jsonl")})
+        assert check_urls([], cache_dir=tmp_path) == []
+        [span] = _spans(tmp_path / "t.jsonl")
+        assert span["name"] == "adversarial.check_citations"
+        assert _attrs(span)["adversarial.urls"] == "0"
+        assert _attrs(span)["adversarial.urls.broken"] == "0"
+
+
+class _Collector(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.received.append((self.path, self.headers, json.loads(body)))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def test_otlp_http_export():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Collector)
+    httpd.received = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        tracing.configure(
+            {
+                "OTEL_EXPORTER_OTLP_ENDPOINT": f"http://127.0.0.1:{httpd.server_address[1]}",
+                "OTEL_EXPORTER_OTLP_HEADERS": "x-api-key=secret",
+                "OTEL_SERVICE_NAME": "agent-reviewer",
+            }
+        )
+        with tracing.span("outer"), tracing.span("inner"):
+            pass
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+    [(path, headers, payload)] = httpd.received
+    assert path == "/v1/traces"
+    assert headers["x-api-key"] == "secret"
+    [resource] = payload["resourceSpans"]
+    assert _attrs(resource["resource"])["service.name"] == "agent-reviewer"
+    assert [s["name"] for s in resource["scopeSpans"][0]["spans"]] == ["inner", "outer"]
+
+
+def test_unreachable_endpoint_is_logged(caplog):
+    tracing.configure({"OTEL_EXPORTER_OTLP_TRACES_ENDPOINT": "http://127.0.0.1:9/v1/traces"})
+    with tracing.span("op"):
+        pass
+    assert "Could not export trace spans" in caplog.text
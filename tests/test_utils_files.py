@@ -0,0 +1,77 @@
+"""Tests for atomic writes and LRU eviction (utils/files.py)."""
+
+from __future__ import annotations
+
+import os
+import stat
+
+import pytest
+
+from adversarial_workflow.utils.files import atomic_write, evict_lru, mark_used
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    directory = tmp_path / "cache"
+    directory.mkdir()
+    return directory
+
+
+class TestAtomicWrite:
+    def test_writes_and_creates_parents(self, tmp_path):
+        path = tmp_path / "a" / "b" / "entry.json"
+        with atomic_write(path, encoding="utf-8") as f:
+            f.write("{}")
+        assert path.read_text() == "{}"
+        assert [p.name for p in path.parent.iterdir()] == ["entry.json"]
+
+    def test_failure_keeps_previous_file(self, cache_dir):
+        path = cache_dir / "entry.bin"
+        path.write_bytes(b"old")
+        with pytest.raises(RuntimeError), atomic_write(path, "wb") as f:
+            f.write(b"partial")
+            raise RuntimeError("interrupted")
+        assert path.read_bytes() == b"old"
+        assert [p.name for p in cache_dir.iterdir()] == ["entry.bin"]
+
+    def test_permissions(self, tmp_path):
+        private = tmp_path / "private"
+        shared = tmp_path / "shared"
+        with atomic_write(private) as f:
+            f.write("x")
+        old_umask = os.umask(0o022)
+        try:
+            with atomic_write(shared, permissions=0o666) as f:
+                f.write("x")
+        finally:
+            os.umask(old_umask)
+        assert stat.S_IMODE(private.stat().st_mode) == 0o600
+        assert stat.S_IMODE(shared.stat().st_mode) == 0o644
+
+
+class TestEvictLru:
+    def _entry(self, directory, name: str, size: int, mtime: int):
+        path = directory / name
+        path.write_bytes(b"x" * size)
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_evicts_least_recently_used_first(self, cache_dir):
+        old = self._entry(cache_dir, "old", 100, 1_000)
+        used = self._entry(cache_dir, "used", 100, 2_000)
+        new = self._entry(cache_dir, "new", 100, 3_000)
+        # A read moves an entry to the back of the eviction order
+        mark_used(old)
+
+        assert evict_lru(cache_dir.iterdir(), max_bytes=250) == 1
+        assert not used.exists()
+        assert old.exists() and new.exists()
+
+    def test_under_budget_and_temporary_files(self, cache_dir):
+        self._entry(cache_dir, "entry", 100, 1_000)
+        tmp = self._entry(cache_dir, "write.tmp", 1_000, 500)
+        assert evict_lru(cache_dir.iterdir(), max_bytes=100) == 0
+        assert tmp.exists()
+
+    def test_mark_used_ignores_missing_files(self, tmp_path):
+        mark_used(tmp_path / "gone")
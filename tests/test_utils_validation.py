@@ -1,8 +1,16 @@
 """Tests for validation utilities."""
 
+import itertools
+import re
+
 import pytest
 
-from adversarial_workflow.utils.validation import validate_evaluation_output
+from adversarial_workflow.utils.validation import (
+    _VERDICT_PATTERNS,
+    extract_verdict,
+    validate_evaluation_content,
+    validate_evaluation_output,
+)
 
 # Padding to exceed the 500-byte minimum content threshold
 _PAD = "Evaluation details. " * 30  # ~600 bytes
@@ -287,3 +295,55 @@ class TestVerdictFormatExtraction:
         is_valid, verdict, _msg = validate_evaluation_output(str(log_file))
         assert is_valid is True
         assert verdict == "FAIL"
+
+
+def _reference_verdict(content: str):
+    """The original extraction: one full search per format, in priority order."""
+    for pattern in _VERDICT_PATTERNS:
+        match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE)
+        if match:
+            return match.group(1).upper()
+    return None
+
+
+class TestValidateEvaluationContent:
+    """validate_evaluation_content() checks text in memory, as the file wrapper does."""
+
+    def test_matches_file_wrapper(self, tmp_path):
+        for content in ("short", f"{_PAD}\nVerdict: PASS\n", f"{_PAD}\nno verdict\n"):
+            log_file = tmp_path / "eval.md"
+            log_file.write_text(content)
+            assert validate_evaluation_content(content) == validate_evaluation_output(str(log_file))
+
+    def test_too_small(self):
+        is_valid, verdict, message = validate_evaluation_content("Verdict: APPROVED")
+        assert (is_valid, verdict) == (False, None)
+        assert "too small" in message
+
+    @pytest.mark.parametrize(
+        "lines",
+        list(
+            itertools.permutations(
+                [
+                    "FAIL",
+                    "- **REJECTED**: blocking issues",
+                    "**PASS**",
+                    "**Verdict**: **CONCERNS**",
+                    "**Verdict**: PROCEED",
+                    "  Verdict: approved  ",
+                    "**FAIL**ure modes in prose",
+                ],
+                3,
+            )
+        ),
+    )
+    def test_single_pass_matches_per_format_search(self, lines):
+        """The combined pattern picks the same verdict as searching format by format."""
+        content = "# Review\n\n" + "\n\n".join(lines) + "\n"
+        assert extract_verdict(content) == _reference_verdict(content)
+
+    def test_first_occurrence_within_a_format_wins(self):
+        assert extract_verdict("**PASS**\nVerdict: FAIL\nVerdict: PASS\n") == "FAIL"
+
+    def test_no_verdict(self):
+        assert extract_verdict(_PAD) is None
@@ -0,0 +1,211 @@
+"""Tests for watch mode (``adversarial <evaluator> --watch``)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from adversarial_workflow.cli import main
+from adversarial_workflow.evaluators.watch import watch_evaluator
+
+POLL = 0.01
+DEBOUNCE = 0.2
+
+
+class _FakeRunner:
+    """Stands in for run_evaluator_async, recording the content it evaluated."""
+
+    def __init__(self, delay: float = 0.0, exit_code: int = 0):
+        self.delay = delay
+        self.exit_code = exit_code
+        self.started: list[tuple[str, str]] = []
+        self.finished: list[str] = []
+        self.cancelled: list[str] = []
+
+    async def __call__(self, config, path, timeout=180, use_cache=True):
+        with open(path) as f:
+            self.started.append((os.path.basename(path), f.read()))
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(os.path.basename(path))
+            raise
+        self.finished.append(os.path.basename(path))
+        return self.exit_code
+
+
+class _Watch:
+    """Runs watch_evaluator() in the background of a test."""
+
+    def __init__(self, config, paths, runner):
+        self.stop = asyncio.Event()
+        self._patch = patch("adversarial_workflow.evaluators.watch.run_evaluator_async", runner)
+        self._patch.start()
+        self.task = asyncio.create_task(
+            watch_evaluator(config, paths, poll_interval=POLL, debounce=DEBOUNCE, stop=self.stop)
+        )
+
+    async def settle(self, seconds: float = DEBOUNCE * 3) -> None:
+        await asyncio.sleep(seconds)
+
+    async def close(self) -> int:
+        self.stop.set()
+        try:
+            return await asyncio.wait_for(self.task, timeout=5)
+        finally:
+            self._patch.stop()
+
+
+def _edit(path, text: str) -> None:
+    """Write text and make sure the mtime moves even on coarse clocks."""
+    before = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    if path.stat().st_mtime_ns == before:
+        os.utime(path, ns=(before + 1_000_000, before + 1_000_000))
+
+
+class TestWatchEvaluator:
+    async def test_evaluates_now_and_after_each_edit(self, evaluator_config, tmp_path):
+        task_file = tmp_path / "task.md"
+        task_file.write_text("v1")
+        runner = _FakeRunner()
+        watch = _Watch(evaluator_config, [str(task_file)], runner)
+
+        await watch.settle()
+        _edit(task_file, "v2")
+        await watch.settle()
+        assert await watch.close() == 0
+
+        assert runner.started == [("task.md", "v1"), ("task.md", "v2")]
+
+    async def test_rapid_saves_are_debounced(self, evaluator_config, tmp_path):
+        task_file = tmp_path / "task.md"
+        task_file.write_text("v1")
+        runner = _FakeRunner()
+        watch = _Watch(evaluator_config, [str(task_file)], runner)
+        await watch.settle()
+
+        for version in ("v2", "v3", "v4"):
+            _edit(task_file, version)
+            await asyncio.sleep(POLL * 2)
+        await watch.settle()
+        await watch.close()
+
+        assert runner.started == [("task.md", "v1"), ("task.md", "v4")]
+
+    async def test_unchanged_content_is_skipped(self, evaluator_config, tmp_path, capsys):
+        task_file = tmp_path / "task.md"
+        task_file.write_text("same")
+        runner = _FakeRunner()
+        watch = _Watch(evaluator_config, [str(task_file)], runner)
+        await watch.settle()
+
+        stat = task_file.stat()
+        os.utime(task_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        await watch.settle()
+        await watch.close()
+
+        assert len(runner.started) == 1
+        assert "content unchanged, skipping" in capsys.readouterr().out
+
+    async def test_failed_evaluation_is_retried_on_save(self, evaluator_config, tmp_path):
+        task_file = tmp_path / "task.md"
+        task_file.write_text("same")
+        runner = _FakeRunner(exit_code=1)
+        watch = _Watch(evaluator_config, [str(task_file)], runner)
+        await watch.settle()
+
+        stat = task_file.stat()
+        os.utime(task_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        await watch.settle()
+        await watch.close()
+
+        assert runner.started == [("task.md", "same"), ("task.md", "same")]
+
+    async def test_newer_edit_cancels_in_flight_evaluation(self, evaluator_config, tmp_path):
+        task_file = tmp_path / "task.md"
+        task_file.write_text("v1")
+        runner = _FakeRunner(delay=10)
+        watch = _Watch(evaluator_config, [str(task_file)], runner)
+        await watch.settle()
+
+        _edit(task_file, "v2")
+        await watch.settle()
+        assert runner.cancelled == ["task.md"]
+        assert runner.started[-1] == ("task.md", "v2")
+
+        await watch.close()
+        # Shutting down cancels the remaining in-flight evaluation
+        assert runner.cancelled == ["task.md", "task.md"]
+        assert runner.finished == []
+
+    async def test_directory_watches_new_markdown_files(self, evaluator_config, tmp_path):
+        tasks = tmp_path / "tasks"
+        (tasks / ".hidden").mkdir(parents=True)
+        (tasks / "existing.md").write_text("old")
+        runner = _FakeRunner()
+        watch = _Watch(evaluator_config, [str(tasks)], runner)
+        await watch.settle()
+        # Directory contents are not evaluated until they change
+        assert runner.started == []
+
+        (tasks / "new.md").write_text("fresh")
+        (tasks / "notes.txt").write_text("ignored")
+        (tasks / ".hidden" / "log.md").write_text("ignored")
+        await watch.settle()
+        await watch.close()
+
+        assert runner.started == [("new.md", "fresh")]
+
+    async def test_log_directory_is_not_watched(self, evaluator_config, tmp_path, monkeypatch):
+        (tmp_path / ".adversarial").mkdir()
+        (tmp_path / ".adversarial" / "config.yml").write_text("log_directory: reviews/\n")
+        (tmp_path / "reviews").mkdir()
+        monkeypatch.chdir(tmp_path)
+        runner = _FakeRunner()
+        watch = _Watch(evaluator_config, ["."], runner)
+        await watch.settle()
+
+        (tmp_path / "task.md").write_text("fresh")
+        (tmp_path / "reviews" / "task-TEST-EVAL.md").write_text("output")
+        await watch.settle()
+        await watch.close()
+
+        assert runner.started == [("task.md", "fresh")]
+
+    async def test_missing_path(self, evaluator_config, tmp_path, capsys):
+        code = await watch_evaluator(
+            evaluator_config, [str(tmp_path / "nope.md")], poll_interval=POLL
+        )
+        assert code == 1
+        assert "Cannot watch missing path" in capsys.readouterr().out
+
+
+class TestWatchCli:
+    @pytest.fixture
+    def project(self, eval_project):
+        (eval_project / "task.md").write_text("# Task\n")
+        return eval_project
+
+    def test_watch_flag_dispatches(self, project):
+        with (
+            patch.object(sys, "argv", ["adversarial", "evaluate", "--watch", "task.md"]),
+            patch("adversarial_workflow.daemon.forward") as forward,
+            patch(
+                "adversarial_workflow.evaluators.watch.run_evaluator_watch", return_value=0
+            ) as watch,
+        ):
+            assert main() == 0
+        forward.assert_not_called()
+        assert watch.call_args.args[1] == ["task.md"]
+
+    def test_watch_rejects_batch(self, project, capsys):
+        with patch.object(
+            sys, "argv", ["adversarial", "evaluate", "--watch", "--batch", "task.md"]
+        ):
+            assert main() == 1
+        assert "--watch cannot be combined" in capsys.readouterr().out